@@ -32,6 +32,7 @@ from app.middleware.tenant import (
     get_current_tenant_id,
 )
 from app.models.user import User
+from app.models.node import Run
 from app.models.event_script import (
     EventScript,
     EventBundle,
@@ -61,6 +62,7 @@ from app.engine.event_executor import (
     create_event_from_dict,
     ExecutionContext,
 )
+from app.engine.rng import create_counter_rng
 
 
 router = APIRouter(prefix="/event-scripts", tags=["event-scripts"])
@@ -622,14 +624,36 @@ async def execute_event_script(
     event_data = event.to_dict()
     executable_event = create_event_from_dict(event_data)
 
+    # Draws come from the run's own random stream
+    run_result = await db.execute(
+        select(Run)
+        .options(selectinload(Run.run_config))
+        .where(
+            and_(
+                Run.id == request.run_id,
+                Run.tenant_id == tenant_id,
+            )
+        )
+    )
+    run = run_result.scalar_one_or_none()
+
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Run {request.run_id} not found",
+        )
+
+    seed_config = run.run_config.seed_config if run.run_config else None
+
     # Create execution context
     # Note: In production, this would be populated from the run's world state
     context = ExecutionContext(
         run_id=str(request.run_id),
         current_tick=request.current_tick,
-        rng_seed=42,  # Would come from run config
+        rng_seed=run.actual_seed,
         environment_state={},  # Would come from world state
         agent_states={},  # Would come from agent pool
+        rng=create_counter_rng(run.actual_seed, seed_config),
     )
 
     # Execute
@@ -5,13 +5,14 @@ Reference: project.md §11 Phase 8, Interaction_design.md §5.17
 All endpoints are READ-ONLY (C3 compliant) - NEVER trigger simulations.
 """
 
+import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db, get_current_tenant
+from app.api.deps import get_current_admin_user, get_current_user, get_db, get_current_tenant
 from app.services.replay_loader import (
     DeterministicReplayLoader,
     ReplayTimeline,
@@ -20,9 +21,12 @@ from app.services.replay_loader import (
     AgentReplayState,
     create_replay_loader,
 )
-from app.services.storage import StorageRef
+from app.services.storage import StorageError, StorageRef
+from app.services.telemetry import get_decoded_telemetry_cache
 from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -109,6 +113,20 @@ class TickEventsResponse(BaseModel):
     events: List[Dict[str, Any]]
 
 
+class TelemetryCacheStatsResponse(BaseModel):
+    """Decoded telemetry cache metrics for this API process."""
+    entries: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    uncached: int
+    in_flight: int
+    hit_rate: float
+
+
 # ============================================================
 # Request Schemas
 # ============================================================
@@ -306,7 +324,7 @@ async def get_agent_history(
 
         return AgentHistoryResponse(
             agent_id=agent_id,
-            states=[AgentStateResponse(**s.to_dict()) for s in history],
+            states=[AgentStateResponse(agent_id=agent_id, **row) for row in history.rows()],
             total_states=len(history),
         )
 
@@ -345,6 +363,18 @@ async def get_events_at_tick(
         raise HTTPException(status_code=500, detail=f"Failed to get events: {str(e)}")
 
 
+@router.get("/cache/stats", response_model=TelemetryCacheStatsResponse)
+async def get_telemetry_cache_stats(
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Hit/miss metrics of the decoded telemetry cache shared by replay and
+    telemetry endpoints in this process. Admin only: the cache spans all
+    tenants.
+    """
+    return TelemetryCacheStatsResponse(**get_decoded_telemetry_cache().get_stats())
+
+
 @router.post("/seek/{tick}", response_model=WorldStateResponse)
 async def seek_to_tick(
     tick: int,
@@ -1034,10 +1064,12 @@ async def show_agent_state_card(
 
         # Get history summary
         history = await loader.get_agent_history(agent_id, max(0, request.current_tick - 10), request.current_tick)
+        stance = history.columns.get("stance", [])
+        emotion = history.columns.get("emotion", [])
         history_summary = {
             "recent_ticks": len(history),
-            "stance_change": history[-1].stance - history[0].stance if len(history) > 1 else 0,
-            "emotion_change": history[-1].emotion - history[0].emotion if len(history) > 1 else 0,
+            "stance_change": stance[-1] - stance[0] if len(history) > 1 else 0,
+            "emotion_change": emotion[-1] - emotion[0] if len(history) > 1 else 0,
         }
 
         # Get events involving this agent
@@ -1081,17 +1113,20 @@ async def show_variable_panel(
 
         state = await loader.get_state_at_tick(request.current_tick)
 
-        # Build variable history
+        # Build variable history, playing forward one tick at a time
         variable_history = {}
-        for tick in range(max(0, request.current_tick - tick_history), request.current_tick + 1):
-            try:
-                hist_state = await loader.get_state_at_tick(tick)
+        history_start = max(0, request.current_tick - tick_history)
+        try:
+            async for tick, hist_state in loader.play(history_start, request.current_tick):
                 for var_name, var_value in hist_state.environment.variables.items():
                     if var_name not in variable_history:
                         variable_history[var_name] = []
                     variable_history[var_name].append({"tick": tick, "value": var_value})
-            except:
-                pass
+        except (RuntimeError, StorageError) as e:
+            # History is supplementary: serve the ticks read before the failure
+            logger.warning(
+                f"Variable history from tick {history_start} unavailable: {e}"
+            )
 
         return VariablePanelResponse(
             tick=request.current_tick,
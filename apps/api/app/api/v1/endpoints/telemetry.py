@@ -13,11 +13,11 @@ Key constraints:
 - C4: Auditable artifacts - telemetry is versioned and immutable
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -157,11 +157,39 @@ class TelemetrySummaryResponse(BaseModel):
 
 class TelemetryExportRequest(BaseModel):
     """Request to export telemetry."""
-    format: str = Field(default="json", pattern="^(json|csv|parquet)$")
-    tick_range: Optional[tuple] = None
+    format: str = Field(default="json", pattern="^(json|ndjson|csv|parquet)$")
+    table: str = Field(default="events", pattern="^(keyframes|deltas|events)$")
+    tick_range: Optional[Tuple[int, int]] = None  # Inclusive (start, end)
     event_types: Optional[List[str]] = None
     agent_ids: Optional[List[str]] = None
+    include_keyframes: bool = True
     include_deltas: bool = True
+    background: bool = False
+
+
+class TelemetryExportResponse(BaseModel):
+    """
+    Background export accepted; download_url serves the file once written.
+    Poll status_url for completion or failure.
+    """
+    export_id: str
+    format: str
+    filename: str
+    download_url: str
+    status_url: str
+    state: str = "pending"
+
+
+class TelemetryExportStatusResponse(BaseModel):
+    """Status of a background export; download_url is set once complete."""
+    export_id: str
+    state: str
+    format: str
+    filename: str
+    size_bytes: int = 0
+    error: Optional[str] = None
+    updated_at: str
+    download_url: Optional[str] = None
 
 
 # ============================================================================
@@ -416,17 +444,18 @@ async def get_agent_history(
         end_tick=end_tick,
     )
 
-    return [
-        AgentStateSnapshot(
+    snapshots = []
+    for row, metrics in zip(history.rows(), history.metrics):
+        tick = row.pop("tick")
+        snapshots.append(AgentStateSnapshot(
             agent_id=agent_id,
-            tick=state.get("tick", 0),
-            state=state.get("state", {}),
-            beliefs=state.get("beliefs"),
-            last_action=state.get("last_action"),
-            metrics=state.get("metrics"),
-        )
-        for state in history
-    ]
+            tick=tick,
+            state=row,
+            beliefs=row.get("beliefs"),
+            last_action=row.get("last_action"),
+            metrics=metrics,
+        ))
+    return snapshots
 
 
 @router.get(
@@ -633,10 +662,12 @@ async def stream_telemetry(
 @router.post(
     "/{run_id}/export",
     summary="Export telemetry",
+    responses={202: {"model": TelemetryExportResponse}},
 )
 async def export_telemetry(
     run_id: str,
     request: TelemetryExportRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     tenant_ctx: TenantContext = Depends(require_tenant),
@@ -645,97 +676,163 @@ async def export_telemetry(
     Export telemetry data in various formats.
 
     Supported formats:
-    - json: Full structured data
-    - csv: Flattened event log
-    - parquet: Columnar format for analytics
+    - json: Full structured data (keyframes, deltas, events)
+    - ndjson: One record per line, tagged with its table
+    - csv: One table (default: events), nested fields as JSON
+    - parquet: One table, one row group per tick window (requires pyarrow)
+
+    The export is streamed window by window. With background=true it is
+    written to object storage instead, and a signed download URL is
+    returned that serves the file once generation completes; the export's
+    status (pending, complete or failed) is served at status_url.
 
     This is READ-ONLY per C3.
     """
+    from uuid import uuid4
+
     from app.services import get_telemetry_service
+    from app.services.telemetry_export import (
+        EXPORT_PENDING,
+        EXPORT_STATUS_FILENAME,
+        PARQUET_AVAILABLE,
+        ExportStatus,
+        TelemetryExporter,
+        TelemetryExportError,
+        TelemetryExportOptions,
+        export_ref,
+        run_background_export,
+        write_export_status,
+    )
+
+    if request.format == "parquet" and not PARQUET_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires pyarrow on the server",
+        )
 
     telemetry_service = get_telemetry_service()
 
-    # Get telemetry data
-    telemetry = await telemetry_service.get_telemetry_by_run(
+    view = await telemetry_service.open_view_by_run(
         run_id=run_id,
         tenant_id=tenant_ctx.tenant_id,
     )
 
-    if not telemetry:
+    if not view:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Telemetry not found for run {run_id}",
         )
 
-    if request.format == "json":
-        import json
-        from fastapi.responses import Response
-
-        export_data = {
-            "run_id": run_id,
-            "version": telemetry.version.to_dict() if hasattr(telemetry, 'version') else {},
-            "index": {
-                "total_ticks": telemetry.index.total_ticks,
-                "keyframe_ticks": telemetry.index.keyframe_ticks,
-                "event_types": telemetry.index.event_types,
-            },
-            "keyframes": [
-                {
-                    "tick": kf.tick,
-                    "timestamp": kf.timestamp,
-                    "agent_states": kf.agent_states,
-                    "metrics": kf.metrics,
-                }
-                for kf in telemetry.keyframes
-            ],
-            "events": telemetry.events,
-        }
-
-        return Response(
-            content=json.dumps(export_data, indent=2),
-            media_type="application/json",
-            headers={
-                "Content-Disposition": f'attachment; filename="telemetry_{run_id}.json"'
-            },
+    tick_start, tick_end = request.tick_range or (0, None)
+    try:
+        exporter = TelemetryExporter(view, TelemetryExportOptions(
+            format=request.format,
+            table=request.table,
+            tick_start=tick_start,
+            tick_end=tick_end,
+            event_types=request.event_types,
+            agent_ids=request.agent_ids,
+            include_keyframes=request.include_keyframes,
+            include_deltas=request.include_deltas,
+        ))
+    except TelemetryExportError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if request.background:
+        storage = telemetry_service.storage
+        export_id = uuid4().hex
+        target = export_ref(
+            storage, tenant_ctx.tenant_id, run_id, export_id,
+            exporter.filename, exporter.media_type,
+        )
+        status_ref = export_ref(
+            storage, tenant_ctx.tenant_id, run_id, export_id, EXPORT_STATUS_FILENAME,
+        )
+        await write_export_status(storage, status_ref, ExportStatus(
+            state=EXPORT_PENDING,
+            format=request.format,
+            filename=exporter.filename,
+        ))
+        download_url = await telemetry_service.get_signed_download_url(target)
+        background_tasks.add_task(
+            run_background_export, exporter, storage, target, status_ref,
         )
 
-    elif request.format == "csv":
-        import csv
-        import io
-        from fastapi.responses import Response
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            "tick", "timestamp", "event_type", "agent_id", "data"
-        ])
-
-        # Events
-        for event in telemetry.events:
-            writer.writerow([
-                event.get("tick", ""),
-                event.get("timestamp", ""),
-                event.get("event_type", ""),
-                event.get("agent_id", ""),
-                json.dumps(event.get("data", {})),
-            ])
-
-        return Response(
-            content=output.getvalue(),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f'attachment; filename="telemetry_{run_id}.csv"'
-            },
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=TelemetryExportResponse(
+                export_id=export_id,
+                format=request.format,
+                filename=exporter.filename,
+                download_url=download_url,
+                status_url=f"/api/v1/telemetry/{run_id}/exports/{export_id}",
+            ).model_dump(),
         )
 
-    else:
+    return StreamingResponse(
+        exporter.stream(),
+        media_type=exporter.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{exporter.filename}"'
+        },
+    )
+
+
+@router.get(
+    "/{run_id}/exports/{export_id}",
+    response_model=TelemetryExportStatusResponse,
+    summary="Get background export status",
+)
+async def get_export_status(
+    run_id: str,
+    export_id: str = Path(..., pattern="^[0-9a-f]{32}$"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    tenant_ctx: TenantContext = Depends(require_tenant),
+) -> TelemetryExportStatusResponse:
+    """
+    Status of a background export started with background=true.
+
+    A failed export reports its error; a complete one carries a fresh
+    signed download URL.
+
+    This is READ-ONLY per C3.
+    """
+    from app.services import get_telemetry_service
+    from app.services.telemetry_export import (
+        EXPORT_COMPLETE,
+        EXPORT_STATUS_FILENAME,
+        export_ref,
+        read_export_status,
+    )
+
+    telemetry_service = get_telemetry_service()
+    storage = telemetry_service.storage
+
+    export_status = await read_export_status(storage, export_ref(
+        storage, tenant_ctx.tenant_id, run_id, export_id, EXPORT_STATUS_FILENAME,
+    ))
+    if export_status is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Export format '{request.format}' not yet implemented",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export {export_id} not found for run {run_id}",
         )
 
+    download_url = None
+    if export_status.state == EXPORT_COMPLETE:
+        download_url = await telemetry_service.get_signed_download_url(export_ref(
+            storage, tenant_ctx.tenant_id, run_id, export_id, export_status.filename,
+        ))
+
+    return TelemetryExportStatusResponse(
+        export_id=export_id,
+        download_url=download_url,
+        **export_status.to_dict(),
+    )
+
 
 @router.get(
     "/{run_id}/metrics",
@@ -42,6 +42,7 @@ celery_app = Celery(
         "app.tasks.chaos_tasks",  # Step 3.2: Chaos engineering tasks
         "app.tasks.calibration",  # Phase 4: Calibration background tasks
         "app.tasks.pil_tasks",  # PIL: Blueprint orchestration tasks
+        "app.tasks.reliability",  # Phase 7: Multi-seed / historical run fan-out
         # Legacy tasks (to be deprecated)
         "app.tasks.world_simulation",
     ],
@@ -132,6 +133,11 @@ celery_app.conf.task_routes = {
         "queue": "default",
         "routing_key": "default",
     },
+    # Phase 7: Reliability run fan-out - using default queue
+    "app.tasks.reliability.*": {
+        "queue": "default",
+        "routing_key": "default",
+    },
     # Legacy world simulation (to be deprecated)
     "app.tasks.world_simulation.*": {
         "queue": "legacy",
@@ -109,6 +109,12 @@ class Settings(BaseSettings):
     # Signed URL expiration (project.md §8.4)
     STORAGE_URL_EXPIRATION_SECONDS: int = 3600  # 1 hour
 
+    # Decoded telemetry shared by replay and telemetry queries (per process)
+    TELEMETRY_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # Decoded JSON bytes
+
+    # Reconstructed replay states kept per replay loader
+    REPLAY_STATE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Estimated state bytes
+
     # Versioning - Platform versions (project.md §6.5)
     ENGINE_VERSION: str = "1.0.0"
     RULESET_VERSION: str = "1.0.0"
@@ -8,6 +8,7 @@ Supports Society Mode (rule-driven) and Target Mode (planning-based).
 
 from app.engine.simulation_engine import SimulationEngine
 from app.engine.state_manager import StateManager
+from app.engine.checkpoint_store import CheckpointStore
 from app.engine.behavioral_model import BehavioralModel, CognitiveBiases
 from app.engine.simulation_loop import SimulationLoop
 from app.engine.action_space import ActionSpace, ActionType
@@ -21,6 +22,8 @@ from app.engine.rules import (
     RuleContext,
     RuleResult,
     RuleFactory,
+    BatchRuleContext,
+    BatchRuleResult,
     # Built-in rules
     ConformityRule,
     MediaInfluenceRule,
@@ -43,6 +46,34 @@ from app.engine.agent import (
     SocialEdgeType,
 )
 
+# Counter-based RNG (project.md §10.1)
+from app.engine.rng import (
+    CounterRNG,
+    RNGAlgorithm,
+    create_counter_rng,
+)
+
+# Vectorized Society Mode tick kernel
+from app.engine.tick_kernel import (
+    VectorizedTickKernel,
+    TickKernelResult,
+    TickEvaluation,
+    KernelArrays,
+)
+
+# Sharded tick execution (project.md §3.3)
+from app.engine.sharding import (
+    ShardedTickExecutor,
+    PartitionStrategy,
+    partition_population,
+)
+
+# Process-parallel Monte Carlo replicates
+from app.engine.monte_carlo import (
+    MonteCarloRunner,
+    ReplicateResult,
+)
+
 # Event Script Executor (project.md §6.4, Phase 3)
 from app.engine.event_executor import (
     EventExecutor,
@@ -63,6 +94,7 @@ __all__ = [
     # Core
     "SimulationEngine",
     "StateManager",
+    "CheckpointStore",
     "BehavioralModel",
     "CognitiveBiases",
     "SimulationLoop",
@@ -76,6 +108,8 @@ __all__ = [
     "RuleContext",
     "RuleResult",
     "RuleFactory",
+    "BatchRuleContext",
+    "BatchRuleResult",
     "ConformityRule",
     "MediaInfluenceRule",
     "LossAversionRule",
@@ -91,6 +125,22 @@ __all__ = [
     "AgentPool",
     "SocialEdge",
     "SocialEdgeType",
+    # Counter-based RNG
+    "CounterRNG",
+    "RNGAlgorithm",
+    "create_counter_rng",
+    # Vectorized Tick Kernel
+    "VectorizedTickKernel",
+    "TickKernelResult",
+    "TickEvaluation",
+    "KernelArrays",
+    # Sharded Tick Execution
+    "ShardedTickExecutor",
+    "PartitionStrategy",
+    "partition_population",
+    # Monte Carlo Replicates
+    "MonteCarloRunner",
+    "ReplicateResult",
     # Event Script Executor (Phase 3)
     "EventExecutor",
     "EventScript",
@@ -0,0 +1,202 @@
+"""
+Action Log Writer
+
+Buffers AgentAction records for SimulationEngine and writes them in bulk.
+
+Implements:
+- Columnar buffers (one list per column) instead of one ORM object per
+  agent per step
+- Bulk INSERT of buffered rows, one executemany statement per chunk
+- Environment state stored once per step as an EnvironmentState row;
+  each action's decision_context references it by id
+- state_before/state_after hold only the state keys the action changed
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+import logging
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import AgentAction
+from app.models.environment import EnvironmentState
+
+logger = logging.getLogger(__name__)
+
+
+# Buffered rows that trigger a flush
+DEFAULT_FLUSH_ROWS = 50_000
+
+# Rows per INSERT statement
+DEFAULT_INSERT_BATCH = 5_000
+
+
+def state_diff(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Reduce two state vectors to the keys that differ.
+
+    Keys missing on one side are recorded as None on that side.
+
+    Returns:
+        (changed values before, changed values after)
+    """
+    changed = [
+        key for key in before.keys() | after.keys()
+        if key not in before or key not in after or before[key] != after[key]
+    ]
+    return (
+        {key: before.get(key) for key in changed},
+        {key: after.get(key) for key in changed},
+    )
+
+
+class ActionLogWriter:
+    """
+    Columnar buffer of agent actions with bulk database writes.
+
+    Usage:
+        writer.begin_step(db, step, environment_state)
+        writer.record(agent_id, action, probabilities, before, after)
+        await writer.flush(db)
+    """
+
+    _COLUMNS = (
+        "agent_id",
+        "time_step",
+        "action",
+        "action_probabilities",
+        "decision_context",
+        "reward",
+        "state_before",
+        "state_after",
+    )
+
+    def __init__(
+        self,
+        environment_id: Optional[UUID] = None,
+        scenario_id: Optional[UUID] = None,
+        flush_rows: int = DEFAULT_FLUSH_ROWS,
+        insert_batch: int = DEFAULT_INSERT_BATCH,
+    ):
+        """
+        Initialize action log writer.
+
+        Args:
+            environment_id: Environment that per-step states belong to; without
+                it, environment state is not stored
+            scenario_id: Scenario that per-step states belong to
+            flush_rows: Buffered rows at which should_flush() becomes true
+            insert_batch: Rows per INSERT statement
+        """
+        self.environment_id = environment_id
+        self.scenario_id = scenario_id
+        self.flush_rows = flush_rows
+        self.insert_batch = insert_batch
+
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self._COLUMNS}
+        self._step = 0
+        self._step_context: Dict[str, Any] = {"step": 0}
+
+        # Write statistics
+        self.rows_written = 0
+        self.environment_states_written = 0
+        self.write_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._columns["agent_id"])
+
+    def begin_step(
+        self,
+        db: AsyncSession,
+        step: int,
+        environment_state: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Start recording actions for a step.
+
+        Adds one EnvironmentState row for the step; actions recorded until
+        the next begin_step reference it from their decision_context.
+        """
+        self._step = step
+        self._step_context = {"step": step}
+
+        if self.environment_id is None or environment_state is None:
+            return
+
+        state_id = uuid4()
+        db.add(EnvironmentState(
+            id=state_id,
+            environment_id=self.environment_id,
+            scenario_id=self.scenario_id,
+            time_step=step,
+            global_state=dict(environment_state),
+        ))
+        self._step_context["environment_state_id"] = str(state_id)
+        self.environment_states_written += 1
+
+    def record(
+        self,
+        agent_id: UUID,
+        action: str,
+        action_probabilities: Optional[Dict[str, float]],
+        state_before: Dict[str, Any],
+        state_after: Dict[str, Any],
+        reward: float = 0.0,
+    ) -> None:
+        """Buffer one action for the current step."""
+        before, after = state_diff(state_before, state_after)
+        if action_probabilities is not None:
+            action_probabilities = {
+                str(k): float(v) for k, v in action_probabilities.items()
+            }
+
+        columns = self._columns
+        columns["agent_id"].append(agent_id)
+        columns["time_step"].append(self._step)
+        columns["action"].append(str(action))
+        columns["action_probabilities"].append(action_probabilities)
+        columns["decision_context"].append(self._step_context)
+        columns["reward"].append(reward)
+        columns["state_before"].append(before)
+        columns["state_after"].append(after)
+
+    def should_flush(self) -> bool:
+        """Whether the buffer has reached flush_rows."""
+        return len(self) >= self.flush_rows
+
+    async def flush(self, db: AsyncSession) -> int:
+        """
+        Write buffered actions with bulk INSERTs and clear the buffer.
+
+        Returns:
+            Number of rows written
+        """
+        num_rows = len(self)
+        if num_rows == 0:
+            return 0
+
+        start = time.perf_counter()
+        columns = [self._columns[name] for name in self._COLUMNS]
+        for batch_start in range(0, num_rows, self.insert_batch):
+            batch_end = min(batch_start + self.insert_batch, num_rows)
+            rows = [
+                dict(zip(self._COLUMNS, values))
+                for values in zip(*(column[batch_start:batch_end] for column in columns))
+            ]
+            await db.execute(insert(AgentAction), rows)
+
+        self._columns = {name: [] for name in self._COLUMNS}
+
+        elapsed = time.perf_counter() - start
+        self.rows_written += num_rows
+        self.write_seconds += elapsed
+        logger.debug(
+            f"Wrote {num_rows} agent actions "
+            f"({num_rows / elapsed if elapsed > 0 else 0.0:.0f} rows/s)"
+        )
+        return num_rows
@@ -268,6 +268,20 @@ class DiscreteActionSpace(BaseActionSpace):
         """Get action index by name."""
         return self.action_to_index.get(name, -1)
 
+    def get_action_type_mask(self, action_type: ActionType) -> np.ndarray:
+        """
+        Get mask of actions of a given type.
+
+        Args:
+            action_type: Action type to select
+
+        Returns:
+            Shape (num_actions,) boolean mask where True = action has that type
+        """
+        return np.array(
+            [a.action_type == action_type for a in self.actions], dtype=bool
+        ).reshape(self._n)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
@@ -795,6 +809,106 @@ class RewardFunction:
 
         return rewards, all_components
 
+    def compute_batch_rewards_from_arrays(
+        self,
+        actions: np.ndarray,
+        action_space: DiscreteActionSpace,
+        states_before: Dict[str, np.ndarray],
+        states_after: Dict[str, np.ndarray],
+        context: Dict[str, Any],
+        option_names: Optional[List[Any]] = None,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Vectorized compute_batch_rewards for column-oriented agent states.
+
+        Gives the same rewards as compute_batch_rewards without building a
+        state dict per agent: action reward components are looked up per
+        action index, and the state-dependent components are array
+        operations over all agents.
+
+        Args:
+            actions: Shape (batch_size,) - action indices
+            action_space: The action space used
+            states_before: Arrays "committed_choice" (batch_size,), -1 when
+                uncommitted, and "information_level" (batch_size,)
+            states_after: Same keys as states_before plus "preferences"
+                (batch_size, num_options)
+            context: Shared context; "peer_support" may be a scalar or an
+                array of shape (batch_size,)
+            option_names: Preference column of each action "choice" effect
+                (default: choices are column indices)
+
+        Returns:
+            Tuple of (rewards array, dict of per-component reward arrays)
+        """
+        actions = np.asarray(actions)
+        batch_size = len(actions)
+        num_actions = action_space.n
+        defined = (actions >= 0) & (actions < num_actions)
+        lookup = np.where(defined, actions, 0)
+        option_index = {name: i for i, name in enumerate(option_names or [])}
+
+        # Per-action tables: weighted base components and alignment column
+        base: Dict[str, np.ndarray] = {}
+        choice_column = np.full(num_actions, -1, dtype=np.int64)
+        for index, action in enumerate(action_space.actions):
+            for comp, value in action.reward_components.items():
+                if comp in self.component_weights:
+                    base.setdefault(comp, np.zeros(num_actions))[index] = value * self.component_weights[comp]
+            choice = action.effects.get("choice")
+            if choice in option_index:
+                choice_column[index] = option_index[choice]
+            elif option_names is None and isinstance(choice, (int, np.integer)):
+                choice_column[index] = choice
+
+        components = {
+            comp: np.where(defined, table[lookup], 0.0) for comp, table in base.items()
+        }
+        overrides: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Alignment reward - how well action aligns with preferences
+        preferences = states_after.get("preferences")
+        if preferences is not None:
+            column = np.where(defined, choice_column[lookup], -1)
+            aligned = (column >= 0) & (column < preferences.shape[1])
+            alignment = preferences[np.arange(batch_size), np.where(aligned, column, 0)]
+            overrides["alignment"] = (aligned, alignment * self.component_weights.get("alignment", 1.0))
+
+        # Social approval - peer support for choice
+        if "peer_support" in context:
+            support = np.broadcast_to(np.asarray(context["peer_support"], dtype=float), (batch_size,))
+            overrides["social_approval"] = (
+                defined, support * self.component_weights.get("social_approval", 0.5)
+            )
+
+        # Consistency reward - not changing too frequently
+        committed_before = states_before.get("committed_choice")
+        committed_after = states_after.get("committed_choice")
+        if committed_before is not None and committed_after is not None:
+            consistent = (committed_before == committed_after) & (committed_before >= 0)
+            overrides["consistency"] = (
+                defined & consistent,
+                np.full(batch_size, 0.1 * self.component_weights.get("consistency", 0.4)),
+            )
+
+        # Information gain
+        info_before = states_before.get("information_level", np.zeros(batch_size))
+        info_after = states_after.get("information_level", np.zeros(batch_size))
+        info_gain = np.maximum(0, np.asarray(info_after) - np.asarray(info_before))
+        overrides["information_gain"] = (
+            defined & (info_gain > 0),
+            info_gain * self.component_weights.get("information_gain", 0.3),
+        )
+
+        for comp, (mask, values) in overrides.items():
+            current = components.get(comp, np.zeros(batch_size))
+            components[comp] = np.where(mask, values, current)
+
+        rewards = np.zeros(batch_size)
+        for values in components.values():
+            rewards += values
+        return rewards, components
+
     def compute_accuracy_reward(
         self,
         predictions: np.ndarray,
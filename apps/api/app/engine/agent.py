@@ -10,13 +10,17 @@ Implements:
 - Integration with Rule Engine
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 import hashlib
+import heapq
 import copy
 
+import numpy as np
+
 
 class AgentState(str, Enum):
     """Agent lifecycle states."""
@@ -66,37 +70,85 @@ class AgentMemory:
     """
     Agent's memory system.
     Stores experiences, beliefs, and learned patterns.
+
+    Recent events live in a fixed-capacity ring buffer and episodes in a
+    min-heap keyed by significance, so memory per agent is bounded by
+    max_recent + max_episodes events and neither insert re-sorts or shifts.
     """
-    # Short-term memory (recent events)
-    recent_events: List[Dict[str, Any]] = field(default_factory=list)
+    # Short-term memory (recent events, ring buffer of max_recent)
+    recent_events: Deque[Dict[str, Any]] = field(default_factory=deque)
     max_recent: int = 50
 
     # Long-term beliefs (learned over time)
     beliefs: Dict[str, float] = field(default_factory=dict)
 
-    # Episodic memory (key events)
-    episodes: List[Dict[str, Any]] = field(default_factory=list)
+    # Episodic memory (key events), heap of (significance, sequence, episode)
     max_episodes: int = 100
+    _episode_heap: List[Tuple[float, int, Dict[str, Any]]] = field(default_factory=list, repr=False)
+    _episode_seq: int = field(default=0, repr=False)
 
     # Learned associations
     associations: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self.recent_events = deque(self.recent_events, maxlen=self.max_recent)
+
+    @property
+    def episodes(self) -> List[Dict[str, Any]]:
+        """Retained episodes in insertion order."""
+        return [episode for _, _, episode in sorted(self._episode_heap, key=lambda e: e[1])]
+
+    @episodes.setter
+    def episodes(self, episodes: List[Dict[str, Any]]) -> None:
+        self._episode_heap = []
+        self._episode_seq = 0
+        for episode in episodes:
+            self.add_episode(episode)
+
+    @property
+    def episode_count(self) -> int:
+        return len(self._episode_heap)
+
+    def set_capacity(self, max_recent: int, max_episodes: int) -> None:
+        """
+        Resize the buffers, keeping the newest events and most significant episodes.
+
+        Significant events dropped from recent memory by a smaller capacity
+        move to episodes, as they do when add_event overflows the buffer.
+        """
+        self.max_episodes = max_episodes
+        while len(self._episode_heap) > max_episodes:
+            heapq.heappop(self._episode_heap)
+
+        events = self.recent_events
+        dropped = len(events) - max_recent
+        for _ in range(max(dropped, 0)):
+            old_event = events.popleft()
+            if old_event.get("significance", 0) > 0.7:
+                self.add_episode(old_event)
+        self.max_recent = max_recent
+        self.recent_events = deque(events, maxlen=max_recent)
+
     def add_event(self, event: Dict[str, Any]) -> None:
         """Add an event to recent memory."""
+        old_event = None
+        if len(self.recent_events) == self.max_recent:
+            old_event = self.recent_events[0] if self.max_recent else event
         self.recent_events.append(event)
-        if len(self.recent_events) > self.max_recent:
-            # Move significant events to episodes
-            old_event = self.recent_events.pop(0)
-            if old_event.get("significance", 0) > 0.7:
-                self.add_episode(old_event)
+
+        # Move significant events to episodes as the ring buffer drops them
+        if old_event is not None and old_event.get("significance", 0) > 0.7:
+            self.add_episode(old_event)
 
     def add_episode(self, episode: Dict[str, Any]) -> None:
         """Add a significant episode to long-term memory."""
-        self.episodes.append(episode)
-        if len(self.episodes) > self.max_episodes:
-            # Remove least significant
-            self.episodes.sort(key=lambda e: e.get("significance", 0))
-            self.episodes.pop(0)
+        entry = (episode.get("significance", 0), self._episode_seq, episode)
+        self._episode_seq += 1
+        if len(self._episode_heap) < self.max_episodes:
+            heapq.heappush(self._episode_heap, entry)
+        elif self.max_episodes > 0:
+            # Remove least significant (oldest first on ties)
+            heapq.heappushpop(self._episode_heap, entry)
 
     def update_belief(self, key: str, value: float, learning_rate: float = 0.1) -> None:
         """Update a belief with exponential moving average."""
@@ -125,7 +177,7 @@ class AgentMemory:
     def to_dict(self) -> Dict[str, Any]:
         """Serialize memory state."""
         return {
-            "recent_events": self.recent_events,
+            "recent_events": list(self.recent_events),
             "beliefs": self.beliefs,
             "episodes": self.episodes,
             "associations": self.associations,
@@ -338,10 +390,20 @@ class Agent:
         """Advance agent to a new tick."""
         self._current_tick = tick_number
 
-    def observe(self, environment: Dict[str, Any], peer_states: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def observe(
+        self,
+        environment: Dict[str, Any],
+        peer_states: List[Dict[str, Any]],
+        peer_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Observe phase: gather information from environment and peers.
 
+        Only peers this agent has a social edge to contribute signals, so
+        callers may pass just those peers' states (see PeerStateTable) along
+        with ``peer_count``, the number of observable agents used to
+        normalise signals (defaults to ``len(peer_states)``).
+
         Returns observation context for rule evaluation.
         """
         self.state = AgentState.OBSERVING
@@ -361,7 +423,9 @@ class Agent:
                         social_signals[signal_key] += value * influence
 
         # Normalize social signals
-        peer_count = len(peer_states) if peer_states else 1
+        if peer_count is None:
+            peer_count = len(peer_states)
+        peer_count = peer_count or 1
         social_signals = {k: v / peer_count for k, v in social_signals.items()}
 
         observation = {
@@ -371,11 +435,12 @@ class Agent:
             "self_state": dict(self._variables),
         }
 
-        # Record to memory
+        # Record a summary to memory; the observation itself references peer
+        # snapshots and the shared environment, which are not copied per agent
         self._memory.add_event({
             "tick": self._current_tick,
             "type": "observation",
-            "data": observation,
+            "data": {"peer_count": len(peer_states)},
             "significance": 0.3,
         })
 
@@ -496,6 +561,21 @@ class Agent:
         # Return to idle
         self.state = AgentState.IDLE
 
+    def record_lifecycle_cycle(self, acted: bool) -> None:
+        """
+        Record the state transitions of one tick executed on this agent's behalf.
+
+        Used by the vectorized tick kernel, which runs the lifecycle on
+        columnar state instead of calling observe/evaluate/decide/act/update.
+        """
+        self.state = AgentState.OBSERVING
+        self.state = AgentState.EVALUATING
+        self.state = AgentState.DECIDING
+        if acted:
+            self.state = AgentState.ACTING
+        self.state = AgentState.UPDATING
+        self.state = AgentState.IDLE
+
     def suspend(self) -> None:
         """Suspend the agent (pause simulation)."""
         self.state = AgentState.SUSPENDED
@@ -523,7 +603,7 @@ class Agent:
             "variables": dict(self._variables),
             "memory_summary": {
                 "belief_count": len(self._memory.beliefs),
-                "episode_count": len(self._memory.episodes),
+                "episode_count": self._memory.episode_count,
             },
             "social_edge_count": len(self._social_edges),
         }
@@ -722,6 +802,100 @@ class AgentFactory:
         return agents
 
 
+# =============================================================================
+# Social Graph Index
+# =============================================================================
+
+@dataclass
+class SocialGraphIndex:
+    """
+    CSR adjacency over the social edges of a population.
+
+    Agents are addressed by integer index (their position in ``agent_ids``).
+    The peers of agent ``i`` are ``indices[indptr[i]:indptr[i + 1]]`` in
+    ascending index order, with the matching edge ``influence_strength()``
+    in ``influence``. Edges to agents outside the population are dropped.
+    """
+    agent_ids: List[str]
+    indptr: np.ndarray
+    indices: np.ndarray
+    influence: np.ndarray
+    positions: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_agents(cls, agents: List["Agent"]) -> "SocialGraphIndex":
+        """Build the index from each agent's SocialEdges."""
+        agent_ids = [str(a.id) for a in agents]
+        position = {aid: i for i, aid in enumerate(agent_ids)}
+
+        indptr = [0]
+        indices: List[int] = []
+        influence: List[float] = []
+        for agent in agents:
+            row = sorted(
+                (position[edge.target_agent_id], edge.influence_strength())
+                for edge in agent.get_social_edges()
+                if edge.target_agent_id in position
+            )
+            indices.extend(j for j, _ in row)
+            influence.extend(w for _, w in row)
+            indptr.append(len(indices))
+
+        return cls(
+            agent_ids=agent_ids,
+            indptr=np.array(indptr, dtype=np.int64),
+            indices=np.array(indices, dtype=np.int64),
+            influence=np.array(influence, dtype=np.float64),
+            positions=position,
+        )
+
+    @property
+    def num_agents(self) -> int:
+        return len(self.agent_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.indices.size)
+
+    def degree(self) -> np.ndarray:
+        """Out-degree of every agent."""
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        """In-degree of every agent (how many agents list it as a peer)."""
+        return np.bincount(self.indices, minlength=self.num_agents)
+
+    def peers_of(self, index: int) -> np.ndarray:
+        """Peer indices of one agent."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def influence_of(self, index: int) -> np.ndarray:
+        """Edge influence strengths of one agent, aligned with peers_of()."""
+        return self.influence[self.indptr[index]:self.indptr[index + 1]]
+
+
+@dataclass
+class PeerStateTable:
+    """
+    Per-tick table of peer snapshots keyed by integer agent index.
+
+    Snapshots are taken once at the start of a tick, and only for agents
+    that appear as someone's peer; terminated agents have no entry.
+    Looking up an agent's peers costs O(degree).
+    """
+    index: SocialGraphIndex
+    states: List[Optional[Dict[str, Any]]]
+    alive_count: int
+
+    def peers_of(self, index: int) -> List[Dict[str, Any]]:
+        """Snapshots of an agent's observable peers, in index order."""
+        states = self.states
+        return [
+            states[j] for j in self.index.peers_of(index).tolist()
+            if states[j] is not None
+        ]
+
+
 # =============================================================================
 # Agent Pool (for simulation management)
 # =============================================================================
@@ -740,10 +914,12 @@ class AgentPool:
         self._agents: Dict[str, Agent] = {}
         self._by_segment: Dict[str, Set[str]] = {}
         self._by_region: Dict[str, Set[str]] = {}
+        self._social_index: Optional[SocialGraphIndex] = None
 
     def add(self, agent: Agent) -> None:
         """Add an agent to the pool."""
         self._agents[agent.id] = agent
+        self.invalidate_social_index()
 
         # Index by segment
         segment = agent.profile.segment
@@ -763,6 +939,8 @@ class AgentPool:
         """Remove an agent from the pool."""
         agent = self._agents.pop(agent_id, None)
         if agent:
+            self.invalidate_social_index()
+
             # Remove from indices
             segment = agent.profile.segment
             if segment and segment in self._by_segment:
@@ -801,6 +979,46 @@ class AgentPool:
         peer_ids = agent.get_peer_ids()
         return [self._agents[pid] for pid in peer_ids if pid in self._agents]
 
+    # =========================================================================
+    # Social Graph Index
+    # =========================================================================
+
+    @property
+    def social_index(self) -> SocialGraphIndex:
+        """
+        CSR adjacency of the pool, in get_all() order.
+
+        Built lazily and cached; call invalidate_social_index() after
+        changing agents' social edges.
+        """
+        if self._social_index is None:
+            self._social_index = SocialGraphIndex.from_agents(self.get_all())
+        return self._social_index
+
+    def invalidate_social_index(self) -> None:
+        """Drop the cached social graph index."""
+        self._social_index = None
+
+    def index_of(self, agent_id: str) -> int:
+        """Integer index of an agent in the social graph index."""
+        return self.social_index.positions[str(agent_id)]
+
+    def snapshot_peer_states(self) -> PeerStateTable:
+        """
+        Snapshot peer states for one tick.
+
+        Only agents that are a peer of some agent are snapshotted, so the
+        cost is bounded by the number of distinct edge targets.
+        """
+        index = self.social_index
+        agents = self.get_all()
+        alive = [a.state != AgentState.TERMINATED for a in agents]
+        states: List[Optional[Dict[str, Any]]] = [None] * index.num_agents
+        for j in np.flatnonzero(index.in_degree()).tolist():
+            if alive[j]:
+                states[j] = agents[j].to_snapshot()
+        return PeerStateTable(index=index, states=states, alive_count=sum(alive))
+
     def count(self) -> int:
         """Get total agent count."""
         return len(self._agents)
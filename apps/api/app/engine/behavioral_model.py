@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import logging
 
+from scipy import sparse
+
 logger = logging.getLogger(__name__)
 
 
@@ -644,11 +646,18 @@ class SocialInfluenceModel:
     """
     Models social influence between agents.
     Implements homophily, opinion dynamics, and information cascade effects.
+
+    Graph operators accept either a dense (num_agents, num_agents) array or a
+    scipy sparse matrix such as StateManager.neighbor_index.to_csr(); large
+    populations should use the sparse form.
     """
 
     # Influence decay with network distance
     distance_decay: float = 0.5
 
+    # Network hops considered for influence
+    max_hops: int = 1
+
     # Homophily strength
     homophily_weight: float = 0.7
 
@@ -661,37 +670,59 @@ class SocialInfluenceModel:
     def compute_social_influence(
         self,
         agent_states: np.ndarray,
-        adjacency_matrix: np.ndarray,
-        influence_weights: np.ndarray,
+        adjacency_matrix: Any,
+        influence_weights: Optional[Any] = None,
+        max_hops: Optional[int] = None,
+        distance_decay: Optional[float] = None,
     ) -> np.ndarray:
         """
         Compute social influence on agent beliefs.
 
+        Influence h hops away is the weighted neighbour average applied h
+        times, weighted by distance_decay ** (h - 1). Hops are computed as
+        repeated products with the normalized graph, never as matrix powers.
+
         Args:
             agent_states: Shape (num_agents, state_dim)
-            adjacency_matrix: Shape (num_agents, num_agents) - sparse
-            influence_weights: Shape (num_agents, num_agents)
+            adjacency_matrix: Shape (num_agents, num_agents) - dense or sparse
+            influence_weights: Shape (num_agents, num_agents) - optional when
+                the adjacency entries are already the influence weights
+            max_hops: Network hops to include (defaults to self.max_hops)
+            distance_decay: Decay per hop (defaults to self.distance_decay)
 
         Returns:
             Influence vector for each agent
         """
+        max_hops = max(1, max_hops or self.max_hops)
+        decay = self.distance_decay if distance_decay is None else distance_decay
+
         # Weighted average of neighbor states
-        weighted_adj = adjacency_matrix * influence_weights
+        if influence_weights is None:
+            weighted_adj = adjacency_matrix
+        elif sparse.issparse(adjacency_matrix):
+            weighted_adj = sparse.csr_matrix(adjacency_matrix.multiply(influence_weights))
+        else:
+            weighted_adj = adjacency_matrix * influence_weights
 
         # Normalize by total influence received
-        row_sums = weighted_adj.sum(axis=1, keepdims=True)
-        row_sums = np.where(row_sums > 0, row_sums, 1)
-        normalized_adj = weighted_adj / row_sums
+        normalized_adj = _row_normalize(weighted_adj)
 
-        # Compute influence: average of connected neighbors
-        influence = normalized_adj @ agent_states
+        # Compute influence: decayed average over successive hops
+        hop_states = agent_states
+        influence = np.zeros(agent_states.shape)
+        total_weight = 0.0
+        for hop in range(max_hops):
+            hop_states = normalized_adj @ hop_states
+            hop_weight = decay ** hop
+            influence += hop_weight * hop_states
+            total_weight += hop_weight
 
-        return influence
+        return influence / total_weight
 
     def detect_information_cascade(
         self,
         agent_choices: np.ndarray,
-        adjacency_matrix: np.ndarray,
+        adjacency_matrix: Any,
         threshold: Optional[float] = None,
     ) -> np.ndarray:
         """
@@ -699,7 +730,7 @@ class SocialInfluenceModel:
 
         Args:
             agent_choices: Shape (num_agents,) - current choices
-            adjacency_matrix: Shape (num_agents, num_agents)
+            adjacency_matrix: Shape (num_agents, num_agents) - dense or sparse
             threshold: Cascade detection threshold
 
         Returns:
@@ -707,28 +738,19 @@ class SocialInfluenceModel:
         """
         threshold = threshold or self.cascade_threshold
         num_agents = len(agent_choices)
-        in_cascade = np.zeros(num_agents, dtype=bool)
+        rows, cols = _edge_list(adjacency_matrix)
 
-        for i in range(num_agents):
-            if agent_choices[i] < 0:
-                continue
+        # Count neighbours with a choice, and those matching the agent's choice
+        neighbor_choices = agent_choices[cols]
+        valid = neighbor_choices >= 0
+        same = valid & (neighbor_choices == agent_choices[rows])
+        valid_counts = np.bincount(rows[valid], minlength=num_agents)
+        same_counts = np.bincount(rows[same], minlength=num_agents)
 
-            # Get neighbor choices
-            neighbors = np.where(adjacency_matrix[i] > 0)[0]
-            if len(neighbors) == 0:
-                continue
-
-            neighbor_choices = agent_choices[neighbors]
-            valid_neighbors = neighbor_choices >= 0
-
-            if valid_neighbors.sum() == 0:
-                continue
-
-            # Check if majority of neighbors made same choice
-            same_choice = (neighbor_choices[valid_neighbors] == agent_choices[i]).mean()
-            in_cascade[i] = same_choice >= threshold
-
-        return in_cascade
+        # Check if majority of neighbors made same choice
+        has_neighbors = (agent_choices >= 0) & (valid_counts > 0)
+        same_share = same_counts / np.maximum(valid_counts, 1)
+        return has_neighbors & (same_share >= threshold)
 
     def compute_homophily_score(
         self,
@@ -758,6 +780,64 @@ class SocialInfluenceModel:
         # Scale to 0-1
         return (similarity + 1) / 2
 
+    def compute_edge_homophily(
+        self,
+        agent_features: np.ndarray,
+        adjacency_matrix: Any,
+        chunk_size: int = 100_000,
+    ) -> sparse.csr_matrix:
+        """
+        Compute homophily scores for every edge of the network at once.
+
+        Args:
+            agent_features: Shape (num_agents, feature_dim)
+            adjacency_matrix: Shape (num_agents, num_agents) - dense or sparse
+            chunk_size: Edges scored per vectorized block
+
+        Returns:
+            Sparse matrix with the compute_homophily_score of each edge
+        """
+        num_agents = agent_features.shape[0]
+        rows, cols = _edge_list(adjacency_matrix)
+
+        norms = np.linalg.norm(agent_features, axis=1)
+        unit = agent_features / np.where(norms < 1e-10, 1.0, norms)[:, np.newaxis]
+
+        scores = np.empty(len(rows))
+        for start in range(0, len(rows), chunk_size):
+            r = rows[start:start + chunk_size]
+            c = cols[start:start + chunk_size]
+            similarity = np.einsum("ij,ij->i", unit[r], unit[c])
+            scores[start:start + chunk_size] = (similarity + 1) / 2
+        scores[(norms[rows] < 1e-10) | (norms[cols] < 1e-10)] = 0.0
+
+        return sparse.csr_matrix((scores, (rows, cols)), shape=(num_agents, num_agents))
+
+
+def _row_normalize(matrix: Any) -> Any:
+    """Scale rows to sum to 1, leaving empty rows as zeros."""
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64, copy=True)
+        row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+        row_sums = np.where(row_sums > 0, row_sums, 1)
+        matrix.data /= np.repeat(row_sums, np.diff(matrix.indptr))
+        return matrix
+
+    row_sums = matrix.sum(axis=1, keepdims=True)
+    row_sums = np.where(row_sums > 0, row_sums, 1)
+    return matrix / row_sums
+
+
+def _edge_list(adjacency_matrix: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """(source, target) index arrays of the positive entries of a graph."""
+    if sparse.issparse(adjacency_matrix):
+        graph = sparse.coo_matrix(adjacency_matrix)
+        positive = graph.data > 0
+        return graph.row[positive].astype(np.int64), graph.col[positive].astype(np.int64)
+
+    rows, cols = np.nonzero(np.asarray(adjacency_matrix) > 0)
+    return rows, cols
+
 
 def create_default_behavioral_params(
     num_agents: int,
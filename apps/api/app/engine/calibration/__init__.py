@@ -16,6 +16,10 @@ from app.engine.calibration.metrics import (
     compute_kl_divergence,
     compute_brier_score,
 )
+from app.engine.calibration.objective_cache import (
+    ObjectiveCache,
+    evaluation_key,
+)
 from app.engine.calibration.optimizer import (
     BayesianOptimizer,
     GridSearchOptimizer,
@@ -30,6 +34,8 @@ __all__ = [
     "compute_accuracy_metrics",
     "compute_kl_divergence",
     "compute_brier_score",
+    "ObjectiveCache",
+    "evaluation_key",
     "BayesianOptimizer",
     "GridSearchOptimizer",
     "ParameterBounds",
@@ -13,6 +13,8 @@ from datetime import datetime
 import logging
 import json
 import asyncio
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 
 from app.engine.calibration.metrics import (
     AccuracyMetrics,
@@ -20,6 +22,7 @@ from app.engine.calibration.metrics import (
     compute_accuracy_metrics,
     compute_calibration_improvement,
 )
+from app.engine.calibration.objective_cache import ObjectiveCache, evaluation_key
 from app.engine.calibration.optimizer import (
     BayesianOptimizer,
     GridSearchOptimizer,
@@ -28,6 +31,7 @@ from app.engine.calibration.optimizer import (
     OptimizationResult,
     create_optimizer,
 )
+from app.engine.workers import worker_processes_unavailable
 
 logger = logging.getLogger(__name__)
 
@@ -161,16 +165,33 @@ class Calibrator:
         self,
         config: CalibrationConfig,
         simulation_runner: Callable[[Dict[str, Any]], Dict[str, float]],
+        mp_context: str = "spawn",
+        cache: Optional[ObjectiveCache] = None,
+        seed: Optional[int] = None,
+        ruleset_hash: Optional[str] = None,
     ):
         """
         Initialize calibrator.
 
         Args:
             config: Calibration configuration
-            simulation_runner: Function that runs simulation with params and returns predictions
+            simulation_runner: Function that runs simulation with params and returns predictions;
+                must be picklable to run on worker processes
+            mp_context: multiprocessing start method for parallel evaluations
+            cache: Simulation result cache; pass ObjectiveCache.for_node(...) to share
+                results across calibration jobs for a node
+            seed: Seed the simulation runner uses, part of the cache key; also
+                seeds the Bayesian and random search optimizers
+            ruleset_hash: RuleEngine.get_ruleset_hash() of the simulated rules, part of
+                the cache key
         """
         self.config = config
         self.simulation_runner = simulation_runner
+        self.mp_context = mp_context
+        self._pool: Optional[Executor] = None
+        self.cache = cache if cache is not None else ObjectiveCache()
+        self.seed = seed
+        self.ruleset_hash = ruleset_hash
         self.accuracy_tracker = AccuracyTracker(target_accuracy=config.target_accuracy)
 
         # Build parameter bounds
@@ -216,14 +237,92 @@ class Calibrator:
 
     def _create_optimizer(self):
         """Create optimizer based on method."""
+        kwargs = {}
+        if self.config.method == CalibrationMethod.BAYESIAN:
+            kwargs["batch_size"] = self.config.n_parallel_evaluations
+        if self.config.method in (CalibrationMethod.BAYESIAN, CalibrationMethod.RANDOM_SEARCH):
+            # A seeded calibration proposes the same points every time
+            kwargs["random_seed"] = self.seed
         return create_optimizer(
             method=self.config.method.value.replace("_search", ""),
             parameter_bounds=self.parameter_bounds,
             n_iterations=self.config.max_iterations,
             convergence_threshold=self.config.convergence_threshold,
             convergence_patience=self.config.patience,
+            **kwargs,
         )
 
+    def _start_pool(self) -> None:
+        """Start workers for concurrent simulation runs."""
+        n_workers = self.config.n_parallel_evaluations
+        if n_workers <= 1:
+            return
+
+        if worker_processes_unavailable(
+            "running calibration simulations on threads",
+            simulation_runner=self.simulation_runner,
+        ):
+            self._pool = ThreadPoolExecutor(max_workers=n_workers)
+        else:
+            self._pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context(self.mp_context),
+            )
+
+    def _stop_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _run_simulation(self, params: Dict[str, Any]) -> Dict[str, float]:
+        """Run simulation, or return the cached predictions for these params."""
+        predictions = self.cache.get(params, self.seed, self.ruleset_hash)
+        if predictions is None:
+            predictions = self.simulation_runner(params)
+            self.cache.put(params, predictions, self.seed, self.ruleset_hash)
+        return predictions
+
+    def _compute_objectives(
+        self,
+        batch: List[Dict[str, Any]],
+        ground_truth: GroundTruth,
+    ) -> List[float]:
+        """
+        Compute calibration objectives for a batch of parameter sets.
+
+        Uncached simulations run concurrently on the calibration pool, once
+        per distinct point; scoring and tracking happen here, in batch order.
+        """
+        if self._pool is None or len(batch) <= 1:
+            return [self._compute_objective(params, ground_truth) for params in batch]
+
+        results: List[Any] = []
+        futures: Dict[str, Future] = {}
+        for params in batch:
+            predictions = self.cache.get(params, self.seed, self.ruleset_hash)
+            if predictions is not None:
+                results.append(predictions)
+                continue
+            key = evaluation_key(params, self.seed, self.ruleset_hash)
+            if key not in futures:
+                futures[key] = self._pool.submit(self.simulation_runner, params)
+            results.append(futures[key])
+
+        objectives = []
+        for params, result in zip(batch, results):
+            if isinstance(result, Future):
+                try:
+                    predictions = result.result()
+                except Exception as e:
+                    logger.error(f"Error computing objective: {e}")
+                    objectives.append(0.0)  # Worst case for failed evaluations
+                    continue
+                self.cache.put(params, predictions, self.seed, self.ruleset_hash)
+            else:
+                predictions = result
+            objectives.append(self._score_predictions(params, predictions, ground_truth))
+        return objectives
+
     def _compute_objective(
         self,
         params: Dict[str, Any],
@@ -237,8 +336,21 @@ class Calibrator:
         """
         try:
             # Run simulation with parameters
-            predictions = self.simulation_runner(params)
+            predictions = self._run_simulation(params)
+        except Exception as e:
+            logger.error(f"Error computing objective: {e}")
+            return 0.0  # Worst case for failed evaluations
 
+        return self._score_predictions(params, predictions, ground_truth)
+
+    def _score_predictions(
+        self,
+        params: Dict[str, Any],
+        predictions: Dict[str, float],
+        ground_truth: GroundTruth,
+    ) -> float:
+        """Score one simulation's predictions and record them."""
+        try:
             # Compute metrics
             metrics = compute_accuracy_metrics(
                 predictions=predictions,
@@ -297,7 +409,7 @@ class Calibrator:
 
         # Compute baseline if initial params provided
         if initial_params:
-            predictions = self.simulation_runner(initial_params)
+            predictions = self._run_simulation(initial_params)
             self.baseline_metrics = compute_accuracy_metrics(
                 predictions=predictions,
                 ground_truth=ground_truth.category_distributions,
@@ -308,13 +420,26 @@ class Calibrator:
         def objective(params: Dict[str, Any]) -> float:
             return self._compute_objective(params, ground_truth)
 
-        # Run optimization
-        if self.config.method == CalibrationMethod.ENSEMBLE:
-            result = self._run_ensemble_calibration(objective)
-        elif self.config.method == CalibrationMethod.ADAPTIVE:
-            result = self._run_adaptive_calibration(objective, ground_truth)
-        else:
-            result = self.optimizer.optimize(objective, maximize=True)
+        def batch_objective(batch: List[Dict[str, Any]]) -> List[float]:
+            return self._compute_objectives(batch, ground_truth)
+
+        # Run optimization; only Bayesian rounds evaluate batches concurrently
+        if self.config.method in (CalibrationMethod.BAYESIAN, CalibrationMethod.ADAPTIVE):
+            self._start_pool()
+        try:
+            if self.config.method == CalibrationMethod.ENSEMBLE:
+                result = self._run_ensemble_calibration(objective)
+            elif self.config.method == CalibrationMethod.ADAPTIVE:
+                result = self._run_adaptive_calibration(objective, ground_truth, batch_objective)
+            elif isinstance(self.optimizer, BayesianOptimizer):
+                result = self.optimizer.optimize(
+                    objective, maximize=True, batch_objective_fn=batch_objective
+                )
+            else:
+                result = self.optimizer.optimize(objective, maximize=True)
+        finally:
+            self._stop_pool()
+            self.cache.save()
 
         # Get best metrics
         if self.calibration_history:
@@ -391,6 +516,7 @@ class Calibrator:
         self,
         objective: Callable[[Dict[str, Any]], float],
         ground_truth: GroundTruth,
+        batch_objective: Optional[Callable[[List[Dict[str, Any]]], List[float]]] = None,
     ) -> OptimizationResult:
         """
         Adaptive calibration that switches methods based on progress.
@@ -414,13 +540,16 @@ class Calibrator:
             n_initial=5,
             n_iterations=self.config.max_iterations * 3 // 4,
             convergence_patience=self.config.patience,
+            batch_size=self.config.n_parallel_evaluations,
         )
 
         # Initialize with random search results
         for entry in random_optimizer.history:
             bayesian_optimizer.update(entry["params"], entry["score"])
 
-        bayesian_result = bayesian_optimizer.optimize(objective, maximize=True)
+        bayesian_result = bayesian_optimizer.optimize(
+            objective, maximize=True, batch_objective_fn=batch_objective
+        )
 
         # Return best overall
         if bayesian_result.best_score > random_result.best_score:
@@ -452,6 +581,7 @@ class Calibrator:
             "improving": self.accuracy_tracker.is_improving(),
             "meets_target": self.accuracy_tracker.meets_target(),
             "target_gap": trend.get("target_gap", 1.0),
+            "cache": self.cache.get_stats(),
         }
 
 
@@ -0,0 +1,181 @@
+"""
+Objective Evaluation Cache
+
+Content-addressed memo of simulation results for calibration and tuning.
+A result is identified by the canonicalized parameter dict, the simulation
+seed and the ruleset hash (RuleEngine.get_ruleset_hash), so a point that an
+optimizer, a finite-difference gradient or a cross-validation fold has
+already evaluated under the same rules is not simulated again.
+
+Entries are kept in memory with LRU eviction. A cache bound to a file (e.g.
+one per node via ObjectiveCache.for_node) loads it on creation and writes
+it back on save(), so calibration jobs for the same node share results.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import copy
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready canonical form: numbers as floats at 12 significant digits."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.number)):
+        number = float(f"{float(value):.12g}")
+        return 0.0 if number == 0 else number  # Fold -0.0 into 0.0
+    return value
+
+
+def evaluation_key(
+    params: Dict[str, Any],
+    seed: Optional[int] = None,
+    ruleset_hash: Optional[str] = None,
+) -> str:
+    """
+    Hash identifying one simulation evaluation.
+
+    Parameter order and numeric type (1 vs 1.0, NumPy scalars) do not
+    change the key.
+    """
+    payload = json.dumps(
+        {"params": _canonical(params), "seed": seed, "ruleset": ruleset_hash},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ObjectiveCache:
+    """
+    LRU cache of simulation results keyed by evaluation_key.
+
+    Values must be JSON-serializable to be persisted. Callers get copies,
+    so mutating a returned result does not alter the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of results kept; least recently used
+                entries are evicted first
+            path: Optional JSON file to load from and save to
+        """
+        self.max_entries = max(1, max_entries)
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if self.path and self.path.exists():
+            self.load()
+
+    @classmethod
+    def for_node(
+        cls,
+        node_id: str,
+        cache_dir: Union[str, Path],
+        max_entries: int = 4096,
+    ) -> "ObjectiveCache":
+        """Cache persisted in cache_dir and shared by all jobs for one node."""
+        return cls(max_entries=max_entries, path=Path(cache_dir) / f"objective_cache_{node_id}.json")
+
+    def get(
+        self,
+        params: Dict[str, Any],
+        seed: Optional[int] = None,
+        ruleset_hash: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Cached result, or None (counted as a miss)."""
+        key = evaluation_key(params, seed, ruleset_hash)
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(self._entries[key])
+
+    def put(
+        self,
+        params: Dict[str, Any],
+        value: Any,
+        seed: Optional[int] = None,
+        ruleset_hash: Optional[str] = None,
+    ) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        key = evaluation_key(params, seed, ruleset_hash)
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def load(self) -> None:
+        """Merge entries from the cache file; unreadable files are ignored."""
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)["entries"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable objective cache {self.path}: {e}")
+            return
+
+        for key, value in entries:
+            self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write entries to the cache file, least recently used first."""
+        if self.path is None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"entries": list(self._entries.items())}, f, default=float)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save objective cache {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
@@ -12,6 +12,8 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
+from scipy.linalg import solve_triangular
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +43,21 @@ class ParameterBounds:
             return int(round(val))
         return val
 
+    def sample_normalized(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Sample uniformly within bounds, returned in normalized [0, 1] space."""
+        if self.dtype == "categorical" and self.categories:
+            return self.normalize(np.asarray(rng.choice(self.categories, size), dtype=float))
+
+        normalized = rng.uniform(0.0, 1.0, size)
+        if self.dtype == "int":
+            if self.log_scale:
+                log_range = np.log(self.upper) - np.log(self.lower)
+                values = np.exp(normalized * log_range + np.log(self.lower))
+            else:
+                values = normalized * (self.upper - self.lower) + self.lower
+            normalized = self.normalize(np.round(values))
+        return normalized
+
     def clip(self, value: float) -> Union[float, int]:
         """Clip value to bounds."""
         clipped = np.clip(value, self.lower, self.upper)
@@ -195,7 +212,11 @@ class BayesianOptimizer:
     """
     Bayesian optimization using Gaussian Process surrogate model.
 
-    Uses Expected Improvement (EI) acquisition function.
+    Uses Expected Improvement (EI) acquisition function. The Cholesky factor
+    of the kernel matrix is extended as observations arrive instead of being
+    recomputed for every prediction. With batch_size > 1, each round proposes
+    a batch of points with the constant-liar heuristic, so the batch can be
+    evaluated concurrently.
     """
 
     def __init__(
@@ -207,6 +228,8 @@ class BayesianOptimizer:
         convergence_threshold: float = 1e-4,
         convergence_patience: int = 10,
         random_seed: Optional[int] = None,
+        batch_size: int = 1,
+        n_candidates: int = 1000,
     ):
         self.parameter_bounds = {p.name: p for p in parameter_bounds}
         self.param_names = list(self.parameter_bounds.keys())
@@ -216,6 +239,8 @@ class BayesianOptimizer:
         self.exploration_weight = exploration_weight
         self.convergence_threshold = convergence_threshold
         self.convergence_patience = convergence_patience
+        self.batch_size = max(1, batch_size)
+        self.n_candidates = n_candidates
 
         self.rng = np.random.default_rng(random_seed)
 
@@ -224,6 +249,14 @@ class BayesianOptimizer:
         self.y: List[float] = []
         self.history: List[Dict[str, Any]] = []
 
+        # Pending batch points with their lie values (constant liar)
+        self._fantasy_X: List[np.ndarray] = []
+        self._fantasy_y: List[float] = []
+
+        # Cholesky factor of K + noise * I over observations, then fantasies
+        self._L = np.zeros((0, 0))
+        self._L_key: Optional[Tuple] = None
+
         # GP hyperparameters
         self.length_scales = np.ones(self.n_params) * 0.2
         self.noise_var = 1e-6
@@ -262,47 +295,84 @@ class BayesianOptimizer:
 
         return np.exp(-0.5 * sq_dist)
 
+    def _training_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Observations followed by pending fantasies."""
+        X = self.X + self._fantasy_X
+        y = self.y + self._fantasy_y
+        return np.array(X).reshape(len(X), self.n_params), np.array(y, dtype=float)
+
+    def _cholesky_factor(self, X_train: np.ndarray) -> np.ndarray:
+        """
+        Cholesky factor of K(X_train) + noise * I.
+
+        The cached factor covers a prefix of X_train (observations and
+        fantasies are only ever appended, and fantasies are dropped from the
+        end), so it is truncated or extended block-wise in O(n^2 k) for k new
+        points rather than refactorized in O(n^3).
+
+        Raises:
+            np.linalg.LinAlgError: If the kernel matrix is not positive definite
+        """
+        # Kernel hyperparameters changed: the cached factor is stale
+        key = (tuple(self.length_scales), self.noise_var)
+        if key != self._L_key:
+            self._L, self._L_key = np.zeros((0, 0)), key
+
+        n = len(X_train)
+        m = min(self._L.shape[0], n)
+        L = self._L[:m, :m]
+
+        if m < n:
+            new_X = X_train[m:]
+            K_new = self._rbf_kernel(new_X, new_X) + self.noise_var * np.eye(n - m)
+            if m > 0:
+                L21 = solve_triangular(L, self._rbf_kernel(X_train[:m], new_X), lower=True).T
+                schur = K_new - L21 @ L21.T
+            else:
+                L21 = np.zeros((n - m, 0))
+                schur = K_new
+            L22 = np.linalg.cholesky(schur)
+            L = np.block([[L, np.zeros((m, n - m))], [L21, L22]])
+
+        self._L = L
+        return L
+
     def _gp_predict(
         self,
         X_test: np.ndarray,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Predict mean and variance using GP."""
-        if len(self.X) == 0:
+        X_train, y_train = self._training_data()
+        if len(X_train) == 0:
             return np.zeros(len(X_test)), np.ones(len(X_test))
 
-        X_train = np.array(self.X)
-        y_train = np.array(self.y)
-
         # Normalize y
         y_mean = np.mean(y_train)
         y_std = np.std(y_train) + 1e-8
         y_norm = (y_train - y_mean) / y_std
 
-        # Kernel matrices
-        K = self._rbf_kernel(X_train, X_train)
-        K += self.noise_var * np.eye(len(X_train))
-        K_s = self._rbf_kernel(X_test, X_train)
-        K_ss = self._rbf_kernel(X_test, X_test)
-
         # GP prediction
         try:
-            L = np.linalg.cholesky(K)
-            alpha = np.linalg.solve(L.T, np.linalg.solve(L, y_norm))
-            v = np.linalg.solve(L, K_s.T)
+            L = self._cholesky_factor(X_train)
+        except np.linalg.LinAlgError:
+            # Fallback for numerical issues; refactorize from scratch next time
+            self._L = np.zeros((0, 0))
+            return np.full(len(X_test), y_mean), np.ones(len(X_test)) * y_std ** 2
 
-            mu = K_s @ alpha
-            var = np.diag(K_ss) - np.sum(v ** 2, axis=0)
-            var = np.maximum(var, 1e-8)
+        K_s = self._rbf_kernel(X_test, X_train)
+        alpha = solve_triangular(L.T, solve_triangular(L, y_norm, lower=True), lower=False)
+        v = solve_triangular(L, K_s.T, lower=True)
 
-            # Denormalize
-            mu = mu * y_std + y_mean
-            var = var * (y_std ** 2)
+        mu = K_s @ alpha
+        # RBF kernel has unit diagonal, so K_ss is never formed
+        var = 1.0 - np.sum(v ** 2, axis=0)
+        var = np.maximum(var, 1e-8)
 
-            return mu, var
+        # Denormalize
+        mu = mu * y_std + y_mean
+        var = var * (y_std ** 2)
 
-        except np.linalg.LinAlgError:
-            # Fallback for numerical issues
-            return np.full(len(X_test), y_mean), np.ones(len(X_test)) * y_std ** 2
+        return mu, var
 
     def _expected_improvement(
         self,
@@ -339,26 +409,77 @@ class BayesianOptimizer:
             samples.append(params)
         return samples
 
+    def _sample_candidates(self, n_candidates: int) -> np.ndarray:
+        """Random candidate points in normalized space, one column per parameter."""
+        return np.column_stack([
+            self.parameter_bounds[name].sample_normalized(self.rng, n_candidates)
+            for name in self.param_names
+        ]).reshape(n_candidates, self.n_params)
+
     def _optimize_acquisition(self, best_y: float, maximize: bool) -> Dict[str, Any]:
         """Find next point by optimizing acquisition function."""
-        # Random search for acquisition optimization
-        n_candidates = 1000
+        return self._propose_batch(best_y, maximize, 1)[0]
 
-        candidates = np.zeros((n_candidates, self.n_params))
-        for i in range(n_candidates):
-            for j, name in enumerate(self.param_names):
-                bounds = self.parameter_bounds[name]
-                candidates[i, j] = bounds.normalize(bounds.sample_uniform(self.rng))
+    def _propose_batch(
+        self,
+        best_y: float,
+        maximize: bool,
+        batch_size: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Propose a batch of points with the constant-liar heuristic.
 
-        ei = self._expected_improvement(candidates, best_y, maximize)
-        best_idx = np.argmax(ei)
+        After each pick, the point is added to the GP as a fantasy observation
+        with the worst observed score, which pushes the next pick elsewhere.
+        Fantasies are dropped once the batch is complete.
+        """
+        # Random search for acquisition optimization
+        candidates = self._sample_candidates(self.n_candidates)
+        lie = (min(self.y) if maximize else max(self.y)) if self.y else best_y
 
-        return self._array_to_params(candidates[best_idx])
+        batch = []
+        try:
+            for _ in range(batch_size):
+                ei = self._expected_improvement(candidates, best_y, maximize)
+                best_idx = int(np.argmax(ei))
+                batch.append(self._array_to_params(candidates[best_idx]))
+
+                self._fantasy_X.append(candidates[best_idx])
+                self._fantasy_y.append(lie)
+                candidates = np.delete(candidates, best_idx, axis=0)
+        finally:
+            # Fantasy rows sit at the end of the factor; drop them with the fantasies
+            self._fantasy_X.clear()
+            self._fantasy_y.clear()
+            n_observed = len(self.X)
+            self._L = self._L[:n_observed, :n_observed]
+
+        return batch
+
+    def _evaluate_batch(
+        self,
+        objective_fn: Callable[[Dict[str, Any]], float],
+        batch: List[Dict[str, Any]],
+        batch_objective_fn: Optional[Callable[[List[Dict[str, Any]]], List[Optional[float]]]],
+    ) -> List[Optional[float]]:
+        """Score a batch; failed evaluations are None."""
+        if batch_objective_fn is not None:
+            return batch_objective_fn(batch)
+
+        scores: List[Optional[float]] = []
+        for params in batch:
+            try:
+                scores.append(objective_fn(params))
+            except Exception as e:
+                logger.error(f"Error evaluating params {params}: {e}")
+                scores.append(None)
+        return scores
 
     def optimize(
         self,
         objective_fn: Callable[[Dict[str, Any]], float],
         maximize: bool = True,
+        batch_objective_fn: Optional[Callable[[List[Dict[str, Any]]], List[Optional[float]]]] = None,
     ) -> OptimizationResult:
         """
         Run Bayesian optimization.
@@ -366,6 +487,9 @@ class BayesianOptimizer:
         Args:
             objective_fn: Function that takes params dict and returns score
             maximize: If True, maximize objective; else minimize
+            batch_objective_fn: Optional function scoring a whole batch at once
+                (e.g. running its simulations concurrently); returns one score
+                per params dict, None for failed evaluations
 
         Returns:
             OptimizationResult with best parameters found
@@ -373,40 +497,46 @@ class BayesianOptimizer:
         # Initial sampling
         initial_samples = self._sample_initial()
 
-        logger.info(f"Bayesian optimization: {self.n_initial} initial + {self.n_iterations} iterations")
+        logger.info(
+            f"Bayesian optimization: {self.n_initial} initial + {self.n_iterations} iterations "
+            f"(batch size {self.batch_size})"
+        )
 
         best_score = float('-inf') if maximize else float('inf')
         best_params = {}
         no_improvement_count = 0
 
-        for params in initial_samples:
-            try:
-                score = objective_fn(params)
-                self.X.append(self._params_to_array(params))
-                self.y.append(score)
-                self.history.append({"params": params, "score": score, "phase": "initial"})
+        scores = self._evaluate_batch(objective_fn, initial_samples, batch_objective_fn)
+        for params, score in zip(initial_samples, scores):
+            if score is None:
+                continue
+            self.X.append(self._params_to_array(params))
+            self.y.append(score)
+            self.history.append({"params": params, "score": score, "phase": "initial"})
+
+            if (maximize and score > best_score) or (not maximize and score < best_score):
+                best_score = score
+                best_params = params.copy()
+
+        # Bayesian optimization rounds, batch_size evaluations each
+        iteration = 0
+        while iteration < self.n_iterations:
+            batch_size = min(self.batch_size, self.n_iterations - iteration)
+            batch = self._propose_batch(best_score, maximize, batch_size)
+            scores = self._evaluate_batch(objective_fn, batch, batch_objective_fn)
+
+            for next_params, score in zip(batch, scores):
+                iteration += 1
+                if score is None:
+                    continue
 
-                if (maximize and score > best_score) or (not maximize and score < best_score):
-                    best_score = score
-                    best_params = params.copy()
-
-            except Exception as e:
-                logger.error(f"Error in initial evaluation: {e}")
-
-        # Bayesian optimization iterations
-        for iteration in range(self.n_iterations):
-            # Get next point
-            next_params = self._optimize_acquisition(best_score, maximize)
-
-            try:
-                score = objective_fn(next_params)
                 self.X.append(self._params_to_array(next_params))
                 self.y.append(score)
                 self.history.append({
                     "params": next_params,
                     "score": score,
                     "phase": "optimization",
-                    "iteration": iteration,
+                    "iteration": iteration - 1,
                 })
 
                 # Check improvement
@@ -418,7 +548,7 @@ class BayesianOptimizer:
                     best_params = next_params.copy()
                     no_improvement_count = 0
 
-                    logger.debug(f"Iteration {iteration}: New best score {best_score:.4f}")
+                    logger.debug(f"Iteration {iteration - 1}: New best score {best_score:.4f}")
 
                     # Check convergence
                     if improvement < self.convergence_threshold:
@@ -444,9 +574,6 @@ class BayesianOptimizer:
                         convergence_reason="patience_exceeded",
                     )
 
-            except Exception as e:
-                logger.error(f"Error in iteration {iteration}: {e}")
-
         return OptimizationResult(
             best_params=best_params,
             best_score=best_score,
@@ -458,15 +585,22 @@ class BayesianOptimizer:
 
     def suggest_next(self, maximize: bool = True) -> Dict[str, Any]:
         """Suggest next parameters to evaluate without running full optimization."""
+        return self.suggest_batch(1, maximize)[0]
+
+    def suggest_batch(self, batch_size: int, maximize: bool = True) -> List[Dict[str, Any]]:
+        """Suggest a batch of parameters to evaluate concurrently."""
         if len(self.y) == 0:
             # No observations yet, sample randomly
-            params = {}
-            for name, bounds in self.parameter_bounds.items():
-                params[name] = bounds.sample_uniform(self.rng)
-            return params
+            batch = []
+            for _ in range(batch_size):
+                params = {}
+                for name, bounds in self.parameter_bounds.items():
+                    params[name] = bounds.sample_uniform(self.rng)
+                batch.append(params)
+            return batch
 
         best_y = max(self.y) if maximize else min(self.y)
-        return self._optimize_acquisition(best_y, maximize)
+        return self._propose_batch(best_y, maximize, batch_size)
 
     def update(self, params: Dict[str, Any], score: float) -> None:
         """Add observation to GP model."""
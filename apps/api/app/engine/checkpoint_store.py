@@ -0,0 +1,346 @@
+"""
+Checkpoint Store for Predictive Simulation
+
+Bounded, delta-encoded storage of state array snapshots used by
+StateManager for checkpointing and rollback.
+
+- Checkpoints live in a ring of fixed capacity; the oldest is evicted
+  once capacity is reached
+- Each array is stored either in full (keyframe) or as the rows that
+  changed since the previous checkpoint, so unchanged state costs nothing
+- Lookup by step is a binary search over the ring
+- Once in-memory snapshot bytes exceed a budget, the oldest blocks are
+  spilled to a memory-mapped file and paged back in on demand
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import logging
+import os
+import tempfile
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Store a row delta only when it is smaller than this share of the array
+_MAX_DELTA_FRACTION = 0.5
+
+# Byte alignment of blocks in the spill file
+_SPILL_ALIGNMENT = 64
+
+
+@dataclass
+class ArrayBlock:
+    """One array of a checkpoint: full values, or changed rows since the previous one."""
+    values: np.ndarray
+    rows: Optional[np.ndarray] = None  # None for a full snapshot
+    spilled: bool = False
+
+    @property
+    def is_full(self) -> bool:
+        return self.rows is None
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + (0 if self.rows is None else self.rows.nbytes)
+
+
+@dataclass
+class Checkpoint:
+    """A materialized checkpoint returned by CheckpointStore.find."""
+    step: int
+    payload: Any
+    arrays: Dict[str, np.ndarray]
+
+
+@dataclass
+class _Entry:
+    step: int
+    payload: Any
+    blocks: Dict[str, ArrayBlock]
+
+
+def _changed_rows(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """Indices of first-axis rows whose bytes differ (NaN-safe)."""
+    n = current.shape[0]
+    a = np.ascontiguousarray(current).reshape(n, -1).view(np.uint8)
+    b = np.ascontiguousarray(previous).reshape(n, -1).view(np.uint8)
+    return np.flatnonzero((a != b).any(axis=1))
+
+
+class CheckpointStore:
+    """
+    Ring of delta-encoded array checkpoints ordered by step.
+
+    Arrays are copied into the store on save() and restored as fresh,
+    writable arrays by find(); callers never share buffers with it.
+    Saving a step at or before the newest stored step discards the newer
+    checkpoints (they belong to a timeline that was rolled back).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        keyframe_interval: int = 10,
+        byte_budget: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            capacity: Maximum number of checkpoints kept
+            keyframe_interval: Store every array in full at least once
+                per this many checkpoints (bounds restore cost)
+            byte_budget: In-memory snapshot bytes above which the oldest
+                blocks spill to disk (None: never spill)
+            spill_dir: Directory for the spill file (default: system temp)
+        """
+        self.capacity = max(1, capacity)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.byte_budget = byte_budget
+        self.spill_dir = spill_dir
+
+        # Ring storage: live entries are _entries[_start:], _steps mirrors steps
+        self._entries: List[_Entry] = []
+        self._steps: List[int] = []
+        self._start = 0
+        self._since_keyframe = 0
+
+        # Copy of the newest checkpoint's arrays, the base for the next delta
+        self._last: Optional[Dict[str, np.ndarray]] = None
+
+        self._spill_path: Optional[str] = None
+        self._spill_file = None
+        self._spill_size = 0
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._entries) - self._start
+
+    @property
+    def steps(self) -> List[int]:
+        return self._steps[self._start:]
+
+    @property
+    def nbytes(self) -> int:
+        """Snapshot bytes held in memory."""
+        return sum(
+            block.nbytes
+            for entry in self._live()
+            for block in entry.blocks.values()
+            if not block.spilled
+        )
+
+    @property
+    def spilled_bytes(self) -> int:
+        """Snapshot bytes held in the spill file."""
+        return sum(
+            block.nbytes
+            for entry in self._live()
+            for block in entry.blocks.values()
+            if block.spilled
+        )
+
+    def _live(self) -> List[_Entry]:
+        return self._entries[self._start:]
+
+    # =========================================================================
+    # Save
+    # =========================================================================
+
+    def save(self, step: int, arrays: Dict[str, np.ndarray], payload: Any = None) -> None:
+        """
+        Store a checkpoint of the given arrays.
+
+        Args:
+            step: Time step of the checkpoint
+            arrays: State arrays by name (copied; first axis is the row axis)
+            payload: Small opaque state stored as given (e.g. a GlobalState copy)
+        """
+        if len(self) and self._steps[-1] >= step:
+            self._truncate_from(step)
+
+        keyframe = (
+            self._last is None
+            or self._last.keys() != arrays.keys()
+            or self._since_keyframe + 1 >= self.keyframe_interval
+        )
+        blocks: Dict[str, ArrayBlock] = {}
+        last: Dict[str, np.ndarray] = {}
+        for name, values in arrays.items():
+            values = np.asarray(values)
+            previous = None if keyframe else self._last[name]
+            blocks[name] = self._encode(values, previous)
+            if previous is not None and not blocks[name].is_full:
+                previous[blocks[name].rows] = blocks[name].values
+                last[name] = previous
+            else:
+                last[name] = values.copy()
+
+        self._entries.append(_Entry(step=step, payload=payload, blocks=blocks))
+        self._steps.append(step)
+        self._last = last
+        self._since_keyframe = 0 if keyframe else self._since_keyframe + 1
+
+        while len(self) > self.capacity:
+            self._evict_oldest()
+        if self.byte_budget is not None and self.nbytes > self.byte_budget:
+            self._spill()
+
+    @staticmethod
+    def _encode(values: np.ndarray, previous: Optional[np.ndarray]) -> ArrayBlock:
+        if (
+            previous is None
+            or values.ndim == 0
+            or previous.shape != values.shape
+            or previous.dtype != values.dtype
+        ):
+            return ArrayBlock(values=values.copy())
+        rows = _changed_rows(values, previous)
+        if rows.size > _MAX_DELTA_FRACTION * values.shape[0]:
+            return ArrayBlock(values=values.copy())
+        return ArrayBlock(values=values[rows], rows=rows)
+
+    def _truncate_from(self, step: int) -> None:
+        """Drop checkpoints at or after ``step``."""
+        keep = bisect_right(self._steps, step - 1, lo=self._start)
+        del self._entries[keep:]
+        del self._steps[keep:]
+        self._last = None
+        self._since_keyframe = 0
+
+    # =========================================================================
+    # Eviction and spilling
+    # =========================================================================
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest checkpoint, folding it into the next one's deltas."""
+        oldest = self._entries[self._start]
+        self._entries[self._start] = None
+        self._start += 1
+
+        if len(self):
+            following = self._entries[self._start]
+            for name, block in following.blocks.items():
+                if block.is_full:
+                    continue
+                base = oldest.blocks[name]
+                values = np.array(base.values) if base.spilled else base.values
+                values[block.rows] = block.values
+                following.blocks[name] = ArrayBlock(values=values)
+
+        # Compact the ring storage once the dead prefix dominates
+        if self._start > self.capacity:
+            del self._entries[:self._start]
+            del self._steps[:self._start]
+            self._start = 0
+
+        if self._spill_file is not None and self._spill_size > 2 * self.spilled_bytes + (self.byte_budget or 0):
+            self._compact_spill()
+
+    def _spill(self) -> None:
+        """Move the oldest in-memory blocks to the spill file until under budget."""
+        excess = self.nbytes - self.byte_budget
+        for entry in self._live():
+            if excess <= 0:
+                break
+            for name, block in entry.blocks.items():
+                if block.spilled or block.nbytes == 0:
+                    continue
+                entry.blocks[name] = self._spill_block(block)
+                excess -= block.nbytes
+        if excess > 0:
+            logger.debug("Checkpoint store exceeds byte budget after spilling")
+
+    def _spill_block(self, block: ArrayBlock) -> ArrayBlock:
+        if self._spill_file is None:
+            fd, self._spill_path = tempfile.mkstemp(prefix="checkpoints-", suffix=".bin", dir=self.spill_dir)
+            self._spill_file = os.fdopen(fd, "w+b")
+            self._spill_size = 0
+        return ArrayBlock(
+            values=self._write(block.values),
+            rows=None if block.rows is None else self._write(block.rows),
+            spilled=True,
+        )
+
+    def _write(self, values: np.ndarray) -> np.ndarray:
+        if values.size == 0:
+            return values
+        offset = -(-self._spill_size // _SPILL_ALIGNMENT) * _SPILL_ALIGNMENT
+        self._spill_file.seek(offset)
+        self._spill_file.write(np.ascontiguousarray(values).tobytes())
+        self._spill_file.flush()
+        self._spill_size = offset + values.nbytes
+        return np.memmap(self._spill_path, dtype=values.dtype, mode="r", offset=offset, shape=values.shape)
+
+    def _compact_spill(self) -> None:
+        """Rewrite live spilled blocks into a fresh spill file."""
+        old_file, old_path = self._spill_file, self._spill_path
+        self._spill_file = None
+        for entry in self._live():
+            for name, block in entry.blocks.items():
+                if block.spilled:
+                    entry.blocks[name] = self._spill_block(block)
+        old_file.close()
+        os.unlink(old_path)  # Existing memmaps stay valid until released
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def find(self, target_step: Optional[int] = None) -> Optional[Checkpoint]:
+        """
+        Latest checkpoint at or before ``target_step`` (newest if None).
+
+        Returns:
+            The materialized checkpoint, or None if there is none
+        """
+        if not len(self):
+            return None
+        if target_step is None:
+            position = len(self._entries) - 1
+        else:
+            position = bisect_right(self._steps, target_step, lo=self._start) - 1
+            if position < self._start:
+                return None
+        entry = self._entries[position]
+        return Checkpoint(
+            step=entry.step,
+            payload=entry.payload,
+            arrays={name: self._materialize(position, name) for name in entry.blocks},
+        )
+
+    def _materialize(self, position: int, name: str) -> np.ndarray:
+        """Rebuild an array by replaying deltas from its latest full snapshot."""
+        base = position
+        while not self._entries[base].blocks[name].is_full:
+            base -= 1
+        values = np.array(self._entries[base].blocks[name].values)
+        for i in range(base + 1, position + 1):
+            block = self._entries[i].blocks[name]
+            values[block.rows] = block.values
+        return values
+
+    def clear(self) -> None:
+        """Drop all checkpoints and remove the spill file."""
+        self._entries = []
+        self._steps = []
+        self._start = 0
+        self._last = None
+        self._since_keyframe = 0
+        if self._spill_file is not None:
+            self._spill_file.close()
+            os.unlink(self._spill_path)
+            self._spill_file = None
+            self._spill_path = None
+            self._spill_size = 0
+
+    def __del__(self):
+        try:
+            self.clear()
+        except Exception:
+            pass
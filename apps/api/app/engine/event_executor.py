@@ -19,6 +19,8 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
+from app.engine.rng import CounterRNG
+
 
 class IntensityProfileType(str, Enum):
     """Intensity profile types for event effects over time."""
@@ -175,9 +177,34 @@ class ExecutionContext:
     rng_seed: int
     environment_state: Dict[str, Any] = field(default_factory=dict)
     agent_states: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Counter-based stream; None keeps the legacy SHA-256 derivation
+    rng: Optional[CounterRNG] = None
+    # Agent index in the run's kernel order; defaults to agent_states order
+    agent_indices: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.agent_indices:
+            self.agent_indices = {agent_id: i for i, agent_id in enumerate(self.agent_states)}
 
     def get_deterministic_random(self, event_id: str, agent_id: str = "") -> float:
-        """Get a deterministic random value for an event/agent combination."""
+        """
+        Get a deterministic random value for an event/agent combination.
+
+        With a counter-based stream, per-agent draws are addressed by the
+        agent's kernel index, so they equal the kernel's
+        rng.uniforms(indices, tick, "event:<event_id>") for that agent.
+        Event-level draws use their own "event:<event_id>:global" domain,
+        independent of every agent's draw.
+        """
+        if self.rng is not None:
+            domain = f"event:{event_id}"
+            if not agent_id:
+                return self.rng.uniform(0, self.current_tick, f"{domain}:global")
+            agent_index = self.agent_indices.get(agent_id)
+            if agent_index is None:
+                return self.rng.uniform(0, self.current_tick, f"{domain}:{agent_id}")
+            return self.rng.uniform(agent_index, self.current_tick, domain)
+
         import hashlib
         combined = f"{self.rng_seed}:{self.current_tick}:{event_id}:{agent_id}"
         hash_bytes = hashlib.sha256(combined.encode()).digest()
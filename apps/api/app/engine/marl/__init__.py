@@ -21,6 +21,11 @@ from app.engine.marl.experience_buffer import (
     Experience,
     Trajectory,
 )
+from app.engine.marl.environment import (
+    EnvConfig,
+    SimulationEnv,
+    VectorSimulationEnv,
+)
 
 __all__ = [
     "PolicyNetwork",
@@ -33,4 +38,7 @@ __all__ = [
     "ExperienceBuffer",
     "Experience",
     "Trajectory",
+    "EnvConfig",
+    "SimulationEnv",
+    "VectorSimulationEnv",
 ]
@@ -0,0 +1,372 @@
+"""
+Vectorized Simulation Environments for MARL Training
+
+Adapts SimulationLoop to the batched env interface PPOTrainer expects:
+reset() returns a (num_agents, state_dim) observation matrix and
+step(actions) advances every agent with one array call, returning
+(next_states, rewards, dones, info).
+
+SimulationEnv wraps one simulation. VectorSimulationEnv runs several
+copies in worker processes and concatenates them along the agent axis,
+so rollout collection for N copies costs about as much wall time as one.
+
+Either env plugs straight into PPOTrainer.train(env.step, env.reset, n)
+with PPOConfig.num_agents set to env.num_agents and PolicyConfig
+state_dim / action_dim set to env.state_dim / env.num_actions.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import multiprocessing
+
+import numpy as np
+
+from app.engine.action_space import ActionType
+from app.engine.simulation_loop import SimulationLoop
+from app.engine.workers import worker_processes_unavailable
+
+logger = logging.getLogger(__name__)
+
+StepResult = Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]
+
+
+@dataclass
+class EnvConfig:
+    """Configuration for a simulation environment."""
+
+    episode_length: Optional[int] = None  # Steps per episode (default: loop total_steps)
+    include_utilities: bool = True  # Add behavioral utilities to observations
+    include_issues: bool = True  # Add issue priorities to observations
+    seed: Optional[int] = None  # Seeds NumPy's global RNG, which the loop draws from
+
+
+class SimulationEnv:
+    """
+    Multi-agent environment over a SimulationLoop's state matrices.
+
+    Observations are the concatenation of each agent's preferences,
+    behavioral decision utilities (BehavioralModel via the loop), scalar
+    states and issue priorities. Policy actions replace the loop's
+    behavioral decisions; their effects are applied with the loop's
+    vectorized action processing and rewarded with the loop's
+    RewardFunction. Every agent finishes its episode together; the
+    environment then resets itself and returns the first observation of
+    the next episode, so step() can be called indefinitely.
+    """
+
+    def __init__(self, loop: SimulationLoop, config: Optional[EnvConfig] = None):
+        """
+        Initialize environment.
+
+        Args:
+            loop: Simulation loop with an initialized StateManager; its
+                current state is the start state of every episode
+            config: Environment configuration
+        """
+        self.loop = loop
+        self.config = config or EnvConfig()
+        self.state_manager = loop.state_manager
+        self.episode_length = self.config.episode_length or loop.config.total_steps
+
+        if self.config.seed is not None:
+            np.random.seed(self.config.seed)
+
+        # Vote actions in order name the preference columns (vote index = choice index)
+        self.option_names = [
+            action.effects.get("choice", index)
+            for index, action in enumerate(loop.action_space.actions)
+            if action.action_type == ActionType.VOTE
+        ]
+
+        self._initial_state = self.state_manager.snapshot()
+        self._scheduled_events = list(loop.scheduled_events)
+        self._context: Dict[str, Any] = {}
+        self.episode_step = 0
+
+    @property
+    def num_agents(self) -> int:
+        return self.state_manager.agent_count
+
+    @property
+    def num_actions(self) -> int:
+        return self.loop.action_space.n
+
+    @property
+    def state_dim(self) -> int:
+        state = self.state_manager
+        dim = state.preferences_matrix.shape[1] + state.scalar_states.shape[1]
+        if self.config.include_utilities:
+            dim += state.preferences_matrix.shape[1]
+        if self.config.include_issues:
+            dim += state.issue_priorities_matrix.shape[1]
+        return dim
+
+    def reset(self) -> np.ndarray:
+        """
+        Restore the start state and begin a new episode.
+
+        Returns:
+            Observations, shape (num_agents, state_dim)
+        """
+        self.state_manager.restore(self._initial_state)
+        self.loop.scheduled_events = list(self._scheduled_events)
+        self.episode_step = 0
+        return self._observe()
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        """
+        Apply one action per agent and advance the simulation one step.
+
+        Args:
+            actions: Shape (num_agents,) - action indices
+
+        Returns:
+            Tuple of (next_states, rewards, dones, info)
+        """
+        state = self.state_manager
+        actions = np.asarray(actions, dtype=np.int64)
+
+        states_before = {
+            "committed_choice": state.committed_choices.copy(),
+            "information_level": state.scalar_states[:, 3].copy(),
+        }
+        actions_taken, commitments_made, _ = self.loop._apply_actions(actions)
+        states_after = {
+            "preferences": state.preferences_matrix,
+            "committed_choice": state.committed_choices,
+            "information_level": state.scalar_states[:, 3],
+        }
+
+        context = {"peer_support": self._peer_support(actions)}
+        rewards, _ = self.loop.reward_function.compute_batch_rewards_from_arrays(
+            actions,
+            self.loop.action_space,
+            states_before,
+            states_after,
+            context,
+            option_names=self.option_names,
+        )
+        rewards = rewards.astype(np.float32)
+
+        state.record_actions(np.arange(self.num_agents), actions, rewards)
+        aggregates = state.compute_global_aggregates()
+        state.advance_time_step()
+        self.episode_step += 1
+
+        info = {
+            "episode_step": self.episode_step,
+            "actions_taken": actions_taken,
+            "commitments_made": commitments_made,
+            "choice_distribution": aggregates.get("choice_distribution", {}),
+        }
+
+        done = self.episode_step >= self.episode_length
+        dones = np.full(self.num_agents, done, dtype=np.bool_)
+        next_states = self.reset() if done else self._observe()
+        return next_states, rewards, dones, info
+
+    def _observe(self) -> np.ndarray:
+        """Apply this step's events and build observations."""
+        state = self.state_manager
+        step = state.global_state.time_step
+        self.loop._apply_events(step)
+
+        parts = [state.preferences_matrix]
+        if self.config.include_utilities:
+            utilities, self._context = self.loop._compute_adjusted_utilities(step)
+            parts.append(utilities)
+        else:
+            self._context = self.loop._build_decision_context(step)
+        parts.append(state.scalar_states)
+        if self.config.include_issues:
+            parts.append(state.issue_priorities_matrix)
+
+        return np.concatenate(parts, axis=1).astype(np.float32)
+
+    def _peer_support(self, actions: np.ndarray) -> np.ndarray:
+        """Fraction of each agent's observed peers committed to its chosen option."""
+        peer_choices = self._context.get("peer_choices")
+        if peer_choices is None or peer_choices.size == 0:
+            return np.zeros(len(actions))
+
+        effects = self.loop.action_effects
+        num_options = self.state_manager.preferences_matrix.shape[1]
+        defined = (actions >= 0) & (actions < effects.num_actions)
+        voting = defined & effects.vote[np.where(defined, actions, 0)] & (actions < num_options)
+        choice = np.where(voting, actions, -1)
+        valid = peer_choices >= 0
+        agree = valid & (peer_choices == choice[:, None]) & (choice[:, None] >= 0)
+        return agree.sum(axis=1) / np.maximum(valid.sum(axis=1), 1)
+
+
+class _InProcessRemote:
+    """Pipe stand-in that runs commands on a local env."""
+
+    def __init__(self, env_fn: Callable[[], SimulationEnv]):
+        self.env = env_fn()
+        self._result: Any = None
+
+    def send(self, message: Tuple[str, Any]) -> None:
+        command, data = message
+        if command == "step":
+            self._result = self.env.step(data)
+        elif command == "reset":
+            self._result = self.env.reset()
+        elif command == "spec":
+            self._result = (self.env.num_agents, self.env.state_dim, self.env.num_actions)
+
+    def recv(self) -> Any:
+        return self._result
+
+    def close(self) -> None:
+        pass
+
+
+def _env_worker(remote, parent_remote, env_fn: Callable[[], SimulationEnv]) -> None:
+    """Worker process loop: build the env, then serve reset/step commands."""
+    parent_remote.close()
+    try:
+        env = _InProcessRemote(env_fn)
+        while True:
+            command, data = remote.recv()
+            if command == "close":
+                break
+            env.send((command, data))
+            remote.send(env.recv())
+    except (EOFError, KeyboardInterrupt):
+        pass
+    except Exception as e:
+        # Report the failure instead of leaving the parent waiting on the pipe
+        remote.send(e)
+    finally:
+        remote.close()
+
+
+class VectorSimulationEnv:
+    """
+    N simulation copies stepped in parallel, one worker process each.
+
+    Agents of all copies are stacked along the first axis, so a trainer
+    with num_agents = num_envs * agents_per_env sees one large population.
+    Commands are sent to every worker before any reply is read, so the
+    copies step concurrently.
+
+    env_fns must be picklable (module-level functions or functools.partial
+    of them) and each should build its own SimulationEnv with a distinct
+    seed. Unpicklable factories, or calls from daemonic processes that
+    cannot start children, run the copies in-process instead.
+    """
+
+    def __init__(
+        self,
+        env_fns: List[Callable[[], SimulationEnv]],
+        mp_context: str = "spawn",
+    ):
+        """
+        Initialize vectorized environment.
+
+        Args:
+            env_fns: One factory per environment copy
+            mp_context: multiprocessing start method for workers
+        """
+        if not env_fns:
+            raise ValueError("VectorSimulationEnv needs at least one environment")
+
+        self.num_envs = len(env_fns)
+        self._processes: List[multiprocessing.Process] = []
+        self._closed = False
+
+        if worker_processes_unavailable(
+            "running environments in-process", environment_factories=env_fns,
+        ):
+            self._remotes = [_InProcessRemote(env_fn) for env_fn in env_fns]
+        else:
+            ctx = multiprocessing.get_context(mp_context)
+            self._remotes = []
+            for env_fn in env_fns:
+                remote, worker_remote = ctx.Pipe()
+                process = ctx.Process(
+                    target=_env_worker, args=(worker_remote, remote, env_fn), daemon=True,
+                )
+                process.start()
+                worker_remote.close()
+                self._remotes.append(remote)
+                self._processes.append(process)
+
+        specs = self._broadcast("spec", [None] * self.num_envs)
+        self.agents_per_env = [num_agents for num_agents, _, _ in specs]
+        if len({dims[1:] for dims in specs}) != 1:
+            raise ValueError("All environments must have the same state_dim and num_actions")
+        _, self.state_dim, self.num_actions = specs[0]
+        self._offsets = np.cumsum([0] + self.agents_per_env)
+
+    @property
+    def num_agents(self) -> int:
+        return int(self._offsets[-1])
+
+    def _broadcast(self, command: str, payloads: List[Any]) -> List[Any]:
+        for remote, payload in zip(self._remotes, payloads):
+            remote.send((command, payload))
+        replies = [remote.recv() for remote in self._remotes]
+        for reply in replies:
+            if isinstance(reply, Exception):
+                self.close()
+                raise RuntimeError(f"Environment worker failed: {reply!r}") from reply
+        return replies
+
+    def reset(self) -> np.ndarray:
+        """
+        Reset every copy.
+
+        Returns:
+            Observations, shape (num_agents, state_dim)
+        """
+        return np.concatenate(self._broadcast("reset", [None] * self.num_envs))
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        """
+        Step every copy with its slice of the actions.
+
+        Args:
+            actions: Shape (num_agents,) - action indices for all copies
+
+        Returns:
+            Tuple of (next_states, rewards, dones, info); info["envs"] holds
+            each copy's info dict
+        """
+        actions = np.asarray(actions)
+        chunks = [
+            actions[self._offsets[i]:self._offsets[i + 1]] for i in range(self.num_envs)
+        ]
+        results = self._broadcast("step", chunks)
+
+        next_states, rewards, dones, infos = zip(*results)
+        return (
+            np.concatenate(next_states),
+            np.concatenate(rewards),
+            np.concatenate(dones),
+            {"envs": list(infos)},
+        )
+
+    def close(self) -> None:
+        """Stop worker processes."""
+        if self._closed:
+            return
+        self._closed = True
+        for remote in self._remotes:
+            try:
+                remote.send(("close", None))
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            remote.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def __enter__(self) -> "VectorSimulationEnv":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
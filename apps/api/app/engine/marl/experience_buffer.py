@@ -130,6 +130,73 @@ class Trajectory:
         return advantages
 
 
+class SumTree:
+    """
+    Binary sum tree over a fixed number of leaves.
+
+    Leaf i holds a non-negative weight; each internal node holds the sum of
+    its children, so the total is at the root. Updates and prefix-sum
+    lookups touch one node per level, O(log n), and both are vectorized
+    over batches of leaves or targets.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.n_leaves = 1 << max(0, int(np.ceil(np.log2(max(capacity, 1)))))
+        self.depth = int(np.log2(self.n_leaves))
+        # Node 1 is the root; leaves are nodes n_leaves .. 2 * n_leaves - 1
+        self.tree = np.zeros(2 * self.n_leaves, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        """Leaf weights."""
+        return self.tree[np.asarray(indices) + self.n_leaves]
+
+    def update(self, indices: np.ndarray, weights: np.ndarray) -> None:
+        """
+        Set leaf weights and refresh their ancestors.
+
+        With repeated indices the last weight wins.
+        """
+        nodes = np.asarray(indices, dtype=np.int64) + self.n_leaves
+        self.tree[nodes] = weights
+
+        nodes = np.unique(nodes // 2)
+        while nodes[0] >= 1:
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+            if nodes[0] == 1:
+                break
+            nodes = np.unique(nodes // 2)
+
+    def find(self, targets: np.ndarray) -> np.ndarray:
+        """
+        Leaves whose cumulative-weight interval contains each target.
+
+        Args:
+            targets: Values in [0, total)
+
+        Returns:
+            Leaf indices, same shape as targets
+        """
+        targets = np.array(targets, dtype=np.float64)
+        nodes = np.ones(targets.shape, dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = targets >= left_sum
+            targets = np.where(go_right, targets - left_sum, targets)
+            nodes = np.where(go_right, left + 1, left)
+
+        # Rounding can walk past the last non-empty leaf
+        return np.minimum(nodes - self.n_leaves, self.capacity - 1)
+
+    def clear(self) -> None:
+        self.tree.fill(0.0)
+
+
 class ExperienceBuffer:
     """
     Buffer for storing and sampling agent experiences.
@@ -151,7 +218,8 @@ class ExperienceBuffer:
             capacity: Maximum buffer size
             state_dim: Dimension of state vectors
             num_agents: Number of agents (for multi-agent)
-            prioritized: Use prioritized experience replay
+            prioritized: Use prioritized experience replay, sampled from a
+                sum tree of priority ** alpha
             priority_alpha: Priority exponent
         """
         self.capacity = capacity
@@ -181,6 +249,7 @@ class ExperienceBuffer:
         if prioritized:
             self.priorities = np.zeros(capacity, dtype=np.float32)
             self.max_priority = 1.0
+            self.priority_tree = SumTree(capacity)
 
         # Buffer state
         self.position = 0
@@ -229,7 +298,7 @@ class ExperienceBuffer:
         self.time_steps[idx] = time_step
 
         if self.prioritized:
-            self.priorities[idx] = self.max_priority
+            self._set_priorities(np.array([idx]), np.array([self.max_priority]))
 
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
@@ -281,9 +350,6 @@ class ExperienceBuffer:
                 self.agent_ids[self.position:end_idx] = agent_ids
 
             self.time_steps[self.position:end_idx] = time_step
-
-            if self.prioritized:
-                self.priorities[self.position:end_idx] = self.max_priority
         else:
             # Wraparound needed
             first_part = self.capacity - self.position
@@ -310,6 +376,10 @@ class ExperienceBuffer:
                 self.values[self.position:] = values[:first_part]
                 self.values[:second_part] = values[first_part:]
 
+        if self.prioritized:
+            written = (self.position + np.arange(batch_size)) % self.capacity
+            self._set_priorities(written, np.full(batch_size, self.max_priority))
+
         self.position = end_idx % self.capacity
         self.size = min(self.size + batch_size, self.capacity)
 
@@ -359,15 +429,23 @@ class ExperienceBuffer:
         batch_size: int,
         beta: float = 0.4,
     ) -> Dict[str, np.ndarray]:
-        """Sample with prioritized experience replay."""
-        priorities = self.priorities[:self.size]
-        probs = priorities ** self.priority_alpha
-        probs /= probs.sum()
+        """
+        Sample with prioritized experience replay.
 
-        indices = np.random.choice(self.size, batch_size, p=probs, replace=False)
+        Stratified: the total priority mass is split into batch_size equal
+        segments and one target is drawn uniformly from each, then located
+        in the sum tree in O(log n). High-priority experiences can appear
+        more than once in a batch.
+        """
+        total = self.priority_tree.total
+        segment = total / batch_size
+        targets = (np.arange(batch_size) + np.random.random(batch_size)) * segment
+        indices = self.priority_tree.find(np.minimum(targets, np.nextafter(total, 0)))
+        indices = np.minimum(indices, self.size - 1)
 
         # Importance sampling weights
-        weights = (self.size * probs[indices]) ** (-beta)
+        probs = self.priority_tree.get(indices) / total
+        weights = (self.size * probs) ** (-beta)
         weights /= weights.max()
 
         batch = self._get_batch(indices)
@@ -387,8 +465,12 @@ class ExperienceBuffer:
             return
 
         priorities = np.abs(td_errors) + epsilon
+        self._set_priorities(np.asarray(indices), priorities)
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+
+    def _set_priorities(self, indices: np.ndarray, priorities: np.ndarray) -> None:
         self.priorities[indices] = priorities
-        self.max_priority = max(self.max_priority, priorities.max())
+        self.priority_tree.update(indices, np.asarray(priorities, dtype=np.float64) ** self.priority_alpha)
 
     def _get_batch(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
         """Get batch by indices."""
@@ -505,6 +587,7 @@ class ExperienceBuffer:
         if self.prioritized:
             self.priorities.fill(0)
             self.max_priority = 1.0
+            self.priority_tree.clear()
 
     def __len__(self) -> int:
         return self.size
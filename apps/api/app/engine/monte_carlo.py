@@ -0,0 +1,450 @@
+"""
+Monte Carlo Replicates for SimulationLoop
+Reference: project.md §4.1
+
+Runs independent replicates of a configured SimulationLoop:
+- The loop's initial agent arrays are published once to shared memory;
+  every replicate builds its own StateManager from those read-only arrays,
+  so no state carries over between runs
+- Replicate i gets its own random stream, spawned from the master seed
+  with SeedSequence(seed, spawn_key=(i,)), so its result depends only on
+  the master seed and i, never on worker count or scheduling
+- Replicates run on a process pool and stream back as they finish
+- Optional early stopping once the 95% confidence interval of the mean
+  final distribution is narrower than a target width
+
+The loop's kernels draw through numpy's global random state, so a
+replicate seeds that (process-local) state from its stream before
+running. In-process runs restore the caller's global state afterwards.
+
+Early stopping only considers the contiguous prefix of replicates
+0..k-1, so where sampling stops and the aggregate it produces are the
+same for any worker count.
+"""
+
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from multiprocessing import shared_memory
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import copy
+import logging
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from app.engine.action_space import DiscreteActionSpace, RewardFunction
+from app.engine.behavioral_model import BehavioralModel
+from app.engine.simulation_loop import SimulationConfig, SimulationLoop, SimulationResult
+from app.engine.state_manager import GlobalState, StateManager
+from app.engine.workers import worker_processes_unavailable
+
+logger = logging.getLogger(__name__)
+
+
+# z-score of a two-sided 95% interval
+_Z_95 = 1.96
+
+# Byte alignment of each array in the shared block
+_ALIGNMENT = 8
+
+# Words of seed material drawn from a replicate's SeedSequence
+_SEED_WORDS = 8
+
+
+@dataclass
+class ReplicateResult:
+    """Result of one Monte Carlo replicate."""
+
+    index: int
+    result: SimulationResult
+    elapsed_seconds: float
+
+    @property
+    def final_distribution(self) -> Dict[str, float]:
+        return self.result.final_distribution
+
+
+@dataclass
+class ReplicateTemplate:
+    """Everything except the agent arrays needed to rebuild a fresh loop."""
+
+    config: SimulationConfig
+    behavioral_model: BehavioralModel
+    action_space: DiscreteActionSpace
+    reward_function: RewardFunction
+    scheduled_events: List[Tuple[int, Dict[str, Any]]]
+    agent_ids: List[UUID]
+    global_state: GlobalState
+    network_adjacency: Dict[int, List[Tuple[int, float]]]
+    region_agent_indices: Dict[str, List[int]]
+    demographic_indices: Dict[str, Dict[str, List[int]]]
+    manager_kwargs: Dict[str, Any]
+
+    @classmethod
+    def from_loop(cls, loop: SimulationLoop) -> Tuple["ReplicateTemplate", Dict[str, np.ndarray]]:
+        """Capture a loop's current state as the replicates' initial state."""
+        state = loop.state_manager
+        template = cls(
+            config=replace(loop.config, num_monte_carlo_runs=1),
+            behavioral_model=loop.behavioral_model,
+            action_space=loop.action_space,
+            reward_function=loop.reward_function,
+            scheduled_events=copy.deepcopy(loop.scheduled_events),
+            agent_ids=list(state.agent_ids),
+            global_state=copy.deepcopy(state.global_state),
+            network_adjacency=dict(state.network_adjacency),
+            region_agent_indices={k: list(v) for k, v in state.region_agent_indices.items()},
+            demographic_indices={
+                key: {value: list(indices) for value, indices in groups.items()}
+                for key, groups in state.demographic_indices.items()
+            },
+            manager_kwargs={
+                "max_agents": state.max_agents,
+                "checkpoint_interval": state.checkpoint_interval,
+                "max_checkpoints": state.max_checkpoints,
+                "preference_dimensions": state.preference_dimensions,
+                "issue_dimensions": state.issue_dimensions,
+            },
+        )
+        arrays = {
+            "preferences": state.preferences_matrix,
+            "issue_priorities": state.issue_priorities_matrix,
+            "scalar_states": state.scalar_states,
+        }
+        return template, arrays
+
+    def build_loop(self, arrays: Dict[str, np.ndarray]) -> SimulationLoop:
+        """A new loop with freshly initialized state and models (arrays are copied)."""
+        manager = StateManager(**self.manager_kwargs)
+        manager.initialize(
+            agent_ids=list(self.agent_ids),
+            initial_preferences=arrays["preferences"],
+            initial_issue_priorities=arrays["issue_priorities"],
+            initial_scalar_states=arrays["scalar_states"],
+            global_state=copy.deepcopy(self.global_state),
+        )
+        manager.set_network_adjacency(self.network_adjacency)
+        manager.region_agent_indices = defaultdict(
+            list, {k: list(v) for k, v in self.region_agent_indices.items()}
+        )
+        for key, groups in self.demographic_indices.items():
+            for value, indices in groups.items():
+                manager.demographic_indices[key][value] = list(indices)
+
+        loop = SimulationLoop(
+            config=self.config,
+            state_manager=manager,
+            behavioral_model=copy.deepcopy(self.behavioral_model),
+            action_space=copy.deepcopy(self.action_space),
+            reward_function=copy.deepcopy(self.reward_function),
+        )
+        for step, event in copy.deepcopy(self.scheduled_events):
+            loop.schedule_event(step, event)
+        return loop
+
+
+def replicate_seed(master_seed: int, index: int) -> np.random.SeedSequence:
+    """Independent stream of replicate ``index`` under ``master_seed``."""
+    return np.random.SeedSequence(master_seed, spawn_key=(index,))
+
+
+async def run_replicate(
+    template: ReplicateTemplate,
+    arrays: Dict[str, np.ndarray],
+    master_seed: int,
+    index: int,
+) -> ReplicateResult:
+    """Run one replicate in the current process."""
+    start = time.perf_counter()
+    np.random.seed(replicate_seed(master_seed, index).generate_state(_SEED_WORDS))
+    result = await template.build_loop(arrays).run()
+    return ReplicateResult(
+        index=index,
+        result=result,
+        elapsed_seconds=time.perf_counter() - start,
+    )
+
+
+def confidence_interval_width(distributions: List[Dict[str, float]]) -> float:
+    """
+    Widest 95% confidence interval of the mean share over all options.
+
+    Returns:
+        Interval width (inf with fewer than two distributions)
+    """
+    if len(distributions) < 2:
+        return float("inf")
+    keys = sorted({key for d in distributions for key in d}, key=str)
+    if not keys:
+        return 0.0
+    values = np.array([[d.get(key, 0.0) for key in keys] for d in distributions])
+    std_error = values.std(axis=0, ddof=1) / np.sqrt(len(distributions))
+    return float(2 * _Z_95 * std_error.max())
+
+
+def aggregate_replicates(replicates: List[ReplicateResult]) -> SimulationResult:
+    """
+    Combine replicates into one result.
+
+    The lowest-index replicate is the base result; Monte Carlo mean, std and
+    mean ± 1.96 std intervals are computed over all final distributions.
+    """
+    replicates = sorted(replicates, key=lambda r: r.index)
+    final_result = replicates[0].result
+    all_distributions = [r.final_distribution for r in replicates]
+
+    all_keys = set()
+    for d in all_distributions:
+        all_keys.update(d.keys())
+
+    mc_mean = {}
+    mc_std = {}
+    for key in all_keys:
+        values = [d.get(key, 0) for d in all_distributions]
+        mc_mean[key] = float(np.mean(values))
+        mc_std[key] = float(np.std(values))
+
+    final_result.monte_carlo_distributions = all_distributions
+    final_result.monte_carlo_mean = mc_mean
+    final_result.monte_carlo_std = mc_std
+
+    # Update confidence intervals with Monte Carlo data
+    for key in all_keys:
+        ci_low = mc_mean[key] - _Z_95 * mc_std[key]
+        ci_high = mc_mean[key] + _Z_95 * mc_std[key]
+        final_result.confidence_intervals[key] = (max(0, ci_low), min(1, ci_high))
+
+    return final_result
+
+
+# =============================================================================
+# Shared memory
+# =============================================================================
+
+class SharedInitialArrays:
+    """
+    Initial agent arrays published in one shared-memory block.
+
+    ``descriptor`` is a small picklable description (block name and array
+    layout) from which workers attach read-only views with
+    attach_initial_arrays().
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        layout = []
+        offset = 0
+        for name, values in arrays.items():
+            layout.append((name, offset, values.shape, values.dtype.str))
+            offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self._layout = layout
+        for name, view in _views(self._shm, layout).items():
+            view[...] = arrays[name]
+
+    @property
+    def descriptor(self) -> Tuple[str, List[Tuple[str, int, Tuple[int, ...], str]]]:
+        return self._shm.name, self._layout
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _views(shm: shared_memory.SharedMemory, layout) -> Dict[str, np.ndarray]:
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, offset, shape, dtype in layout
+    }
+
+
+def attach_initial_arrays(descriptor) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+    """Read-only views on a published shared-memory block."""
+    name, layout = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    views = _views(shm, layout)
+    for view in views.values():
+        view.flags.writeable = False
+    return shm, views
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+# Per-process state set by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(descriptor, template: ReplicateTemplate, master_seed: int) -> None:
+    shm, arrays = attach_initial_arrays(descriptor)
+    _worker.update(shm=shm, arrays=arrays, template=template, master_seed=master_seed)
+
+
+def _run_replicate(index: int) -> ReplicateResult:
+    return asyncio.run(run_replicate(
+        _worker["template"], _worker["arrays"], _worker["master_seed"], index
+    ))
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+class MonteCarloRunner:
+    """
+    Runs Monte Carlo replicates of a SimulationLoop.
+
+    With ``workers`` > 1 replicates run on a process pool attached to the
+    shared initial arrays; otherwise (or where child processes cannot be
+    started, e.g. inside a daemonic Celery worker) they run in-process one
+    after another. Either way each replicate's result is the same. The
+    loop passed in is only read, never run.
+    """
+
+    def __init__(
+        self,
+        loop: SimulationLoop,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        ci_target: Optional[float] = None,
+        min_runs: int = 10,
+        mp_context: str = "spawn",
+    ):
+        """
+        Initialize Monte Carlo runner.
+
+        Args:
+            loop: Configured loop whose current state is the initial state
+            workers: Worker processes (defaults to the CPU count)
+            seed: Master seed (drawn from OS entropy when omitted)
+            ci_target: Stop once the widest 95% CI of the mean final
+                distribution is at most this width
+            min_runs: Replicates required before early stopping applies
+            mp_context: multiprocessing start method for the pool
+        """
+        self.template, self._arrays = ReplicateTemplate.from_loop(loop)
+        self.workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self.seed = int(seed if seed is not None else np.random.SeedSequence().entropy)
+        self.ci_target = ci_target
+        self.min_runs = max(2, min_runs)
+        self.mp_context = mp_context
+
+        # Set while streaming: contiguous replicates accepted so far
+        self.accepted: List[ReplicateResult] = []
+        self.stopped_early = False
+
+    def _accept(self, finished: Dict[int, ReplicateResult]) -> bool:
+        """
+        Extend the accepted prefix with finished replicates.
+
+        Returns:
+            True once the early-stopping target is met
+        """
+        while len(self.accepted) in finished:
+            self.accepted.append(finished.pop(len(self.accepted)))
+            if (
+                self.ci_target is not None
+                and len(self.accepted) >= self.min_runs
+                and confidence_interval_width(
+                    [r.final_distribution for r in self.accepted]
+                ) <= self.ci_target
+            ):
+                return True
+        return False
+
+    async def stream(self, num_runs: int) -> AsyncGenerator[ReplicateResult, None]:
+        """
+        Run up to ``num_runs`` replicates, yielding each as it finishes.
+
+        Replicates that finish after the early-stopping point are still
+        yielded but are not part of ``accepted``.
+        """
+        self.accepted = []
+        self.stopped_early = False
+        finished: Dict[int, ReplicateResult] = {}
+        workers = min(self.workers, num_runs)
+
+        if workers > 1 and worker_processes_unavailable(
+            "running replicates in-process", simulation_template=self.template,
+        ):
+            workers = 1
+
+        if workers <= 1:
+            saved_state = np.random.get_state()
+            try:
+                for index in range(num_runs):
+                    replicate = await run_replicate(self.template, self._arrays, self.seed, index)
+                    finished[index] = replicate
+                    self.stopped_early = self._accept(finished)
+                    yield replicate
+                    if self.stopped_early:
+                        break
+            finally:
+                np.random.set_state(saved_state)
+            return
+
+        shared = SharedInitialArrays(self._arrays)
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(self.mp_context),
+            initializer=_init_worker,
+            initargs=(shared.descriptor, self.template, self.seed),
+        )
+        try:
+            # Keep a bounded number in flight so early stopping wastes little work
+            pending: Dict[asyncio.Future, int] = {}
+            next_index = 0
+            while next_index < num_runs or pending:
+                while next_index < num_runs and len(pending) < 2 * workers and not self.stopped_early:
+                    future: Future = pool.submit(_run_replicate, next_index)
+                    pending[asyncio.wrap_future(future)] = next_index
+                    next_index += 1
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.pop(future)
+                    replicate = future.result()
+                    if not self.stopped_early:
+                        finished[replicate.index] = replicate
+                        self.stopped_early = self._accept(finished)
+                    yield replicate
+
+                if self.stopped_early:
+                    for future in pending:
+                        future.cancel()
+                    break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            shared.close()
+
+    async def run(self, num_runs: int) -> SimulationResult:
+        """
+        Run replicates and aggregate the accepted ones.
+
+        Returns:
+            Result of replicate 0 with Monte Carlo statistics attached
+        """
+        start = time.perf_counter()
+        async for replicate in self.stream(num_runs):
+            logger.info(
+                f"Monte Carlo replicate {replicate.index + 1}/{num_runs} finished "
+                f"in {replicate.elapsed_seconds:.2f}s"
+            )
+
+        if not self.accepted:
+            raise RuntimeError("No Monte Carlo replicates completed")
+
+        logger.info(
+            f"Monte Carlo aggregated {len(self.accepted)} replicates (seed {self.seed}, "
+            f"{'stopped early, ' if self.stopped_early else ''}"
+            f"{time.perf_counter() - start:.2f}s)"
+        )
+        return aggregate_replicates(self.accepted)
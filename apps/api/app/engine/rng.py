@@ -0,0 +1,201 @@
+"""
+Counter-Based Deterministic RNG
+Reference: project.md §10.1, P0-003 (RNG policy)
+
+Implements:
+- Philox4x32-10 counter-based generator keyed by the run seed
+- Random values addressed by (agent index, tick, domain, draw), so any
+  value can be produced independently and whole arrays in one call
+- Algorithm selection with a SHA-256 compatibility mode, so runs recorded
+  before the counter-based stream still replay bit for bit
+
+Call sites keep their SHA-256 derivation for RNGAlgorithm.SHA256 and use
+CounterRNG for RNGAlgorithm.PHILOX.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+import hashlib
+
+import numpy as np
+
+
+class RNGAlgorithm(str, Enum):
+    """Random stream algorithms recorded in a run's seed_config."""
+    SHA256 = "sha256"   # Legacy per-call SHA-256 derivation (compatibility)
+    PHILOX = "philox"   # Counter-based Philox4x32-10
+
+
+# Runs whose seed_config has no rng_algorithm predate the counter-based stream
+LEGACY_RNG_ALGORITHM = RNGAlgorithm.SHA256
+
+# Algorithm recorded for newly created runs
+DEFAULT_RNG_ALGORITHM = RNGAlgorithm.PHILOX
+
+# Philox4x32-10 constants (Salmon et al., "Parallel Random Numbers: As Easy as 1, 2, 3")
+_PHILOX_M0 = 0xD2511F53
+_PHILOX_M1 = 0xCD9E8D57
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_PHILOX_ROUNDS = 10
+_MASK32 = 0xFFFFFFFF
+
+# Uniforms use the top 53 bits of a 64-bit output word
+_UNIFORM_SCALE = 2.0 ** -53
+
+
+def resolve_rng_algorithm(seed_config: Optional[Dict]) -> RNGAlgorithm:
+    """Algorithm for a run, defaulting to the legacy stream when unrecorded."""
+    value = (seed_config or {}).get("rng_algorithm")
+    if value is None:
+        return LEGACY_RNG_ALGORITHM
+    return RNGAlgorithm(value)
+
+
+def create_counter_rng(
+    seed: int,
+    seed_config: Optional[Dict],
+    num_agents: Optional[int] = None,
+) -> Optional["CounterRNG"]:
+    """Counter-based stream for a run, or None when it uses the legacy stream."""
+    if resolve_rng_algorithm(seed_config) != RNGAlgorithm.PHILOX:
+        return None
+    return CounterRNG(seed, num_agents=num_agents)
+
+
+@lru_cache(maxsize=4096)
+def domain_key(domain: str) -> int:
+    """Stable 32-bit key for a domain label (hashed once per label)."""
+    return int.from_bytes(hashlib.sha256(domain.encode()).digest()[:4], "big")
+
+
+def philox4x32(counters: np.ndarray, key: Tuple[int, int]) -> np.ndarray:
+    """
+    Philox4x32-10 block function over an array of counters.
+
+    Args:
+        counters: (n, 4) array of 32-bit counter words
+        key: Two 32-bit key words
+
+    Returns:
+        (n, 4) uint32 array of output words
+    """
+    counters = np.asarray(counters, dtype=np.uint64)
+    c0, c1, c2, c3 = (counters[:, i] for i in range(4))
+    k0, k1 = key
+    m0, m1, mask = np.uint64(_PHILOX_M0), np.uint64(_PHILOX_M1), np.uint64(_MASK32)
+    shift = np.uint64(32)
+
+    for round_index in range(_PHILOX_ROUNDS):
+        if round_index:
+            k0 = (k0 + _PHILOX_W0) & _MASK32
+            k1 = (k1 + _PHILOX_W1) & _MASK32
+        p0 = m0 * c0
+        p1 = m1 * c2
+        c0, c1, c2, c3 = (
+            (p1 >> shift) ^ c1 ^ np.uint64(k0),
+            p1 & mask,
+            (p0 >> shift) ^ c3 ^ np.uint64(k1),
+            p0 & mask,
+        )
+
+    return np.stack([c0, c1, c2, c3], axis=1).astype(np.uint32)
+
+
+def _philox4x32_scalar(
+    c0: int, c1: int, c2: int, c3: int, k0: int, k1: int
+) -> Tuple[int, int, int, int]:
+    """Pure-Python Philox4x32-10 for a single counter."""
+    for round_index in range(_PHILOX_ROUNDS):
+        if round_index:
+            k0 = (k0 + _PHILOX_W0) & _MASK32
+            k1 = (k1 + _PHILOX_W1) & _MASK32
+        p0 = _PHILOX_M0 * c0
+        p1 = _PHILOX_M1 * c2
+        c0, c1, c2, c3 = (p1 >> 32) ^ c1 ^ k0, p1 & _MASK32, (p0 >> 32) ^ c3 ^ k1, p0 & _MASK32
+    return c0, c1, c2, c3
+
+
+class CounterRNG:
+    """
+    Counter-based random stream for a run.
+
+    Every value is a pure function of (seed, agent index, tick, domain,
+    draw), so results do not depend on evaluation order, batching or
+    worker count. Uniforms for a whole population are produced by one
+    vectorized Philox call.
+
+    When ``num_agents`` is given, scalar lookups are served from a block
+    of uniforms generated for the whole population on first use of a
+    (tick, domain, draw) triple; only the current tick's blocks are kept.
+    """
+
+    def __init__(self, seed: int, num_agents: Optional[int] = None):
+        self.seed = seed
+        self.num_agents = num_agents
+        self._key = (seed & _MASK32, (seed >> 32) & _MASK32)
+        self._block_tick: Optional[int] = None
+        self._blocks: Dict[Tuple[int, int], np.ndarray] = {}
+
+    @property
+    def algorithm(self) -> RNGAlgorithm:
+        return RNGAlgorithm.PHILOX
+
+    def random_words(
+        self,
+        agent_indices: np.ndarray,
+        tick: int,
+        domain: Union[str, int],
+        draw: int = 0,
+    ) -> np.ndarray:
+        """Raw (n, 4) uint32 Philox output for each agent index."""
+        agent_indices = np.asarray(agent_indices, dtype=np.uint64)
+        counters = np.empty((agent_indices.size, 4), dtype=np.uint64)
+        counters[:, 0] = agent_indices & np.uint64(_MASK32)
+        counters[:, 1] = tick & _MASK32
+        counters[:, 2] = domain if isinstance(domain, int) else domain_key(domain)
+        counters[:, 3] = draw & _MASK32
+        return philox4x32(counters, self._key)
+
+    def uniforms(
+        self,
+        agent_indices: np.ndarray,
+        tick: int,
+        domain: Union[str, int],
+        draw: int = 0,
+    ) -> np.ndarray:
+        """Uniform floats in [0, 1), one per agent index."""
+        words = self.random_words(agent_indices, tick, domain, draw).astype(np.uint64)
+        bits = (words[:, 0] << np.uint64(32)) | words[:, 1]
+        return (bits >> np.uint64(11)).astype(np.float64) * _UNIFORM_SCALE
+
+    def uniform(
+        self,
+        agent_index: int,
+        tick: int,
+        domain: Union[str, int],
+        draw: int = 0,
+    ) -> float:
+        """A single uniform float in [0, 1); equal to the matching uniforms() entry."""
+        key = domain if isinstance(domain, int) else domain_key(domain)
+
+        if self.num_agents is not None and 0 <= agent_index < self.num_agents:
+            if tick != self._block_tick:
+                self._block_tick = tick
+                self._blocks.clear()
+            block = self._blocks.get((key, draw))
+            if block is None:
+                block = self.uniforms(np.arange(self.num_agents), tick, key, draw)
+                self._blocks[(key, draw)] = block
+            return float(block[agent_index])
+
+        w0, w1, _, _ = _philox4x32_scalar(
+            agent_index & _MASK32, tick & _MASK32, key, draw & _MASK32, *self._key
+        )
+        return (((w0 << 32) | w1) >> 11) * _UNIFORM_SCALE
+
+    def derive_seed(self, domain: str) -> int:
+        """Derive a 32-bit sub-seed for a domain (independent sub-streams)."""
+        w0, _, _, _ = _philox4x32_scalar(0, 0, domain_key(domain), 0, *self._key)
+        return w0
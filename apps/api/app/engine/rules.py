@@ -18,6 +18,10 @@ from uuid import UUID
 import hashlib
 import math
 
+import numpy as np
+
+from app.engine.rng import CounterRNG
+
 
 class RulePhase(str, Enum):
     """Phases in the agent lifecycle where rules can be inserted."""
@@ -59,8 +63,11 @@ class RuleContext:
     social_signals: Dict[str, float] = field(default_factory=dict)
     peer_states: List[Dict[str, Any]] = field(default_factory=list)
 
-    # Random source (seeded)
+    # Random source (seeded). With a counter-based stream, values are keyed
+    # by agent_index; otherwise rng_seed feeds the legacy SHA-256 derivation.
     rng_seed: int = 0
+    rng: Optional[CounterRNG] = None
+    agent_index: int = 0
 
     # Previous decision (for chaining)
     current_decision: Optional[Dict[str, Any]] = None
@@ -97,6 +104,111 @@ class RuleResult:
     explanation: str = ""
 
 
+@dataclass
+class BatchRuleContext:
+    """
+    Columnar counterpart of RuleContext for evaluating a whole batch of agents.
+
+    Per-agent values are NumPy arrays aligned with ``agent_ids``. A NaN entry
+    means the key is absent for that agent, so rules fall back to the same
+    defaults they use with ``dict.get`` on a RuleContext. Nested lookups such
+    as ``agent_state["interests"][topic]`` use dotted keys ("interests.topic").
+
+    Peers are stored in CSR form: the peers of row ``i`` are
+    ``peer_indices[peer_indptr[i]:peer_indptr[i + 1]]``, which index into the
+    ``peer_state`` columns.
+    """
+    tick: int
+    agent_ids: List[str] = field(default_factory=list)
+    tick_delta: float = 1.0
+
+    # Random source: counter-based stream keyed by agent_indices, or
+    # legacy per-agent seeds for the SHA-256 derivation
+    rng_seeds: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    rng: Optional[CounterRNG] = None
+    agent_indices: Optional[np.ndarray] = None
+
+    # Agent state and memory columns
+    agent_state: Dict[str, np.ndarray] = field(default_factory=dict)
+    agent_memory: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    # Environment (shared by all agents in the batch)
+    environment: Dict[str, Any] = field(default_factory=dict)
+
+    # Social context
+    social_signals: Dict[str, np.ndarray] = field(default_factory=dict)
+    peer_indptr: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    peer_indices: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    peer_state: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    # Current decision columns; rows outside decision_mask have no decision
+    decision_mask: Optional[np.ndarray] = None
+    current_decision: Dict[str, np.ndarray] = field(default_factory=dict)
+    decision_confidence: Optional[np.ndarray] = None
+
+    # Metadata
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Number of agents in the batch."""
+        return len(self.agent_ids)
+
+    def _column(self, columns: Dict[str, np.ndarray], key: str, default: float) -> np.ndarray:
+        column = columns.get(key)
+        if column is None:
+            return np.full(self.size, default, dtype=np.float64)
+        if column.dtype.kind == "f":
+            return np.where(np.isnan(column), default, column)
+        return column
+
+    def get_state(self, key: str, default: float) -> np.ndarray:
+        """Per-agent state value, with ``default`` where absent."""
+        return self._column(self.agent_state, key, default)
+
+    def get_memory(self, key: str, default: float) -> np.ndarray:
+        """Per-agent memory value, with ``default`` where absent."""
+        column = self.agent_memory.get(key)
+        if column is None and isinstance(default, int):
+            # Keep integer counters integral, as RuleContext lookups do
+            return np.full(self.size, default, dtype=np.int64)
+        return self._column(self.agent_memory, key, default)
+
+    def get_decision(self, key: str, default: float) -> np.ndarray:
+        """Per-agent value from the current decision, with ``default`` where absent."""
+        return self._column(self.current_decision, key, default)
+
+    def peer_rows(self) -> np.ndarray:
+        """Owning batch row of each entry in ``peer_indices``."""
+        return np.repeat(np.arange(self.size), np.diff(self.peer_indptr))
+
+
+@dataclass
+class BatchRuleResult:
+    """Result of batched rule evaluation; arrays are aligned with the batch rows."""
+    applied: np.ndarray
+
+    # Values are only meaningful on rows where ``applied`` is True
+    state_updates: Dict[str, np.ndarray] = field(default_factory=dict)
+    decision_modifiers: Dict[str, np.ndarray] = field(default_factory=dict)
+    decision_confidence: Optional[np.ndarray] = None
+    signals: Dict[str, np.ndarray] = field(default_factory=dict)
+    telemetry: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls, size: int) -> "BatchRuleResult":
+        """A result in which the rule applied to no agent."""
+        return cls(applied=np.zeros(size, dtype=bool))
+
+
+def _hash_uniform(seed_str: str) -> float:
+    """Map a seed string to a float in [0, 1) via SHA-256 (P0-003)."""
+    hash_bytes = hashlib.sha256(seed_str.encode()).digest()
+    # Use first 8 bytes as a float in [0, 1)
+    int_val = int.from_bytes(hash_bytes[:8], 'big')
+    return int_val / (2**64)
+
+
 class Rule(ABC):
     """
     Abstract base class for Society Mode rules.
@@ -148,11 +260,57 @@ class Rule(ABC):
         Get a deterministic random value from the context seed.
         Uses the same derivation as the RNG policy (P0-003).
         """
+        if ctx.rng is not None:
+            return ctx.rng.uniform(ctx.agent_index, ctx.tick, f"rule:{self.name}:{domain}")
         seed_str = f"{ctx.rng_seed}:{ctx.agent_id}:{ctx.tick}:{self.name}:{domain}"
-        hash_bytes = hashlib.sha256(seed_str.encode()).digest()
-        # Use first 8 bytes as a float in [0, 1)
-        int_val = int.from_bytes(hash_bytes[:8], 'big')
-        return int_val / (2**64)
+        return _hash_uniform(seed_str)
+
+    def evaluate_batch(self, ctx: BatchRuleContext) -> BatchRuleResult:
+        """
+        Evaluate the rule for every agent in a batch at once.
+
+        Must produce, row for row, the same result as ``evaluate`` on the
+        equivalent RuleContext. Rules without a batched implementation
+        leave this unimplemented and are run on the per-agent path.
+        """
+        raise NotImplementedError(f"Rule '{self.name}' has no batched implementation")
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether this rule can run inside the vectorized tick kernel."""
+        cls = type(self)
+        return (
+            cls.evaluate_batch is not Rule.evaluate_batch
+            and cls.applies_to is Rule.applies_to
+        )
+
+    def derive_random_batch(
+        self,
+        ctx: BatchRuleContext,
+        domain: str = "",
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Batched derive_random over ``rows`` (all rows by default).
+
+        Produces exactly the values derive_random returns for each agent.
+        """
+        if rows is None:
+            rows = np.arange(ctx.size)
+        if ctx.rng is not None:
+            return ctx.rng.uniforms(
+                ctx.agent_indices[rows], ctx.tick, f"rule:{self.name}:{domain}"
+            )
+        return np.fromiter(
+            (
+                _hash_uniform(
+                    f"{int(ctx.rng_seeds[i])}:{ctx.agent_ids[i]}:{ctx.tick}:{self.name}:{domain}"
+                )
+                for i in rows
+            ),
+            dtype=np.float64,
+            count=len(rows),
+        )
 
     def __lt__(self, other: "Rule") -> bool:
         """For sorting by priority."""
@@ -228,6 +386,49 @@ class ConformityRule(Rule):
 
         return result
 
+    def evaluate_batch(self, ctx: BatchRuleContext) -> BatchRuleResult:
+        n = ctx.size
+        result = BatchRuleResult.empty(n)
+
+        peer_opinion = ctx.peer_state.get("opinion")
+        if peer_opinion is None or ctx.peer_indices.size == 0:
+            return result
+
+        # Peer consensus per agent over peers that report an opinion
+        values = peer_opinion[ctx.peer_indices]
+        present = ~np.isnan(values)
+        rows = ctx.peer_rows()[present]
+        values = values[present]
+
+        counts = np.bincount(rows, minlength=n)
+        has_peers = counts > 0
+        safe_counts = np.maximum(counts, 1)
+        avg_opinion = np.bincount(rows, weights=values, minlength=n) / safe_counts
+        opinion_variance = np.bincount(
+            rows, weights=(values - avg_opinion[rows]) ** 2, minlength=n
+        ) / safe_counts
+        consensus_strength = np.maximum(0, 1 - opinion_variance * 4)
+
+        applied = has_peers & (consensus_strength >= self.threshold)
+        if not applied.any():
+            return result
+
+        applied_rows = np.flatnonzero(applied)
+        resistance = np.zeros(n)
+        resistance[applied_rows] = self.derive_random_batch(ctx, "resistance", applied_rows)
+        effective_strength = self.conformity_strength * (1 - resistance * 0.5)
+
+        agent_opinion = ctx.get_state("opinion", 0.5)
+        opinion_delta = (avg_opinion - agent_opinion) * effective_strength * consensus_strength
+
+        result.applied = applied
+        result.state_updates["opinion_delta"] = opinion_delta
+        result.decision_modifiers["conformity"] = effective_strength
+        result.telemetry["conformity_applied"] = applied.astype(np.float64)
+        result.telemetry["consensus_strength"] = consensus_strength
+
+        return result
+
 
 class MediaInfluenceRule(Rule):
     """
@@ -287,6 +488,34 @@ class MediaInfluenceRule(Rule):
 
         return result
 
+    def evaluate_batch(self, ctx: BatchRuleContext) -> BatchRuleResult:
+        n = ctx.size
+        result = BatchRuleResult.empty(n)
+
+        media_signal = ctx.environment.get("media_signal", 0)
+        media_topic = ctx.environment.get("media_topic")
+
+        if media_signal == 0 or media_topic is None or n == 0:
+            return result
+
+        prior_exposure = ctx.get_memory(f"media_exposure_{media_topic}", 0)
+        interest_level = ctx.get_state(f"interests.{media_topic}", 0.5)
+
+        attention = interest_level * (self.attention_decay ** prior_exposure)
+        noise = (self.derive_random_batch(ctx, "media_noise") - 0.5) * 0.2
+
+        effective_influence = media_signal * self.media_weight * attention + noise
+        effective_influence = np.clip(effective_influence, -1, 1)
+
+        result.applied = np.ones(n, dtype=bool)
+        result.state_updates["perceived_media"] = effective_influence
+        result.state_updates[f"media_exposure_{media_topic}"] = prior_exposure + 1
+        result.signals["media_reception"] = effective_influence
+        result.telemetry["media_influence"] = effective_influence
+        result.telemetry["attention_level"] = attention
+
+        return result
+
 
 class LossAversionRule(Rule):
     """
@@ -356,6 +585,46 @@ class LossAversionRule(Rule):
 
         return result
 
+    def evaluate_batch(self, ctx: BatchRuleContext) -> BatchRuleResult:
+        n = ctx.size
+        result = BatchRuleResult.empty(n)
+
+        if ctx.decision_mask is None or not ctx.decision_mask.any():
+            return result
+
+        potential_gain = ctx.get_decision("potential_gain", 0)
+        potential_loss = ctx.get_decision("potential_loss", 0)
+
+        applied = ctx.decision_mask & ~((potential_gain == 0) & (potential_loss == 0))
+        if not applied.any():
+            return result
+
+        alpha = 0.88
+        with np.errstate(invalid="ignore"):
+            gain_value = np.where(potential_gain == 0, 0.0, np.power(potential_gain, alpha))
+            loss_value = np.where(potential_loss == 0, 0.0, -(np.abs(potential_loss) ** alpha))
+
+        perceived_net = gain_value - loss_value * self.loss_aversion_lambda
+
+        confidence_modifier = np.where(
+            perceived_net < 0,
+            np.maximum(0.1, 1 + perceived_net / 10),
+            np.minimum(1.5, 1 + perceived_net / 20),
+        )
+
+        base_confidence = ctx.decision_confidence
+        if base_confidence is None:
+            base_confidence = np.ones(n)
+
+        result.applied = applied
+        result.decision_modifiers["loss_aversion"] = confidence_modifier
+        result.decision_confidence = base_confidence * confidence_modifier
+        result.telemetry["perceived_gain"] = gain_value
+        result.telemetry["perceived_loss"] = loss_value * self.loss_aversion_lambda
+        result.telemetry["loss_aversion_modifier"] = confidence_modifier
+
+        return result
+
     def _prospect_value(self, x: float, is_loss: bool = False, alpha: float = 0.88) -> float:
         """Calculate prospect theory value function."""
         if x == 0:
@@ -421,6 +690,37 @@ class SocialNetworkRule(Rule):
 
         return result
 
+    def evaluate_batch(self, ctx: BatchRuleContext) -> BatchRuleResult:
+        n = ctx.size
+        result = BatchRuleResult.empty(n)
+
+        if not ctx.social_signals:
+            return result
+
+        weighted_sum = np.zeros(n)
+        total_weight = np.zeros(n)
+
+        for signal_type, values in ctx.social_signals.items():
+            weight = 1.0
+            if "strong_tie" in signal_type:
+                weight = 1.0 + self.tie_strength_weight
+            elif "weak_tie" in signal_type:
+                weight = 1.0 - self.tie_strength_weight * 0.5
+
+            present = ~np.isnan(values)
+            weighted_sum = np.where(present, weighted_sum + values * weight, weighted_sum)
+            total_weight = np.where(present, total_weight + weight, total_weight)
+
+        applied = total_weight > 0
+        aggregate_signal = weighted_sum / np.where(applied, total_weight, 1.0)
+
+        result.applied = applied
+        result.state_updates["social_influence"] = aggregate_signal
+        result.signals["social_aggregate"] = aggregate_signal
+        result.telemetry["social_influence_aggregate"] = aggregate_signal
+
+        return result
+
 
 # =============================================================================
 # Rule Engine
@@ -436,6 +736,15 @@ class RuleEngine:
     Reference: project.md §4.1, §9.3
     """
 
+    # Agent lifecycle order: Observe → Evaluate → Decide → Act → Update
+    _LIFECYCLE_PHASES = (
+        RulePhase.OBSERVE,
+        RulePhase.EVALUATE,
+        RulePhase.DECIDE,
+        RulePhase.ACT,
+        RulePhase.UPDATE,
+    )
+
     def __init__(self, version: str = "1.0.0"):
         self.version = version
         self._rules: Dict[RulePhase, List[Rule]] = {
@@ -552,15 +861,7 @@ class RuleEngine:
         }
 
         # Process each phase in order
-        lifecycle_phases = [
-            RulePhase.OBSERVE,
-            RulePhase.EVALUATE,
-            RulePhase.DECIDE,
-            RulePhase.ACT,
-            RulePhase.UPDATE,
-        ]
-
-        for phase in lifecycle_phases:
+        for phase in self._LIFECYCLE_PHASES:
             phase_results = self.evaluate_phase(phase, ctx)
 
             for result in phase_results:
@@ -590,6 +891,108 @@ class RuleEngine:
 
         return tick_result
 
+    def supports_batch(self) -> bool:
+        """Whether every enabled lifecycle rule has a batched implementation."""
+        return all(
+            rule.supports_batch
+            for phase in self._LIFECYCLE_PHASES
+            for rule in self.get_rules_for_phase(phase)
+        )
+
+    def evaluate_phase_batch(
+        self,
+        phase: RulePhase,
+        ctx: BatchRuleContext,
+    ) -> List[Tuple[Rule, BatchRuleResult]]:
+        """
+        Evaluate all rules for a phase over a batch of agents.
+
+        Batched counterpart of evaluate_phase: state updates are chained
+        into the context for later rules on the rows where a rule applied.
+        """
+        results = []
+
+        for rule in self.get_rules_for_phase(phase):
+            result = rule.evaluate_batch(ctx)
+            if not result.applied.any():
+                continue
+            results.append((rule, result))
+
+            # Update context with state changes for chaining
+            for key, values in result.state_updates.items():
+                previous = ctx.agent_state.get(key)
+                if previous is None:
+                    previous = np.full(ctx.size, np.nan)
+                ctx.agent_state[key] = np.where(result.applied, values, previous)
+
+        return results
+
+    def run_batch_tick(
+        self,
+        ctx: BatchRuleContext,
+    ) -> Dict[str, Any]:
+        """
+        Run a complete lifecycle tick for a batch of agents.
+
+        Batched counterpart of run_agent_tick. Every per-agent output is a
+        pair of dicts: values keyed by name, and a boolean mask per name that
+        marks the rows on which the value is present.
+
+        Args:
+            ctx: The batched tick context
+
+        Returns:
+            Tick result with state updates, signals, telemetry and the
+            rows each rule applied to
+        """
+        tick_result: Dict[str, Any] = {
+            "state_updates": {},
+            "state_update_masks": {},
+            "signals": {},
+            "signal_masks": {},
+            "telemetry": {},
+            "telemetry_masks": {},
+            "rules_applied": {},
+        }
+
+        for phase in self._LIFECYCLE_PHASES:
+            for rule, result in self.evaluate_phase_batch(phase, ctx):
+                applied = result.applied
+                tick_result["rules_applied"][rule.name] = applied
+
+                # Merge state updates and telemetry (later rules win)
+                for values_key, masks_key, source in (
+                    ("state_updates", "state_update_masks", result.state_updates),
+                    ("telemetry", "telemetry_masks", result.telemetry),
+                ):
+                    merged = tick_result[values_key]
+                    masks = tick_result[masks_key]
+                    for key, values in source.items():
+                        if key in merged:
+                            merged[key] = np.where(applied, values, merged[key])
+                            masks[key] = masks[key] | applied
+                        else:
+                            merged[key] = values
+                            masks[key] = applied.copy()
+
+                # Merge signals (averaged with any earlier value)
+                signals = tick_result["signals"]
+                signal_masks = tick_result["signal_masks"]
+                for key, values in result.signals.items():
+                    if key in signals:
+                        both = signal_masks[key] & applied
+                        signals[key] = np.where(
+                            both,
+                            (signals[key] + values) / 2,
+                            np.where(applied, values, signals[key]),
+                        )
+                        signal_masks[key] = signal_masks[key] | applied
+                    else:
+                        signals[key] = values
+                        signal_masks[key] = applied.copy()
+
+        return tick_result
+
     def run_aggregate_tick(
         self,
         agent_results: List[Dict[str, Any]],
@@ -0,0 +1,374 @@
+"""
+Sharded Society Mode Tick Execution
+Reference: project.md §3.3 (Scheduler), §4.1, Phase 1
+
+Runs the vectorized tick kernel over a partitioned population:
+- Agents are assigned to shards by segment, region, social-graph
+  locality or contiguous index ranges
+- The kernel's read-only arrays are published once to shared memory;
+  worker processes attach to them instead of receiving copies
+- Each tick, shards run Observe → Evaluate → Decide (and rules) in
+  parallel. The main process waits for every shard (the barrier), merges
+  the results back into row order and runs Act → Update once
+
+Shards only read tick-start state and results are merged by row
+position, so the output is identical for any shard or worker count and
+identical to VectorizedTickKernel.run_tick.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import multiprocessing
+import time
+import weakref
+
+import numpy as np
+
+from app.engine.agent import Agent, SocialGraphIndex
+from app.engine.rng import CounterRNG
+from app.engine.rules import RuleEngine
+from app.engine.tick_kernel import (
+    KernelArrays,
+    TickEvaluation,
+    TickKernelResult,
+    VectorizedTickKernel,
+)
+from app.engine.workers import worker_processes_unavailable
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionStrategy(str, Enum):
+    """How agents are assigned to shards."""
+    CONTIGUOUS = "contiguous"  # Equal ranges of agent index
+    SEGMENT = "segment"        # Whole segments per shard
+    REGION = "region"          # Whole regions per shard
+    GRAPH = "graph"            # Breadth-first social-graph neighbourhoods
+
+
+# Arrays that can change between ticks and are re-published before each one
+_MUTABLE_ARRAYS = ("alive",)
+
+# Byte alignment of each array in the shared block
+_ALIGNMENT = 8
+
+
+# =============================================================================
+# Partitioning
+# =============================================================================
+
+def partition_population(
+    agents: List[Agent],
+    social_index: SocialGraphIndex,
+    num_shards: int,
+    strategy: PartitionStrategy = PartitionStrategy.CONTIGUOUS,
+) -> np.ndarray:
+    """
+    Assign every agent (by index) to a shard.
+
+    Segment and region groups are kept whole and spread over shards
+    largest-first onto the least-loaded shard. Graph partitioning orders
+    agents breadth-first over social edges and cuts that order into equal
+    ranges, so connected agents tend to share a shard.
+
+    Returns:
+        Shard id per agent index
+    """
+    n = len(agents)
+    num_shards = max(1, min(num_shards, n)) if n else 1
+    strategy = PartitionStrategy(strategy)
+
+    if strategy in (PartitionStrategy.SEGMENT, PartitionStrategy.REGION):
+        attribute = strategy.value
+        groups: Dict[str, List[int]] = {}
+        for i, agent in enumerate(agents):
+            groups.setdefault(getattr(agent.profile, attribute) or "", []).append(i)
+
+        shard_of = np.zeros(n, dtype=np.int64)
+        load = np.zeros(num_shards, dtype=np.int64)
+        for key in sorted(groups, key=lambda k: (-len(groups[k]), k)):
+            shard = int(np.argmin(load))
+            shard_of[groups[key]] = shard
+            load[shard] += len(groups[key])
+        return shard_of
+
+    if strategy == PartitionStrategy.GRAPH:
+        order = _breadth_first_order(social_index)
+    else:
+        order = np.arange(n)
+
+    shard_of = np.empty(n, dtype=np.int64)
+    shard_of[order] = np.arange(n) * num_shards // max(n, 1)
+    return shard_of
+
+
+def _breadth_first_order(social_index: SocialGraphIndex) -> np.ndarray:
+    """Agent indices in breadth-first order, starting each component at its lowest index."""
+    n = social_index.num_agents
+    visited = np.zeros(n, dtype=bool)
+    order: List[int] = []
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = True
+        frontier = [root]
+        while frontier:
+            order.extend(frontier)
+            next_frontier = []
+            for i in frontier:
+                for j in social_index.peers_of(i).tolist():
+                    if not visited[j]:
+                        visited[j] = True
+                        next_frontier.append(j)
+            frontier = next_frontier
+    return np.array(order, dtype=np.int64)
+
+
+# =============================================================================
+# Shared memory
+# =============================================================================
+
+def _kernel_array_sources(arrays: KernelArrays) -> Dict[str, np.ndarray]:
+    sources = {
+        "indptr": arrays.social_index.indptr,
+        "indices": arrays.social_index.indices,
+        "influence": arrays.social_index.influence,
+        "alive": arrays.alive,
+        "decision_index": arrays.decision_index,
+    }
+    for name, values in arrays.snapshot_fields.items():
+        sources[f"snapshot:{name}"] = values
+    return sources
+
+
+class SharedKernelArrays:
+    """
+    KernelArrays published in one shared-memory block.
+
+    ``descriptor`` is a small picklable description (block name, array
+    layout and agent ids) from which workers rebuild the arrays as views
+    on the block with attach_kernel_arrays().
+    """
+
+    def __init__(self, arrays: KernelArrays):
+        sources = _kernel_array_sources(arrays)
+        layout = []
+        offset = 0
+        for name, values in sources.items():
+            layout.append((name, offset, values.shape, values.dtype.str))
+            offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self._layout = layout
+        self._agent_ids = list(arrays.agent_ids)
+        self._views = _views(self._shm, layout)
+        for name, values in sources.items():
+            self._views[name][...] = values
+
+    @property
+    def descriptor(self) -> Tuple[str, List[Tuple[str, int, Tuple[int, ...], str]], List[str]]:
+        return self._shm.name, self._layout, self._agent_ids
+
+    def refresh(self, arrays: KernelArrays) -> None:
+        """Re-publish the arrays that may change between ticks."""
+        sources = _kernel_array_sources(arrays)
+        for name in _MUTABLE_ARRAYS:
+            self._views[name][...] = sources[name]
+        for name, values in sources.items():
+            if name.startswith("snapshot:"):
+                self._views[name][...] = values
+
+    def close(self) -> None:
+        self._views = {}
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _views(shm: shared_memory.SharedMemory, layout) -> Dict[str, np.ndarray]:
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, offset, shape, dtype in layout
+    }
+
+
+def attach_kernel_arrays(descriptor) -> Tuple[shared_memory.SharedMemory, KernelArrays]:
+    """Rebuild KernelArrays as views on a published shared-memory block."""
+    name, layout, agent_ids = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    views = _views(shm, layout)
+    arrays = KernelArrays(
+        agent_ids=agent_ids,
+        social_index=SocialGraphIndex(
+            agent_ids=agent_ids,
+            indptr=views["indptr"],
+            indices=views["indices"],
+            influence=views["influence"],
+        ),
+        alive=views["alive"],
+        snapshot_fields={
+            key.split(":", 1)[1]: values
+            for key, values in views.items()
+            if key.startswith("snapshot:")
+        },
+        decision_index=views["decision_index"],
+    )
+    return shm, arrays
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+# Per-process state set by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(descriptor, rule_engine: RuleEngine, rng: Optional[CounterRNG]) -> None:
+    shm, arrays = attach_kernel_arrays(descriptor)
+    _worker.update(shm=shm, arrays=arrays, rule_engine=rule_engine, rng=rng)
+
+
+def _evaluate_shard(
+    tick: int,
+    active: np.ndarray,
+    environment: Dict[str, Any],
+    rng_seeds: Optional[np.ndarray],
+) -> Tuple[TickEvaluation, float]:
+    start = time.perf_counter()
+    evaluation = _worker["arrays"].evaluate(
+        _worker["rule_engine"], tick, active, environment,
+        rng_seeds=rng_seeds, rng=_worker["rng"],
+    )
+    return evaluation, (time.perf_counter() - start) * 1000
+
+
+def _shutdown(pool: Optional[ProcessPoolExecutor], shared: Optional[SharedKernelArrays]) -> None:
+    if pool is not None:
+        pool.shutdown(wait=True)
+    if shared is not None:
+        shared.close()
+
+
+# =============================================================================
+# Executor
+# =============================================================================
+
+class ShardedTickExecutor:
+    """
+    Evaluates a VectorizedTickKernel's ticks shard by shard.
+
+    With ``workers`` > 1 shards are evaluated on a process pool attached to
+    shared-memory kernel arrays; otherwise (or where child processes
+    cannot be started, e.g. inside a daemonic Celery worker) they are
+    evaluated in-process one after another. Either way results are the
+    same. Call close() when done (also done on garbage collection).
+    """
+
+    def __init__(
+        self,
+        kernel: VectorizedTickKernel,
+        num_shards: int,
+        workers: Optional[int] = None,
+        strategy: PartitionStrategy = PartitionStrategy.CONTIGUOUS,
+        mp_context: str = "spawn",
+    ):
+        self.kernel = kernel
+        self.strategy = PartitionStrategy(strategy)
+        self.shard_of = partition_population(
+            kernel.agents, kernel.social_index, num_shards, self.strategy
+        )
+        self.num_shards = int(self.shard_of.max()) + 1 if self.shard_of.size else 1
+        self.workers = min(workers if workers is not None else self.num_shards, self.num_shards)
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shared: Optional[SharedKernelArrays] = None
+        if self.workers > 1:
+            if worker_processes_unavailable(
+                "evaluating shards in-process",
+                rule_engine=kernel.rule_engine,
+                rng=kernel.rng,
+            ):
+                self.workers = 1
+            else:
+                self._shared = SharedKernelArrays(kernel.arrays)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(mp_context),
+                    initializer=_init_worker,
+                    initargs=(self._shared.descriptor, kernel.rule_engine, kernel.rng),
+                )
+        self._finalizer = weakref.finalize(self, _shutdown, self._pool, self._shared)
+
+    @property
+    def is_parallel(self) -> bool:
+        return self._pool is not None
+
+    def shard_sizes(self) -> np.ndarray:
+        return np.bincount(self.shard_of, minlength=self.num_shards)
+
+    def run_tick(
+        self,
+        tick: int,
+        active: np.ndarray,
+        environment: Dict[str, Any],
+        rng_seeds: Optional[np.ndarray] = None,
+    ) -> Tuple[TickKernelResult, Dict[str, float]]:
+        """
+        Run one tick; arguments are as for VectorizedTickKernel.run_tick.
+
+        Returns:
+            The kernel result and the evaluation time of each shard in ms
+            (keyed "shard_{id}")
+        """
+        if rng_seeds is None and self.kernel.rng is None:
+            raise ValueError("rng_seeds are required without a counter-based rng")
+
+        active = np.asarray(active, dtype=np.int64)
+        shard_ids = self.shard_of[active]
+        shards = [
+            (shard, np.flatnonzero(shard_ids == shard)) for shard in range(self.num_shards)
+        ]
+        shards = [(shard, positions) for shard, positions in shards if positions.size]
+
+        def seeds(positions: np.ndarray) -> Optional[np.ndarray]:
+            return None if rng_seeds is None else np.asarray(rng_seeds)[positions]
+
+        parts: List[Tuple[np.ndarray, TickEvaluation]] = []
+        timings: Dict[str, float] = {}
+        if self._pool is not None:
+            self._shared.refresh(self.kernel.arrays)
+            futures = [
+                (shard, positions, self._pool.submit(
+                    _evaluate_shard, tick, active[positions], environment, seeds(positions)
+                ))
+                for shard, positions in shards
+            ]
+            # Barrier: every shard finishes Observe/Decide before any Update
+            for shard, positions, future in futures:
+                evaluation, elapsed_ms = future.result()
+                parts.append((positions, evaluation))
+                timings[f"shard_{shard}"] = elapsed_ms
+        else:
+            for shard, positions in shards:
+                start = time.perf_counter()
+                evaluation = self.kernel.evaluate(
+                    tick, active[positions], environment, seeds(positions)
+                )
+                parts.append((positions, evaluation))
+                timings[f"shard_{shard}"] = (time.perf_counter() - start) * 1000
+
+        merged = TickEvaluation.merge(active, parts)
+        return self.kernel.apply(tick, merged), timings
+
+    def close(self) -> None:
+        """Stop worker processes and release shared memory."""
+        self._finalizer()
+
+    def __enter__(self) -> "ShardedTickExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
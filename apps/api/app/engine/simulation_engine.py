@@ -22,11 +22,12 @@ from app.models.environment import (
 )
 from app.models.agent import (
     SimulationAgent,
-    AgentAction,
     AgentInteractionLog,
     PolicyModel,
 )
 from app.models.prediction import PredictionResult
+from app.engine.action_log import ActionLogWriter
+from app.engine.social_network import build_homophily_network
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,7 @@ class SimulationEngine:
         self._environment_state: Optional[Dict[str, Any]] = None
         self._external_events: List[ExternalEvent] = []
         self._metrics: Dict[str, List[float]] = {}
+        self._action_log = ActionLogWriter()
 
     @property
     def state_manager(self) -> "StateManager":
@@ -121,6 +123,12 @@ class SimulationEngine:
         # Set random seed for reproducibility
         self._rng = np.random.default_rng(self.config.random_seed)
 
+        # Actions are buffered and written in bulk, environment state once per step
+        self._action_log = ActionLogWriter(
+            environment_id=environment.id,
+            scenario_id=scenario.id,
+        )
+
         # Initialize environment state
         self._environment_state = await self._initialize_environment_state(
             scenario, environment
@@ -391,82 +399,26 @@ class SimulationEngine:
     async def _build_social_network(self) -> None:
         """Build social network connections between agents."""
         agent_list = list(self._agents.values())
-        n_agents = len(agent_list)
-
-        # Average connections per agent (small-world network property)
-        avg_connections = min(20, n_agents // 10)
-
-        for agent in agent_list:
-            # Number of connections follows a power-law-like distribution
-            n_connections = int(self._rng.exponential(avg_connections))
-            n_connections = min(n_connections, n_agents - 1)
-            n_connections = max(1, n_connections)
-
-            # Preferentially connect to similar demographics (homophily)
-            candidates = [a for a in agent_list if a.id != agent.id]
-
-            # Calculate similarity scores
-            similarities = []
-            for candidate in candidates:
-                sim = self._calculate_demographic_similarity(
-                    agent.demographics, candidate.demographics
-                )
-                similarities.append(sim)
-
-            # Sample connections with probability proportional to similarity
-            similarities = np.array(similarities)
-            probabilities = similarities / similarities.sum()
-
-            selected_indices = self._rng.choice(
-                len(candidates),
-                size=min(n_connections, len(candidates)),
-                replace=False,
-                p=probabilities
-            )
 
-            connections = [str(candidates[i].id) for i in selected_indices]
+        # Homophily: connect preferentially to similar demographics,
+        # sampled block-wise over encoded demographic columns
+        network = build_homophily_network(
+            [agent.demographics or {} for agent in agent_list],
+            self._rng,
+        )
+
+        for agent, (peers, similarities) in zip(agent_list, network):
+            connections = [str(agent_list[i].id) for i in peers.tolist()]
 
             # Assign influence weights based on similarity
-            influence_weights = {}
-            for conn_id, idx in zip(connections, selected_indices):
-                influence_weights[conn_id] = float(similarities[idx])
+            influence_weights = dict(zip(connections, similarities.tolist()))
 
             agent.social_network = {
                 "connections": connections,
                 "influence_weights": influence_weights,
-                "echo_chamber_score": float(np.mean([similarities[i] for i in selected_indices]))
+                "echo_chamber_score": float(similarities.mean()) if len(similarities) else 0.0,
             }
 
-    def _calculate_demographic_similarity(
-        self,
-        demo1: Dict[str, Any],
-        demo2: Dict[str, Any]
-    ) -> float:
-        """Calculate similarity between two demographic profiles."""
-        score = 0.0
-
-        # Age similarity (closer ages = higher similarity)
-        age_diff = abs(demo1.get("age", 40) - demo2.get("age", 40))
-        score += max(0, 1 - age_diff / 50) * 0.2
-
-        # Same education level
-        if demo1.get("education") == demo2.get("education"):
-            score += 0.2
-
-        # Same income bracket
-        if demo1.get("income_bracket") == demo2.get("income_bracket"):
-            score += 0.2
-
-        # Same urban/rural
-        if demo1.get("urban_rural") == demo2.get("urban_rural"):
-            score += 0.2
-
-        # Same ethnicity
-        if demo1.get("ethnicity") == demo2.get("ethnicity"):
-            score += 0.2
-
-        return score
-
     async def step(
         self,
         db: AsyncSession,
@@ -494,6 +446,7 @@ class SimulationEngine:
             step_metrics["events_applied"] = events_applied
 
         # 2. Process agents in batches
+        self._action_log.begin_step(db, self._current_step, self._environment_state)
         agent_list = list(self._agents.values())
         total_agents = len(agent_list)
 
@@ -518,6 +471,9 @@ class SimulationEngine:
             if progress_callback:
                 progress_callback(batch_end, total_agents)
 
+        if self._action_log.should_flush():
+            await self._action_log.flush(db)
+
         # 3. Apply social influence if enabled
         if self.config.enable_social_network:
             await self._apply_social_influence()
@@ -573,6 +529,8 @@ class SimulationEngine:
         actions = []
 
         for agent in batch:
+            state_before = agent.state_vector.copy()
+
             # Get agent's action based on policy
             action, action_probs = await self._get_agent_action(agent)
             actions.append(action)
@@ -581,21 +539,14 @@ class SimulationEngine:
             agent.last_action = action
             agent.last_action_step = self._current_step
 
-            # Record action
-            agent_action = AgentAction(
+            # Record action (reward calculated later)
+            self._action_log.record(
                 agent_id=agent.id,
-                time_step=self._current_step,
-                state_before=agent.state_vector.copy(),
                 action=action,
                 action_probabilities=action_probs,
-                decision_context={
-                    "environment_state": self._environment_state,
-                    "step": self._current_step,
-                },
-                reward=0.0,  # Calculated later
-                state_after=agent.state_vector.copy(),
+                state_before=state_before,
+                state_after=agent.state_vector,
             )
-            db.add(agent_action)
 
         return actions
 
@@ -772,8 +723,11 @@ class SimulationEngine:
 
                 # Checkpoint
                 if (step + 1) % self.config.checkpoint_interval == 0:
+                    await self._action_log.flush(db)
                     await db.flush()
 
+            await self._action_log.flush(db)
+
             # Calculate final results
             result = await self._calculate_final_results(scenario, db)
 
@@ -973,12 +927,15 @@ class SimulationEngine:
 
                 # Periodic checkpoint
                 if (step + 1) % self.config.checkpoint_interval == 0:
+                    await self._action_log.flush(db)
                     await db.flush()
                     yield {
                         "type": "checkpoint",
                         "step": step + 1,
                     }
 
+            await self._action_log.flush(db)
+
             # Final results
             result = await self._calculate_final_results(scenario, db)
 
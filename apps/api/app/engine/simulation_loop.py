@@ -19,7 +19,11 @@ from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.engine.state_manager import StateManager, GlobalState
-from app.engine.behavioral_model import BehavioralModel, create_default_behavioral_params
+from app.engine.behavioral_model import (
+    BehavioralModel,
+    SocialInfluenceModel,
+    create_default_behavioral_params,
+)
 from app.engine.action_space import (
     ActionSpace,
     DiscreteActionSpace,
@@ -66,6 +70,9 @@ class SimulationConfig:
     # Social network
     influence_radius: int = 5  # Network hops for influence
     influence_decay: float = 0.5  # Decay per hop
+    # Share of susceptibility applied as pull toward the multi-hop
+    # neighbourhood's preferences each step; 0 (default) disables it
+    network_influence_scale: float = 0.0
 
     # Checkpoint and persistence
     checkpoint_interval: int = 10
@@ -73,6 +80,10 @@ class SimulationConfig:
 
     # Monte Carlo
     num_monte_carlo_runs: int = 1
+    random_seed: Optional[int] = None  # Master seed for replicate streams
+    monte_carlo_workers: Optional[int] = None  # Processes (None = CPU count)
+    monte_carlo_ci_width: Optional[float] = None  # Early-stop 95% CI width target
+    monte_carlo_min_runs: int = 10  # Replicates before early stopping applies
 
     # Logging
     log_interval: int = 10
@@ -128,6 +139,30 @@ class SimulationResult:
     distribution_history: List[Dict[str, float]] = field(default_factory=list)
 
 
+@dataclass
+class ActionEffectTable:
+    """
+    Per-action-type lookup tables for a discrete action space.
+
+    Each mask has shape (num_actions,) so that indexing with an array of
+    chosen actions gives the per-agent effect mask in one operation.
+    """
+
+    num_actions: int
+    vote: np.ndarray
+    abstain: np.ndarray
+    switch_preference: np.ndarray
+
+    @classmethod
+    def from_action_space(cls, action_space: DiscreteActionSpace) -> "ActionEffectTable":
+        return cls(
+            num_actions=action_space.n,
+            vote=action_space.get_action_type_mask(ActionType.VOTE),
+            abstain=action_space.get_action_type_mask(ActionType.ABSTAIN),
+            switch_preference=action_space.get_action_type_mask(ActionType.SWITCH_PREFERENCE),
+        )
+
+
 class SimulationLoop:
     """
     Main simulation loop orchestrator.
@@ -157,6 +192,11 @@ class SimulationLoop:
         self.behavioral_model = behavioral_model
         self.action_space = action_space
         self.reward_function = reward_function or RewardFunction()
+        self.action_effects = ActionEffectTable.from_action_space(action_space)
+        self.social_influence = SocialInfluenceModel(
+            distance_decay=config.influence_decay,
+            max_hops=config.influence_radius,
+        )
 
         # Execution state
         self.status = SimulationStatus.PENDING
@@ -251,7 +291,7 @@ class SimulationLoop:
 
                 # Periodic persistence
                 if db and step > 0 and step % self.config.persist_interval == 0:
-                    await self.state_manager.persist_to_database(db)
+                    await self.state_manager.persist_to_database(db, only_changed=True)
 
                 # Logging
                 if self.config.verbose and step % self.config.log_interval == 0:
@@ -300,6 +340,51 @@ class SimulationLoop:
             Step execution result
         """
         step_start = time.time()
+        events_applied = self._apply_events(step)
+
+        adjusted_utilities, _ = self._compute_adjusted_utilities(step)
+
+        # Make decisions
+        actions, action_probs = self.behavioral_model.make_decisions(
+            utilities=adjusted_utilities,
+            temperature=self.config.decision_temperature,
+        )
+
+        # Process actions and update states
+        actions_taken, commitments_made, state_changes = await self._process_actions(
+            actions,
+            action_probs,
+            step,
+        )
+
+        # Update aggregate statistics
+        self.state_manager.compute_global_aggregates()
+
+        # Advance time
+        self.state_manager.advance_time_step()
+
+        step_time = (time.time() - step_start) * 1000  # milliseconds
+
+        return StepResult(
+            step=step,
+            timestamp=current_date,
+            actions_taken=actions_taken,
+            commitments_made=commitments_made,
+            state_changes=state_changes,
+            events_applied=events_applied,
+            aggregate_distribution=self.state_manager.global_state.aggregate_stats.get(
+                "choice_distribution", {}
+            ),
+            computation_time_ms=step_time,
+        )
+
+    def _apply_events(self, step: int) -> List[Dict[str, Any]]:
+        """
+        Apply scheduled and random events for a step, then decay active events.
+
+        Returns:
+            Events applied at this step
+        """
         events_applied = []
 
         # Apply scheduled events
@@ -318,12 +403,30 @@ class SimulationLoop:
         # Decay active events
         self._decay_events()
 
+        return events_applied
+
+    def _compute_adjusted_utilities(
+        self,
+        step: int,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Compute behavioral decision utilities for all agents.
+
+        Args:
+            step: Current step
+
+        Returns:
+            Tuple of (utilities shape (num_agents, num_options), decision context)
+        """
         # Get agent states for batch processing
         preferences, issues, scalars = self.state_manager.get_batch_states()
 
         # Build decision context
         context = self._build_decision_context(step)
 
+        # Pull preferences toward the agent's network neighbourhood
+        preferences = self._apply_network_influence(preferences, scalars[:, 2])
+
         # Compute base utilities (rational choice)
         base_utilities = self._compute_base_utilities(preferences)
 
@@ -336,40 +439,38 @@ class SimulationLoop:
             behavioral_params=behavioral_params,
             context=context,
         )
+        return adjusted_utilities, context
 
-        # Make decisions
-        actions, action_probs = self.behavioral_model.make_decisions(
-            utilities=adjusted_utilities,
-            temperature=self.config.decision_temperature,
-        )
-
-        # Process actions and update states
-        actions_taken, commitments_made, state_changes = await self._process_actions(
-            actions,
-            action_probs,
-            step,
-        )
+    def _apply_network_influence(
+        self,
+        preferences: np.ndarray,
+        susceptibility: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Blend preferences with multi-hop social influence.
 
-        # Update aggregate statistics
-        self.state_manager.compute_global_aggregates()
+        Influence is the neighbour-weighted average of preferences over
+        config.influence_radius hops of the CSR social graph, decayed by
+        config.influence_decay per hop. Opt-in through
+        config.network_influence_scale; agents without neighbours (and
+        runs without a network) keep their own preferences.
 
-        # Advance time
-        self.state_manager.advance_time_step()
+        Args:
+            preferences: Shape (num_agents, num_options)
+            susceptibility: Shape (num_agents,)
 
-        step_time = (time.time() - step_start) * 1000  # milliseconds
+        Returns:
+            Influenced preferences
+        """
+        scale = self.config.network_influence_scale
+        index = self.state_manager.neighbor_index
+        if scale <= 0 or index.num_edges == 0 or self.config.influence_radius < 1:
+            return preferences
 
-        return StepResult(
-            step=step,
-            timestamp=current_date,
-            actions_taken=actions_taken,
-            commitments_made=commitments_made,
-            state_changes=state_changes,
-            events_applied=events_applied,
-            aggregate_distribution=self.state_manager.global_state.aggregate_stats.get(
-                "choice_distribution", {}
-            ),
-            computation_time_ms=step_time,
-        )
+        influence = self.social_influence.compute_social_influence(preferences, index.to_csr())
+        has_neighbors = np.diff(index.indptr) > 0
+        pull = np.where(has_neighbors, susceptibility * scale, 0.0)
+        return preferences + pull[:, None] * (influence - preferences)
 
     def _compute_base_utilities(self, preferences: np.ndarray) -> np.ndarray:
         """
@@ -443,25 +544,17 @@ class SimulationLoop:
             num_options = self.state_manager.preferences_matrix.shape[1]
             context["population_distribution"] = np.ones(num_options) / num_options
 
-        # Peer choices (from social network)
-        # Simplified: sample random peers for each agent
+        # Peer choices (from social network, or random peers without one)
         num_agents = self.state_manager.agent_count
-        num_peers = min(10, num_agents - 1)
-        peer_choices = np.full((num_agents, num_peers), -1, dtype=np.int32)
-
-        for i in range(num_agents):
-            # Get peer indices (excluding self)
-            peer_candidates = np.concatenate([np.arange(i), np.arange(i+1, num_agents)])
-            if len(peer_candidates) > 0:
-                peer_indices = np.random.choice(
-                    peer_candidates,
-                    size=min(num_peers, len(peer_candidates)),
-                    replace=False
-                )
-                peer_choices[i, :len(peer_indices)] = self.state_manager.committed_choices[peer_indices]
+        num_peers = max(0, min(10, num_agents - 1))
+        peer_indices, social_weights = self.state_manager.sample_peers(num_peers)
+        committed = self.state_manager.committed_choices
+        peer_choices = np.where(
+            peer_indices >= 0, committed[np.maximum(peer_indices, 0)], -1
+        ).astype(np.int32)
 
         context["peer_choices"] = peer_choices
-        context["social_weights"] = np.ones((num_agents, num_peers)) * 0.1
+        context["social_weights"] = social_weights
 
         # Framing (from active events)
         num_options = self.state_manager.preferences_matrix.shape[1]
@@ -494,86 +587,73 @@ class SimulationLoop:
         Returns:
             Tuple of (actions_taken, commitments_made, state_changes)
         """
-        actions_taken = 0
-        commitments_made = 0
-        state_changes = 0
-
-        # Process in batches for efficiency
-        batch_size = self.config.batch_size
-        num_agents = len(actions)
-
-        for batch_start in range(0, num_agents, batch_size):
-            batch_end = min(batch_start + batch_size, num_agents)
-            batch_indices = np.arange(batch_start, batch_end)
-            batch_actions = actions[batch_start:batch_end]
-            batch_probs = action_probs[batch_start:batch_end]
-
-            # Update preferences based on action probabilities
-            # Actions influence beliefs (commitment reinforces)
-            current_prefs = self.state_manager.preferences_matrix[batch_indices]
-
-            # Learning rate based on certainty
-            certainty = self.state_manager.scalar_states[batch_indices, 1]
-            learning_rate = 0.1 * (1 - certainty)  # Less learning when more certain
-
-            # Update preferences toward chosen action
-            for i, (idx, action) in enumerate(zip(batch_indices, batch_actions)):
-                action_def = self.action_space.get_action_by_index(int(action))
-                if action_def is None:
-                    continue
-
-                actions_taken += 1
-
-                if action_def.action_type == ActionType.VOTE:
-                    # Voting reinforces preference
-                    choice_idx = action  # Assuming vote action index = choice index
-                    if choice_idx < current_prefs.shape[1]:
-                        # Reinforce chosen option
-                        new_prefs = current_prefs[i].copy()
-                        new_prefs[choice_idx] += learning_rate[i] * 0.1
-
-                        # Check commitment threshold
-                        max_pref = new_prefs.max()
-                        current_commitment = self.state_manager.scalar_states[idx, 4]
-
-                        if max_pref > self.config.commitment_threshold:
-                            # Make commitment
-                            if self.state_manager.committed_choices[idx] < 0:
-                                commitments_made += 1
-                            self.state_manager.committed_choices[idx] = choice_idx
-                            self.state_manager.scalar_states[idx, 4] = min(
-                                current_commitment + 0.1, 1.0
-                            )
-
-                        # Update certainty
-                        certainty_change = 0.02 * (1 - certainty[i])
-                        self.state_manager.scalar_states[idx, 1] = min(
-                            certainty[i] + certainty_change, 1.0
-                        )
-
-                        state_changes += 1
-
-                elif action_def.action_type == ActionType.ABSTAIN:
-                    # Abstain may decrease certainty
-                    self.state_manager.scalar_states[idx, 1] *= 0.99
-
-                elif action_def.action_type == ActionType.SWITCH_PREFERENCE:
-                    # Uncommit
-                    if self.state_manager.committed_choices[idx] >= 0:
-                        self.state_manager.committed_choices[idx] = -1
-                        self.state_manager.scalar_states[idx, 4] *= 0.5
-                        state_changes += 1
-
-            # Normalize updated preferences
-            self.state_manager.preferences_matrix[batch_indices] = current_prefs
-            row_sums = self.state_manager.preferences_matrix[batch_indices].sum(axis=1, keepdims=True)
-            row_sums = np.where(row_sums > 0, row_sums, 1)
-            self.state_manager.preferences_matrix[batch_indices] /= row_sums
-
-            # Record actions in buffer
-            batch_rewards = np.zeros(len(batch_indices))  # Simplified
-            self.state_manager.record_actions(batch_indices, batch_actions, batch_rewards)
+        actions = np.asarray(actions)
+        result = self._apply_actions(actions)
 
+        # Record actions in buffer
+        rewards = np.zeros(len(actions))  # Simplified
+        self.state_manager.record_actions(np.arange(len(actions)), actions, rewards)
+
+        return result
+
+    def _apply_actions(self, actions: np.ndarray) -> Tuple[int, int, int]:
+        """
+        Apply action effects to agent states in one pass over the population.
+
+        Args:
+            actions: Shape (num_agents,) - chosen action indices
+
+        Returns:
+            Tuple of (actions_taken, commitments_made, state_changes)
+        """
+        state = self.state_manager
+        effects = self.action_effects
+        num_options = state.preferences_matrix.shape[1]
+
+        # Look up action types for the whole population at once;
+        # out-of-range indices have no action definition and are skipped
+        actions = np.asarray(actions)
+        defined = (actions >= 0) & (actions < effects.num_actions)
+        lookup = np.where(defined, actions, 0)
+        voting = defined & effects.vote[lookup] & (actions < num_options)
+        abstaining = defined & effects.abstain[lookup]
+        switching = defined & effects.switch_preference[lookup]
+
+        # Learning rate based on certainty (less learning when more certain)
+        certainty = state.scalar_states[:, 1].copy()
+        learning_rate = 0.1 * (1 - certainty)
+
+        # Voting reinforces the chosen option (vote action index = choice index)
+        voters = np.flatnonzero(voting)
+        choices = actions[voters]
+        state.preferences_matrix[voters, choices] += learning_rate[voters] * 0.1
+
+        # Commit voters whose strongest preference crosses the threshold
+        above = state.preferences_matrix[voters].max(axis=1) > self.config.commitment_threshold
+        committing = voters[above]
+        commitments_made = int((state.committed_choices[committing] < 0).sum())
+        state.committed_choices[committing] = choices[above]
+        state.scalar_states[committing, 4] = np.minimum(
+            state.scalar_states[committing, 4] + 0.1, 1.0
+        )
+
+        # Voting increases certainty, abstaining decreases it
+        state.scalar_states[voters, 1] = np.minimum(
+            certainty[voters] + 0.02 * (1 - certainty[voters]), 1.0
+        )
+        state.scalar_states[abstaining, 1] *= 0.99
+
+        # Switching preference uncommits
+        uncommitting = switching & (state.committed_choices >= 0)
+        state.committed_choices[uncommitting] = -1
+        state.scalar_states[uncommitting, 4] *= 0.5
+
+        # Normalize updated preferences
+        row_sums = state.preferences_matrix.sum(axis=1, keepdims=True)
+        state.preferences_matrix /= np.where(row_sums > 0, row_sums, 1)
+
+        actions_taken = int(defined.sum())
+        state_changes = len(voters) + int(uncommitting.sum())
         return actions_taken, commitments_made, state_changes
 
     def _generate_random_event(self, step: int) -> Optional[Dict[str, Any]]:
@@ -766,60 +846,29 @@ class SimulationLoop:
         """
         Run multiple simulations for Monte Carlo analysis.
 
+        Each replicate starts from this loop's current state with its own
+        random stream derived from config.random_seed, and replicates run on
+        config.monte_carlo_workers processes. This loop's state is not
+        modified.
+
         Args:
-            num_runs: Number of simulation runs
-            db: Optional database session
+            num_runs: Maximum number of simulation runs (fewer when the
+                config.monte_carlo_ci_width target is reached)
+            db: Unused; replicates are not persisted
 
         Returns:
             Aggregated results with distribution statistics
         """
-        all_distributions = []
-        all_results = []
-
-        for run in range(num_runs):
-            logger.info(f"Monte Carlo run {run + 1}/{num_runs}")
-
-            # Reset state for new run
-            # Note: This assumes state can be reset; in practice may need to reinitialize
-
-            # Run simulation
-            result = await self.run(db)
-            all_results.append(result)
-            all_distributions.append(result.final_distribution)
-
-            # Reset for next run
-            self.step_results = []
-            self.distribution_history = []
-            self.current_step = 0
-
-        # Aggregate results
-        final_result = all_results[-1]  # Use last run as base
-
-        # Calculate Monte Carlo statistics
-        all_keys = set()
-        for d in all_distributions:
-            all_keys.update(d.keys())
-
-        mc_mean = {}
-        mc_std = {}
-        for key in all_keys:
-            values = [d.get(key, 0) for d in all_distributions]
-            mc_mean[key] = float(np.mean(values))
-            mc_std[key] = float(np.std(values))
-
-        final_result.monte_carlo_distributions = all_distributions
-        final_result.monte_carlo_mean = mc_mean
-        final_result.monte_carlo_std = mc_std
-
-        # Update confidence intervals with Monte Carlo data
-        for key in all_keys:
-            mean_val = mc_mean[key]
-            std_val = mc_std[key]
-            ci_low = mean_val - 1.96 * std_val
-            ci_high = mean_val + 1.96 * std_val
-            final_result.confidence_intervals[key] = (max(0, ci_low), min(1, ci_high))
-
-        return final_result
+        from app.engine.monte_carlo import MonteCarloRunner
+
+        runner = MonteCarloRunner(
+            self,
+            workers=self.config.monte_carlo_workers,
+            seed=self.config.random_seed,
+            ci_target=self.config.monte_carlo_ci_width,
+            min_runs=self.config.monte_carlo_min_runs,
+        )
+        return await runner.run(num_runs)
 
 
 async def create_simulation_loop(
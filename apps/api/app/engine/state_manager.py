@@ -16,13 +16,37 @@ from collections import defaultdict
 import copy
 import json
 import logging
+import time
 
-from sqlalchemy import select, update
+from scipy import sparse
+from sqlalchemy import select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.engine.checkpoint_store import CheckpointStore
+
 logger = logging.getLogger(__name__)
 
 
+# One statement per chunk: rows are shipped as parallel arrays and joined
+# back with unnest (PostgreSQL)
+_BULK_AGENT_STATE_UPDATE = text("""
+    UPDATE simulation_agents AS a
+    SET state_vector = CAST(v.state_vector AS jsonb),
+        commitment_strength = v.commitment_strength,
+        committed_action = v.committed_action
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:state_vectors AS text[]),
+        CAST(:commitment_strengths AS float8[]),
+        CAST(:committed_actions AS text[])
+    ) AS v(id, state_vector, commitment_strength, committed_action)
+    WHERE a.id = v.id
+""")
+
+# Preference/issue weights at or below this are omitted from persisted state vectors
+_PERSIST_MIN_WEIGHT = 0.001
+
+
 @dataclass
 class GlobalState:
     """Global environment state at a specific time step."""
@@ -172,6 +196,118 @@ class AgentStateVector:
         return state
 
 
+# Social weight given to peers sampled without a social network
+DEFAULT_PEER_WEIGHT = 0.1
+
+
+@dataclass
+class NeighborIndex:
+    """
+    Compressed sparse row view of the social network.
+
+    Neighbours of agent i are indices[indptr[i]:indptr[i+1]] with the
+    matching edge weights.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_adjacency(
+        cls,
+        adjacency: Dict[int, List[Tuple[int, float]]],
+        num_agents: int,
+    ) -> "NeighborIndex":
+        """Build from an adjacency mapping (agent index -> [(peer index, weight)])."""
+        degree = np.zeros(num_agents, dtype=np.int64)
+        for i, edges in adjacency.items():
+            if 0 <= i < num_agents:
+                degree[i] = len(edges)
+        indptr = np.concatenate([[0], np.cumsum(degree)])
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        weights = np.empty(indptr[-1], dtype=np.float64)
+        for i, edges in adjacency.items():
+            if edges and 0 <= i < num_agents:
+                peers, edge_weights = zip(*edges)
+                indices[indptr[i]:indptr[i + 1]] = peers
+                weights[indptr[i]:indptr[i + 1]] = edge_weights
+        return cls(indptr=indptr, indices=indices, weights=weights)
+
+    @property
+    def num_agents(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def to_csr(self) -> sparse.csr_matrix:
+        """Edge weights as a scipy CSR matrix of shape (num_agents, num_agents)."""
+        return sparse.csr_matrix(
+            (self.weights, self.indices, self.indptr),
+            shape=(self.num_agents, self.num_agents),
+            copy=False,
+        )
+
+    def sample(self, num_peers: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample up to ``num_peers`` distinct neighbours for every agent at once.
+
+        Each edge gets a uniform random key and the ``num_peers`` smallest
+        keys per row are kept, which is sampling without replacement.
+
+        Returns:
+            (peer indices, edge weights), both shape (num_agents, num_peers);
+            unused slots are -1 and 0.0
+        """
+        n = self.num_agents
+        peers = np.full((n, num_peers), -1, dtype=np.int64)
+        weights = np.zeros((n, num_peers))
+        if self.num_edges == 0 or num_peers == 0:
+            return peers, weights
+
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        keys = np.random.random(self.num_edges)
+        order = np.lexsort((keys, rows))
+        rank = np.arange(self.num_edges) - self.indptr[rows[order]]
+        keep = rank < num_peers
+        selected = order[keep]
+        peers[rows[selected], rank[keep]] = self.indices[selected]
+        weights[rows[selected], rank[keep]] = self.weights[selected]
+        return peers, weights
+
+
+def sample_random_peers(num_agents: int, num_peers: int) -> np.ndarray:
+    """
+    Sample ``num_peers`` distinct peers other than itself for every agent.
+
+    Returns:
+        Peer indices, shape (num_agents, min(num_peers, num_agents - 1))
+    """
+    num_peers = max(0, min(num_peers, num_agents - 1))
+    if num_peers == 0:
+        return np.empty((num_agents, 0), dtype=np.int64)
+
+    if 2 * num_peers >= num_agents - 1:
+        # Dense: random permutation of the other agents per row
+        keys = np.random.random((num_agents, num_agents - 1))
+        offsets = np.argsort(keys, axis=1)[:, :num_peers] + 1
+    else:
+        # Sparse: draw offsets and redraw rows that repeat a peer
+        offsets = np.random.randint(1, num_agents, size=(num_agents, num_peers))
+        while True:
+            ordered = np.sort(offsets, axis=1)
+            repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            if not repeated.any():
+                break
+            offsets[repeated] = np.random.randint(
+                1, num_agents, size=(int(repeated.sum()), num_peers)
+            )
+    # A non-zero offset modulo num_agents never maps an agent to itself
+    return (np.arange(num_agents)[:, np.newaxis] + offsets) % num_agents
+
+
 class StateManager:
     """
     Manages simulation state for both global environment and individual agents.
@@ -185,6 +321,9 @@ class StateManager:
         max_checkpoints: int = 100,
         preference_dimensions: int = 10,
         issue_dimensions: int = 10,
+        checkpoint_keyframe_interval: int = 10,
+        checkpoint_byte_budget: Optional[int] = None,
+        checkpoint_spill_dir: Optional[str] = None,
     ):
         self.max_agents = max_agents
         self.checkpoint_interval = checkpoint_interval
@@ -211,18 +350,27 @@ class StateManager:
 
         # Social network (sparse representation)
         self.network_adjacency: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        self._neighbor_index: Optional[NeighborIndex] = None
 
         # Memory buffers
         self.recent_actions_buffer: Optional[np.ndarray] = None  # (num_agents, buffer_size)
         self.recent_rewards_buffer: Optional[np.ndarray] = None
         self.buffer_size = 10
 
-        # Checkpoints for rollback
-        self.checkpoints: List[Tuple[int, GlobalState, np.ndarray, np.ndarray, np.ndarray]] = []
+        # Checkpoints for rollback (delta-encoded ring, spills to disk over budget)
+        self.checkpoints = CheckpointStore(
+            capacity=max_checkpoints,
+            keyframe_interval=checkpoint_keyframe_interval,
+            byte_budget=checkpoint_byte_budget,
+            spill_dir=checkpoint_spill_dir,
+        )
 
         # State change tracking
         self.state_change_log: List[Dict[str, Any]] = []
 
+        # Persisted columns as of the last database flush (for only_changed)
+        self._persisted_state: Optional[Dict[str, np.ndarray]] = None
+
         # Observers for state changes
         self.observers: List[Callable[[str, Any], None]] = []
 
@@ -270,6 +418,8 @@ class StateManager:
         if global_state:
             self.global_state = global_state
 
+        self._persisted_state = None
+
         # Create initial checkpoint
         self._create_checkpoint()
 
@@ -290,6 +440,8 @@ class StateManager:
         self.agent_count = len(agents)
         self.agent_ids = [a.id for a in agents]
         self.agent_id_to_index = {a.id: i for i, a in enumerate(agents)}
+        index_by_key = {str(a.id): i for i, a in enumerate(agents)}
+        adjacency: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
 
         # Build matrices from agent data
         self.preferences_matrix = np.zeros((self.agent_count, self.preference_dimensions))
@@ -324,6 +476,14 @@ class StateManager:
             self.scalar_states[i, 5] = social_net.get("centrality", 0.0)
             self.scalar_states[i, 6] = social_net.get("echo_chamber_score", 0.0)
 
+            influence_weights = social_net.get("influence_weights", {})
+            for peer_key in social_net.get("connections", []):
+                peer = index_by_key.get(str(peer_key))
+                if peer is not None and peer != i:
+                    adjacency[i].append(
+                        (peer, float(influence_weights.get(peer_key, DEFAULT_PEER_WEIGHT)))
+                    )
+
             # Build region indices
             if agent.region_id:
                 self.region_agent_indices[agent.region_id].append(i)
@@ -334,6 +494,8 @@ class StateManager:
                 if isinstance(value, str):
                     self.demographic_indices[key][value].append(i)
 
+        self.set_network_adjacency(adjacency)
+
         # Initialize commitments and buffers
         self.committed_choices = np.full(self.agent_count, -1, dtype=np.int32)
         self.recent_actions_buffer = np.full((self.agent_count, self.buffer_size), -1, dtype=np.int32)
@@ -343,11 +505,54 @@ class StateManager:
         if global_state:
             self.global_state = global_state
 
+        self._persisted_state = None
+
         # Create initial checkpoint
         self._create_checkpoint()
 
         logger.info(f"StateManager initialized from {self.agent_count} agent objects")
 
+    def set_network_adjacency(self, adjacency: Dict[int, List[Tuple[int, float]]]) -> None:
+        """
+        Replace the social network.
+
+        Args:
+            adjacency: Agent index -> list of (peer index, influence weight)
+        """
+        self.network_adjacency = defaultdict(list, adjacency)
+        self._neighbor_index = None
+
+    @property
+    def neighbor_index(self) -> NeighborIndex:
+        """CSR index of network_adjacency, built on first use after a change."""
+        if self._neighbor_index is None or self._neighbor_index.num_agents != self.agent_count:
+            self._neighbor_index = NeighborIndex.from_adjacency(
+                self.network_adjacency, self.agent_count
+            )
+        return self._neighbor_index
+
+    def sample_peers(self, num_peers: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample peers for every agent in one vectorized call.
+
+        Peers are drawn from the social network with their edge weights.
+        Without a network they are drawn uniformly from all other agents
+        with DEFAULT_PEER_WEIGHT.
+
+        Returns:
+            (peer indices, social weights), shape (agent_count, num_peers);
+            unused slots are -1 and 0.0
+        """
+        index = self.neighbor_index
+        if index.num_edges:
+            return index.sample(num_peers)
+
+        peers = np.full((self.agent_count, num_peers), -1, dtype=np.int64)
+        sampled = sample_random_peers(self.agent_count, num_peers)
+        peers[:, :sampled.shape[1]] = sampled
+        weights = np.where(peers >= 0, DEFAULT_PEER_WEIGHT, 0.0)
+        return peers, weights
+
     def get_agent_state(self, agent_id: UUID) -> Optional[AgentStateVector]:
         """Get state for a specific agent."""
         if agent_id not in self.agent_id_to_index:
@@ -652,22 +857,25 @@ class StateManager:
 
         return aggregates
 
+    def _checkpoint_arrays(self) -> Dict[str, np.ndarray]:
+        """State arrays captured by checkpoints."""
+        return {
+            "preferences": self.preferences_matrix,
+            "issue_priorities": self.issue_priorities_matrix,
+            "scalar_states": self.scalar_states,
+            "committed_choices": self.committed_choices,
+            "recent_actions": self.recent_actions_buffer,
+            "recent_rewards": self.recent_rewards_buffer,
+        }
+
     def _create_checkpoint(self) -> None:
         """Create a state checkpoint for potential rollback."""
-        checkpoint = (
+        self.checkpoints.save(
             self.global_state.time_step,
-            self.global_state.copy(),
-            self.preferences_matrix.copy(),
-            self.issue_priorities_matrix.copy(),
-            self.scalar_states.copy(),
+            self._checkpoint_arrays(),
+            payload=self.global_state.copy(),
         )
 
-        self.checkpoints.append(checkpoint)
-
-        # Remove old checkpoints if exceeding limit
-        while len(self.checkpoints) > self.max_checkpoints:
-            self.checkpoints.pop(0)
-
         logger.debug(f"Created checkpoint at step {self.global_state.time_step}")
 
     def rollback(self, target_step: Optional[int] = None) -> bool:
@@ -680,36 +888,59 @@ class StateManager:
         Returns:
             True if rollback successful
         """
-        if not self.checkpoints:
+        if not len(self.checkpoints):
             logger.warning("No checkpoints available for rollback")
             return False
 
-        # Find appropriate checkpoint
-        checkpoint = None
-        if target_step is None:
-            checkpoint = self.checkpoints[-1]
-        else:
-            for cp in reversed(self.checkpoints):
-                if cp[0] <= target_step:
-                    checkpoint = cp
-                    break
+        # Find appropriate checkpoint (restored arrays are fresh copies)
+        checkpoint = self.checkpoints.find(target_step)
 
         if checkpoint is None:
             logger.warning(f"No checkpoint found for step {target_step}")
             return False
 
         # Restore state
-        step, global_state, prefs, issues, scalars = checkpoint
-        self.global_state = global_state.copy()
-        self.preferences_matrix = prefs.copy()
-        self.issue_priorities_matrix = issues.copy()
-        self.scalar_states = scalars.copy()
+        self._restore_arrays(checkpoint.arrays, checkpoint.payload.copy())
 
-        logger.info(f"Rolled back to step {step}")
-        self._notify_observers("rollback", step)
+        logger.info(f"Rolled back to step {checkpoint.step}")
+        self._notify_observers("rollback", checkpoint.step)
 
         return True
 
+    def _restore_arrays(self, arrays: Dict[str, np.ndarray], global_state: GlobalState) -> None:
+        """Install checkpoint arrays (taken over, not copied) and global state."""
+        self.global_state = global_state
+        self.preferences_matrix = arrays["preferences"]
+        self.issue_priorities_matrix = arrays["issue_priorities"]
+        self.scalar_states = arrays["scalar_states"]
+        self.committed_choices = arrays["committed_choices"]
+        self.recent_actions_buffer = arrays["recent_actions"]
+        self.recent_rewards_buffer = arrays["recent_rewards"]
+
+    def snapshot(self) -> Tuple[Dict[str, np.ndarray], GlobalState]:
+        """
+        In-memory copy of the current state, outside the checkpoint ring.
+
+        Returns:
+            Tuple of (state arrays, global state) for restore()
+        """
+        arrays = {name: array.copy() for name, array in self._checkpoint_arrays().items()}
+        return arrays, self.global_state.copy()
+
+    def restore(self, snapshot: Tuple[Dict[str, np.ndarray], GlobalState]) -> None:
+        """
+        Restore a state taken with snapshot(). The snapshot stays reusable.
+
+        Args:
+            snapshot: Tuple of (state arrays, global state)
+        """
+        arrays, global_state = snapshot
+        self._restore_arrays(
+            {name: array.copy() for name, array in arrays.items()},
+            global_state.copy(),
+        )
+        self._notify_observers("restore", self.global_state.time_step)
+
     def add_observer(self, callback: Callable[[str, Any], None]) -> None:
         """Add state change observer."""
         self.observers.append(callback)
@@ -722,54 +953,145 @@ class StateManager:
             except Exception as e:
                 logger.error(f"Observer notification failed: {e}")
 
-    async def persist_to_database(self, db: AsyncSession) -> None:
-        """
-        Persist current state to database.
-        Called periodically during long simulations.
-        """
-        from app.models.agent import SimulationAgent
-
-        # Batch update agents
-        batch_size = 1000
-        for batch_start in range(0, self.agent_count, batch_size):
-            batch_end = min(batch_start + batch_size, self.agent_count)
+    def _persisted_columns(self) -> Dict[str, np.ndarray]:
+        """Arrays backing the persisted agent columns."""
+        return {
+            "preferences": self.preferences_matrix,
+            "issue_priorities": self.issue_priorities_matrix,
+            "scalars": self.scalar_states[:, :5],
+            "committed_choices": self.committed_choices,
+        }
 
-            for i in range(batch_start, batch_end):
-                agent_id = self.agent_ids[i]
+    def changed_agent_indices(self) -> np.ndarray:
+        """Indices of agents whose persisted state changed since the last flush."""
+        current = self._persisted_columns()
+        previous = self._persisted_state
+        if previous is None or any(
+            previous[name].shape != values.shape for name, values in current.items()
+        ):
+            return np.arange(self.agent_count)
+
+        changed = np.zeros(self.agent_count, dtype=bool)
+        for name, values in current.items():
+            diff = values != previous[name]
+            changed |= diff.reshape(self.agent_count, -1).any(axis=1)
+        return np.flatnonzero(changed)
+
+    def state_vector_rows(self, agent_indices: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Persisted column values for the given agents, built from the matrices.
 
-                # Reconstruct state vector dict
-                state_vector = {
+        Returns:
+            One dict per agent with id, state_vector, commitment_strength
+            and committed_action
+        """
+        agent_indices = np.asarray(agent_indices, dtype=np.int64)
+        choice_keys = [f"choice_{j}" for j in range(self.preference_dimensions)]
+        issue_keys = [f"issue_{j}" for j in range(self.issue_dimensions)]
+
+        prefs = self.preferences_matrix[agent_indices]
+        issues = self.issue_priorities_matrix[agent_indices]
+        pref_mask = (prefs > _PERSIST_MIN_WEIGHT).tolist()
+        issue_mask = (issues > _PERSIST_MIN_WEIGHT).tolist()
+        prefs, issues = prefs.tolist(), issues.tolist()
+        scalars = self.scalar_states[agent_indices, :5].tolist()
+        choices = self.committed_choices[agent_indices].tolist()
+
+        rows = []
+        for k, i in enumerate(agent_indices.tolist()):
+            engagement, certainty, susceptibility, exposure, strength = scalars[k]
+            rows.append({
+                "id": self.agent_ids[i],
+                "state_vector": {
                     "political_preference": {
-                        f"choice_{j}": float(self.preferences_matrix[i, j])
-                        for j in range(self.preference_dimensions)
-                        if self.preferences_matrix[i, j] > 0.001
+                        key: value
+                        for key, value, keep in zip(choice_keys, prefs[k], pref_mask[k])
+                        if keep
                     },
                     "issue_priorities": {
-                        f"issue_{j}": float(self.issue_priorities_matrix[i, j])
-                        for j in range(self.issue_dimensions)
-                        if self.issue_priorities_matrix[i, j] > 0.001
+                        key: value
+                        for key, value, keep in zip(issue_keys, issues[k], issue_mask[k])
+                        if keep
                     },
-                    "engagement_level": float(self.scalar_states[i, 0]),
-                    "certainty": float(self.scalar_states[i, 1]),
-                    "influence_susceptibility": float(self.scalar_states[i, 2]),
-                    "information_exposure": float(self.scalar_states[i, 3]),
-                }
-
-                # Update in database
-                await db.execute(
-                    update(SimulationAgent)
-                    .where(SimulationAgent.id == agent_id)
-                    .values(
-                        state_vector=state_vector,
-                        commitment_strength=float(self.scalar_states[i, 4]),
-                        committed_action=str(self.committed_choices[i]) if self.committed_choices[i] >= 0 else None,
-                    )
-                )
+                    "engagement_level": engagement,
+                    "certainty": certainty,
+                    "influence_susceptibility": susceptibility,
+                    "information_exposure": exposure,
+                },
+                "commitment_strength": strength,
+                "committed_action": str(choices[k]) if choices[k] >= 0 else None,
+            })
+        return rows
+
+    async def persist_to_database(
+        self,
+        db: AsyncSession,
+        only_changed: bool = False,
+        batch_size: int = 5000,
+    ) -> Dict[str, Any]:
+        """
+        Persist current state to database.
+        Called periodically during long simulations.
+
+        Sends one bulk statement per chunk: an unnest-driven UPDATE ... FROM
+        on PostgreSQL, an executemany bulk update elsewhere.
+
+        Args:
+            db: Database session
+            only_changed: Only write agents whose state changed since the
+                last flush
+            batch_size: Agents per statement
+
+        Returns:
+            Persistence statistics (rows written, elapsed time, rows/second)
+        """
+        from app.models.agent import SimulationAgent
+
+        start = time.perf_counter()
+        if only_changed:
+            indices = self.changed_agent_indices()
+        else:
+            indices = np.arange(self.agent_count)
+
+        try:
+            dialect = db.get_bind().dialect.name
+        except Exception:
+            dialect = None
+        method = "unnest" if dialect == "postgresql" else "executemany"
+
+        for batch_start in range(0, len(indices), batch_size):
+            rows = self.state_vector_rows(indices[batch_start:batch_start + batch_size])
+
+            if method == "unnest":
+                await db.execute(_BULK_AGENT_STATE_UPDATE, {
+                    "ids": [row["id"] for row in rows],
+                    "state_vectors": [json.dumps(row["state_vector"]) for row in rows],
+                    "commitment_strengths": [row["commitment_strength"] for row in rows],
+                    "committed_actions": [row["committed_action"] for row in rows],
+                })
+            else:
+                await db.execute(update(SimulationAgent), rows)
 
             await db.flush()
 
         await db.commit()
-        logger.info(f"Persisted state for {self.agent_count} agents")
+
+        self._persisted_state = {
+            name: values.copy() for name, values in self._persisted_columns().items()
+        }
+
+        elapsed = time.perf_counter() - start
+        stats = {
+            "rows_persisted": int(len(indices)),
+            "elapsed_seconds": elapsed,
+            "rows_per_second": len(indices) / elapsed if elapsed > 0 else 0.0,
+            "method": method,
+        }
+        logger.info(
+            f"Persisted state for {stats['rows_persisted']} of {self.agent_count} agents "
+            f"({stats['rows_per_second']:.0f} rows/s, {method})"
+        )
+        return stats
 
     def get_state_summary(self) -> Dict[str, Any]:
         """Get summary of current state for logging/display."""
@@ -778,6 +1100,7 @@ class StateManager:
             "agent_count": self.agent_count,
             "committed_agents": int((self.committed_choices >= 0).sum()),
             "checkpoint_count": len(self.checkpoints),
+            "checkpoint_memory_bytes": self.checkpoints.nbytes,
             "active_events": len(self.global_state.active_events),
             "economic_indicators": self.global_state.economic_indicators,
             "aggregate_stats": self.global_state.aggregate_stats,
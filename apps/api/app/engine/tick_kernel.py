@@ -0,0 +1,551 @@
+"""
+Vectorized Society Mode Tick Kernel
+Reference: project.md §4.1, §6.3, Phase 1
+
+Columnar execution of the agent lifecycle:
+- Agent traits, decision tables, beliefs and rule-updated variables
+  are held in NumPy arrays
+- A whole tick (Observe → Evaluate → Decide → Act → Update) runs as
+  batched array operations through RuleEngine.run_batch_tick
+- Results are written back to the Agent objects on sync_to_agents()
+- A tick is split into evaluate() (Observe → Evaluate → Decide and rules,
+  reading only tick-start state from KernelArrays) and apply() (Act →
+  Update), so row subsets can be evaluated independently and merged
+  (see app.engine.sharding)
+
+The per-agent path (Agent.observe/evaluate/decide/act/update followed by
+RuleEngine.run_agent_tick) remains the reference implementation; for the
+same seed the kernel produces the same variables, beliefs, decisions and
+actions.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.engine.agent import Agent, AgentPool, AgentState, SocialGraphIndex
+from app.engine.rng import CounterRNG
+from app.engine.rules import BatchRuleContext, RuleEngine
+
+
+# Trait that modulates each action type's base probability (mirrors Agent.decide)
+_ACTION_TRAIT_MODIFIERS = {
+    "risky_action": "risk_tolerance",
+    "social_action": "extraversion",
+}
+
+# Belief reinforcement applied by Agent.update for an action result without
+# a "success" flag, which is the case for every action the kernel produces
+_FAILED_ACTION_BELIEF = 0.0
+_FAILED_ACTION_LEARNING_RATE = 0.05
+
+# Decision threshold used by Agent.decide
+_DECISION_THRESHOLD = 0.5
+
+# Agent._state_history transitions recorded per tick; to_full_state() only
+# exposes the last ten, so two cycles are enough to reproduce it exactly
+_LIFECYCLE_CYCLES_KEPT = 2
+
+
+@dataclass
+class TickEvaluation:
+    """
+    Output of the Observe → Evaluate → Decide phases for some rows.
+
+    Nothing in the kernel is modified while producing it; the Act → Update
+    phases consume it in VectorizedTickKernel.apply().
+    """
+    active: np.ndarray
+    decision_index: np.ndarray
+    observable_peers: np.ndarray
+    social_signals: Dict[str, np.ndarray]
+    rule_results: Dict[str, Dict[str, np.ndarray]]
+
+    @classmethod
+    def merge(
+        cls,
+        active: np.ndarray,
+        parts: List[Tuple[np.ndarray, "TickEvaluation"]],
+    ) -> "TickEvaluation":
+        """
+        Reassemble evaluations of disjoint row subsets into ``active`` order.
+
+        Args:
+            active: Rows of the whole tick
+            parts: (positions in ``active``, evaluation of active[positions])
+        """
+        n = len(active)
+
+        def scatter(columns: List[Tuple[np.ndarray, Dict[str, np.ndarray]]], fill) -> Dict[str, np.ndarray]:
+            merged: Dict[str, np.ndarray] = {}
+            for key in sorted({k for _, values in columns for k in values}):
+                present = [(pos, values[key]) for pos, values in columns if key in values]
+                dtype = np.result_type(*(v.dtype for _, v in present))
+                column = np.full(n, fill, dtype=dtype)
+                for pos, values in present:
+                    column[pos] = values
+                merged[key] = column
+            return merged
+
+        decision_index = np.full(n, -1, dtype=np.int64)
+        observable_peers = np.zeros(n, dtype=np.int64)
+        for positions, part in parts:
+            decision_index[positions] = part.decision_index
+            observable_peers[positions] = part.observable_peers
+
+        result_keys = sorted({k for _, part in parts for k in part.rule_results})
+        rule_results = {}
+        for key in result_keys:
+            columns = [(pos, part.rule_results.get(key, {})) for pos, part in parts]
+            # Masks and rules_applied are boolean; absent rows were not applied
+            is_mask = key.endswith("_masks") or key == "rules_applied"
+            rule_results[key] = scatter(columns, False if is_mask else 0)
+
+        return cls(
+            active=np.asarray(active, dtype=np.int64),
+            decision_index=decision_index,
+            observable_peers=observable_peers,
+            social_signals=scatter(
+                [(pos, part.social_signals) for pos, part in parts], np.nan
+            ),
+            rule_results=rule_results,
+        )
+
+
+@dataclass
+class KernelArrays:
+    """
+    Read-only inputs of the Observe → Evaluate → Decide phases.
+
+    Everything evaluate() reads, as plain arrays, so the same code can run
+    in another process over shared-memory copies (see app.engine.sharding).
+    """
+    agent_ids: List[str]
+    social_index: SocialGraphIndex
+    alive: np.ndarray
+    snapshot_fields: Dict[str, np.ndarray]
+    decision_index: np.ndarray
+
+    def observe(self, active: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Influence-weighted peer signals for the active rows.
+
+        Matches Agent.observe: numeric top-level snapshot fields of
+        influencing peers, normalised by the number of observable peers.
+        Returns the signal columns and the observable (connected,
+        non-terminated) peer count per row.
+        """
+        graph = self.social_index
+        num_rows = len(active)
+        counts = graph.degree()[active]
+        rows = np.repeat(np.arange(num_rows), counts)
+        edges = np.arange(counts.sum()) + np.repeat(
+            graph.indptr[active] - (np.cumsum(counts) - counts), counts
+        )
+
+        peers = graph.indices[edges]
+        influence = graph.influence[edges]
+        observable = self.alive[peers]
+        observable_peers = np.bincount(rows[observable], minlength=num_rows)
+
+        contributing = observable & (influence > 0)
+        rows, peers, influence = rows[contributing], peers[contributing], influence[contributing]
+        has_signal = np.bincount(rows, minlength=num_rows) > 0
+        peer_count = max(int(self.alive.sum()), 1)
+
+        social_signals = {}
+        for name, values in self.snapshot_fields.items():
+            total = np.bincount(rows, weights=values[peers] * influence, minlength=num_rows)
+            social_signals[f"peer_{name}"] = np.where(has_signal, total / peer_count, np.nan)
+
+        return social_signals, observable_peers
+
+    def evaluate(
+        self,
+        rule_engine: RuleEngine,
+        tick: int,
+        active: np.ndarray,
+        environment: Dict[str, Any],
+        rng_seeds: Optional[np.ndarray] = None,
+        rng: Optional[CounterRNG] = None,
+    ) -> TickEvaluation:
+        """Run Observe → Evaluate → Decide and the lifecycle rules for ``active``."""
+        active = np.asarray(active, dtype=np.int64)
+
+        # Observe
+        social_signals, observable_peers = self.observe(active)
+
+        # Rules. The per-agent path passes to_full_state() as agent_state and
+        # to_snapshot() dicts as peer_states, both of which nest variables
+        # under "variables"; rules therefore see their defaults for top-level
+        # keys, and no social signals or decision are handed to them.
+        ctx = BatchRuleContext(
+            tick=tick,
+            agent_ids=[self.agent_ids[i] for i in active],
+            rng_seeds=(
+                np.zeros(len(active), dtype=np.int64)
+                if rng_seeds is None
+                else np.asarray(rng_seeds, dtype=np.int64)
+            ),
+            rng=rng,
+            agent_indices=active,
+            environment=environment,
+            peer_indptr=np.zeros(len(active) + 1, dtype=np.int64),
+        )
+
+        # Evaluate + Decide (decision table is precomputed)
+        return TickEvaluation(
+            active=active,
+            decision_index=self.decision_index[active],
+            observable_peers=observable_peers,
+            social_signals=social_signals,
+            rule_results=rule_engine.run_batch_tick(ctx),
+        )
+
+
+@dataclass
+class TickKernelResult:
+    """Per-tick output of the vectorized kernel, aligned with ``active``."""
+    tick: int
+    active: np.ndarray
+    agent_ids: List[str]
+    decision_types: List[Optional[str]]
+    actions: List[Optional[Dict[str, Any]]]
+    state_updates: Dict[str, np.ndarray] = field(default_factory=dict)
+    state_update_masks: Dict[str, np.ndarray] = field(default_factory=dict)
+    social_signals: Dict[str, np.ndarray] = field(default_factory=dict)
+    rules_applied: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def action_count(self) -> int:
+        """Number of agents that acted this tick."""
+        return sum(1 for a in self.actions if a is not None)
+
+    def state_delta(self, row: int) -> Dict[str, Any]:
+        """State updates of one row as a plain dict (same shape as run_agent_tick)."""
+        return {
+            key: values[row].item()
+            for key, values in self.state_updates.items()
+            if self.state_update_masks[key][row] and key != "timestamp"
+        }
+
+    def iter_rows(self) -> Iterator[Tuple[str, Optional[str], Optional[Dict[str, Any]], Dict[str, Any]]]:
+        """Yield (agent_id, decision_type, action, state_delta) per active agent."""
+        for row, agent_id in enumerate(self.agent_ids):
+            yield agent_id, self.decision_types[row], self.actions[row], self.state_delta(row)
+
+
+class VectorizedTickKernel:
+    """
+    Columnar tick kernel for Society Mode.
+
+    Built once per run from the agent population. Agent objects are only
+    touched to record memory events each tick and on sync_to_agents(),
+    which must be called before reading agent snapshots or full states.
+
+    Only rule engines whose enabled lifecycle rules all implement
+    ``evaluate_batch`` are supported (see RuleEngine.supports_batch).
+
+    With a counter-based ``rng``, rule randomness is keyed by kernel row,
+    which matches AgentPool.index_of for a kernel built with from_pool.
+    """
+
+    def __init__(
+        self,
+        agents: List[Agent],
+        rule_engine: RuleEngine,
+        social_index: Optional[SocialGraphIndex] = None,
+        rng: Optional[CounterRNG] = None,
+    ):
+        if not rule_engine.supports_batch():
+            raise ValueError("Rule engine contains rules without a batched implementation")
+
+        self.rule_engine = rule_engine
+        self.rng = rng
+        self.agents = list(agents)
+        self.agent_ids = [str(a.id) for a in self.agents]
+        self._index = {aid: i for i, aid in enumerate(self.agent_ids)}
+        n = len(self.agents)
+
+        # Stable traits
+        self.traits: Dict[str, np.ndarray] = {
+            name: np.array([getattr(a.profile, name) for a in self.agents], dtype=np.float64)
+            for name in ("openness", "extraversion", "risk_tolerance", "loss_aversion")
+        }
+
+        # Peers visible to observation and rules (non-terminated agents)
+        alive = np.array(
+            [a.state != AgentState.TERMINATED for a in self.agents], dtype=bool
+        )
+        if social_index is None:
+            social_index = SocialGraphIndex.from_agents(self.agents)
+        elif social_index.agent_ids != self.agent_ids:
+            raise ValueError("Social graph index does not match the agent order")
+        self.social_index = social_index
+
+        # Numeric top-level fields of Agent.to_snapshot(), as seen by peers
+        snapshot_fields: Dict[str, np.ndarray] = {
+            "tick": np.array([a._current_tick for a in self.agents], dtype=np.float64),
+            "social_edge_count": np.array(
+                [len(a.get_peer_ids()) for a in self.agents], dtype=np.float64
+            ),
+        }
+
+        # Decision table: first action (in profile order) above threshold
+        self.action_types: List[str] = []
+        action_columns: Dict[str, int] = {}
+        for agent in self.agents:
+            for action_type in agent.profile.action_probabilities:
+                if action_type not in action_columns:
+                    action_columns[action_type] = len(self.action_types)
+                    self.action_types.append(action_type)
+        self._build_decision_table(action_columns)
+
+        self.arrays = KernelArrays(
+            agent_ids=self.agent_ids,
+            social_index=social_index,
+            alive=alive,
+            snapshot_fields=snapshot_fields,
+            decision_index=self.decision_index,
+        )
+
+        # Beliefs touched by action reinforcement: action_{type}_success
+        num_actions = len(self.action_types)
+        self.beliefs = np.full((n, num_actions), np.nan)
+        for i, agent in enumerate(self.agents):
+            for j, action_type in enumerate(self.action_types):
+                value = agent.memory.beliefs.get(f"action_{action_type}_success")
+                if value is not None:
+                    self.beliefs[i, j] = value
+        self._beliefs_dirty = np.zeros((n, num_actions), dtype=bool)
+
+        # Variables written by rules since the last sync
+        self.variables: Dict[str, np.ndarray] = {}
+        self._variables_dirty: Dict[str, np.ndarray] = {}
+
+        # Lifecycle bookkeeping for sync
+        self._ticks_since_sync = np.zeros(n, dtype=np.int64)
+
+    @classmethod
+    def from_pool(
+        cls,
+        agent_pool: AgentPool,
+        rule_engine: RuleEngine,
+        rng: Optional[CounterRNG] = None,
+    ) -> "VectorizedTickKernel":
+        """Build a kernel sharing the pool's social graph index."""
+        return cls(
+            agent_pool.get_all(), rule_engine, social_index=agent_pool.social_index, rng=rng
+        )
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    def _build_decision_table(self, action_columns: Dict[str, int]) -> None:
+        """Precompute each agent's decision; traits are stable during a run."""
+        n = len(self.agents)
+        num_actions = len(self.action_types)
+        if num_actions == 0:
+            self.decision_index = np.full(n, -1, dtype=np.int64)
+            self.decision_probability = np.zeros(n)
+            return
+
+        probability = np.zeros((n, num_actions))
+        rank = np.full((n, num_actions), np.iinfo(np.int64).max, dtype=np.int64)
+        for i, agent in enumerate(self.agents):
+            for order, (action_type, base_prob) in enumerate(
+                agent.profile.action_probabilities.items()
+            ):
+                j = action_columns[action_type]
+                probability[i, j] = base_prob
+                rank[i, j] = order
+
+        for action_type, trait in _ACTION_TRAIT_MODIFIERS.items():
+            j = action_columns.get(action_type)
+            if j is not None:
+                probability[:, j] = probability[:, j] * self.traits[trait]
+
+        eligible = (probability > _DECISION_THRESHOLD) & (rank != np.iinfo(np.int64).max)
+        first_eligible = np.argmin(np.where(eligible, rank, np.iinfo(np.int64).max), axis=1)
+        has_decision = eligible.any(axis=1)
+
+        self.decision_index = np.where(has_decision, first_eligible, -1)
+        self.decision_probability = np.where(
+            has_decision, probability[np.arange(n), first_eligible], 0.0
+        )
+
+    def indices_of(self, agents: List[Agent]) -> np.ndarray:
+        """Kernel row indices of the given agents, in order."""
+        return np.fromiter(
+            (self._index[str(a.id)] for a in agents), dtype=np.int64, count=len(agents)
+        )
+
+    # =========================================================================
+    # Tick
+    # =========================================================================
+
+    def evaluate(
+        self,
+        tick: int,
+        active: np.ndarray,
+        environment: Dict[str, Any],
+        rng_seeds: Optional[np.ndarray] = None,
+    ) -> TickEvaluation:
+        """
+        Observe → Evaluate → Decide and rules for the given rows.
+
+        Reads tick-start state only, so disjoint row subsets can be
+        evaluated separately and combined with TickEvaluation.merge.
+        Arguments are as for run_tick.
+        """
+        if rng_seeds is None and self.rng is None:
+            raise ValueError("rng_seeds are required without a counter-based rng")
+        return self.arrays.evaluate(
+            self.rule_engine, tick, active, environment, rng_seeds=rng_seeds, rng=self.rng
+        )
+
+    def run_tick(
+        self,
+        tick: int,
+        active: np.ndarray,
+        environment: Dict[str, Any],
+        rng_seeds: Optional[np.ndarray] = None,
+    ) -> TickKernelResult:
+        """
+        Run one tick for the given kernel rows.
+
+        Args:
+            tick: Tick number
+            active: Row indices of the agents to process (see indices_of)
+            environment: Shared environment for the tick
+            rng_seeds: Per-agent RNG seeds aligned with ``active``, derived
+                exactly as for RuleContext.rng_seed on the per-agent path.
+                Only used without a counter-based rng.
+
+        Returns:
+            TickKernelResult aligned with ``active``
+        """
+        return self.apply(tick, self.evaluate(tick, active, environment, rng_seeds))
+
+    def apply(self, tick: int, evaluation: TickEvaluation) -> TickKernelResult:
+        """Act → Update for an evaluated tick."""
+        active = evaluation.active
+        agent_ids = [self.agent_ids[i] for i in active]
+        decision_index = evaluation.decision_index
+        rule_results = evaluation.rule_results
+        acted = decision_index >= 0
+        decision_types: List[Optional[str]] = [
+            self.action_types[j] if j >= 0 else None for j in decision_index.tolist()
+        ]
+
+        # Act
+        actions: List[Optional[Dict[str, Any]]] = [None] * len(active)
+        probabilities = self.decision_probability[active]
+        for row in np.flatnonzero(acted).tolist():
+            agent = self.agents[active[row]]
+            actions[row] = {
+                "agent_id": agent.id,
+                "tick": agent._current_tick,
+                "action_type": decision_types[row],
+                "parameters": {},
+                "confidence": probabilities[row].item(),
+            }
+
+        # Update
+        self._apply_state_updates(
+            active, rule_results["state_updates"], rule_results["state_update_masks"]
+        )
+        self._reinforce_beliefs(active[acted], decision_index[acted])
+        self._ticks_since_sync[active] += 1
+        self._record_memory(active, evaluation.observable_peers, actions)
+
+        return TickKernelResult(
+            tick=tick,
+            active=active,
+            agent_ids=agent_ids,
+            decision_types=decision_types,
+            actions=actions,
+            state_updates=rule_results["state_updates"],
+            state_update_masks=rule_results["state_update_masks"],
+            social_signals=evaluation.social_signals,
+            rules_applied=rule_results["rules_applied"],
+        )
+
+    def _apply_state_updates(
+        self,
+        active: np.ndarray,
+        updates: Dict[str, np.ndarray],
+        masks: Dict[str, np.ndarray],
+    ) -> None:
+        n = len(self.agents)
+        for key, values in updates.items():
+            mask = masks[key]
+            column = self.variables.get(key)
+            if column is None:
+                column = np.zeros(n, dtype=values.dtype)
+                self._variables_dirty[key] = np.zeros(n, dtype=bool)
+            elif column.dtype != values.dtype:
+                column = column.astype(np.result_type(column, values))
+            column[active[mask]] = values[mask]
+            self.variables[key] = column
+            self._variables_dirty[key][active[mask]] = True
+
+    def _reinforce_beliefs(self, rows: np.ndarray, columns: np.ndarray) -> None:
+        current = self.beliefs[rows, columns]
+        self.beliefs[rows, columns] = np.where(
+            np.isnan(current),
+            _FAILED_ACTION_BELIEF,
+            current * (1 - _FAILED_ACTION_LEARNING_RATE)
+            + _FAILED_ACTION_BELIEF * _FAILED_ACTION_LEARNING_RATE,
+        )
+        self._beliefs_dirty[rows, columns] = True
+
+    def _record_memory(
+        self,
+        active: np.ndarray,
+        observable_peers: np.ndarray,
+        actions: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        """Record observation/action events as Agent.observe/act do."""
+        for row, i in enumerate(active.tolist()):
+            agent = self.agents[i]
+            agent.memory.add_event({
+                "tick": agent._current_tick,
+                "type": "observation",
+                "data": {"peer_count": int(observable_peers[row])},
+                "significance": 0.3,
+            })
+            action = actions[row]
+            if action is not None:
+                agent.memory.add_event({
+                    "tick": agent._current_tick,
+                    "type": "action",
+                    "data": action,
+                    "significance": 0.5,
+                })
+
+    # =========================================================================
+    # Sync
+    # =========================================================================
+
+    def sync_to_agents(self) -> None:
+        """Write columnar state back to the Agent objects."""
+        for key, column in self.variables.items():
+            dirty = self._variables_dirty[key]
+            rows = np.flatnonzero(dirty)
+            for i, value in zip(rows.tolist(), column[rows].tolist()):
+                self.agents[i].set_var(key, value)
+            dirty[:] = False
+
+        rows, columns = np.nonzero(self._beliefs_dirty)
+        for i, j, value in zip(rows.tolist(), columns.tolist(), self.beliefs[rows, columns].tolist()):
+            self.agents[i].memory.beliefs[f"action_{self.action_types[j]}_success"] = value
+        self._beliefs_dirty[:] = False
+
+        acted = self.decision_index >= 0
+        for i in np.flatnonzero(self._ticks_since_sync).tolist():
+            for _ in range(min(int(self._ticks_since_sync[i]), _LIFECYCLE_CYCLES_KEPT)):
+                self.agents[i].record_lifecycle_cycle(bool(acted[i]))
+        self._ticks_since_sync[:] = 0
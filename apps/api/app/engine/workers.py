@@ -0,0 +1,47 @@
+"""
+Worker Process Availability
+
+One check used by every component that runs work on child processes
+(reliability run executors, shard evaluation, Monte Carlo replicates,
+calibration and vectorized MARL environments) before starting them.
+Each falls back to in-process execution when worker processes cannot
+be used.
+"""
+
+from typing import Any, Optional
+import logging
+import multiprocessing
+import pickle
+
+logger = logging.getLogger(__name__)
+
+
+def worker_processes_unavailable(fallback: str, **payloads: Any) -> Optional[str]:
+    """
+    Why worker processes cannot be used here, or None if they can.
+
+    Daemonic processes (e.g. Celery workers) cannot start children, and
+    everything shipped to a worker must be picklable. When unavailable a
+    warning naming the fallback is logged.
+
+    Args:
+        fallback: What the caller does instead, e.g. "using threads"
+        payloads: Objects sent to workers, keyed by a readable name
+
+    Returns:
+        The reason, or None when worker processes can be started
+    """
+    reason = None
+    if multiprocessing.current_process().daemon:
+        reason = "daemonic process cannot start worker processes"
+    else:
+        for name, payload in payloads.items():
+            try:
+                pickle.dumps(payload)
+            except Exception as e:
+                reason = f"{name.replace('_', ' ')} is not picklable ({e})"
+                break
+
+    if reason:
+        logger.warning(f"Worker processes unavailable: {reason}; {fallback}")
+    return reason
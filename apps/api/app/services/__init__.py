@@ -63,9 +63,16 @@ from app.services.telemetry import (
     TelemetryVersion,
     TelemetryIndexResult,
     TelemetrySliceResult,
+    AgentHistorySeries,
     get_telemetry_service,
     create_telemetry_writer,
 )
+from app.services.telemetry_export import (
+    TelemetryExporter,
+    TelemetryExportOptions,
+    TelemetryExportError,
+    ExportStatus,
+)
 # Simulation Orchestrator (Phase 1 Integration)
 from app.services.simulation_orchestrator import (
     SimulationOrchestrator,
@@ -204,8 +211,13 @@ __all__ = [
     "TelemetryVersion",
     "TelemetryIndexResult",
     "TelemetrySliceResult",
+    "AgentHistorySeries",
     "get_telemetry_service",
     "create_telemetry_writer",
+    "TelemetryExporter",
+    "TelemetryExportOptions",
+    "TelemetryExportError",
+    "ExportStatus",
     # Simulation Orchestrator (Phase 1 Integration)
     "SimulationOrchestrator",
     "SimulationMode",
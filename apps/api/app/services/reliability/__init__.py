@@ -6,6 +6,7 @@ Phase 7 implementation per project.md §11 Phase 7:
 - Error metrics suite
 - Bounded auto-tune
 - Stability suite
+- Run executors (serial, thread, process pool, Celery)
 - Sensitivity scanner
 - Drift detector
 - Reliability report generator
@@ -39,6 +40,16 @@ from .stability import (
     StabilityAnalyzer,
     SeedVarianceReport,
     MultiSeedRunner,
+    RunningStability,
+)
+from .executors import (
+    RunExecutor,
+    RunOutcome,
+    SimulationSpec,
+    SerialExecutor,
+    ThreadPoolRunExecutor,
+    ProcessPoolRunExecutor,
+    CeleryRunExecutor,
 )
 from .sensitivity import (
     SensitivityScanner,
@@ -46,6 +57,8 @@ from .sensitivity import (
     PerturbationResult,
     VariableImpact,
     VariableBound,
+    SensitivityMethod,
+    GlobalSensitivityIndices,
 )
 from .drift_detector import (
     DriftDetector,
@@ -90,12 +103,23 @@ __all__ = [
     'StabilityAnalyzer',
     'SeedVarianceReport',
     'MultiSeedRunner',
+    'RunningStability',
+    # Run executors
+    'RunExecutor',
+    'RunOutcome',
+    'SimulationSpec',
+    'SerialExecutor',
+    'ThreadPoolRunExecutor',
+    'ProcessPoolRunExecutor',
+    'CeleryRunExecutor',
     # Sensitivity
     'SensitivityScanner',
     'SensitivityReport',
     'PerturbationResult',
     'VariableImpact',
     'VariableBound',
+    'SensitivityMethod',
+    'GlobalSensitivityIndices',
     # Drift
     'DriftDetector',
     'DriftReport',
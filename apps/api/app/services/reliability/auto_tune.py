@@ -11,6 +11,8 @@ from datetime import datetime
 import numpy as np
 import logging
 
+from app.engine.calibration.objective_cache import ObjectiveCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -323,6 +325,9 @@ class BoundedAutoTune:
         self,
         config: TuneConfig,
         simulation_runner: Callable[[Dict[str, float]], float],
+        cache: Optional[ObjectiveCache] = None,
+        seed: Optional[int] = None,
+        ruleset_hash: Optional[str] = None,
     ):
         """
         Initialize auto-tuner.
@@ -330,9 +335,16 @@ class BoundedAutoTune:
         Args:
             config: Tuning configuration
             simulation_runner: Function that runs simulation with params
+            cache: Accuracy cache; gradient base points and cross-validation
+                folds re-evaluate the same params
+            seed: Seed the simulation runner uses, part of the cache key
+            ruleset_hash: RuleEngine.get_ruleset_hash() of the simulated rules
         """
         self.config = config
         self.simulation_runner = simulation_runner
+        self.cache = cache if cache is not None else ObjectiveCache()
+        self.seed = seed
+        self.ruleset_hash = ruleset_hash
         self.cross_validator = CrossValidator(
             n_folds=config.n_folds,
             overfitting_threshold=config.overfitting_threshold,
@@ -456,6 +468,7 @@ class BoundedAutoTune:
         if self.config.use_cross_validation and scenario_ids:
             final_cv = self._cross_validate(self.best_parameters, scenario_ids)
 
+        self.cache.save()
         end_time = datetime.now()
 
         final_param_set = ParameterSet(
@@ -491,12 +504,19 @@ class BoundedAutoTune:
 
     def _evaluate(self, params: Dict[str, float]) -> float:
         """Evaluate accuracy with given parameters."""
+        accuracy = self.cache.get(params, self.seed, self.ruleset_hash)
+        if accuracy is not None:
+            return accuracy
+
         try:
-            return self.simulation_runner(params)
+            accuracy = self.simulation_runner(params)
         except Exception as e:
             logger.error(f"Evaluation failed: {e}")
             return 0.0
 
+        self.cache.put(params, accuracy, self.seed, self.ruleset_hash)
+        return accuracy
+
     def _compute_gradients(
         self,
         params: Dict[str, float],
@@ -554,4 +574,5 @@ class BoundedAutoTune:
             "best_parameters": self.best_parameters,
             "rollback_count": self.rollback_count,
             "current_learning_rate": self.config.learning_rate,
+            "cache": self.cache.get_stats(),
         }
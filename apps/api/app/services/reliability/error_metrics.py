@@ -53,12 +53,13 @@ class RankingError:
 
     # Distance-based
     rank_distance: float  # Normalized rank distance (0 to 1)
-    top_k_accuracy: Dict[int, float] = field(default_factory=dict)  # Accuracy of top-k
 
     # Detailed
     pairwise_inversions: int  # Number of pairwise ordering mistakes
     total_pairs: int
 
+    top_k_accuracy: Dict[int, float] = field(default_factory=dict)  # Accuracy of top-k
+
     # Which categories were misordered
     misranked_pairs: List[Tuple[str, str]] = field(default_factory=list)
 
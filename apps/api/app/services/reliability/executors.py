@@ -0,0 +1,348 @@
+"""
+Reliability Run Executors
+
+Pluggable backends for running many independent simulations (seed
+replicas, historical scenarios) and collecting results as they finish.
+
+Backends:
+- SerialExecutor: in-process, one after another
+- ThreadPoolRunExecutor: threads; only useful for I/O-bound simulation
+  functions, since CPU-bound Python/NumPy code is serialized by the GIL
+- ProcessPoolRunExecutor: worker processes; the default for CPU-bound runs
+- CeleryRunExecutor: a Celery group of run_simulation_spec tasks
+
+Process and Celery backends need picklable (Celery: importable) simulation
+functions. SimulationSpec names a module-level function by import path
+together with fixed keyword arguments, so it can be shipped anywhere.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import importlib
+import logging
+import multiprocessing
+import time
+
+from app.engine.workers import worker_processes_unavailable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SimulationSpec:
+    """
+    Picklable reference to a simulation function.
+
+    Calling the spec imports ``target`` ("package.module:function") and
+    calls it with the positional arguments plus ``kwargs``.
+    """
+    target: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def resolve(self) -> Callable[..., Any]:
+        module_name, _, attribute = self.target.partition(":")
+        if not attribute:
+            raise ValueError(f"Simulation target must be 'module:function', got {self.target!r}")
+        fn = importlib.import_module(module_name)
+        for part in attribute.split("."):
+            fn = getattr(fn, part)
+        return fn
+
+    def __call__(self, *args: Any) -> Any:
+        return self.resolve()(*args, **self.kwargs)
+
+
+@dataclass
+class RunOutcome:
+    """Outcome of one submitted run."""
+    index: int  # Position in the submitted argument list
+    value: Any = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def _timed_call(fn: Callable[[Any], Any], arg: Any) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    value = fn(arg)
+    return value, time.perf_counter() - start
+
+
+def _timeout_error(timeout: float) -> str:
+    return f"Run exceeded timeout of {timeout:.1f}s"
+
+
+class RunExecutor(ABC):
+    """Runs ``fn(arg)`` for every argument and yields outcomes as they finish."""
+
+    @abstractmethod
+    def map_unordered(
+        self,
+        fn: Callable[[Any], Any],
+        args: List[Any],
+        timeout: Optional[float] = None,
+    ) -> Iterator[RunOutcome]:
+        """
+        Run ``fn`` over ``args``.
+
+        Args:
+            fn: Simulation function taking one argument
+            args: One argument per run
+            timeout: Per-run limit in seconds, measured from dispatch
+
+        Yields:
+            RunOutcome per argument, in completion order
+        """
+
+
+class SerialExecutor(RunExecutor):
+    """
+    Runs in the calling thread, one after another.
+
+    A run cannot be interrupted here, so one exceeding the timeout is
+    reported as timed out once it returns.
+    """
+
+    def map_unordered(self, fn, args, timeout=None):
+        for index, arg in enumerate(args):
+            start = time.perf_counter()
+            try:
+                value = fn(arg)
+            except Exception as e:
+                yield RunOutcome(index=index, error=str(e), duration_seconds=time.perf_counter() - start)
+                continue
+
+            duration = time.perf_counter() - start
+            if timeout is not None and duration > timeout:
+                yield RunOutcome(
+                    index=index, error=_timeout_error(timeout),
+                    duration_seconds=duration, timed_out=True,
+                )
+            else:
+                yield RunOutcome(index=index, value=value, duration_seconds=duration)
+
+
+class _PoolExecutor(RunExecutor):
+    """
+    Shared logic for concurrent.futures pools.
+
+    At most ``max_workers`` runs are in flight, so a run starts when it is
+    dispatched and its timeout is measured from then. Timed-out runs are
+    reported as failed. Pools whose workers can be stopped (processes)
+    terminate them and continue on a fresh pool, re-running the runs that
+    were in flight alongside; otherwise (threads) the run is abandoned and
+    keeps its worker until it returns, so no new run is dispatched into
+    that slot meanwhile.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+
+    @abstractmethod
+    def _create_pool(self):
+        ...
+
+    def _terminate_workers(self, pool) -> bool:
+        """Stop the pool's workers mid-run; False if they cannot be stopped."""
+        return False
+
+    def map_unordered(self, fn, args, timeout=None):
+        if not args:
+            return
+
+        pool = self._create_pool()
+        queue = deque(range(len(args)))
+        pending: Dict[Future, Tuple[int, float]] = {}
+        abandoned: List[Future] = []
+        try:
+            while queue or pending:
+                abandoned = [future for future in abandoned if not future.done()]
+                while queue and len(pending) + len(abandoned) < self.max_workers:
+                    index = queue.popleft()
+                    future = pool.submit(_timed_call, fn, args[index])
+                    pending[future] = (index, time.perf_counter())
+
+                if not pending:
+                    # Every worker is busy with an abandoned run
+                    wait(abandoned, return_when=FIRST_COMPLETED)
+                    continue
+
+                wait_for = None
+                if timeout is not None:
+                    earliest = min(started for _, started in pending.values())
+                    wait_for = max(0.0, earliest + timeout - time.perf_counter())
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, started = pending.pop(future)
+                    yield self._outcome(future, index, started)
+
+                if timeout is None:
+                    continue
+                now = time.perf_counter()
+                expired = [
+                    future for future, (_, started) in pending.items()
+                    if now - started >= timeout
+                ]
+                if not expired:
+                    continue
+                for future in expired:
+                    index, started = pending.pop(future)
+                    yield RunOutcome(
+                        index=index, error=_timeout_error(timeout),
+                        duration_seconds=now - started, timed_out=True,
+                    )
+
+                if not self._terminate_workers(pool):
+                    abandoned.extend(expired)
+                    continue
+
+                # The other in-flight runs died with the workers unless they
+                # had already finished; re-run those on a fresh pool
+                pool.shutdown(wait=True, cancel_futures=True)
+                rerun = []
+                for future, (index, started) in pending.items():
+                    finished = future.done() and not future.cancelled()
+                    if finished and not isinstance(future.exception(), BrokenProcessPool):
+                        yield self._outcome(future, index, started)
+                    else:
+                        rerun.append(index)
+                pending.clear()
+                queue.extendleft(sorted(rerun, reverse=True))
+                pool = self._create_pool()
+        finally:
+            # Consumer stopped early or runs were abandoned: stop what still runs
+            unfinished = [future for future in list(pending) + abandoned if not future.done()]
+            stopped = bool(unfinished) and self._terminate_workers(pool)
+            pool.shutdown(wait=stopped or not unfinished, cancel_futures=True)
+
+    @staticmethod
+    def _outcome(future: Future, index: int, started: float) -> RunOutcome:
+        try:
+            value, duration = future.result()
+        except Exception as e:
+            return RunOutcome(
+                index=index, error=str(e),
+                duration_seconds=time.perf_counter() - started,
+            )
+        return RunOutcome(index=index, value=value, duration_seconds=duration)
+
+
+class ThreadPoolRunExecutor(_PoolExecutor):
+    """Runs on a thread pool (for I/O-bound simulation functions)."""
+
+    def _create_pool(self):
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+class ProcessPoolRunExecutor(_PoolExecutor):
+    """
+    Runs on a process pool, so CPU-bound runs execute in parallel.
+
+    The simulation function and its arguments must be picklable (module
+    level functions or SimulationSpec, not closures). Unpicklable functions,
+    and calls from daemonic processes (e.g. Celery workers) that cannot
+    start children, fall back to a thread pool with a warning.
+
+    A run exceeding the timeout is stopped by terminating the worker
+    processes, so a hung simulation never outlives map_unordered.
+    """
+
+    def __init__(self, max_workers: int = 4, mp_context: str = "spawn"):
+        super().__init__(max_workers)
+        self.mp_context = mp_context
+
+    def _create_pool(self):
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.mp_context),
+        )
+
+    def _terminate_workers(self, pool) -> bool:
+        terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+        if terminate is not None:
+            terminate()
+            return True
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        for process in list((pool._processes or {}).values()):
+            process.join()
+        return True
+
+    def map_unordered(self, fn, args, timeout=None):
+        if worker_processes_unavailable("using threads", simulation_function=fn):
+            yield from ThreadPoolRunExecutor(self.max_workers).map_unordered(fn, args, timeout)
+            return
+
+        yield from super().map_unordered(fn, args, timeout)
+
+
+class CeleryRunExecutor(RunExecutor):
+    """
+    Runs as a Celery group of run_simulation_spec tasks.
+
+    The simulation function must be a SimulationSpec and its arguments and
+    results JSON-serializable. The timeout becomes each task's hard time
+    limit, so it is enforced by the worker from the moment the task starts.
+    """
+
+    def __init__(self, queue: str = "default", poll_interval: float = 0.5):
+        self.queue = queue
+        self.poll_interval = poll_interval
+
+    def map_unordered(self, fn, args, timeout=None):
+        if not isinstance(fn, SimulationSpec):
+            raise TypeError("CeleryRunExecutor requires a SimulationSpec")
+        if not args:
+            return
+
+        from celery import group
+        from celery.exceptions import TimeLimitExceeded
+        from app.tasks.reliability import run_simulation_spec
+
+        options: Dict[str, Any] = {"queue": self.queue}
+        if timeout is not None:
+            options["time_limit"] = timeout
+        started = time.perf_counter()
+        group_result = group(
+            run_simulation_spec.s(fn.target, fn.kwargs, arg).set(**options) for arg in args
+        ).apply_async()
+
+        pending = dict(enumerate(group_result.results))
+        try:
+            while pending:
+                for index, result in list(pending.items()):
+                    if not result.ready():
+                        continue
+                    del pending[index]
+                    if result.successful():
+                        payload = result.result
+                        yield RunOutcome(
+                            index=index, value=payload["value"],
+                            duration_seconds=payload["duration_seconds"],
+                        )
+                    elif timeout is not None and isinstance(result.result, TimeLimitExceeded):
+                        yield RunOutcome(
+                            index=index, error=_timeout_error(timeout),
+                            duration_seconds=timeout, timed_out=True,
+                        )
+                    else:
+                        yield RunOutcome(
+                            index=index, error=str(result.result),
+                            duration_seconds=time.perf_counter() - started,
+                        )
+
+                if pending:
+                    time.sleep(self.poll_interval)
+        finally:
+            # Consumer stopped early: don't leave orphaned simulations running
+            for result in pending.values():
+                result.revoke(terminate=True)
@@ -0,0 +1,195 @@
+"""
+Global Sensitivity Designs
+
+Sampling designs and index estimators for SensitivityScanner's global modes.
+Designs are generated in the unit hypercube [0, 1]^k up front, so the whole
+batch of simulations can be evaluated in parallel before any index is
+computed.
+
+Implements:
+- Morris elementary effects (mu, mu*, sigma) from random one-at-a-time
+  trajectories on a p-level grid
+- Saltelli sampling with first-order (Saltelli 2010) and total-order
+  (Jansen) Sobol index estimators
+
+Failed evaluations are passed in as NaN rows; estimators average over the
+samples that are available.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
+from scipy.stats import qmc
+
+
+@dataclass
+class SensitivityDesign:
+    """
+    Unit-hypercube design plus its one-variable-change pairs.
+
+    Row ``after_rows[j]`` differs from row ``before_rows[j]`` only in
+    variable ``variables[j]``.
+    """
+    points: np.ndarray  # (n_points, n_vars)
+    before_rows: np.ndarray  # (n_pairs,)
+    after_rows: np.ndarray  # (n_pairs,)
+    variables: np.ndarray  # (n_pairs,)
+
+    @property
+    def n_points(self) -> int:
+        return self.points.shape[0]
+
+    @property
+    def n_vars(self) -> int:
+        return self.points.shape[1]
+
+
+def _masked_mean(values: np.ndarray, axis: int) -> np.ndarray:
+    """Mean over finite entries; NaN where there are none."""
+    finite = np.isfinite(values)
+    counts = finite.sum(axis=axis)
+    totals = np.where(finite, values, 0.0).sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+
+
+def morris_design(
+    n_vars: int,
+    n_trajectories: int,
+    n_levels: int,
+    rng: np.random.Generator,
+) -> SensitivityDesign:
+    """
+    Generate Morris trajectories.
+
+    Each trajectory starts at a random grid point and moves every variable
+    once, in random order, by +/-delta where delta = p / (2 (p - 1)).
+
+    Returns:
+        Design with n_trajectories * (n_vars + 1) points
+    """
+    if n_levels < 2:
+        raise ValueError("Morris design needs at least 2 levels")
+
+    delta = n_levels / (2.0 * (n_levels - 1))
+    grid = np.arange(n_levels) / (n_levels - 1)
+
+    points = np.empty((n_trajectories, n_vars + 1, n_vars))
+    start = rng.choice(grid, size=(n_trajectories, n_vars))
+    order = np.argsort(rng.random((n_trajectories, n_vars)), axis=1)
+
+    # Step up where the grid allows it, otherwise down
+    direction = np.where(start + delta <= 1.0 + 1e-12, 1.0, -1.0)
+    steps = np.zeros((n_trajectories, n_vars + 1, n_vars))
+    rows = np.arange(n_trajectories)[:, None]
+    step_index = np.arange(1, n_vars + 1)[None, :]
+    steps[rows, step_index, order] = direction[rows, order] * delta
+    points[:] = start[:, None, :] + np.cumsum(steps, axis=1)
+    points = np.clip(points, 0.0, 1.0)
+
+    base = (np.arange(n_trajectories) * (n_vars + 1))[:, None]
+    before_rows = (base + np.arange(n_vars)[None, :]).ravel()
+    return SensitivityDesign(
+        points=points.reshape(-1, n_vars),
+        before_rows=before_rows,
+        after_rows=before_rows + 1,
+        variables=order.ravel(),
+    )
+
+
+def morris_indices(
+    design: SensitivityDesign,
+    outputs: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Elementary-effect statistics.
+
+    Args:
+        design: Design from morris_design
+        outputs: (n_points, n_outcomes) simulation outputs, NaN if failed
+
+    Returns:
+        (mu, mu_star, sigma), each (n_vars, n_outcomes)
+    """
+    step = (
+        design.points[design.after_rows, design.variables]
+        - design.points[design.before_rows, design.variables]
+    )
+    effects = (outputs[design.after_rows] - outputs[design.before_rows]) / step[:, None]
+
+    # Every trajectory moves every variable once: group effects by variable
+    n_vars = design.n_vars
+    by_variable = np.full((n_vars, len(effects) // n_vars, outputs.shape[1]), np.nan)
+    trajectory = np.arange(len(effects)) // n_vars
+    by_variable[design.variables, trajectory] = effects
+
+    mu = _masked_mean(by_variable, axis=1)
+    mu_star = _masked_mean(np.abs(by_variable), axis=1)
+    sigma = np.sqrt(np.maximum(_masked_mean((by_variable - mu[:, None]) ** 2, axis=1), 0.0))
+    return mu, mu_star, sigma
+
+
+def saltelli_design(
+    n_vars: int,
+    n_samples: int,
+    rng: np.random.Generator,
+) -> SensitivityDesign:
+    """
+    Generate a Saltelli design from a scrambled Sobol' sequence.
+
+    n_samples is rounded up to a power of two to keep the sequence
+    balanced. Rows are stacked as [A; B; AB_1; ...; AB_k], where AB_i is A
+    with column i taken from B.
+
+    Returns:
+        Design with n_samples * (n_vars + 2) points
+    """
+    m = max(1, int(np.ceil(np.log2(max(n_samples, 2)))))
+    base = qmc.Sobol(d=2 * n_vars, scramble=True, seed=rng).random_base2(m)
+    n = base.shape[0]
+    a, b = base[:, :n_vars], base[:, n_vars:]
+
+    ab = np.repeat(a[None, :, :], n_vars, axis=0)
+    variables = np.arange(n_vars)
+    ab[variables, :, variables] = b[:, variables].T
+
+    before_rows = np.tile(np.arange(n), n_vars)
+    return SensitivityDesign(
+        points=np.concatenate([a, b, ab.reshape(-1, n_vars)]),
+        before_rows=before_rows,
+        after_rows=2 * n + np.arange(n_vars * n),
+        variables=np.repeat(variables, n),
+    )
+
+
+def sobol_indices(
+    design: SensitivityDesign,
+    outputs: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    First-order and total-order Sobol indices.
+
+    Args:
+        design: Design from saltelli_design
+        outputs: (n_points, n_outcomes) simulation outputs, NaN if failed
+
+    Returns:
+        (first_order, total_order), each (n_vars, n_outcomes); zero for
+        outcomes with no variance
+    """
+    n_vars = design.n_vars
+    n = design.n_points // (n_vars + 2)
+    f_a = outputs[:n]
+    f_b = outputs[n:2 * n]
+    f_ab = outputs[2 * n:].reshape(n_vars, n, -1)
+
+    stacked = np.concatenate([f_a, f_b])
+    variance = _masked_mean((stacked - _masked_mean(stacked, axis=0)) ** 2, axis=0)
+
+    first = _masked_mean(f_b[None] * (f_ab - f_a[None]), axis=1)
+    total = 0.5 * _masked_mean((f_a[None] - f_ab) ** 2, axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        first = np.where(variance > 0, first / variance, 0.0)
+        total = np.where(variance > 0, total / variance, 0.0)
+    return np.nan_to_num(first), np.nan_to_num(total)
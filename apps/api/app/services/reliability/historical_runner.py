@@ -7,12 +7,14 @@ Enforces no-leakage policy per project.md §7.2.
 
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple, Union
 from enum import Enum
 import logging
 import hashlib
 import json
 
+from .executors import RunExecutor, SerialExecutor
+
 logger = logging.getLogger(__name__)
 
 
@@ -345,6 +347,19 @@ class HistoricalRunResult:
         }
 
 
+@dataclass
+class _PendingRun:
+    """A validated scenario run waiting for its simulation output."""
+    scenario: HistoricalScenario
+    run_id: str
+    seed: int
+    params: Dict[str, Any]
+    validate_leakage: bool
+    leakage_violations: List[Dict[str, Any]]
+    start_time: datetime
+    start_ms: float
+
+
 class HistoricalScenarioRunner:
     """
     Runs simulations against historical scenarios with anti-leakage enforcement.
@@ -389,6 +404,118 @@ class HistoricalScenarioRunner:
         Returns:
             HistoricalRunResult with predictions and errors
         """
+        pending = self._start_run(scenario, seed, validate_leakage)
+        if isinstance(pending, HistoricalRunResult):
+            return pending
+
+        # Run simulation
+        try:
+            predictions = self.simulation_runner(pending.params)
+        except Exception as e:
+            return self._finish_run(pending, error=str(e))
+
+        return self._finish_run(pending, predictions=predictions)
+
+    def run_multiple_scenarios(
+        self,
+        scenarios: List[HistoricalScenario],
+        seeds: Optional[List[int]] = None,
+        validate_leakage: bool = True,
+        executor: Optional[RunExecutor] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> List[HistoricalRunResult]:
+        """
+        Run multiple historical scenarios.
+
+        Args:
+            scenarios: List of scenarios to run
+            seeds: Optional list of seeds (one per scenario)
+            validate_leakage: Whether to check for leakage
+            executor: Backend for running the simulations (default: serial);
+                process and Celery backends need a picklable simulation_runner
+            timeout_seconds: Per-scenario time limit
+
+        Returns:
+            List of HistoricalRunResult, in scenario order
+
+        Raises:
+            ValueError: seeds given with a different length than scenarios
+        """
+        results: List[Optional[HistoricalRunResult]] = [None] * len(scenarios)
+        for index, result in self.iter_multiple_scenarios(
+            scenarios, seeds, validate_leakage, executor, timeout_seconds
+        ):
+            results[index] = result
+
+        return results
+
+    def iter_multiple_scenarios(
+        self,
+        scenarios: List[HistoricalScenario],
+        seeds: Optional[List[int]] = None,
+        validate_leakage: bool = True,
+        executor: Optional[RunExecutor] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Iterator[Tuple[int, HistoricalRunResult]]:
+        """
+        Run multiple historical scenarios, yielding results as they finish.
+
+        Leakage checks and error metrics run in the calling process; only the
+        simulation_runner calls go through the executor.
+
+        Yields:
+            (scenario index, HistoricalRunResult) in completion order
+
+        Raises:
+            ValueError: seeds given with a different length than scenarios
+        """
+        if seeds is None:
+            seeds = [42 + i for i in range(len(scenarios))]
+        elif len(seeds) != len(scenarios):
+            raise ValueError(
+                f"Expected one seed per scenario: got {len(seeds)} seeds "
+                f"for {len(scenarios)} scenarios"
+            )
+
+        pending_runs: List[_PendingRun] = []
+        indices: List[int] = []
+        for index, (scenario, seed) in enumerate(zip(scenarios, seeds)):
+            pending = self._start_run(scenario, seed, validate_leakage)
+            if isinstance(pending, HistoricalRunResult):
+                yield index, pending
+            else:
+                pending_runs.append(pending)
+                indices.append(index)
+
+        if executor is None:
+            executor = SerialExecutor()
+
+        for outcome in executor.map_unordered(
+            self.simulation_runner,
+            [pending.params for pending in pending_runs],
+            timeout_seconds,
+        ):
+            pending = pending_runs[outcome.index]
+            elapsed_ms = outcome.duration_seconds * 1000
+            if outcome.success:
+                result = self._finish_run(pending, predictions=outcome.value, elapsed_ms=elapsed_ms)
+            else:
+                result = self._finish_run(pending, error=outcome.error, elapsed_ms=elapsed_ms)
+            yield indices[outcome.index], result
+
+    def _start_run(
+        self,
+        scenario: HistoricalScenario,
+        seed: int,
+        validate_leakage: bool,
+    ) -> Union[_PendingRun, HistoricalRunResult]:
+        """
+        Validate a scenario and build its simulation params.
+
+        Returns:
+            _PendingRun ready for simulation, or a failed HistoricalRunResult
+            when strict leakage validation rejects the scenario
+        """
         import uuid
         from time import time
 
@@ -439,14 +566,48 @@ class HistoricalScenarioRunner:
             "seed": seed,
         }
 
-        # Run simulation
-        try:
-            predictions = self.simulation_runner(params)
-        except Exception as e:
-            logger.error(f"Simulation failed: {e}")
+        return _PendingRun(
+            scenario=scenario,
+            run_id=run_id,
+            seed=seed,
+            params=params,
+            validate_leakage=validate_leakage,
+            leakage_violations=leakage_violations,
+            start_time=start_time,
+            start_ms=start_ms,
+        )
+
+    def _finish_run(
+        self,
+        pending: _PendingRun,
+        predictions: Optional[Dict[str, float]] = None,
+        error: Optional[str] = None,
+        elapsed_ms: Optional[float] = None,
+    ) -> HistoricalRunResult:
+        """
+        Score a simulation's predictions against the scenario's outcomes.
+
+        Args:
+            pending: Run started by _start_run
+            predictions: Simulation output (None if the simulation failed)
+            error: Failure message if the simulation failed
+            elapsed_ms: Simulation time, when it ran elsewhere
+        """
+        from time import time
+
+        scenario = pending.scenario
+        leakage_violations = pending.leakage_violations
+
+        def computation_time_ms() -> float:
+            if elapsed_ms is not None:
+                return elapsed_ms
+            return time() * 1000 - pending.start_ms
+
+        if error is not None:
+            logger.error(f"Simulation failed: {error}")
             return HistoricalRunResult(
                 scenario_id=scenario.scenario_id,
-                run_id=run_id,
+                run_id=pending.run_id,
                 predictions={},
                 actuals=scenario.dataset.outcomes,
                 distribution_error=1.0,
@@ -455,10 +616,10 @@ class HistoricalScenarioRunner:
                 accuracy=0.0,
                 leakage_check_passed=len(leakage_violations) == 0,
                 leakage_violations=leakage_violations,
-                run_started_at=start_time,
+                run_started_at=pending.start_time,
                 run_completed_at=datetime.now(),
-                computation_time_ms=time() * 1000 - start_ms,
-                seed=seed,
+                computation_time_ms=computation_time_ms(),
+                seed=pending.seed,
             )
 
         # Compute error metrics
@@ -478,14 +639,14 @@ class HistoricalScenarioRunner:
         accuracy = 1.0 - min(distribution_error, 1.0)
 
         # Check for suspicious patterns
-        if validate_leakage:
+        if pending.validate_leakage:
             validator = LeakageValidator(scenario.time_cutoff)
             validator.detect_suspicious_patterns(predictions, actuals)
             leakage_violations.extend([v.to_dict() for v in validator.violations])
 
         result = HistoricalRunResult(
             scenario_id=scenario.scenario_id,
-            run_id=run_id,
+            run_id=pending.run_id,
             predictions=predictions,
             actuals=actuals,
             distribution_error=distribution_error,
@@ -494,10 +655,10 @@ class HistoricalScenarioRunner:
             accuracy=accuracy,
             leakage_check_passed=len(leakage_violations) == 0,
             leakage_violations=leakage_violations,
-            run_started_at=start_time,
+            run_started_at=pending.start_time,
             run_completed_at=datetime.now(),
-            computation_time_ms=time() * 1000 - start_ms,
-            seed=seed,
+            computation_time_ms=computation_time_ms(),
+            seed=pending.seed,
         )
 
         self.run_history.append(result)
@@ -509,33 +670,6 @@ class HistoricalScenarioRunner:
 
         return result
 
-    def run_multiple_scenarios(
-        self,
-        scenarios: List[HistoricalScenario],
-        seeds: Optional[List[int]] = None,
-        validate_leakage: bool = True,
-    ) -> List[HistoricalRunResult]:
-        """
-        Run multiple historical scenarios.
-
-        Args:
-            scenarios: List of scenarios to run
-            seeds: Optional list of seeds (one per scenario)
-            validate_leakage: Whether to check for leakage
-
-        Returns:
-            List of HistoricalRunResult
-        """
-        if seeds is None:
-            seeds = [42 + i for i in range(len(scenarios))]
-
-        results = []
-        for scenario, seed in zip(scenarios, seeds):
-            result = self.run_scenario(scenario, seed, validate_leakage)
-            results.append(result)
-
-        return results
-
     def _compute_distribution_error(
         self,
         predictions: Dict[str, float],
@@ -160,7 +160,6 @@ class ReliabilityReport:
 
     # Version info
     engine_version: str
-    report_version: str = "1.0.0"
 
     # Core sections
     calibration: CalibrationScore
@@ -175,6 +174,7 @@ class ReliabilityReport:
     confidence_level: ConfidenceLevel
     is_reliable: bool
     reliability_threshold: float = 0.7
+    report_version: str = "1.0.0"
 
     # Recommendations
     recommendations: List[str] = field(default_factory=list)
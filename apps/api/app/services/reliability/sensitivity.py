@@ -3,6 +3,11 @@ Sensitivity Scanner
 
 P7-005: Variable perturbation analysis and impact ranking.
 Identifies which input variables have the largest effect on outcomes.
+
+Besides the one-at-a-time scan, supports global designs (Morris elementary
+effects, Saltelli/Sobol indices). Every design is generated up front and
+evaluated as one batch on a RunExecutor, with already-evaluated parameter
+points served from a cache.
 """
 
 from dataclasses import dataclass, field
@@ -11,6 +16,16 @@ from datetime import datetime
 from enum import Enum
 import numpy as np
 import logging
+import warnings
+
+from .executors import RunExecutor, SerialExecutor
+from .global_sensitivity import (
+    SensitivityDesign,
+    morris_design,
+    morris_indices,
+    saltelli_design,
+    sobol_indices,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +37,13 @@ class PerturbationType(str, Enum):
     RANGE = "range"  # Sweep across value range
 
 
+class SensitivityMethod(str, Enum):
+    """Sensitivity analysis methods."""
+    OAT = "oat"  # One-at-a-time perturbation around the baseline
+    MORRIS = "morris"  # Morris elementary effects (screening)
+    SOBOL = "sobol"  # Saltelli sampling with Sobol indices
+
+
 @dataclass
 class VariableBound:
     """Bounds for a variable during sensitivity analysis."""
@@ -156,6 +178,41 @@ class VariableImpact:
         }
 
 
+@dataclass
+class GlobalSensitivityIndices:
+    """Global sensitivity indices for a single variable."""
+    variable_name: str
+    method: str
+
+    # Sobol indices, averaged over varying outcomes (SOBOL only)
+    first_order: Optional[float] = None
+    total_order: Optional[float] = None
+
+    # Morris statistics, averaged over varying outcomes (MORRIS only)
+    mu: Optional[float] = None
+    mu_star: Optional[float] = None  # Mean absolute elementary effect
+    sigma: Optional[float] = None  # Spread: non-linearity or interactions
+
+    # Per-outcome values of the primary indices
+    first_order_by_outcome: Dict[str, float] = field(default_factory=dict)
+    total_order_by_outcome: Dict[str, float] = field(default_factory=dict)
+    mu_star_by_outcome: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "variable_name": self.variable_name,
+            "method": self.method,
+            "first_order": self.first_order,
+            "total_order": self.total_order,
+            "mu": self.mu,
+            "mu_star": self.mu_star,
+            "sigma": self.sigma,
+            "first_order_by_outcome": self.first_order_by_outcome,
+            "total_order_by_outcome": self.total_order_by_outcome,
+            "mu_star_by_outcome": self.mu_star_by_outcome,
+        }
+
+
 @dataclass
 class SensitivityReport:
     """Complete sensitivity analysis report."""
@@ -175,9 +232,15 @@ class SensitivityReport:
     # Cross-sensitivity (if computed)
     interaction_effects: Dict[Tuple[str, str], float] = field(default_factory=dict)
 
+    # Global indices (MORRIS / SOBOL methods)
+    method: str = SensitivityMethod.OAT.value
+    global_indices: Dict[str, GlobalSensitivityIndices] = field(default_factory=dict)
+
     # Execution
     total_perturbations: int = 0
     total_duration_seconds: float = 0.0
+    simulations_run: int = 0
+    cache_hits: int = 0
 
     # Timestamps
     started_at: datetime = field(default_factory=datetime.now)
@@ -193,20 +256,89 @@ class SensitivityReport:
             "impact_ranking": self.impact_ranking,
             "high_impact_variables": self.high_impact_variables,
             "high_impact_threshold": self.high_impact_threshold,
+            "method": self.method,
+            "global_indices": {
+                k: v.to_dict() for k, v in self.global_indices.items()
+            },
             "total_perturbations": self.total_perturbations,
             "total_duration_seconds": self.total_duration_seconds,
+            "simulations_run": self.simulations_run,
+            "cache_hits": self.cache_hits,
         }
 
 
+def _param_key(params: Dict[str, Any]) -> Tuple:
+    """Hashable, order-independent cache key for a parameter point."""
+    return tuple(sorted(
+        (name, float(value) if isinstance(value, (int, float, np.number)) else repr(value))
+        for name, value in params.items()
+    ))
+
+
+class _BatchEvaluator:
+    """
+    Evaluates batches of parameter points on an executor.
+
+    Points already in the cache (including duplicates within a batch) are
+    not simulated again. Failed points are remembered for the batch only.
+    """
+
+    def __init__(
+        self,
+        simulation_fn: Callable[[Dict[str, float]], Dict[str, float]],
+        executor: RunExecutor,
+        timeout_seconds: Optional[float],
+        cache: Dict[Tuple, Tuple[Dict[str, float], float]],
+    ):
+        self.simulation_fn = simulation_fn
+        self.executor = executor
+        self.timeout_seconds = timeout_seconds
+        self.cache = cache
+        self.errors: Dict[Tuple, str] = {}
+        self.simulations_run = 0
+        self.cache_hits = 0
+
+    def evaluate(self, points: List[Dict[str, Any]]) -> None:
+        """Simulate every point not already cached."""
+        missing: Dict[Tuple, Dict[str, Any]] = {}
+        for params in points:
+            key = _param_key(params)
+            if key in self.cache or key in missing:
+                self.cache_hits += 1
+            else:
+                missing[key] = params
+
+        keys = list(missing)
+        for outcome in self.executor.map_unordered(
+            self.simulation_fn, list(missing.values()), self.timeout_seconds
+        ):
+            key = keys[outcome.index]
+            self.simulations_run += 1
+            if outcome.success:
+                self.cache[key] = (outcome.value, outcome.duration_seconds)
+            else:
+                logger.warning(f"Sensitivity simulation failed: {outcome.error}")
+                self.errors[key] = outcome.error
+
+    def get(self, params: Dict[str, Any]) -> Optional[Tuple[Dict[str, float], float]]:
+        """(outcomes, duration) for an evaluated point, or None if it failed."""
+        return self.cache.get(_param_key(params))
+
+    def error(self, params: Dict[str, Any]) -> Optional[str]:
+        return self.errors.get(_param_key(params))
+
+
 class SensitivityScanner:
     """
     Scans variable sensitivity through controlled perturbations.
 
     Key features:
     - One-at-a-time (OAT) sensitivity analysis
+    - Global analysis: Morris elementary effects or Sobol indices
     - Elasticity calculation (% change in output per % change in input)
     - Impact ranking across all variables
     - High-impact variable identification
+    - Batch evaluation on a RunExecutor with a parameter-point cache
     """
 
     def __init__(
@@ -215,6 +347,13 @@ class SensitivityScanner:
         perturbation_amount: float = 0.1,
         n_steps: int = 5,
         high_impact_threshold: float = 0.5,
+        method: SensitivityMethod = SensitivityMethod.OAT,
+        executor: Optional[RunExecutor] = None,
+        timeout_seconds: Optional[float] = None,
+        n_trajectories: int = 10,
+        n_levels: int = 4,
+        n_samples: int = 64,
+        seed: int = 42,
     ):
         """
         Initialize sensitivity scanner.
@@ -224,11 +363,34 @@ class SensitivityScanner:
             perturbation_amount: Amount of perturbation (0.1 = 10%)
             n_steps: Number of steps for range perturbation
             high_impact_threshold: Threshold for high-impact classification
+            method: OAT, MORRIS or SOBOL
+            executor: Backend for evaluating designs (default: serial)
+            timeout_seconds: Per-simulation time limit
+            n_trajectories: Morris trajectories (cost: n_trajectories * (k + 1))
+            n_levels: Morris grid levels
+            n_samples: Saltelli base samples, rounded up to a power of two
+                (cost: n_samples * (k + 2))
+            seed: Seed for design generation
         """
         self.perturbation_type = perturbation_type
         self.perturbation_amount = perturbation_amount
         self.n_steps = n_steps
         self.high_impact_threshold = high_impact_threshold
+        self.method = SensitivityMethod(method)
+        self.executor = executor
+        self.timeout_seconds = timeout_seconds
+        self.n_trajectories = n_trajectories
+        self.n_levels = n_levels
+        self.n_samples = n_samples
+        self.seed = seed
+
+        # Evaluated points per simulation function:
+        # simulation_fn -> param key -> (outcomes, duration_seconds)
+        self._cache: Dict[Callable, Dict[Tuple, Tuple[Dict[str, float], float]]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget evaluated parameter points (e.g. after the model changed)."""
+        self._cache.clear()
 
     def scan(
         self,
@@ -241,7 +403,10 @@ class SensitivityScanner:
 
         Args:
             variables: Variable bounds for sensitivity analysis
-            simulation_fn: Function that takes params and returns outcomes
+            simulation_fn: Function that takes params and returns outcomes;
+                must be picklable for process or Celery executors. Points
+                are cached per function, so a scanner can be reused
+                across models
             baseline_params: Optional baseline parameters (uses bound defaults if None)
 
         Returns:
@@ -255,24 +420,65 @@ class SensitivityScanner:
                 name: bound.baseline for name, bound in variables.items()
             }
 
+        evaluator = _BatchEvaluator(
+            simulation_fn,
+            self.executor or SerialExecutor(),
+            self.timeout_seconds,
+            self._cache.setdefault(simulation_fn, {}),
+        )
+
+        if self.method != SensitivityMethod.OAT:
+            variable_impacts, global_indices, n_points = self._scan_global(
+                variables, baseline_params, evaluator
+            )
+            return self._build_report(
+                variables, variable_impacts, n_points, evaluator, start_time, global_indices
+            )
+
+        # Evaluate baseline and every perturbation as one batch
+        oat_points = {
+            var_name: self._oat_points(var_name, bound, baseline_params)
+            for var_name, bound in variables.items()
+        }
+        evaluator.evaluate([baseline_params] + [
+            params for points in oat_points.values() for _, params in points
+        ])
+
         # Get baseline outcomes
-        baseline_outcomes = simulation_fn(baseline_params)
+        baseline = evaluator.get(baseline_params)
+        if baseline is None:
+            raise RuntimeError(f"Baseline simulation failed: {evaluator.error(baseline_params)}")
+        baseline_outcomes = baseline[0]
 
         # Analyze each variable
         variable_impacts = {}
-        all_perturbations = []
+        total_perturbations = 0
 
         for var_name, bound in variables.items():
             impact = self._analyze_variable(
                 var_name=var_name,
                 bound=bound,
-                baseline_params=baseline_params,
+                points=oat_points[var_name],
                 baseline_outcomes=baseline_outcomes,
-                simulation_fn=simulation_fn,
+                evaluator=evaluator,
             )
             variable_impacts[var_name] = impact
-            all_perturbations.extend(impact.perturbation_results)
+            total_perturbations += len(impact.perturbation_results)
+
+        return self._build_report(
+            variables, variable_impacts, total_perturbations, evaluator, start_time
+        )
 
+    def _build_report(
+        self,
+        variables: Dict[str, VariableBound],
+        variable_impacts: Dict[str, VariableImpact],
+        total_perturbations: int,
+        evaluator: _BatchEvaluator,
+        start_time: datetime,
+        global_indices: Optional[Dict[str, GlobalSensitivityIndices]] = None,
+    ) -> SensitivityReport:
+        """Rank variables and assemble the report."""
         # Rank by impact score
         impact_ranking = sorted(
             variable_impacts.keys(),
@@ -299,30 +505,30 @@ class SensitivityScanner:
             impact_ranking=impact_ranking,
             high_impact_variables=high_impact_variables,
             high_impact_threshold=self.high_impact_threshold,
-            total_perturbations=len(all_perturbations),
+            method=self.method.value,
+            global_indices=global_indices or {},
+            total_perturbations=total_perturbations,
             total_duration_seconds=(end_time - start_time).total_seconds(),
+            simulations_run=evaluator.simulations_run,
+            cache_hits=evaluator.cache_hits,
             started_at=start_time,
             completed_at=end_time,
         )
 
-    def _analyze_variable(
+    def _oat_points(
         self,
         var_name: str,
         bound: VariableBound,
         baseline_params: Dict[str, float],
-        baseline_outcomes: Dict[str, float],
-        simulation_fn: Callable[[Dict[str, float]], Dict[str, float]],
-    ) -> VariableImpact:
-        """Analyze sensitivity for a single variable."""
+    ) -> List[Tuple[float, Dict[str, float]]]:
+        """Perturbed values and parameter points for one variable."""
         perturbation_values = bound.get_perturbation_range(
             n_steps=self.n_steps,
             perturbation_type=self.perturbation_type,
             perturbation_amount=self.perturbation_amount,
         )
 
-        perturbation_results = []
-        outcome_changes = {outcome: [] for outcome in baseline_outcomes}
-
+        points = []
         for value in perturbation_values:
             if value == bound.baseline:
                 continue  # Skip baseline
@@ -330,11 +536,27 @@ class SensitivityScanner:
             # Create perturbed params
             perturbed_params = baseline_params.copy()
             perturbed_params[var_name] = value
+            points.append((value, perturbed_params))
+
+        return points
+
+    def _analyze_variable(
+        self,
+        var_name: str,
+        bound: VariableBound,
+        points: List[Tuple[float, Dict[str, float]]],
+        baseline_outcomes: Dict[str, float],
+        evaluator: _BatchEvaluator,
+    ) -> VariableImpact:
+        """Analyze sensitivity for a single variable."""
+        perturbation_results = []
+        outcome_changes = {outcome: [] for outcome in baseline_outcomes}
 
-            # Run simulation
-            start_time = datetime.now()
-            perturbed_outcomes = simulation_fn(perturbed_params)
-            duration = (datetime.now() - start_time).total_seconds()
+        for value, perturbed_params in points:
+            evaluated = evaluator.get(perturbed_params)
+            if evaluated is None:
+                continue  # Simulation failed; already logged
+            perturbed_outcomes, duration = evaluated
 
             # Calculate deltas
             outcome_deltas = {}
@@ -439,6 +661,167 @@ class SensitivityScanner:
             is_linear=is_linear,
         )
 
+    def _scan_global(
+        self,
+        variables: Dict[str, VariableBound],
+        baseline_params: Dict[str, float],
+        evaluator: _BatchEvaluator,
+    ) -> Tuple[Dict[str, VariableImpact], Dict[str, GlobalSensitivityIndices], int]:
+        """
+        Run a Morris or Sobol design over all variables' ranges.
+
+        Variables not being scanned keep their baseline_params values.
+
+        Returns:
+            (variable impacts, global indices, number of design points)
+        """
+        names = list(variables.keys())
+        bounds = [variables[name] for name in names]
+        lower = np.array([b.min_value for b in bounds], dtype=float)
+        upper = np.array([b.max_value for b in bounds], dtype=float)
+        is_integer = np.array([b.is_integer for b in bounds])
+        baselines = np.array([b.baseline for b in bounds], dtype=float)
+
+        rng = np.random.default_rng(self.seed)
+        if self.method == SensitivityMethod.MORRIS:
+            design = morris_design(len(names), self.n_trajectories, self.n_levels, rng)
+        else:
+            design = saltelli_design(len(names), self.n_samples, rng)
+
+        # Map to parameter space; integer variables are rounded and the design
+        # is updated to the values actually simulated
+        span = upper - lower
+        values = lower + design.points * span
+        values[:, is_integer] = np.round(values[:, is_integer])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            unit = np.where(span > 0, (values - lower) / np.where(span > 0, span, 1.0), design.points)
+        design = SensitivityDesign(
+            points=unit,
+            before_rows=design.before_rows,
+            after_rows=design.after_rows,
+            variables=design.variables,
+        )
+
+        points = []
+        for row in values:
+            params = dict(baseline_params)
+            for name, value, integer in zip(names, row, is_integer):
+                params[name] = int(value) if integer else float(value)
+            points.append(params)
+
+        evaluator.evaluate(points)
+
+        # Outcome matrix, NaN rows for failed simulations
+        evaluated = [evaluator.get(params) for params in points]
+        outcome_names: List[str] = []
+        for result in evaluated:
+            if result is not None:
+                outcome_names.extend(k for k in result[0] if k not in outcome_names)
+        if not outcome_names:
+            raise RuntimeError("All sensitivity simulations failed")
+
+        outputs = np.full((len(points), len(outcome_names)), np.nan)
+        for i, result in enumerate(evaluated):
+            if result is not None:
+                outputs[i] = [result[0].get(k, np.nan) for k in outcome_names]
+
+        # Per-variable summaries average over outcomes that vary at all, so
+        # constant outcomes don't dilute the indices
+        varying = np.nanmax(outputs, axis=0) > np.nanmin(outputs, axis=0)
+
+        def _mean_over_outcomes(per_outcome: np.ndarray) -> np.ndarray:
+            if not varying.any():
+                return np.zeros(per_outcome.shape[0])
+            return np.nan_to_num(per_outcome[:, varying]).mean(axis=1)
+
+        # Primary indices: per variable, per outcome
+        global_indices = {}
+        if self.method == SensitivityMethod.MORRIS:
+            mu, mu_star, sigma = morris_indices(design, outputs)
+            sensitivities = np.nan_to_num(mu_star)
+            mean_mu_star = _mean_over_outcomes(mu_star)
+            scale = mean_mu_star.max() if mean_mu_star.max() > 0 else 1.0
+            impact_scores = mean_mu_star / scale
+            mean_mu = _mean_over_outcomes(mu)
+            mean_sigma = _mean_over_outcomes(sigma)
+            linear = mean_sigma <= 0.1 * mean_mu_star
+            for i, name in enumerate(names):
+                global_indices[name] = GlobalSensitivityIndices(
+                    variable_name=name,
+                    method=self.method.value,
+                    mu=float(mean_mu[i]),
+                    mu_star=float(mean_mu_star[i]),
+                    sigma=float(mean_sigma[i]),
+                    mu_star_by_outcome=dict(zip(outcome_names, sensitivities[i].tolist())),
+                )
+        else:
+            first, total = sobol_indices(design, outputs)
+            sensitivities = total
+            mean_first = _mean_over_outcomes(first)
+            mean_total = _mean_over_outcomes(total)
+            impact_scores = np.clip(mean_total, 0.0, 1.0)
+            linear = mean_first >= 0.9 * mean_total
+            for i, name in enumerate(names):
+                global_indices[name] = GlobalSensitivityIndices(
+                    variable_name=name,
+                    method=self.method.value,
+                    first_order=float(mean_first[i]),
+                    total_order=float(mean_total[i]),
+                    first_order_by_outcome=dict(zip(outcome_names, first[i].tolist())),
+                    total_order_by_outcome=dict(zip(outcome_names, total[i].tolist())),
+                )
+
+        # Elasticity and direction from the design's one-variable changes
+        step = values[design.after_rows, design.variables] - values[design.before_rows, design.variables]
+        change = outputs[design.after_rows] - outputs[design.before_rows]
+        mean_output = np.nanmean(outputs, axis=0)
+        pair_baseline = baselines[design.variables]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            elasticity = np.abs((change / mean_output) / (step / pair_baseline)[:, None])
+        elasticity[~np.isfinite(elasticity)] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN rows of failed runs
+            signal = np.nanmean(change, axis=1) * np.sign(step)
+
+        variable_impacts = {}
+        for i, name in enumerate(names):
+            pairs = (design.variables == i) & (step != 0) & np.isfinite(signal)
+            var_elasticity = elasticity[design.variables == i]
+            mean_elasticity = (
+                float(np.nanmean(var_elasticity)) if np.isfinite(var_elasticity).any() else 0.0
+            )
+
+            positive_changes = int((signal[pairs] > 0).sum())
+            negative_changes = int((signal[pairs] < 0).sum())
+            n_pairs = int(pairs.sum())
+            if n_pairs and positive_changes > 0.8 * n_pairs:
+                direction = "positive"
+            elif n_pairs and negative_changes > 0.8 * n_pairs:
+                direction = "negative"
+            else:
+                direction = "mixed"
+
+            outcome_sensitivities = dict(zip(outcome_names, sensitivities[i].tolist()))
+            sorted_outcomes = sorted(
+                outcome_sensitivities.items(),
+                key=lambda x: x[1],
+                reverse=True,
+            )
+
+            variable_impacts[name] = VariableImpact(
+                variable_name=name,
+                elasticity=mean_elasticity,
+                impact_score=float(impact_scores[i]),
+                direction=direction,
+                outcome_sensitivities=outcome_sensitivities,
+                most_affected_outcome=sorted_outcomes[0][0],
+                least_affected_outcome=sorted_outcomes[-1][0],
+                is_high_impact=False,  # Will be set by _build_report()
+                is_linear=bool(linear[i]),
+            )
+
+        return variable_impacts, global_indices, design.n_points
+
     def _check_linearity(
         self,
         results: List[PerturbationResult],
@@ -6,11 +6,12 @@ Runs simulations with different seeds and measures variance in outcomes.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator
 from datetime import datetime
 import numpy as np
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .executors import ProcessPoolRunExecutor, RunExecutor, SerialExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +113,8 @@ class MultiSeedRunner:
     Runs simulations with multiple seeds for stability analysis.
 
     Generates deterministic seeds from a base seed to ensure reproducibility.
+    Parallel runs go through a RunExecutor; the default process pool needs a
+    picklable simulation function (module-level function or SimulationSpec).
     """
 
     def __init__(
@@ -119,6 +122,8 @@ class MultiSeedRunner:
         n_seeds: int = 10,
         base_seed: int = 42,
         max_workers: int = 4,
+        executor: Optional[RunExecutor] = None,
+        timeout_seconds: Optional[float] = None,
     ):
         """
         Initialize multi-seed runner.
@@ -127,10 +132,16 @@ class MultiSeedRunner:
             n_seeds: Number of seeds to test
             base_seed: Base seed for generating seed sequence
             max_workers: Max parallel workers for running simulations
+            executor: Backend for parallel runs (default: process pool
+                with max_workers)
+            timeout_seconds: Per-seed time limit; seeds exceeding it are
+                reported as failed
         """
         self.n_seeds = n_seeds
         self.base_seed = base_seed
         self.max_workers = max_workers
+        self.executor = executor
+        self.timeout_seconds = timeout_seconds
 
     def generate_seeds(self) -> List[int]:
         """Generate deterministic seed sequence from base seed."""
@@ -154,167 +165,132 @@ class MultiSeedRunner:
         Returns:
             List of SeedRunResult for each seed
         """
-        if seeds is None:
-            seeds = self.generate_seeds()
-
-        results = []
-
-        if parallel and len(seeds) > 1:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_seed = {
-                    executor.submit(self._run_single, simulation_fn, seed): seed
-                    for seed in seeds
-                }
-
-                for future in as_completed(future_to_seed):
-                    seed = future_to_seed[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                    except Exception as e:
-                        results.append(SeedRunResult(
-                            seed=seed,
-                            outcomes={},
-                            metrics={},
-                            duration_seconds=0.0,
-                            success=False,
-                            error=str(e),
-                        ))
-        else:
-            # Sequential execution
-            for seed in seeds:
-                result = self._run_single(simulation_fn, seed)
-                results.append(result)
+        results = list(self.iter_with_seeds(simulation_fn, seeds, parallel))
 
         # Sort by seed for consistent ordering
         results.sort(key=lambda r: r.seed)
         return results
 
-    def _run_single(
+    def iter_with_seeds(
         self,
         simulation_fn: Callable[[int], Dict[str, float]],
-        seed: int,
-    ) -> SeedRunResult:
-        """Run a single simulation with given seed."""
-        start_time = datetime.now()
+        seeds: Optional[List[int]] = None,
+        parallel: bool = True,
+    ) -> Iterator[SeedRunResult]:
+        """
+        Run simulation with multiple seeds, yielding results as they finish.
 
-        try:
-            outcomes = simulation_fn(seed)
-            duration = (datetime.now() - start_time).total_seconds()
+        Args:
+            simulation_fn: Function that takes a seed and returns outcome distribution
+            seeds: Optional custom seed list (uses generated seeds if None)
+            parallel: Whether to run in parallel
 
-            return SeedRunResult(
-                seed=seed,
-                outcomes=outcomes,
-                metrics={},
-                duration_seconds=duration,
-                success=True,
-            )
-        except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.error(f"Seed run failed (seed={seed}): {e}")
+        Yields:
+            SeedRunResult per seed, in completion order
+        """
+        if seeds is None:
+            seeds = self.generate_seeds()
+
+        if not parallel or len(seeds) <= 1:
+            executor: RunExecutor = SerialExecutor()
+        elif self.executor is not None:
+            executor = self.executor
+        else:
+            executor = ProcessPoolRunExecutor(max_workers=self.max_workers)
+
+        for outcome in executor.map_unordered(simulation_fn, seeds, self.timeout_seconds):
+            seed = seeds[outcome.index]
+            if not outcome.success:
+                logger.error(f"Seed run failed (seed={seed}): {outcome.error}")
 
-            return SeedRunResult(
+            yield SeedRunResult(
                 seed=seed,
-                outcomes={},
+                outcomes=outcome.value if outcome.success else {},
                 metrics={},
-                duration_seconds=duration,
-                success=False,
-                error=str(e),
+                duration_seconds=outcome.duration_seconds,
+                success=outcome.success,
+                error=outcome.error,
             )
 
 
-class StabilityAnalyzer:
-    """
-    Analyzes stability of simulation outcomes across multiple seeds.
-
-    Key features:
-    - Variance analysis per outcome category
-    - Coefficient of variation for relative stability
-    - Stability classification with configurable threshold
-    """
-
-    def __init__(
-        self,
-        stability_threshold: float = 0.1,
-        min_successful_runs: int = 3,
-    ):
-        """
-        Initialize stability analyzer.
-
-        Args:
-            stability_threshold: Max allowed coefficient of variation for "stable"
-            min_successful_runs: Minimum successful runs for valid analysis
-        """
-        self.stability_threshold = stability_threshold
-        self.min_successful_runs = min_successful_runs
-
-    def analyze(
-        self,
-        results: List[SeedRunResult],
-        base_seed: int = 42,
-    ) -> SeedVarianceReport:
-        """
-        Analyze variance across seed runs.
-
-        Args:
-            results: List of seed run results
-            base_seed: Base seed used for generation
+@dataclass
+class _RunningMoments:
+    """Running mean/variance (Welford) and range for one outcome category."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min_value: float = float("inf")
+    max_value: float = float("-inf")
+    values_by_seed: Dict[int, float] = field(default_factory=dict)
 
-        Returns:
-            SeedVarianceReport with complete variance analysis
-        """
-        start_time = datetime.now()
+    def add(self, seed: int, value: float) -> None:
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min_value = min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+        self.values_by_seed[seed] = value
 
-        # Filter successful runs
-        successful_results = [r for r in results if r.success]
-        failed_count = len(results) - len(successful_results)
 
-        if len(successful_results) < self.min_successful_runs:
-            logger.warning(
-                f"Only {len(successful_results)} successful runs, "
-                f"minimum {self.min_successful_runs} required"
-            )
+class RunningStability:
+    """
+    Incremental stability analysis.
 
-        # Collect all outcome categories
-        all_categories = set()
-        for result in successful_results:
-            all_categories.update(result.outcomes.keys())
+    Seed results are folded in one at a time as they arrive; report() can be
+    called at any point for the variance report over the results so far.
+    """
 
-        # Compute variance for each category
+    def __init__(self, stability_threshold: float = 0.1, base_seed: int = 42):
+        self.stability_threshold = stability_threshold
+        self.base_seed = base_seed
+        self.started_at = datetime.now()
+
+        self._moments: Dict[str, _RunningMoments] = {}
+        self._seeds: List[int] = []
+        self._successful = 0
+        self._total_duration = 0.0
+
+    @property
+    def successful_runs(self) -> int:
+        return self._successful
+
+    def add(self, result: SeedRunResult) -> None:
+        """Fold one seed result into the running statistics."""
+        self._seeds.append(result.seed)
+        self._total_duration += result.duration_seconds
+        if not result.success:
+            return
+
+        self._successful += 1
+        for category, value in result.outcomes.items():
+            moments = self._moments.get(category)
+            if moments is None:
+                moments = self._moments[category] = _RunningMoments()
+            moments.add(result.seed, value)
+
+    def report(self) -> SeedVarianceReport:
+        """Build the variance report for the results added so far."""
         outcome_variances = {}
-
-        for category in all_categories:
-            values = []
-            values_by_seed = {}
-
-            for result in successful_results:
-                if category in result.outcomes:
-                    value = result.outcomes[category]
-                    values.append(value)
-                    values_by_seed[result.seed] = value
-
-            if values:
-                values_arr = np.array(values)
-                mean = float(np.mean(values_arr))
-                std = float(np.std(values_arr))
-                variance = float(np.var(values_arr))
-                min_val = float(np.min(values_arr))
-                max_val = float(np.max(values_arr))
-
-                # Coefficient of variation (relative variance)
-                cv = std / mean if mean > 0 else 0.0
-
-                outcome_variances[category] = OutcomeVariance(
-                    category=category,
-                    mean=mean,
-                    std=std,
-                    variance=variance,
-                    min_value=min_val,
-                    max_value=max_val,
-                    range=max_val - min_val,
-                    coefficient_of_variation=cv,
-                    values_by_seed=values_by_seed,
-                )
+        for category, moments in self._moments.items():
+            variance = max(moments.m2 / moments.count, 0.0)
+            std = float(np.sqrt(variance))
+
+            # Coefficient of variation (relative variance)
+            cv = std / moments.mean if moments.mean > 0 else 0.0
+
+            outcome_variances[category] = OutcomeVariance(
+                category=category,
+                mean=moments.mean,
+                std=std,
+                variance=variance,
+                min_value=moments.min_value,
+                max_value=moments.max_value,
+                range=moments.max_value - moments.min_value,
+                coefficient_of_variation=cv,
+                values_by_seed=dict(moments.values_by_seed),
+            )
 
         # Aggregate metrics
         if outcome_variances:
@@ -347,15 +323,10 @@ class StabilityAnalyzer:
             most_stable = ""
             least_stable = ""
 
-        # Total duration
-        total_duration = sum(r.duration_seconds for r in results)
-
-        end_time = datetime.now()
-
         return SeedVarianceReport(
-            n_seeds=len(results),
-            seeds_used=[r.seed for r in results],
-            base_seed=base_seed,
+            n_seeds=len(self._seeds),
+            seeds_used=list(self._seeds),
+            base_seed=self.base_seed,
             outcome_variances=outcome_variances,
             mean_variance=mean_variance,
             max_variance=max_variance,
@@ -364,13 +335,87 @@ class StabilityAnalyzer:
             stability_threshold=self.stability_threshold,
             most_stable_outcome=most_stable,
             least_stable_outcome=least_stable,
-            successful_runs=len(successful_results),
-            failed_runs=failed_count,
-            total_duration_seconds=total_duration,
-            started_at=start_time,
-            completed_at=end_time,
+            successful_runs=self._successful,
+            failed_runs=len(self._seeds) - self._successful,
+            total_duration_seconds=self._total_duration,
+            started_at=self.started_at,
+            completed_at=datetime.now(),
         )
 
+
+class StabilityAnalyzer:
+    """
+    Analyzes stability of simulation outcomes across multiple seeds.
+
+    Key features:
+    - Variance analysis per outcome category
+    - Coefficient of variation for relative stability
+    - Stability classification with configurable threshold
+    """
+
+    def __init__(
+        self,
+        stability_threshold: float = 0.1,
+        min_successful_runs: int = 3,
+    ):
+        """
+        Initialize stability analyzer.
+
+        Args:
+            stability_threshold: Max allowed coefficient of variation for "stable"
+            min_successful_runs: Minimum successful runs for valid analysis
+        """
+        self.stability_threshold = stability_threshold
+        self.min_successful_runs = min_successful_runs
+
+    def analyze(
+        self,
+        results: List[SeedRunResult],
+        base_seed: int = 42,
+    ) -> SeedVarianceReport:
+        """
+        Analyze variance across seed runs.
+
+        Args:
+            results: List of seed run results
+            base_seed: Base seed used for generation
+
+        Returns:
+            SeedVarianceReport with complete variance analysis
+        """
+        return self.analyze_stream(results, base_seed)
+
+    def analyze_stream(
+        self,
+        results: Iterable[SeedRunResult],
+        base_seed: int = 42,
+        on_update: Optional[Callable[[SeedVarianceReport], None]] = None,
+    ) -> SeedVarianceReport:
+        """
+        Analyze variance while seed runs are still arriving.
+
+        Args:
+            results: Seed run results, e.g. MultiSeedRunner.iter_with_seeds()
+            base_seed: Base seed used for generation
+            on_update: Called with the interim report after each result
+
+        Returns:
+            SeedVarianceReport over all results
+        """
+        running = RunningStability(self.stability_threshold, base_seed)
+        for result in results:
+            running.add(result)
+            if on_update is not None:
+                on_update(running.report())
+
+        if running.successful_runs < self.min_successful_runs:
+            logger.warning(
+                f"Only {running.successful_runs} successful runs, "
+                f"minimum {self.min_successful_runs} required"
+            )
+
+        return running.report()
+
     def compare_stability(
         self,
         report_a: SeedVarianceReport,
@@ -10,18 +10,23 @@ Features:
 - Reconstructs world state at any tick (deterministic)
 - Same node always replays same storyline
 - Efficient seeking using keyframe index
+- Incremental reconstruction from the nearest reconstructed tick
+- Bounded LRU cache of reconstructed states
 - Timeline generation for 2D Replay UI
 """
 
+from bisect import bisect_right, insort
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-from copy import deepcopy
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from copy import copy
 
 from app.services.telemetry import (
+    AgentHistorySeries,
     TelemetryService,
-    TelemetryBlob,
+    TelemetryView,
     TelemetryKeyframe,
     TelemetryDelta,
     TelemetrySlice,
@@ -31,6 +36,12 @@ from app.services.telemetry import (
 from app.services.storage import StorageRef, get_storage_service
 
 
+DEFAULT_REPLAY_STATE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Rough in-memory size of one AgentReplayState with its dicts
+AGENT_STATE_BYTES = 1024
+
+
 class ReplayState(str, Enum):
     """Replay loading states."""
     IDLE = "idle"
@@ -212,13 +223,114 @@ class ReplayChunk:
         }
 
 
+def _agent_columns(agent: AgentReplayState) -> Dict[str, Any]:
+    values = agent.to_dict()
+    del values["agent_id"], values["tick"]
+    return values
+
+
+class ReplayStateCache:
+    """
+    LRU cache of reconstructed world states, keyed by tick.
+
+    Bounded by an estimated size: every state is counted as if it owned
+    all of its agents, although consecutive states share unchanged ones,
+    so the estimate is an upper bound. Cached ticks are also kept sorted
+    so the loader can bisect for the nearest reconstructed tick at or
+    before a target and play forward from there.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_REPLAY_STATE_CACHE_BYTES):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Estimated state bytes kept; least recently used
+                states are evicted first, larger states are not cached
+        """
+        self.max_bytes = max(0, max_bytes)
+        self.current_bytes = 0
+        self._entries: "OrderedDict[int, Tuple[WorldReplayState, int]]" = OrderedDict()
+        self._ticks: List[int] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def estimate_bytes(state: WorldReplayState) -> int:
+        return AGENT_STATE_BYTES * (len(state.agents) + 1)
+
+    def get(self, tick: int) -> Optional[WorldReplayState]:
+        entry = self._entries.get(tick)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(tick)
+        self.hits += 1
+        return entry[0]
+
+    def nearest_before(self, tick: int, floor: int) -> Optional[Tuple[int, WorldReplayState]]:
+        """Cached state with the largest tick in [floor, tick], if any."""
+        position = bisect_right(self._ticks, tick)
+        if not position or self._ticks[position - 1] < floor:
+            return None
+        nearest = self._ticks[position - 1]
+        self._entries.move_to_end(nearest)
+        return nearest, self._entries[nearest][0]
+
+    def put(self, tick: int, state: WorldReplayState) -> None:
+        size = self.estimate_bytes(state)
+        if size > self.max_bytes:
+            return
+        self._discard(tick)
+        while self._entries and self.current_bytes + size > self.max_bytes:
+            evicted = next(iter(self._entries))
+            self._discard(evicted)
+            self.evictions += 1
+        self._entries[tick] = (state, size)
+        insort(self._ticks, tick)
+        self.current_bytes += size
+
+    def _discard(self, tick: int) -> None:
+        entry = self._entries.pop(tick, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry[1]
+        del self._ticks[bisect_right(self._ticks, tick) - 1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._ticks.clear()
+        self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tick: int) -> bool:
+        return tick in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
 class DeterministicReplayLoader:
     """
     Loads telemetry and reconstructs world state for replay.
 
     Key features:
     - Deterministic: Same node always produces same replay
-    - Efficient: Uses keyframe index for fast seeking
+    - Efficient: Uses keyframe index for fast seeking and plays forward
+      from the nearest state already reconstructed
+    - Bounded: Reconstructed states are kept in a size-capped LRU cache
     - Read-only: NEVER triggers simulations (C3 compliant)
 
     Reference: project.md §11 Phase 8
@@ -226,15 +338,22 @@ class DeterministicReplayLoader:
 
     DEFAULT_CHUNK_SIZE = 1000  # Ticks per chunk
     DEFAULT_TICK_RATE = 10.0   # Ticks per second for playback
+    PLAY_WINDOW = 100          # Ticks of deltas read at a time by play()
 
     def __init__(
         self,
         telemetry_service: Optional[TelemetryService] = None,
+        state_cache_bytes: Optional[int] = None,
     ):
         self.telemetry = telemetry_service or get_telemetry_service()
-        self._loaded_blob: Optional[TelemetryBlob] = None
+        if state_cache_bytes is None:
+            from app.core.config import settings
+            state_cache_bytes = settings.REPLAY_STATE_CACHE_MAX_BYTES
+        self.state_cache = ReplayStateCache(state_cache_bytes)
+        self._view: Optional[TelemetryView] = None
         self._storage_ref: Optional[StorageRef] = None
-        self._reconstructed_states: Dict[int, WorldReplayState] = {}
+        # Last reconstructed (tick, state); kept even if the cache evicts it
+        self._cursor: Optional[Tuple[int, WorldReplayState]] = None
         self._state = ReplayState.IDLE
 
     @property
@@ -243,7 +362,7 @@ class DeterministicReplayLoader:
 
     @property
     def is_loaded(self) -> bool:
-        return self._loaded_blob is not None
+        return self._view is not None
 
     async def load(
         self,
@@ -265,17 +384,18 @@ class DeterministicReplayLoader:
         self._state = ReplayState.LOADING
 
         try:
-            # Load telemetry blob
-            self._loaded_blob = await self.telemetry.get_telemetry(storage_ref)
+            # Open telemetry; segmented telemetry is read by tick range on demand
+            self._view = await self.telemetry.open_view(storage_ref)
             self._storage_ref = storage_ref
 
             # Build timeline
-            timeline = self._build_timeline()
+            timeline = await self._build_timeline()
 
             # Pre-reconstruct initial states for fast start
-            if preload_ticks > 0:
-                for tick in range(min(preload_ticks, self._loaded_blob.ticks_executed)):
-                    await self.get_state_at_tick(tick)
+            preload_end = min(preload_ticks, self._view.ticks_executed) - 1
+            if preload_end >= 0:
+                async for _ in self.play(0, preload_end):
+                    pass
 
             self._state = ReplayState.READY
             return timeline
@@ -293,18 +413,18 @@ class DeterministicReplayLoader:
         storage_ref = StorageRef.from_dict(ref_dict)
         return await self.load(storage_ref, preload_ticks)
 
-    def _build_timeline(self) -> ReplayTimeline:
+    async def _build_timeline(self) -> ReplayTimeline:
         """Build the timeline structure from loaded telemetry."""
-        if not self._loaded_blob:
+        if not self._view:
             raise RuntimeError("No telemetry loaded")
 
-        blob = self._loaded_blob
+        view = self._view
 
         # Build event markers from index
         event_markers = []
 
         # Add keyframe markers
-        for tick in blob.index.keyframe_ticks:
+        for tick in view.index.keyframe_ticks:
             event_markers.append(TimelineMarker(
                 tick=int(tick) if isinstance(tick, str) else tick,
                 marker_type="keyframe",
@@ -312,7 +432,7 @@ class DeterministicReplayLoader:
             ))
 
         # Add event markers
-        for entry in blob.index.event_index:
+        for entry in view.index.event_index:
             tick = entry.get("tick", 0)
             events = entry.get("events", [])
             if events:
@@ -330,28 +450,28 @@ class DeterministicReplayLoader:
         segment_dist: Dict[str, int] = {}
         region_dist: Dict[str, int] = {}
 
-        for agent_id, state in blob.final_states.items():
+        for agent_id, state in (await view.final_states()).items():
             segment = state.get("segment", "default")
             region = state.get("region", "unknown")
             segment_dist[segment] = segment_dist.get(segment, 0) + 1
             region_dist[region] = region_dist.get(region, 0) + 1
 
         # Estimate duration (assuming 1 second = 10 ticks by default)
-        duration = blob.ticks_executed / self.DEFAULT_TICK_RATE
+        duration = view.ticks_executed / self.DEFAULT_TICK_RATE
 
         return ReplayTimeline(
-            run_id=blob.run_id,
+            run_id=view.run_id,
             node_id=None,  # Will be set by caller if available
-            total_ticks=blob.ticks_executed,
-            keyframe_ticks=[int(t) if isinstance(t, str) else t for t in blob.index.keyframe_ticks],
+            total_ticks=view.ticks_executed,
+            keyframe_ticks=[int(t) if isinstance(t, str) else t for t in view.index.keyframe_ticks],
             event_markers=event_markers,
             duration_seconds=duration,
             tick_rate=self.DEFAULT_TICK_RATE,
-            seed_used=blob.seed_used,
-            agent_count=blob.agent_count,
+            seed_used=view.seed_used,
+            agent_count=view.agent_count,
             segment_distribution=segment_dist,
             region_distribution=region_dist,
-            metrics_summary=blob.metrics_summary,
+            metrics_summary=await view.metrics_summary(),
         )
 
     async def get_state_at_tick(self, tick: int) -> WorldReplayState:
@@ -360,26 +480,34 @@ class DeterministicReplayLoader:
 
         This is DETERMINISTIC:
         - Same tick always produces identical state
-        - Uses keyframe + delta reconstruction
+        - Uses keyframe + delta reconstruction, starting from the latest
+          state already reconstructed between that keyframe and tick
 
         This is READ-ONLY (C3 compliant):
         - Does not trigger any simulation
         - Pure state reconstruction from stored telemetry
         """
-        if not self._loaded_blob:
+        if not self._view:
             raise RuntimeError("No telemetry loaded - call load() first")
 
         # Check cache
-        if tick in self._reconstructed_states:
-            return self._reconstructed_states[tick]
+        cached = self.state_cache.get(tick)
+        if cached is not None:
+            return cached
 
         self._state = ReplayState.SEEKING
 
         try:
             # Find nearest keyframe at or before tick
-            keyframe = self._find_keyframe_before(tick)
+            keyframe = await self._find_keyframe_before(tick)
+            floor = keyframe.tick if keyframe is not None else 0
+
+            # States at or after the keyframe already include it
+            base = self._nearest_reconstructed(tick, floor)
 
-            if keyframe is None:
+            if base is not None:
+                start_tick, state = base
+            elif keyframe is None:
                 # No keyframe before tick - reconstruct from start
                 state = self._create_initial_state()
                 start_tick = 0
@@ -388,14 +516,14 @@ class DeterministicReplayLoader:
                 state = self._keyframe_to_world_state(keyframe)
                 start_tick = keyframe.tick
 
-            # Apply deltas from keyframe to target tick
+            # Apply deltas from the starting point to target tick
             if start_tick < tick:
-                deltas = self._get_deltas_in_range(start_tick, tick)
+                deltas = await self._get_deltas_in_range(start_tick, tick)
                 for delta in deltas:
                     state = self._apply_delta(state, delta)
 
             # Cache reconstructed state
-            self._reconstructed_states[tick] = state
+            self._remember(tick, state)
 
             self._state = ReplayState.READY
             return state
@@ -404,34 +532,89 @@ class DeterministicReplayLoader:
             self._state = ReplayState.ERROR
             raise RuntimeError(f"Failed to reconstruct state at tick {tick}: {e}")
 
-    def _find_keyframe_before(self, tick: int) -> Optional[TelemetryKeyframe]:
+    async def play(
+        self,
+        start_tick: int = 0,
+        end_tick: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, WorldReplayState]]:
+        """
+        Yield (tick, state) for every tick from start_tick to end_tick.
+
+        The first state comes from get_state_at_tick; each later tick
+        applies only its own deltas to the previous state, or restarts from
+        a keyframe stored at that tick, so sequential playback does not
+        reconstruct from the keyframe again. Deltas and keyframes are read
+        PLAY_WINDOW ticks at a time. Yielded states go through the state
+        cache like seeks do.
+
+        This is READ-ONLY (C3 compliant).
+        """
+        if not self._view:
+            raise RuntimeError("No telemetry loaded - call load() first")
+
+        if end_tick is None:
+            end_tick = self._view.ticks_executed - 1
+        if end_tick < start_tick:
+            return
+
+        state = await self.get_state_at_tick(start_tick)
+        yield start_tick, state
+
+        tick = start_tick + 1
+        while tick <= end_tick:
+            window_end = min(tick + self.PLAY_WINDOW - 1, end_tick)
+            keyframes = {
+                kf.tick: kf for kf in await self._view.keyframes_in_range(tick, window_end)
+            }
+            deltas: Dict[int, List[TelemetryDelta]] = {}
+            for delta in await self._view.deltas_in_range(tick, window_end):
+                deltas.setdefault(delta.tick, []).append(delta)
+
+            for current in range(tick, window_end + 1):
+                if current in keyframes:
+                    state = self._keyframe_to_world_state(keyframes[current])
+                else:
+                    for delta in deltas.get(current, []):
+                        state = self._apply_delta(state, delta)
+                self._remember(current, state)
+                yield current, state
+
+            tick = window_end + 1
+
+    def _nearest_reconstructed(
+        self,
+        tick: int,
+        floor: int,
+    ) -> Optional[Tuple[int, WorldReplayState]]:
+        """Latest reconstructed (tick, state) with floor <= tick' <= tick."""
+        nearest = self.state_cache.nearest_before(tick, floor)
+        cursor = self._cursor
+        if cursor is not None and floor <= cursor[0] <= tick:
+            if nearest is None or cursor[0] > nearest[0]:
+                return cursor
+        return nearest
+
+    def _remember(self, tick: int, state: WorldReplayState) -> None:
+        self.state_cache.put(tick, state)
+        self._cursor = (tick, state)
+
+    async def _find_keyframe_before(self, tick: int) -> Optional[TelemetryKeyframe]:
         """Find the closest keyframe at or before the given tick."""
-        if not self._loaded_blob:
+        if not self._view:
             return None
 
-        closest: Optional[TelemetryKeyframe] = None
-        for kf in self._loaded_blob.keyframes:
-            if kf.tick <= tick:
-                if closest is None or kf.tick > closest.tick:
-                    closest = kf
-            else:
-                break  # Keyframes are sorted by tick
-
-        return closest
+        return await self._view.keyframe_at(tick)
 
-    def _get_deltas_in_range(
+    async def _get_deltas_in_range(
         self,
         start_tick: int,
         end_tick: int,
     ) -> List[TelemetryDelta]:
         """Get all deltas in a tick range (exclusive start, inclusive end)."""
-        if not self._loaded_blob:
+        if not self._view:
             return []
 
-        return [
-            d for d in self._loaded_blob.deltas
-            if start_tick < d.tick <= end_tick
-        ]
+        return await self._view.deltas_in_range(start_tick + 1, end_tick)
 
     def _create_initial_state(self) -> WorldReplayState:
         """Create initial world state (tick 0)."""
@@ -480,11 +663,10 @@ class DeterministicReplayLoader:
     ) -> WorldReplayState:
         """
         Apply a delta to the world state.
-        Returns a new state (immutable update).
+        Returns a new state (immutable update): agents the delta does not
+        touch are shared with the previous state, updated agents are copied.
         """
-        # Deep copy to ensure immutability
-        new_agents = deepcopy(state.agents)
-        new_env = deepcopy(state.environment)
+        new_agents = dict(state.agents)
 
         # Apply agent updates
         for update in delta.agent_updates:
@@ -493,17 +675,21 @@ class DeterministicReplayLoader:
                 continue
 
             if agent_id in new_agents:
-                # Update existing agent
-                agent = new_agents[agent_id]
+                # Update a copy of the existing agent; fields are replaced, never mutated
+                agent = copy(new_agents[agent_id])
                 self._apply_agent_update(agent, update, delta.tick)
+                new_agents[agent_id] = agent
             else:
                 # New agent (shouldn't normally happen mid-simulation)
                 new_agents[agent_id] = AgentReplayState.from_dict(update, delta.tick)
 
         # Update environment
-        new_env.tick = delta.tick
-        new_env.metrics = {**new_env.metrics, **delta.metrics}
-        new_env.active_events = delta.events_triggered
+        new_env = EnvironmentReplayState(
+            tick=delta.tick,
+            variables=state.environment.variables,
+            active_events=delta.events_triggered,
+            metrics={**state.environment.metrics, **delta.metrics},
+        )
 
         # Build event log
         event_log = [
@@ -569,25 +755,17 @@ class DeterministicReplayLoader:
 
         This is READ-ONLY (C3 compliant).
         """
-        if not self._loaded_blob:
+        if not self._view:
             raise RuntimeError("No telemetry loaded - call load() first")
 
         if end_tick is None:
             end_tick = start_tick + self.DEFAULT_CHUNK_SIZE
 
-        end_tick = min(end_tick, self._loaded_blob.ticks_executed)
+        end_tick = min(end_tick, self._view.ticks_executed)
 
-        # Get keyframes in range
-        keyframes = [
-            kf for kf in self._loaded_blob.keyframes
-            if start_tick <= kf.tick <= end_tick
-        ]
-
-        # Get deltas in range
-        deltas = [
-            d for d in self._loaded_blob.deltas
-            if start_tick <= d.tick <= end_tick
-        ]
+        # Only segments overlapping the chunk are read
+        keyframes = await self._view.keyframes_in_range(start_tick, end_tick)
+        deltas = await self._view.deltas_in_range(start_tick, end_tick)
 
         return ReplayChunk(
             start_tick=start_tick,
@@ -601,43 +779,36 @@ class DeterministicReplayLoader:
         agent_id: str,
         tick_start: Optional[int] = None,
         tick_end: Optional[int] = None,
-    ) -> List[AgentReplayState]:
+    ) -> AgentHistorySeries:
         """
         Get the state history for a specific agent.
         Used for "Explain-on-Click" feature.
 
+        Returns columns of AgentReplayState fields, one point per tick
+        where the agent changed. Only the agent's own updates are read,
+        located through the agent postings index.
+
         This is READ-ONLY (C3 compliant).
         """
-        if not self._loaded_blob:
+        if not self._view:
             raise RuntimeError("No telemetry loaded - call load() first")
 
         tick_start = tick_start or 0
-        tick_end = tick_end or self._loaded_blob.ticks_executed
-
-        history: List[AgentReplayState] = []
-
-        # Get states from keyframes
-        for kf in self._loaded_blob.keyframes:
-            if tick_start <= kf.tick <= tick_end:
-                if agent_id in kf.agent_states:
-                    history.append(
-                        AgentReplayState.from_dict(kf.agent_states[agent_id], kf.tick)
-                    )
-
-        # Fill in from deltas
-        for delta in self._loaded_blob.deltas:
-            if tick_start <= delta.tick <= tick_end:
-                for update in delta.agent_updates:
-                    if update.get("agent_id") == agent_id or update.get("id") == agent_id:
-                        # Apply update to last known state
-                        if history:
-                            last_state = deepcopy(history[-1])
-                            self._apply_agent_update(last_state, update, delta.tick)
-                            history.append(last_state)
-
-        # Sort by tick
-        history.sort(key=lambda s: s.tick)
-        return history
+        tick_end = tick_end or self._view.ticks_executed
+
+        def apply(agent: AgentReplayState, update: Dict[str, Any], tick: int) -> AgentReplayState:
+            # One working state; fields are replaced, never mutated, so points stay intact
+            self._apply_agent_update(agent, update, tick)
+            return agent
+
+        return await self._view.agent_history(
+            agent_id,
+            tick_start,
+            tick_end,
+            reset=AgentReplayState.from_dict,
+            apply=apply,
+            values=_agent_columns,
+        )
 
     async def get_events_at_tick(
         self,
@@ -649,37 +820,38 @@ class DeterministicReplayLoader:
 
         This is READ-ONLY (C3 compliant).
         """
-        if not self._loaded_blob:
+        if not self._view:
             raise RuntimeError("No telemetry loaded - call load() first")
 
         events = []
 
-        for delta in self._loaded_blob.deltas:
-            if delta.tick == tick:
-                for event_type in delta.events_triggered:
-                    events.append({
-                        "tick": tick,
-                        "type": event_type,
-                        "metrics": delta.metrics,
-                    })
-                break
+        for delta in await self._view.deltas_in_range(tick, tick):
+            for event_type in delta.events_triggered:
+                events.append({
+                    "tick": tick,
+                    "type": event_type,
+                    "metrics": delta.metrics,
+                })
+            break
 
         return events
 
     def clear(self):
         """Clear loaded telemetry and cached states."""
-        self._loaded_blob = None
+        self._view = None
         self._storage_ref = None
-        self._reconstructed_states.clear()
+        self.state_cache.clear()
+        self._cursor = None
         self._state = ReplayState.IDLE
 
 
 # Factory function
 def create_replay_loader(
     telemetry_service: Optional[TelemetryService] = None,
+    state_cache_bytes: Optional[int] = None,
 ) -> DeterministicReplayLoader:
     """Create a new replay loader instance."""
-    return DeterministicReplayLoader(telemetry_service)
+    return DeterministicReplayLoader(telemetry_service, state_cache_bytes)
 
 
 # Singleton instance (for shared use)
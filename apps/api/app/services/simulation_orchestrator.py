@@ -29,6 +29,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.engine.rng import DEFAULT_RNG_ALGORITHM
 from app.models.node import Node, Edge, Run, RunStatus, NodeCluster, TriggeredBy, InterventionType, NodePatch
 from app.services.node_service import (
     NodeService,
@@ -75,6 +76,7 @@ class RunConfigInput:
     seed_strategy: str = "single"
     primary_seed: Optional[int] = None
     seed_count: int = 1
+    rng_algorithm: str = DEFAULT_RNG_ALGORITHM.value  # philox | sha256 (legacy stream)
     keyframe_interval: int = 100
     scenario_patch: Optional[Dict[str, Any]] = None
     max_agents: Optional[int] = None
@@ -236,6 +238,7 @@ class SimulationOrchestrator:
                     "strategy": config.seed_strategy,
                     "primary_seed": config.primary_seed,
                     "count": config.seed_count,
+                    "rng_algorithm": config.rng_algorithm,
                 }),
                 "horizon": config.horizon,
                 "tick_rate": config.tick_rate,
@@ -811,6 +814,7 @@ class SimulationOrchestrator:
                 tick_rate=base_config.tick_rate,
                 seed_strategy="single",
                 primary_seed=seed,
+                rng_algorithm=base_config.rng_algorithm,
                 keyframe_interval=base_config.keyframe_interval,
                 scenario_patch=base_config.scenario_patch,
                 max_agents=base_config.max_agents,
@@ -17,6 +17,8 @@ Key features:
 - Tenant isolation via path prefixes
 - Signed URLs for secure downloads
 - Compression support (gzip, zstd)
+- Chunked telemetry objects written incrementally during a run
+- Segmented telemetry objects with an index and range-readable segments
 """
 
 import gzip
@@ -27,11 +29,15 @@ import os
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, BinaryIO, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from app.core.config import settings
 
+# Bytes read per step when uploading from a file object
+STREAM_COPY_BYTES = 1024 * 1024
+
 
 class StorageError(Exception):
     """Base exception for storage operations."""
@@ -107,11 +113,32 @@ class StorageBackend(ABC):
         """Upload an object to storage."""
         pass
 
+    async def put_object_stream(
+        self,
+        key: str,
+        stream: BinaryIO,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> StorageRef:
+        """
+        Upload an object from a file object, read STREAM_COPY_BYTES at a time.
+        Backends that can upload without holding the object override this.
+        """
+        return await self.put_object(key, stream.read(), content_type, metadata)
+
     @abstractmethod
     async def get_object(self, key: str) -> bytes:
         """Download an object from storage."""
         pass
 
+    async def get_object_range(self, key: str, offset: int, length: int) -> bytes:
+        """
+        Download length bytes of an object starting at offset.
+        Backends that support partial reads override this.
+        """
+        data = await self.get_object(key)
+        return data[offset:offset + length]
+
     @abstractmethod
     async def delete_object(self, key: str) -> bool:
         """Delete an object from storage."""
@@ -180,12 +207,47 @@ class LocalStorageBackend(StorageBackend):
         # Write content
         path.write_bytes(content)
 
-        # Write metadata
+        return self._write_metadata(key, path, content_type, checksum, len(content), metadata)
+
+    async def put_object_stream(
+        self,
+        key: str,
+        stream: BinaryIO,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> StorageRef:
+        """Copy a file object to local storage in STREAM_COPY_BYTES steps."""
+        path = self._get_full_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, "wb") as f:
+            while True:
+                block = stream.read(STREAM_COPY_BYTES)
+                if not block:
+                    break
+                digest.update(block)
+                f.write(block)
+                size += len(block)
+
+        return self._write_metadata(key, path, content_type, digest.hexdigest(), size, metadata)
+
+    def _write_metadata(
+        self,
+        key: str,
+        path: Path,
+        content_type: str,
+        checksum: str,
+        size_bytes: int,
+        metadata: Optional[dict],
+    ) -> StorageRef:
+        """Write the .meta sidecar of a stored object."""
         meta_path = path.with_suffix(path.suffix + ".meta")
         meta_data = {
             "content_type": content_type,
             "checksum": checksum,
-            "size_bytes": len(content),
+            "size_bytes": size_bytes,
             "created_at": datetime.utcnow().isoformat(),
             **(metadata or {}),
         }
@@ -194,7 +256,7 @@ class LocalStorageBackend(StorageBackend):
         return StorageRef(
             bucket="local",
             key=key,
-            size_bytes=len(content),
+            size_bytes=size_bytes,
             content_type=content_type,
             checksum=checksum,
         )
@@ -206,6 +268,15 @@ class LocalStorageBackend(StorageBackend):
             raise StorageNotFoundError(f"Object not found: {key}")
         return path.read_bytes()
 
+    async def get_object_range(self, key: str, offset: int, length: int) -> bytes:
+        """Read part of an object from local storage."""
+        path = self._get_full_path(key)
+        if not path.exists():
+            raise StorageNotFoundError(f"Object not found: {key}")
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
     async def delete_object(self, key: str) -> bool:
         """Delete an object from local storage."""
         path = self._get_full_path(key)
@@ -337,6 +408,52 @@ class S3StorageBackend(StorageBackend):
             checksum=checksum,
         )
 
+    async def put_object_stream(
+        self,
+        key: str,
+        stream: BinaryIO,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> StorageRef:
+        """
+        Upload a seekable file object to S3 with a managed (multipart)
+        transfer, which reads the object part by part.
+
+        The checksum is computed in a first pass over the stream, which is
+        then rewound for the upload.
+        """
+        start = stream.tell()
+        digest = hashlib.sha256()
+        size = 0
+        while True:
+            block = stream.read(STREAM_COPY_BYTES)
+            if not block:
+                break
+            digest.update(block)
+            size += len(block)
+        stream.seek(start)
+
+        extra_args = {
+            "ContentType": content_type,
+        }
+        if metadata:
+            extra_args["Metadata"] = {k: str(v) for k, v in metadata.items()}
+
+        self._client.upload_fileobj(
+            stream,
+            self.bucket,
+            key,
+            ExtraArgs=extra_args,
+        )
+
+        return StorageRef(
+            bucket=self.bucket,
+            key=key,
+            size_bytes=size,
+            content_type=content_type,
+            checksum=digest.hexdigest(),
+        )
+
     async def get_object(self, key: str) -> bytes:
         """Download an object from S3."""
         try:
@@ -345,6 +462,20 @@ class S3StorageBackend(StorageBackend):
         except self._client.exceptions.NoSuchKey:
             raise StorageNotFoundError(f"Object not found: {key}")
 
+    async def get_object_range(self, key: str, offset: int, length: int) -> bytes:
+        """Download part of an object from S3 with a Range request."""
+        if length <= 0:
+            return b""
+        try:
+            response = self._client.get_object(
+                Bucket=self.bucket,
+                Key=key,
+                Range=f"bytes={offset}-{offset + length - 1}",
+            )
+            return response["Body"].read()
+        except self._client.exceptions.NoSuchKey:
+            raise StorageNotFoundError(f"Object not found: {key}")
+
     async def delete_object(self, key: str) -> bool:
         """Delete an object from S3."""
         self._client.delete_object(Bucket=self.bucket, Key=key)
@@ -386,6 +517,411 @@ class S3StorageBackend(StorageBackend):
         return [obj["Key"] for obj in response.get("Contents", [])]
 
 
+# Manifest marker of telemetry stored as a sequence of chunk objects
+CHUNKED_TELEMETRY_FORMAT = "chunked-v1"
+
+# Encoded bytes buffered per section before a chunk is uploaded
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Manifest marker of telemetry stored as range-addressable segments in packs
+SEGMENTED_TELEMETRY_FORMAT = "segmented-v2"
+
+# Encoded record bytes per segment (the unit of a range read)
+DEFAULT_SEGMENT_BYTES = 256 * 1024
+
+
+def _encode_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# A record encoded once: (field names, encoded field values) for dicts
+# with string keys, (None, [encoded record]) for anything else
+EncodedRecord = Tuple[Optional[Tuple[str, ...]], List[bytes]]
+
+
+@lru_cache(maxsize=4096)
+def _encode_key(key: str) -> bytes:
+    return _encode_json(key)
+
+
+def _encode_record(record: Any) -> Tuple[EncodedRecord, int]:
+    """Encode a record's values once; also returns its JSON length."""
+    if isinstance(record, dict) and all(isinstance(key, str) for key in record):
+        values = [_encode_json(value) for value in record.values()]
+        size = 1 + sum(len(_encode_key(key)) + len(value) + 2 for key, value in zip(record, values))
+        return (tuple(record), values), max(size, 2)
+    encoded = _encode_json(record)
+    return (None, [encoded]), len(encoded)
+
+
+def _join_records(records: List[EncodedRecord]) -> bytes:
+    """Column-wise JSON for dict records sharing one field order, row-wise otherwise."""
+    fields = records[0][0] if records else None
+    if fields is not None and all(record_fields == fields for record_fields, _ in records):
+        columns = b",".join(
+            b"[" + b",".join(values[i] for _, values in records) + b"]"
+            for i in range(len(fields))
+        )
+        return b'{"count":%d,"fields":%s,"columns":[%s]}' % (
+            len(records), _encode_json(list(fields)), columns,
+        )
+
+    rows = []
+    for record_fields, values in records:
+        if record_fields is None:
+            rows.append(values[0])
+        else:
+            rows.append(b"{" + b",".join(
+                _encode_key(key) + b":" + value for key, value in zip(record_fields, values)
+            ) + b"}")
+    return b'{"rows":[' + b",".join(rows) + b"]}"
+
+
+def _encode_records(records: List[Any]) -> bytes:
+    """Column-wise JSON for dict records sharing one key set, row-wise otherwise."""
+    return _join_records([_encode_record(record)[0] for record in records])
+
+
+def _decode_records(payload: Dict[str, Any]) -> List[Any]:
+    if "rows" in payload:
+        return payload["rows"]
+    if not payload["fields"]:
+        return [{} for _ in range(payload["count"])]
+    return [dict(zip(payload["fields"], values)) for values in zip(*payload["columns"])]
+
+
+def _set_path(document: dict, path: str, value: Any) -> None:
+    """
+    Set a dotted path in a nested dict. Intermediate dicts are copied, so
+    nested dicts shared with the source manifest are left untouched.
+    """
+    *parents, leaf = path.split(".")
+    for part in parents:
+        child = dict(document.get(part) or {})
+        document[part] = child
+        document = child
+    document[leaf] = value
+
+
+class ChunkedTelemetryWriter:
+    """
+    Incremental writer for a chunked telemetry object (chunked-v1).
+
+    Superseded by SegmentedTelemetryWriter: new runs no longer write this
+    layout. It is kept because chunked-v1 objects written by earlier
+    releases are still read (get_telemetry, TelemetryView), and tests use
+    it to produce such objects.
+
+    Records are appended to named sections and serialized immediately;
+    once a section buffers ``chunk_bytes`` of JSON it is uploaded as a
+    numbered chunk object, so memory is bounded by one partial chunk per
+    section however long the run is. close() uploads the remainder and a
+    manifest at the regular telemetry key; StorageService.get_telemetry
+    reassembles the full document from it.
+
+    Section names are dotted paths into the assembled document (e.g.
+    "metrics_summary.by_tick"). List sections are concatenated in order;
+    mapping sections hold (key, value) records and assemble into a dict.
+    """
+
+    def __init__(
+        self,
+        storage: "StorageService",
+        tenant_id: str,
+        telemetry_id: str,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        compress: bool = True,
+    ):
+        self.storage = storage
+        self.tenant_id = tenant_id
+        self.telemetry_id = telemetry_id
+        self.chunk_bytes = chunk_bytes
+        self.compress = compress
+
+        self._buffers: Dict[str, List[bytes]] = {}
+        self._buffered_bytes: Dict[str, int] = {}
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._uploaded: List[StorageRef] = []
+        self._closed = False
+
+    def _section(self, name: str, mapping: bool) -> Dict[str, Any]:
+        section = self._sections.get(name)
+        if section is None:
+            section = {"mapping": mapping, "records": 0, "parts": []}
+            self._sections[name] = section
+            self._buffers[name] = []
+            self._buffered_bytes[name] = 0
+        elif section["mapping"] != mapping:
+            raise StorageError(f"Section {name} was opened as {'mapping' if section['mapping'] else 'list'}")
+        return section
+
+    async def append(self, section: str, record: Any) -> None:
+        """Append one record to a list section."""
+        await self._append(section, record, mapping=False)
+
+    async def put(self, section: str, key: str, value: Any) -> None:
+        """Add one entry to a mapping section."""
+        await self._append(section, [key, value], mapping=True)
+
+    async def _append(self, name: str, record: Any, mapping: bool) -> None:
+        if self._closed:
+            raise StorageError("Chunked telemetry writer is closed")
+        section = self._section(name, mapping)
+        encoded = _encode_json(record)
+        self._buffers[name].append(encoded)
+        self._buffered_bytes[name] += len(encoded)
+        section["records"] += 1
+        if self._buffered_bytes[name] >= self.chunk_bytes:
+            await self._flush(name)
+
+    async def _flush(self, name: str) -> None:
+        records = self._buffers[name]
+        if not records:
+            return
+        section = self._sections[name]
+        chunk_index = len(section["parts"])
+        key = self.storage._build_key(
+            self.tenant_id, "telemetry", self.telemetry_id,
+            f"chunks/{name}/{chunk_index:06d}.json",
+        )
+        ref = await self.storage._put_json_bytes(
+            key, b"[" + b",".join(records) + b"]", self.compress
+        )
+        section["parts"].append({
+            "key": ref.key,
+            "records": len(records),
+            "size_bytes": ref.size_bytes,
+            "compression": ref.compression,
+        })
+        self._uploaded.append(ref)
+        self._buffers[name] = []
+        self._buffered_bytes[name] = 0
+
+    async def close(self, document: dict) -> StorageRef:
+        """
+        Flush remaining records and write the manifest.
+
+        Args:
+            document: Top-level fields of the assembled document; sections
+                are merged into it on read.
+
+        Returns:
+            Reference to the manifest (size_bytes covers all chunks)
+        """
+        for name in list(self._sections):
+            await self._flush(name)
+        self._closed = True
+
+        manifest = dict(document)
+        manifest["storage_format"] = CHUNKED_TELEMETRY_FORMAT
+        manifest["chunks"] = self._sections
+        key = self.storage._build_key(self.tenant_id, "telemetry", self.telemetry_id, "data.json")
+        ref = await self.storage._put_json_bytes(key, _encode_json(manifest), self.compress)
+        ref.size_bytes += sum(chunk.size_bytes for chunk in self._uploaded)
+        return ref
+
+    async def abort(self) -> None:
+        """Delete chunks uploaded so far (run failed before close)."""
+        self._closed = True
+        for ref in self._uploaded:
+            await self.storage.backend.delete_object(ref.key)
+        self._uploaded = []
+
+
+class SegmentedTelemetryWriter:
+    """
+    Incremental writer for the segmented telemetry layout.
+
+    Records appended to a section are grouped into segments of about
+    ``segment_bytes`` of JSON (or ``segment_records`` records for sections
+    listed there). Each segment is encoded column-wise, compressed on its
+    own and appended to a pack object; packs are uploaded once they reach
+    ``pack_bytes``, so memory is bounded by one pack plus one open segment
+    per section.
+
+    close() writes a small manifest at the regular telemetry key listing,
+    per section, every segment's pack key, byte offset, length and tick
+    range (key range for mapping sections). Readers fetch only the
+    segments overlapping a tick range with range reads;
+    StorageService.get_telemetry still reassembles the full document,
+    leaving out derived sections (indexes readers can rebuild). Section
+    names are dotted paths as in ChunkedTelemetryWriter.
+    """
+
+    def __init__(
+        self,
+        storage: "StorageService",
+        tenant_id: str,
+        telemetry_id: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        pack_bytes: int = DEFAULT_CHUNK_BYTES,
+        segment_records: Optional[Dict[str, int]] = None,
+        compress: bool = True,
+    ):
+        self.storage = storage
+        self.tenant_id = tenant_id
+        self.telemetry_id = telemetry_id
+        self.segment_bytes = segment_bytes
+        self.pack_bytes = pack_bytes
+        self.segment_records = segment_records or {}
+        self.compression = "gzip" if compress else "none"
+
+        self._records: Dict[str, List[EncodedRecord]] = {}
+        self._record_bytes: Dict[str, int] = {}
+        self._ticks: Dict[str, List[Optional[int]]] = {}
+        self._keys: Dict[str, List[str]] = {}
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._pack = bytearray()
+        self._uploaded: List[StorageRef] = []
+        self._closed = False
+
+    def _pack_key(self) -> str:
+        return self.storage._build_key(
+            self.tenant_id, "telemetry", self.telemetry_id,
+            f"segments/{len(self._uploaded):06d}.bin",
+        )
+
+    def _section(self, name: str, mapping: bool, derived: bool = False) -> Dict[str, Any]:
+        section = self._sections.get(name)
+        if section is None:
+            section = {
+                "mapping": mapping,
+                "records": 0,
+                "compression": self.compression,
+                "segments": [],
+            }
+            if derived:
+                section["derived"] = True
+            self._sections[name] = section
+            self._records[name] = []
+            self._record_bytes[name] = 0
+            self._ticks[name] = []
+            self._keys[name] = []
+        elif section["mapping"] != mapping:
+            raise StorageError(f"Section {name} was opened as {'mapping' if section['mapping'] else 'list'}")
+        return section
+
+    async def append(self, section: str, record: Any, tick: Optional[int] = None) -> None:
+        """Append one record to a list section; tick places it on the timeline."""
+        await self._append(section, record, tick, mapping=False)
+
+    async def put(self, section: str, key: str, value: Any, derived: bool = False) -> None:
+        """
+        Add one entry to a mapping section.
+
+        derived marks an index section that is not part of the assembled
+        document; entries put in key order make its key ranges disjoint.
+        """
+        await self._append(section, [key, value], None, mapping=True, derived=derived)
+
+    def position(self, section: str) -> Tuple[int, int]:
+        """(segment number, record number within it) of the next record appended to section."""
+        if section not in self._sections:
+            return 0, 0
+        return len(self._sections[section]["segments"]), len(self._records[section])
+
+    async def _append(
+        self,
+        name: str,
+        record: Any,
+        tick: Optional[int],
+        mapping: bool,
+        derived: bool = False,
+    ) -> None:
+        if self._closed:
+            raise StorageError("Segmented telemetry writer is closed")
+        section = self._section(name, mapping, derived)
+        # Encoded once here; the segment is joined from these bytes
+        encoded, size = _encode_record(record)
+        self._records[name].append(encoded)
+        self._record_bytes[name] += size
+        self._ticks[name].append(tick)
+        if mapping:
+            self._keys[name].append(record[0])
+        section["records"] += 1
+
+        max_records = self.segment_records.get(name)
+        if (max_records and len(self._records[name]) >= max_records) or (
+            self._record_bytes[name] >= self.segment_bytes
+        ):
+            await self._flush_segment(name)
+
+    async def _flush_segment(self, name: str) -> None:
+        records = self._records[name]
+        if not records:
+            return
+
+        data = _join_records(records)
+        if self.compression == "gzip":
+            data = gzip.compress(data)
+
+        ticks = [tick for tick in self._ticks[name] if tick is not None]
+        segment = {
+            "key": self._pack_key(),
+            "offset": len(self._pack),
+            "length": len(data),
+            "records": len(records),
+            "tick_start": min(ticks) if ticks else None,
+            "tick_end": max(ticks) if ticks else None,
+        }
+        if self._sections[name]["mapping"]:
+            keys = self._keys[name]
+            segment["key_start"] = min(keys)
+            segment["key_end"] = max(keys)
+        self._sections[name]["segments"].append(segment)
+        self._pack.extend(data)
+        self._records[name] = []
+        self._record_bytes[name] = 0
+        self._ticks[name] = []
+        self._keys[name] = []
+
+        if len(self._pack) >= self.pack_bytes:
+            await self._upload_pack()
+
+    async def _upload_pack(self) -> None:
+        if not self._pack:
+            return
+        ref = await self.storage.backend.put_object(
+            key=self._pack_key(),
+            data=bytes(self._pack),
+            content_type="application/octet-stream",
+        )
+        self._uploaded.append(ref)
+        self._pack = bytearray()
+
+    async def close(self, document: dict) -> StorageRef:
+        """
+        Flush remaining segments and write the manifest.
+
+        Args:
+            document: Top-level fields of the assembled document; sections
+                are merged into it on read.
+
+        Returns:
+            Reference to the manifest (size_bytes covers all packs)
+        """
+        for name in list(self._sections):
+            await self._flush_segment(name)
+        await self._upload_pack()
+        self._closed = True
+
+        manifest = dict(document)
+        manifest["storage_format"] = SEGMENTED_TELEMETRY_FORMAT
+        manifest["sections"] = self._sections
+        key = self.storage._build_key(self.tenant_id, "telemetry", self.telemetry_id, "data.json")
+        ref = await self.storage._put_json_bytes(key, _encode_json(manifest), compress=True)
+        ref.size_bytes += sum(pack.size_bytes for pack in self._uploaded)
+        return ref
+
+    async def abort(self) -> None:
+        """Delete packs uploaded so far (run failed before close)."""
+        self._closed = True
+        for ref in self._uploaded:
+            await self.storage.backend.delete_object(ref.key)
+        self._uploaded = []
+        self._pack = bytearray()
+
+
 class StorageService:
     """
     High-level storage service with tenant isolation.
@@ -433,9 +969,10 @@ class StorageService:
         key = self._build_key(tenant_id, "telemetry", telemetry_id, "data.json")
 
         # Serialize to JSON
-        json_data = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return await self._put_json_bytes(key, _encode_json(data), compress)
 
-        # Optionally compress
+    async def _put_json_bytes(self, key: str, json_data: bytes, compress: bool) -> StorageRef:
+        """Upload serialized JSON, optionally gzip-compressed."""
         if compress:
             compressed = gzip.compress(json_data)
             ref = await self.backend.put_object(
@@ -454,15 +991,137 @@ class StorageService:
 
         return ref
 
-    async def get_telemetry(self, storage_ref: StorageRef) -> dict:
-        """Retrieve telemetry data."""
-        data = await self.backend.get_object(storage_ref.key)
+    async def _get_json(self, key: str, compression: str) -> Any:
+        document, _ = await self._get_json_sized(key, compression)
+        return document
+
+    async def _get_json_sized(self, key: str, compression: str) -> Tuple[Any, int]:
+        """Download and decode JSON; also returns the decoded byte count."""
+        data = await self.backend.get_object(key)
 
         # Decompress if needed
-        if storage_ref.compression == "gzip":
+        if compression == "gzip":
             data = gzip.decompress(data)
 
-        return json.loads(data.decode("utf-8"))
+        return json.loads(data.decode("utf-8")), len(data)
+
+    def open_telemetry_stream(
+        self,
+        tenant_id: str,
+        telemetry_id: str,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        compress: bool = True,
+    ) -> ChunkedTelemetryWriter:
+        """Start a chunked-v1 telemetry object (legacy layout; new runs use open_segmented_telemetry)."""
+        return ChunkedTelemetryWriter(self, tenant_id, telemetry_id, chunk_bytes, compress)
+
+    def open_segmented_telemetry(
+        self,
+        tenant_id: str,
+        telemetry_id: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        pack_bytes: int = DEFAULT_CHUNK_BYTES,
+        segment_records: Optional[Dict[str, int]] = None,
+        compress: bool = True,
+    ) -> SegmentedTelemetryWriter:
+        """Start a segmented telemetry object written incrementally."""
+        return SegmentedTelemetryWriter(
+            self, tenant_id, telemetry_id, segment_bytes, pack_bytes, segment_records, compress
+        )
+
+    async def get_telemetry(self, storage_ref: StorageRef) -> dict:
+        """Retrieve telemetry data (chunked and segmented objects are reassembled)."""
+        data, _ = await self.get_telemetry_sized(storage_ref)
+        return data
+
+    async def get_telemetry_sized(self, storage_ref: StorageRef) -> Tuple[dict, int]:
+        """
+        Retrieve telemetry data and its decoded JSON size in bytes.
+        The size covers the manifest and every chunk or segment.
+        """
+        data, size = await self.get_telemetry_header(storage_ref)
+        data, part_bytes = await self.assemble_telemetry(data)
+        return data, size + part_bytes
+
+    async def get_telemetry_header(self, storage_ref: StorageRef) -> Tuple[dict, int]:
+        """
+        Retrieve the top-level telemetry object and its decoded size: the
+        whole document for single-object telemetry, the manifest for
+        chunked and segmented layouts.
+        """
+        return await self._get_json_sized(storage_ref.key, storage_ref.compression)
+
+    async def assemble_telemetry(self, data: dict) -> Tuple[dict, int]:
+        """
+        Reassemble a chunked or segmented manifest into the full document.
+        Returns the document and the decoded bytes read for it.
+        """
+        storage_format = data.get("storage_format") if isinstance(data, dict) else None
+        if storage_format == CHUNKED_TELEMETRY_FORMAT:
+            return await self._assemble_chunked_telemetry(data)
+        if storage_format == SEGMENTED_TELEMETRY_FORMAT:
+            return await self._assemble_segmented_telemetry(data)
+        return data, 0
+
+    async def read_segment(self, segment: Dict[str, Any], compression: str) -> Tuple[List[Any], int]:
+        """
+        Range-read one segment of a segmented telemetry object.
+        Returns its records and decoded size in bytes.
+        """
+        data = await self.backend.get_object_range(segment["key"], segment["offset"], segment["length"])
+        return self._decode_segment(data, compression)
+
+    @staticmethod
+    def _decode_segment(data: bytes, compression: str) -> Tuple[List[Any], int]:
+        if compression == "gzip":
+            data = gzip.decompress(data)
+        return _decode_records(json.loads(data.decode("utf-8"))), len(data)
+
+    async def _assemble_segmented_telemetry(self, manifest: dict) -> Tuple[dict, int]:
+        """Merge every segment listed in a manifest back into one document."""
+        document = dict(manifest)
+        sections = document.pop("sections", {})
+        document.pop("storage_format", None)
+        packs: Dict[str, bytes] = {}
+        decoded_bytes = 0
+
+        for name, section in sections.items():
+            if section.get("derived"):
+                continue
+            records: List[Any] = []
+            for segment in section.get("segments", []):
+                # Reading a whole document touches every segment: fetch each pack once
+                pack = packs.get(segment["key"])
+                if pack is None:
+                    pack = packs[segment["key"]] = await self.backend.get_object(segment["key"])
+                data = pack[segment["offset"]:segment["offset"] + segment["length"]]
+                segment_records, segment_bytes = self._decode_segment(data, section.get("compression", "none"))
+                records.extend(segment_records)
+                decoded_bytes += segment_bytes
+            value = dict(records) if section.get("mapping") else records
+            _set_path(document, name, value)
+
+        return document, decoded_bytes
+
+    async def _assemble_chunked_telemetry(self, manifest: dict) -> Tuple[dict, int]:
+        """Merge the chunks listed in a manifest back into one document."""
+        document = dict(manifest)
+        sections = document.pop("chunks", {})
+        document.pop("storage_format", None)
+        decoded_bytes = 0
+
+        for name, section in sections.items():
+            records: List[Any] = []
+            for part in section.get("parts", []):
+                part_records, part_bytes = await self._get_json_sized(
+                    part["key"], part.get("compression", "none")
+                )
+                records.extend(part_records)
+                decoded_bytes += part_bytes
+            value = dict(records) if section.get("mapping") else records
+            _set_path(document, name, value)
+
+        return document, decoded_bytes
 
     async def store_snapshot(
         self,
@@ -519,6 +1178,25 @@ class StorageService:
         key = self._build_key(tenant_id, artifact_type, artifact_id, filename)
         return await self.backend.put_object(key, data, content_type)
 
+    def artifact_ref(
+        self,
+        tenant_id: str,
+        artifact_type: str,
+        artifact_id: str,
+        filename: str,
+        content_type: str = "application/octet-stream",
+    ) -> StorageRef:
+        """
+        Reference to where store_artifact would write, without writing.
+        Used to hand out a signed URL for an artifact still being generated.
+        """
+        return StorageRef(
+            bucket=getattr(self.backend, "bucket", "local"),
+            key=self._build_key(tenant_id, artifact_type, artifact_id, filename),
+            size_bytes=0,
+            content_type=content_type,
+        )
+
     async def get_signed_download_url(
         self,
         storage_ref: StorageRef,
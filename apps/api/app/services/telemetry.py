@@ -22,16 +22,39 @@ Telemetry Contract (§6.8):
   - by event type
 """
 
+import asyncio
 import gzip
+import heapq
 import json
+import struct
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 import uuid
 
-from app.services.storage import StorageService, StorageRef, get_storage_service
+from app.services.storage import (
+    DEFAULT_CHUNK_BYTES,
+    DEFAULT_SEGMENT_BYTES,
+    SEGMENTED_TELEMETRY_FORMAT,
+    StorageService,
+    StorageRef,
+    get_storage_service,
+)
+
+DEFAULT_TELEMETRY_CACHE_BYTES = 512 * 1024 * 1024
+
+# Records per segment by section; one keyframe per segment so a seek reads one
+TELEMETRY_SEGMENT_RECORDS = {"keyframes": 1}
+
+# Derived segmented section: agent_id -> ticks and delta offsets of its updates
+AGENT_POSTINGS_SECTION = "agent_postings"
 
 
 class TelemetryVersion(str, Enum):
@@ -444,6 +467,55 @@ class TelemetrySlice:
     total_ticks: int
 
 
+@dataclass
+class AgentHistorySeries:
+    """
+    Column-oriented state history of one agent.
+
+    Point i is the agent's state at ticks[i]; columns[name][i] is that
+    field's value there (None where the field was not yet set). Points
+    are the start of the requested range and every later tick where a
+    keyframe or an update changed the agent. metrics[i] is the run's
+    tick metrics recorded at ticks[i], or None if no keyframe or delta
+    read for the history was recorded at that tick.
+    """
+    agent_id: str
+    ticks: List[int] = field(default_factory=list)
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+    metrics: List[Optional[Dict[str, float]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def append(
+        self,
+        tick: int,
+        values: Dict[str, Any],
+        metrics: Optional[Dict[str, float]] = None,
+    ) -> None:
+        for name in values.keys() - self.columns.keys():
+            self.columns[name] = [None] * len(self.ticks)
+        for name, column in self.columns.items():
+            column.append(values.get(name))
+        self.ticks.append(tick)
+        self.metrics.append(metrics)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Points as {"tick": ..., field: value} dicts."""
+        return [
+            {"tick": tick, **{name: column[i] for name, column in self.columns.items()}}
+            for i, tick in enumerate(self.ticks)
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "agent_id": self.agent_id,
+            "ticks": self.ticks,
+            "columns": self.columns,
+            "metrics": self.metrics,
+        }
+
+
 @dataclass
 class TelemetryIndexResult:
     """
@@ -595,6 +667,769 @@ class TelemetryWriter:
         )
 
 
+class TelemetryStreamWriter:
+    """
+    Streams telemetry to segmented object storage during execution.
+
+    Produces the same blob as TelemetryService.store_from_execution_result,
+    but deltas, keyframes, per-tick metrics and final states are uploaded
+    in segments as they are written. Only the index (keyframe ticks, event
+    markers and event-type postings) is held until close(); per-agent
+    update postings are spilled to a temporary file as each delta segment
+    closes and merged into the postings section at close().
+    """
+
+    def __init__(
+        self,
+        storage: StorageService,
+        tenant_id: str,
+        run_id: str,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        compress: bool = True,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ):
+        self.run_id = run_id
+        self._segments = storage.open_segmented_telemetry(
+            tenant_id,
+            run_id,
+            segment_bytes=segment_bytes,
+            pack_bytes=chunk_bytes,
+            segment_records=TELEMETRY_SEGMENT_RECORDS,
+            compress=compress,
+        )
+        self.tick_count = 0
+        self.keyframe_ticks: List[int] = []
+        self.event_index: List[Dict[str, Any]] = []
+        self.event_postings: Dict[str, List[int]] = {}
+        self.agent_postings = _AgentPostingsSpill()
+        self.capabilities = TelemetryCapabilities()
+
+    async def write_delta(
+        self,
+        tick: int,
+        agent_updates: List[Dict[str, Any]],
+        events_triggered: List[str],
+        metrics: Dict[str, float],
+    ):
+        """Stream the delta entry for this tick."""
+        delta = TelemetryDelta(
+            tick=tick,
+            agent_updates=agent_updates,
+            events_triggered=events_triggered,
+            metrics=metrics,
+        )
+        await self._append_delta(delta)
+        await self._segments.append("metrics_summary.by_tick", metrics, tick=tick)
+        self.tick_count += 1
+
+        # Update event index
+        if events_triggered:
+            self.event_index.append({
+                "tick": tick,
+                "events": events_triggered,
+            })
+
+    async def write_keyframe(
+        self,
+        tick: int,
+        agent_states: Dict[str, Any],
+        environment_state: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Dict[str, float]] = None,
+    ):
+        """Stream a keyframe snapshot."""
+        keyframe = TelemetryKeyframe(
+            tick=tick,
+            timestamp=datetime.utcnow().isoformat(),
+            agent_states=agent_states,
+            environment_state=environment_state,
+            metrics=metrics,
+        )
+        await self._append_keyframe(keyframe)
+        self.keyframe_ticks.append(tick)
+
+    async def write_final_state(self, agent_id: str, state: Dict[str, Any]):
+        """Stream one agent's final state."""
+        if not self.capabilities.has_spatial and isinstance(state, dict):
+            self.capabilities.has_spatial = _has_spatial_fields(state)
+        await self._segments.put("final_states", agent_id, state)
+
+    async def _append_keyframe(self, keyframe: TelemetryKeyframe):
+        if not self.capabilities.has_spatial:
+            self.capabilities.has_spatial = any(
+                isinstance(state, dict) and _has_spatial_fields(state)
+                for state in keyframe.agent_states.values()
+            )
+        await self._segments.append("keyframes", keyframe.to_dict(), tick=keyframe.tick)
+
+    async def _append_delta(self, delta: TelemetryDelta):
+        for event_type in delta.events_triggered:
+            ticks = self.event_postings.setdefault(event_type, [])
+            if not ticks or ticks[-1] != delta.tick:
+                ticks.append(delta.tick)
+        self.capabilities.has_events |= bool(delta.events_triggered)
+        self.capabilities.has_metrics |= bool(delta.metrics)
+        segment, record = self._segments.position("deltas")
+        self.agent_postings.add(delta, segment, record)
+        await self._segments.append("deltas", delta.to_dict(), tick=delta.tick)
+
+    async def _finish(self, header: Dict[str, Any]) -> StorageRef:
+        # Merged in agent_id order, so each postings segment covers a
+        # disjoint agent_id range
+        for agent_id, flat in self.agent_postings.merged():
+            await self._segments.put(
+                AGENT_POSTINGS_SECTION,
+                agent_id,
+                _postings_entry(flat),
+                derived=True,
+            )
+        self.agent_postings.close()
+        manifest = dict(header)
+        manifest["event_postings"] = self.event_postings
+        manifest["capabilities"] = self.capabilities.to_dict()
+        return await self._segments.close(manifest)
+
+    async def close(
+        self,
+        seed_used: int,
+        agent_count: int,
+        metrics_summary: Optional[Dict[str, Any]] = None,
+    ) -> StorageRef:
+        """Upload remaining segments and the blob manifest."""
+        index = TelemetryIndex(
+            tick_count=self.tick_count,
+            keyframe_ticks=self.keyframe_ticks,
+            event_index=self.event_index,
+        )
+        return await self._finish({
+            "run_id": self.run_id,
+            "schema_version": TelemetryVersion.CURRENT.value,
+            "created_at": datetime.utcnow().isoformat(),
+            "ticks_executed": self.tick_count,
+            "seed_used": seed_used,
+            "agent_count": agent_count,
+            "index": index.to_dict(),
+            "metrics_summary": metrics_summary or {},
+        })
+
+    async def write_blob(self, blob: TelemetryBlob) -> StorageRef:
+        """Stream a complete in-memory blob and close."""
+        try:
+            for keyframe in blob.keyframes:
+                await self._append_keyframe(keyframe)
+            for delta in blob.deltas:
+                await self._append_delta(delta)
+
+            metrics_summary = dict(blob.metrics_summary)
+            if metrics_summary.get("by_tick"):
+                for entry in metrics_summary.pop("by_tick"):
+                    await self._segments.append("metrics_summary.by_tick", entry)
+            for agent_id, state in blob.final_states.items():
+                await self.write_final_state(agent_id, state)
+
+            return await self._finish({
+                "run_id": blob.run_id,
+                "schema_version": blob.schema_version,
+                "created_at": blob.created_at,
+                "ticks_executed": blob.ticks_executed,
+                "seed_used": blob.seed_used,
+                "agent_count": blob.agent_count,
+                "index": blob.index.to_dict(),
+                "metrics_summary": metrics_summary,
+            })
+        except BaseException:
+            await self.abort()
+            raise
+
+    async def abort(self):
+        """Discard segments written so far."""
+        self.agent_postings.close()
+        await self._segments.abort()
+
+
+def _post_agent_updates(
+    postings: Dict[str, array],
+    delta: TelemetryDelta,
+    segment: int,
+    record: int,
+) -> None:
+    """Add (tick, segment, record, update) postings for each agent the delta updates."""
+    for position, update in enumerate(delta.agent_updates):
+        agent_id = update.get("agent_id", update.get("id"))
+        if agent_id:
+            postings.setdefault(str(agent_id), array("q")).extend(
+                (delta.tick, segment, record, position)
+            )
+
+
+def _postings_entry(flat: array) -> Dict[str, List[int]]:
+    return {
+        "ticks": flat[0::4].tolist(),
+        "segments": flat[1::4].tolist(),
+        "records": flat[2::4].tolist(),
+        "updates": flat[3::4].tolist(),
+    }
+
+
+_EMPTY_POSTINGS: Dict[str, List[int]] = _postings_entry(array("q"))
+
+
+class _AgentPostingsSpill:
+    """
+    Agent postings of a stream writer, spilled one delta segment at a time.
+
+    Postings of the open delta segment are kept in memory; when it closes
+    they are appended to a temporary file as one run sorted by agent_id.
+    merged() streams the runs back in agent_id order, so writer memory is
+    bounded by one segment's postings and one read buffer per run.
+    """
+
+    READ_BYTES = 64 * 1024
+    _HEADER = struct.Struct("<II")  # agent_id bytes, postings integers
+    _ITEM_BYTES = array("q").itemsize
+
+    def __init__(self):
+        self._file = None
+        self._runs: List[Tuple[int, int]] = []  # (offset, length)
+        self.pending: Dict[str, array] = {}
+        self.segment: Optional[int] = None
+
+    @property
+    def run_count(self) -> int:
+        return len(self._runs)
+
+    def add(self, delta: TelemetryDelta, segment: int, record: int) -> None:
+        if segment != self.segment:
+            self.flush()
+            self.segment = segment
+        _post_agent_updates(self.pending, delta, segment, record)
+
+    def flush(self) -> None:
+        """Spill the pending postings as one sorted run."""
+        if not self.pending:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        offset = self._file.seek(0, 2)
+        for agent_id in sorted(self.pending):
+            key = agent_id.encode("utf-8")
+            flat = self.pending[agent_id]
+            self._file.write(self._HEADER.pack(len(key), len(flat)))
+            self._file.write(key)
+            self._file.write(flat.tobytes())
+        self._runs.append((offset, self._file.tell() - offset))
+        self.pending = {}
+
+    def merged(self) -> Iterator[Tuple[str, array]]:
+        """(agent_id, postings) in agent_id order; postings stay in tick order."""
+        self.flush()
+        runs = [
+            self._read_run(number, offset, length)
+            for number, (offset, length) in enumerate(self._runs)
+        ]
+        # Runs are in segment order, so ties on agent_id merge in tick order
+        current_id, current = None, None
+        for agent_id, _, flat in heapq.merge(*runs):
+            if agent_id != current_id:
+                if current is not None:
+                    yield current_id, current
+                current_id, current = agent_id, flat
+            else:
+                current.extend(flat)
+        if current is not None:
+            yield current_id, current
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._runs = []
+        self.pending = {}
+
+    def _read_run(self, number: int, offset: int, length: int) -> Iterator[Tuple[str, int, array]]:
+        header_size = self._HEADER.size
+        buffer = b""
+        start = 0
+        position, end = offset, offset + length
+        while True:
+            while len(buffer) - start >= header_size:
+                key_length, count = self._HEADER.unpack_from(buffer, start)
+                size = header_size + key_length + count * self._ITEM_BYTES
+                if len(buffer) - start < size:
+                    break
+                key_end = start + header_size + key_length
+                flat = array("q")
+                flat.frombytes(buffer[key_end:start + size])
+                yield buffer[start + header_size:key_end].decode("utf-8"), number, flat
+                start += size
+            if position >= end:
+                return
+            # Runs share the file, so seek before every read
+            self._file.seek(position)
+            chunk = self._file.read(min(self.READ_BYTES, end - position))
+            position += len(chunk)
+            buffer = buffer[start:] + chunk
+            start = 0
+
+
+def _raw_agent_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: value for name, value in state.items() if name not in ("agent_id", "id")}
+
+
+class DecodedTelemetryCache:
+    """
+    Process-wide LRU cache of decoded telemetry.
+
+    Entries are keyed by (storage key, checksum, part), so a blob rewritten
+    under the same key is never served stale, and bounded by the decoded
+    JSON size of the cached values. A part is the whole blob, the layout
+    read first (segmented manifest or older whole blob) or one segment.
+    Concurrent requests for a blob that is still loading wait for that load
+    instead of downloading and decoding it again (single flight). Refs
+    without a checksum cannot be identified safely and are always loaded
+    from storage.
+
+    Cached blobs are shared by every caller and must be treated as
+    read-only (C3).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TELEMETRY_CACHE_BYTES):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Decoded JSON bytes kept; least recently used blobs
+                are evicted first, blobs larger than this are not cached
+        """
+        self.max_bytes = max(0, max_bytes)
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, int]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.uncached = 0
+
+    @staticmethod
+    def cache_key(storage_ref: StorageRef, part: str = "blob") -> Optional[Tuple[str, str, str]]:
+        if not storage_ref.checksum:
+            return None
+        return (storage_ref.key, storage_ref.checksum, part)
+
+    async def get_or_load(
+        self,
+        storage_ref: StorageRef,
+        load: Callable[[], Awaitable[Tuple[Any, int]]],
+        part: str = "blob",
+    ) -> Any:
+        """
+        Return the cached value for a part of storage_ref, loading it on a miss.
+
+        Args:
+            storage_ref: Reference to the telemetry object
+            load: Coroutine factory returning (value, decoded_bytes)
+            part: Which decoded part of the object is requested
+        """
+        key = self.cache_key(storage_ref, part)
+        if key is None:
+            with self._lock:
+                self.uncached += 1
+            value, _ = await load()
+            return value
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            pending = self._inflight.get(key)
+            # Futures belong to one event loop; other loops load independently
+            if pending is not None and pending.get_loop() is loop:
+                self.coalesced += 1
+            else:
+                pending = None
+                self.misses += 1
+                future = loop.create_future()
+                self._inflight[key] = future
+
+        if pending is not None:
+            # asyncio.wait only raises if this waiter itself is cancelled
+            await asyncio.wait({pending})
+            if pending.cancelled():
+                return await self.get_or_load(storage_ref, load, part)
+            return pending.result()
+
+        try:
+            value, size = await load()
+        except BaseException as e:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # Waiters re-raise it; don't log as unretrieved
+            else:
+                future.cancel()
+            raise
+
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            self._store(key, value, size)
+        future.set_result(value)
+        return value
+
+    def _store(self, key: Tuple[str, str, str], value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous[1]
+        while self._entries and self.current_bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+
+    def invalidate(self, storage_ref: StorageRef) -> None:
+        """Drop every cached part of storage_ref."""
+        with self._lock:
+            for key in [k for k in self._entries if k[:2] == (storage_ref.key, storage_ref.checksum)]:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+            self.evictions = 0
+            self.uncached = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "uncached": self.uncached,
+            "in_flight": len(self._inflight),
+            "hit_rate": self.hit_rate,
+        }
+
+
+_decoded_telemetry_cache: Optional[DecodedTelemetryCache] = None
+
+
+def get_decoded_telemetry_cache() -> DecodedTelemetryCache:
+    """Get the process-wide decoded telemetry cache."""
+    global _decoded_telemetry_cache
+    if _decoded_telemetry_cache is None:
+        from app.core.config import settings
+        _decoded_telemetry_cache = DecodedTelemetryCache(settings.TELEMETRY_CACHE_MAX_BYTES)
+    return _decoded_telemetry_cache
+
+
+class TelemetryView:
+    """
+    Tick-range read access to one stored telemetry object.
+
+    For the segmented layout only the manifest is held: a read touches the
+    segments whose tick range overlaps the request, fetched with range
+    reads through the shared decoded cache. Single-document and chunked
+    telemetry is loaded whole (also cached) and sliced in memory.
+    Returned objects are shared with the cache and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        service: "TelemetryService",
+        storage_ref: StorageRef,
+        layout: Union[TelemetryBlob, Dict[str, Any]],
+    ):
+        self._service = service
+        self.storage_ref = storage_ref
+
+        if isinstance(layout, TelemetryBlob):
+            self._blob: Optional[TelemetryBlob] = layout
+            self._manifest: Dict[str, Any] = {}
+            header = layout
+            self.run_id = header.run_id
+            self.schema_version = header.schema_version
+            self.ticks_executed = header.ticks_executed
+            self.seed_used = header.seed_used
+            self.agent_count = header.agent_count
+            self.index = header.index
+        else:
+            self._blob = None
+            self._manifest = layout
+            self.run_id = layout["run_id"]
+            self.schema_version = layout.get("schema_version", TelemetryVersion.V1_0_0.value)
+            self.ticks_executed = layout.get("ticks_executed", 0)
+            self.seed_used = layout.get("seed_used", 0)
+            self.agent_count = layout.get("agent_count", 0)
+            self.index = TelemetryIndex.from_dict(layout.get("index", {}))
+
+    @property
+    def is_segmented(self) -> bool:
+        return self._blob is None
+
+    @property
+    def capabilities(self) -> TelemetryCapabilities:
+        if self._blob is not None:
+            return detect_capabilities(self._blob.to_dict())
+        return TelemetryCapabilities.from_dict(self._manifest.get("capabilities", {}))
+
+    def event_ticks(self, event_type: str) -> List[int]:
+        """Ticks at which event_type was triggered."""
+        if "event_postings" in self._manifest:
+            return list(self._manifest["event_postings"].get(event_type, []))
+        return [
+            entry["tick"] for entry in self.index.event_index
+            if event_type in entry.get("events", [])
+        ]
+
+    async def keyframe_at(self, tick: int) -> Optional[TelemetryKeyframe]:
+        """Closest keyframe at or before tick."""
+        if self._blob is not None:
+            keyframes = self._blob.keyframes
+            position = bisect_right(keyframes, tick, key=lambda kf: kf.tick)
+            return keyframes[position - 1] if position else None
+
+        segments = self._segments("keyframes")
+        position = bisect_right(segments, tick, key=lambda seg: seg["tick_start"])
+        if not position:
+            return None
+        keyframes = await self._read("keyframes", segments[position - 1])
+        position = bisect_right(keyframes, tick, key=lambda kf: kf.tick)
+        return keyframes[position - 1] if position else None
+
+    async def keyframes_in_range(self, tick_start: int, tick_end: int) -> List[TelemetryKeyframe]:
+        """Keyframes with tick_start <= tick <= tick_end."""
+        return await self._records_in_range("keyframes", tick_start, tick_end)
+
+    async def deltas_in_range(self, tick_start: int, tick_end: int) -> List[TelemetryDelta]:
+        """Deltas with tick_start <= tick <= tick_end."""
+        return await self._records_in_range("deltas", tick_start, tick_end)
+
+    async def final_states(self) -> Dict[str, Any]:
+        if self._blob is not None:
+            return self._blob.final_states
+        states: Dict[str, Any] = {}
+        for segment in self._segments("final_states"):
+            states.update(await self._read("final_states", segment))
+        return states
+
+    async def metrics_summary(self) -> Dict[str, Any]:
+        if self._blob is not None:
+            return self._blob.metrics_summary
+        summary = dict(self._manifest.get("metrics_summary", {}))
+        if "metrics_summary.by_tick" in self._manifest.get("sections", {}):
+            by_tick: List[Any] = []
+            for segment in self._segments("metrics_summary.by_tick"):
+                by_tick.extend(await self._read("metrics_summary.by_tick", segment))
+            summary["by_tick"] = by_tick
+        return summary
+
+    async def agent_updates(
+        self,
+        agent_id: str,
+        tick_start: int,
+        tick_end: int,
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        (tick, update) for agent_id's updates with tick_start <= tick <= tick_end.
+
+        Located through the agent postings index, so only the delta
+        segments holding this agent's updates are read and no delta's
+        update list is scanned.
+        """
+        return [
+            (tick, update)
+            for tick, _, update in await self._agent_deltas(agent_id, tick_start, tick_end)
+        ]
+
+    async def _agent_deltas(
+        self,
+        agent_id: str,
+        tick_start: int,
+        tick_end: int,
+    ) -> List[Tuple[int, TelemetryDelta, Dict[str, Any]]]:
+        """(tick, delta, update) for each of agent_updates' updates."""
+        postings = await self._agent_postings(agent_id)
+        ticks = postings["ticks"]
+        first = bisect_left(ticks, tick_start)
+        last = bisect_right(ticks, tick_end)
+
+        updates = []
+        segments = self._segments("deltas")
+        for i in range(first, last):
+            if self._blob is not None:
+                delta = self._blob.deltas[postings["records"][i]]
+            else:
+                records = await self._read("deltas", segments[postings["segments"][i]])
+                delta = records[postings["records"][i]]
+            updates.append((ticks[i], delta, delta.agent_updates[postings["updates"][i]]))
+        return updates
+
+    async def agent_history(
+        self,
+        agent_id: str,
+        tick_start: int,
+        tick_end: int,
+        reset: Optional[Callable[[Dict[str, Any], int], Any]] = None,
+        apply: Optional[Callable[[Any, Dict[str, Any], int], Any]] = None,
+        values: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ) -> AgentHistorySeries:
+        """
+        Column-oriented history of agent_id over [tick_start, tick_end].
+
+        Reads the keyframe at or before tick_start, keyframes inside the
+        range and this agent's updates; as in replay, a keyframe replaces
+        the agent's state and updates at a keyframe tick are skipped. By
+        default columns are the raw telemetry fields; reset (state from a
+        keyframe or a first update), apply and values let replay fold the
+        same changes into its own state model.
+        """
+        reset = reset or (lambda state, tick: _raw_agent_state(state))
+        apply = apply or (lambda state, update, tick: {**state, **_raw_agent_state(update)})
+        values = values or (lambda state: state)
+
+        anchor = await self.keyframe_at(tick_start)
+        first_update = anchor.tick + 1 if anchor is not None else 0
+        keyframes = {
+            kf.tick: kf for kf in await self.keyframes_in_range(tick_start + 1, tick_end)
+        }
+
+        changes: Dict[int, List[Dict[str, Any]]] = {}
+        metrics: Dict[int, Optional[Dict[str, float]]] = {}
+        for tick, delta, update in await self._agent_deltas(agent_id, first_update, tick_end):
+            if tick not in keyframes:
+                changes.setdefault(tick, []).append(update)
+                metrics[tick] = delta.metrics
+        for tick, keyframe in keyframes.items():
+            changes.setdefault(tick, [])
+            metrics[tick] = keyframe.metrics
+        if anchor is not None:
+            metrics.setdefault(anchor.tick, anchor.metrics)
+
+        series = AgentHistorySeries(agent_id)
+        state = None
+        if anchor is not None and agent_id in anchor.agent_states:
+            state = reset(anchor.agent_states[agent_id], anchor.tick)
+
+        started = False
+        for tick in sorted(changes):
+            if tick > tick_start and not started:
+                if state is not None:
+                    series.append(tick_start, values(state), metrics.get(tick_start))
+                started = True
+            keyframe = keyframes.get(tick)
+            if keyframe is not None:
+                if agent_id not in keyframe.agent_states:
+                    continue
+                state = reset(keyframe.agent_states[agent_id], tick)
+            for update in changes[tick]:
+                state = reset(update, tick) if state is None else apply(state, update, tick)
+            if tick >= tick_start and state is not None:
+                series.append(tick, values(state), metrics.get(tick))
+                started = True
+        if not started and state is not None:
+            series.append(tick_start, values(state), metrics.get(tick_start))
+        return series
+
+    async def _agent_postings(self, agent_id: str) -> Dict[str, List[int]]:
+        if AGENT_POSTINGS_SECTION in self._manifest.get("sections", {}):
+            for segment in self._segments(AGENT_POSTINGS_SECTION):
+                if segment["key_start"] <= agent_id <= segment["key_end"]:
+                    entries = await self._read(AGENT_POSTINGS_SECTION, segment)
+                    if agent_id in entries:
+                        return entries[agent_id]
+            return _EMPTY_POSTINGS
+
+        # Older telemetry: index every delta once and keep it in the cache
+        postings = await self._service.cache.get_or_load(
+            self.storage_ref, self._build_agent_postings, part=AGENT_POSTINGS_SECTION,
+        )
+        flat = postings.get(agent_id)
+        return _postings_entry(flat) if flat is not None else _EMPTY_POSTINGS
+
+    async def _build_agent_postings(self) -> Tuple[Dict[str, array], int]:
+        postings: Dict[str, array] = {}
+        if self._blob is not None:
+            for record, delta in enumerate(self._blob.deltas):
+                _post_agent_updates(postings, delta, 0, record)
+        else:
+            for segment_number, segment in enumerate(self._segments("deltas")):
+                for record, delta in enumerate(await self._read("deltas", segment)):
+                    _post_agent_updates(postings, delta, segment_number, record)
+        size = sum(len(agent_id) + flat.itemsize * len(flat) for agent_id, flat in postings.items())
+        return postings, size
+
+    async def _records_in_range(self, section: str, tick_start: int, tick_end: int) -> List[Any]:
+        if self._blob is not None:
+            records = getattr(self._blob, section)
+            first = bisect_left(records, tick_start, key=lambda record: record.tick)
+            last = bisect_right(records, tick_end, key=lambda record: record.tick)
+            return records[first:last]
+
+        # Segments are in tick order; skip those ending before the range
+        segments = self._segments(section)
+        position = bisect_left(segments, tick_start, key=lambda seg: seg["tick_end"])
+        records = []
+        for segment in segments[position:]:
+            if segment["tick_start"] > tick_end:
+                break
+            decoded = await self._read(section, segment)
+            first = bisect_left(decoded, tick_start, key=lambda record: record.tick)
+            last = bisect_right(decoded, tick_end, key=lambda record: record.tick)
+            records.extend(decoded[first:last])
+        return records
+
+    def _segments(self, section: str) -> List[Dict[str, Any]]:
+        return self._manifest.get("sections", {}).get(section, {}).get("segments", [])
+
+    async def _read(self, section: str, segment: Dict[str, Any]) -> Any:
+        """Decoded records of one segment, through the shared cache."""
+        storage = self._service.storage
+        compression = self._manifest["sections"][section].get("compression", "none")
+        decode = _SECTION_DECODERS.get(section)
+
+        async def load() -> Tuple[Any, int]:
+            records, size = await storage.read_segment(segment, compression)
+            if decode is not None:
+                records = [decode(record) for record in records]
+            elif self._manifest["sections"][section].get("mapping"):
+                records = dict(records)
+            return records, size
+
+        part = f"segment:{segment['key']}:{segment['offset']}"
+        return await self._service.cache.get_or_load(self.storage_ref, load, part=part)
+
+
+_SECTION_DECODERS: Dict[str, Callable[[dict], Any]] = {
+    "keyframes": TelemetryKeyframe.from_dict,
+    "deltas": TelemetryDelta.from_dict,
+}
+
+
 class TelemetryService:
     """
     Service for telemetry operations.
@@ -603,8 +1438,13 @@ class TelemetryService:
     Reference: project.md §6.8
     """
 
-    def __init__(self, storage: Optional[StorageService] = None):
+    def __init__(
+        self,
+        storage: Optional[StorageService] = None,
+        cache: Optional[DecodedTelemetryCache] = None,
+    ):
         self.storage = storage or get_storage_service()
+        self.cache = cache if cache is not None else get_decoded_telemetry_cache()
 
     # ================================================================
     # RUN-BASED LOOKUP METHODS (used by API endpoints)
@@ -726,17 +1566,14 @@ class TelemetryService:
             return None
 
         try:
-            blob = await self.get_telemetry(storage_ref)
-            blob_dict = blob.to_dict()
-
-            # Phase 5: Detect capabilities from blob
-            capabilities = detect_capabilities(blob_dict)
+            # Reads only the segments covering the range for segmented telemetry
+            view = await self.open_view(storage_ref)
 
-            # Filter keyframes in range
-            keyframes = [k for k in blob.keyframes if start_tick <= k.tick <= end_tick]
+            # Phase 5: Detect capabilities (recorded at write time for segmented telemetry)
+            capabilities = view.capabilities
 
-            # Filter deltas in range
-            deltas = [d for d in blob.deltas if start_tick <= d.tick <= end_tick]
+            keyframes = await view.keyframes_in_range(start_tick, end_tick)
+            deltas = await view.deltas_in_range(start_tick, end_tick)
 
             # Phase 5: Extract normalized positions from keyframes
             normalized_positions: List[Dict[str, Any]] = []
@@ -768,7 +1605,7 @@ class TelemetryService:
                 # Phase 5 additions
                 normalized_positions=normalized_positions,
                 capabilities=capabilities,
-                telemetry_schema_version=blob.schema_version,
+                telemetry_schema_version=view.schema_version,
             )
         except Exception:
             return None
@@ -851,6 +1688,24 @@ class TelemetryService:
         except Exception:
             return None
 
+    async def open_view_by_run(
+        self,
+        run_id: str,
+        tenant_id: str,
+    ) -> Optional[TelemetryView]:
+        """
+        Open tick-range access to a run's telemetry.
+        Used by API endpoints (export).
+        """
+        storage_ref = await self._get_telemetry_ref_for_run(run_id, tenant_id)
+        if not storage_ref:
+            return None
+
+        try:
+            return await self.open_view(storage_ref)
+        except Exception:
+            return None
+
     async def get_agent_history(
         self,
         run_id: str,
@@ -858,36 +1713,19 @@ class TelemetryService:
         tenant_id: str,
         start_tick: int = 0,
         end_tick: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> AgentHistorySeries:
         """
-        Get state history for a specific agent.
+        Get state history for a specific agent, as columns.
         Used by API endpoints.
         """
         storage_ref = await self._get_telemetry_ref_for_run(run_id, tenant_id)
         if not storage_ref:
-            return []
+            return AgentHistorySeries(agent_id)
 
         try:
-            blob = await self.get_telemetry(storage_ref)
-
-            history = []
-            for keyframe in blob.keyframes:
-                if keyframe.tick < start_tick:
-                    continue
-                if end_tick is not None and keyframe.tick > end_tick:
-                    break
-                if agent_id in keyframe.agent_states:
-                    history.append({
-                        "tick": keyframe.tick,
-                        "state": keyframe.agent_states[agent_id],
-                        "beliefs": None,
-                        "last_action": None,
-                        "metrics": keyframe.metrics,
-                    })
-
-            return history
+            return await self.get_agent_series(storage_ref, agent_id, start_tick, end_tick)
         except Exception:
-            return []
+            return AgentHistorySeries(agent_id)
 
     async def get_events_by_type(
         self,
@@ -1009,14 +1847,24 @@ class TelemetryService:
         compress: bool = True,
     ) -> StorageRef:
         """
-        Store complete telemetry blob to object storage.
+        Store complete telemetry blob to object storage (segmented layout).
         Called at end of simulation run.
         """
-        return await self.storage.store_telemetry(
-            tenant_id=tenant_id,
-            telemetry_id=run_id,
-            data=telemetry.to_dict(),
-            compress=compress,
+        return await self.open_stream(tenant_id, run_id, compress=compress).write_blob(telemetry)
+
+    def open_stream(
+        self,
+        tenant_id: str,
+        run_id: str,
+        compress: bool = True,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> TelemetryStreamWriter:
+        """
+        Start streaming telemetry for a run.
+        Used by RunExecutor so the trace is not held in memory.
+        """
+        return TelemetryStreamWriter(
+            self.storage, tenant_id, run_id, compress=compress, segment_bytes=segment_bytes
         )
 
     async def store_from_execution_result(
@@ -1093,10 +1941,37 @@ class TelemetryService:
     ) -> TelemetryBlob:
         """
         Retrieve complete telemetry blob.
+        Served from the shared decoded cache; the blob must not be mutated.
+        Prefer open_view() for tick-range reads.
+        READ-ONLY operation (C3 compliant).
+        """
+        layout = await self._get_layout(storage_ref)
+        if isinstance(layout, TelemetryBlob):
+            return layout
+
+        async def load() -> Tuple[TelemetryBlob, int]:
+            data, size = await self.storage.assemble_telemetry(layout)
+            return TelemetryBlob.from_dict(data), size
+
+        return await self.cache.get_or_load(storage_ref, load)
+
+    async def _get_layout(self, storage_ref: StorageRef) -> Union[TelemetryBlob, Dict[str, Any]]:
+        """Segmented manifest, or the whole blob for older layouts."""
+        async def load() -> Tuple[Union[TelemetryBlob, Dict[str, Any]], int]:
+            data, size = await self.storage.get_telemetry_header(storage_ref)
+            if data.get("storage_format") == SEGMENTED_TELEMETRY_FORMAT:
+                return data, size
+            data, part_bytes = await self.storage.assemble_telemetry(data)
+            return TelemetryBlob.from_dict(data), size + part_bytes
+
+        return await self.cache.get_or_load(storage_ref, load, part="layout")
+
+    async def open_view(self, storage_ref: StorageRef) -> TelemetryView:
+        """
+        Open telemetry for tick-range reads.
         READ-ONLY operation (C3 compliant).
         """
-        data = await self.storage.get_telemetry(storage_ref)
-        return TelemetryBlob.from_dict(data)
+        return TelemetryView(self, storage_ref, await self._get_layout(storage_ref))
 
     async def get_telemetry_by_ref_dict(
         self,
@@ -1125,60 +2000,58 @@ class TelemetryService:
 
         Reference: project.md §6.8 (Query hooks)
         """
-        blob = await self.get_telemetry(storage_ref)
+        view = await self.open_view(storage_ref)
 
         # Apply tick range filter
         tick_start = params.tick_start or 0
-        tick_end = params.tick_end or blob.ticks_executed
+        tick_end = params.tick_end or view.ticks_executed
 
         # Filter keyframes
         keyframes = []
         if params.include_keyframes:
-            for kf in blob.keyframes:
-                if tick_start <= kf.tick <= tick_end:
-                    # Filter by agent IDs if specified
-                    if params.agent_ids:
-                        filtered_states = {
-                            aid: state for aid, state in kf.agent_states.items()
-                            if aid in params.agent_ids
-                        }
-                        keyframes.append(TelemetryKeyframe(
-                            tick=kf.tick,
-                            timestamp=kf.timestamp,
-                            agent_states=filtered_states,
-                            environment_state=kf.environment_state,
-                            metrics=kf.metrics,
-                        ))
-                    else:
-                        keyframes.append(kf)
+            for kf in await view.keyframes_in_range(tick_start, tick_end):
+                # Filter by agent IDs if specified
+                if params.agent_ids:
+                    filtered_states = {
+                        aid: state for aid, state in kf.agent_states.items()
+                        if aid in params.agent_ids
+                    }
+                    keyframes.append(TelemetryKeyframe(
+                        tick=kf.tick,
+                        timestamp=kf.timestamp,
+                        agent_states=filtered_states,
+                        environment_state=kf.environment_state,
+                        metrics=kf.metrics,
+                    ))
+                else:
+                    keyframes.append(kf)
 
         # Filter deltas
         deltas = []
         if params.include_deltas:
-            for delta in blob.deltas:
-                if tick_start <= delta.tick <= tick_end:
-                    # Filter by event types if specified
-                    if params.event_types:
-                        matching_events = [
-                            e for e in delta.events_triggered
-                            if e in params.event_types
-                        ]
-                        if matching_events or not params.event_types:
-                            deltas.append(TelemetryDelta(
-                                tick=delta.tick,
-                                agent_updates=delta.agent_updates,
-                                events_triggered=matching_events,
-                                metrics=delta.metrics,
-                            ))
-                    else:
-                        deltas.append(delta)
+            for delta in await view.deltas_in_range(tick_start, tick_end):
+                # Filter by event types if specified
+                if params.event_types:
+                    matching_events = [
+                        e for e in delta.events_triggered
+                        if e in params.event_types
+                    ]
+                    if matching_events or not params.event_types:
+                        deltas.append(TelemetryDelta(
+                            tick=delta.tick,
+                            agent_updates=delta.agent_updates,
+                            events_triggered=matching_events,
+                            metrics=delta.metrics,
+                        ))
+                else:
+                    deltas.append(delta)
 
         return TelemetrySlice(
             tick_start=tick_start,
             tick_end=tick_end,
             keyframes=keyframes,
             deltas=deltas,
-            total_ticks=blob.ticks_executed,
+            total_ticks=view.ticks_executed,
         )
 
     async def get_keyframe_at_tick(
@@ -1188,21 +2061,11 @@ class TelemetryService:
     ) -> Optional[TelemetryKeyframe]:
         """
         Get the closest keyframe at or before the specified tick.
-        Useful for seeking in replay.
+        Useful for seeking in replay; segmented telemetry reads one segment.
         READ-ONLY operation (C3 compliant).
         """
-        blob = await self.get_telemetry(storage_ref)
-
-        # Find closest keyframe at or before tick
-        closest: Optional[TelemetryKeyframe] = None
-        for kf in blob.keyframes:
-            if kf.tick <= tick:
-                if closest is None or kf.tick > closest.tick:
-                    closest = kf
-            else:
-                break
-
-        return closest
+        view = await self.open_view(storage_ref)
+        return await view.keyframe_at(tick)
 
     async def get_deltas_in_range(
         self,
@@ -1215,11 +2078,25 @@ class TelemetryService:
         Used for replaying from a keyframe.
         READ-ONLY operation (C3 compliant).
         """
-        blob = await self.get_telemetry(storage_ref)
-        return [
-            d for d in blob.deltas
-            if tick_start <= d.tick <= tick_end
-        ]
+        view = await self.open_view(storage_ref)
+        return await view.deltas_in_range(tick_start, tick_end)
+
+    async def get_agent_series(
+        self,
+        storage_ref: StorageRef,
+        agent_id: str,
+        tick_start: int = 0,
+        tick_end: Optional[int] = None,
+    ) -> AgentHistorySeries:
+        """
+        Get one agent's state history as columns.
+        Reads only the agent's postings and the deltas they point to.
+        READ-ONLY operation (C3 compliant).
+        """
+        view = await self.open_view(storage_ref)
+        if tick_end is None:
+            tick_end = view.ticks_executed
+        return await view.agent_history(agent_id, tick_start, tick_end)
 
     async def get_events_by_type(
         self,
@@ -1230,10 +2107,10 @@ class TelemetryService:
         Find all ticks where specific event types occurred.
         READ-ONLY operation (C3 compliant).
         """
-        blob = await self.get_telemetry(storage_ref)
+        view = await self.open_view(storage_ref)
         results = []
 
-        for entry in blob.index.event_index:
+        for entry in view.index.event_index:
             matching = [e for e in entry.get("events", []) if e in event_types]
             if matching:
                 results.append((entry["tick"], matching))
@@ -1248,8 +2125,8 @@ class TelemetryService:
         Get metrics summary for quick overview.
         READ-ONLY operation (C3 compliant).
         """
-        blob = await self.get_telemetry(storage_ref)
-        return blob.metrics_summary
+        view = await self.open_view(storage_ref)
+        return await view.metrics_summary()
 
     async def get_final_states(
         self,
@@ -1261,14 +2138,15 @@ class TelemetryService:
         Optionally filtered by agent IDs.
         READ-ONLY operation (C3 compliant).
         """
-        blob = await self.get_telemetry(storage_ref)
+        view = await self.open_view(storage_ref)
+        final_states = await view.final_states()
 
         if agent_ids:
             return {
-                aid: state for aid, state in blob.final_states.items()
+                aid: state for aid, state in final_states.items()
                 if aid in agent_ids
             }
-        return blob.final_states
+        return final_states
 
     async def get_signed_download_url(
         self,
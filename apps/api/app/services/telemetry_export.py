@@ -0,0 +1,487 @@
+"""
+Telemetry Export Service
+Reference: project.md §6.8, §8.4
+
+Streams telemetry exports in bounded memory:
+- json: one document whose record arrays are written as they are read
+- ndjson: one JSON object per record, tagged with its table
+- csv: one table, nested fields as JSON text
+- parquet: one table with an explicit schema, one row group per tick
+  window (requires the optional pyarrow dependency)
+
+Telemetry is read through TelemetryView one tick window at a time, so
+only the segments of that window are decoded and held. Exports can also
+be generated in the background into object storage and downloaded with
+a signed URL; a status object next to the export records whether it is
+pending, complete or failed, so clients can poll for the outcome.
+
+Tables:
+- keyframes: one row per agent per keyframe
+- deltas: one row per agent update
+- events: one row per triggered event, with the tick's metrics
+
+Constraint C3: Exports are READ-ONLY - they never trigger simulations.
+"""
+
+import csv
+import io
+import json
+import logging
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services.storage import StorageNotFoundError, StorageRef, StorageService
+from app.services.telemetry import TelemetryDelta, TelemetryKeyframe, TelemetryView
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("json", "ndjson", "csv", "parquet")
+
+# Column name and type per table; "json" columns hold nested values
+EXPORT_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "keyframes": [
+        ("tick", "int64"),
+        ("timestamp", "string"),
+        ("agent_id", "string"),
+        ("state", "json"),
+    ],
+    "deltas": [
+        ("tick", "int64"),
+        ("agent_id", "string"),
+        ("update", "json"),
+    ],
+    "events": [
+        ("tick", "int64"),
+        ("event_type", "string"),
+        ("metrics", "json"),
+    ],
+}
+
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+DEFAULT_EXPORT_WINDOW_TICKS = 100
+
+# Background exports are buffered in memory up to this size, then on disk
+EXPORT_SPOOL_BYTES = 16 * 1024 * 1024
+
+# Background export states, recorded in a status object next to the export
+EXPORT_PENDING = "pending"
+EXPORT_COMPLETE = "complete"
+EXPORT_FAILED = "failed"
+EXPORT_STATUS_FILENAME = "status.json"
+
+
+class TelemetryExportError(Exception):
+    """Raised for export options that cannot be served."""
+    pass
+
+
+@dataclass
+class TelemetryExportOptions:
+    """Options for a telemetry export."""
+    format: str = "ndjson"
+    table: str = "events"  # Table written by csv and parquet exports
+    tick_start: int = 0
+    tick_end: Optional[int] = None  # Inclusive; defaults to the last tick
+    event_types: Optional[List[str]] = None
+    agent_ids: Optional[List[str]] = None
+    include_keyframes: bool = True
+    include_deltas: bool = True
+    window_ticks: int = DEFAULT_EXPORT_WINDOW_TICKS  # Ticks read (and parquet row group) per step
+
+
+@dataclass
+class ExportStatus:
+    """Progress of a background export, as polled by clients."""
+    state: str
+    format: str
+    filename: str
+    size_bytes: int = 0
+    error: Optional[str] = None
+    updated_at: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "format": self.format,
+            "filename": self.filename,
+            "size_bytes": self.size_bytes,
+            "error": self.error,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ExportStatus":
+        return cls(
+            state=data["state"],
+            format=data["format"],
+            filename=data["filename"],
+            size_bytes=data.get("size_bytes", 0),
+            error=data.get("error"),
+            updated_at=data.get("updated_at", ""),
+        )
+
+
+class _ChunkSink:
+    """Write-only file object drained after every row group."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._buffer.extend(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _flat_row(table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Row with json columns encoded as text, for csv and parquet."""
+    return {
+        name: _json(row[name]) if kind == "json" else row[name]
+        for name, kind in EXPORT_TABLES[table]
+    }
+
+
+def arrow_schema(table: str) -> "pa.Schema":
+    """Arrow schema of an export table; json columns are UTF-8 JSON text."""
+    if not PARQUET_AVAILABLE:
+        raise TelemetryExportError(
+            "pyarrow is required for Parquet export. Install with: pip install pyarrow"
+        )
+    types = {"int64": pa.int64(), "string": pa.string(), "json": pa.string()}
+    return pa.schema([
+        pa.field(name, types[kind], nullable=name != "tick")
+        for name, kind in EXPORT_TABLES[table]
+    ])
+
+
+class TelemetryExporter:
+    """
+    Streams one run's telemetry in a chosen format.
+
+    stream() yields encoded chunks, one (or a few) per tick window, so
+    memory is bounded by the records of one window however long the run.
+    """
+
+    def __init__(self, view: TelemetryView, options: Optional[TelemetryExportOptions] = None):
+        """
+        Initialize exporter.
+
+        Args:
+            view: Telemetry to export
+            options: Export options
+
+        Raises:
+            TelemetryExportError: Unknown format or table, or Parquet
+                requested without pyarrow installed
+        """
+        self.view = view
+        self.options = options or TelemetryExportOptions()
+
+        if self.options.format not in EXPORT_FORMATS:
+            raise TelemetryExportError(f"Unknown export format: {self.options.format}")
+        if self.options.table not in EXPORT_TABLES:
+            raise TelemetryExportError(f"Unknown export table: {self.options.table}")
+        if self.options.window_ticks < 1:
+            raise TelemetryExportError("window_ticks must be at least 1")
+        if self.options.format == "parquet" and not PARQUET_AVAILABLE:
+            raise TelemetryExportError(
+                "pyarrow is required for Parquet export. Install with: pip install pyarrow"
+            )
+
+        self.tick_start = max(0, self.options.tick_start)
+        self.tick_end = (
+            self.options.tick_end if self.options.tick_end is not None else view.ticks_executed
+        )
+        self._agents = set(self.options.agent_ids) if self.options.agent_ids else None
+        self._event_types = set(self.options.event_types) if self.options.event_types else None
+
+    @property
+    def media_type(self) -> str:
+        return EXPORT_MEDIA_TYPES[self.options.format]
+
+    @property
+    def filename(self) -> str:
+        extension = self.options.format
+        if extension in ("csv", "parquet"):
+            return f"telemetry_{self.view.run_id}_{self.options.table}.{extension}"
+        return f"telemetry_{self.view.run_id}.{extension}"
+
+    @property
+    def tables(self) -> List[str]:
+        """Tables written, in output order."""
+        if self.options.format in ("csv", "parquet"):
+            return [self.options.table]
+        tables = []
+        if self.options.include_keyframes:
+            tables.append("keyframes")
+        if self.options.include_deltas:
+            tables.append("deltas")
+        tables.append("events")
+        return tables
+
+    def stream(self) -> AsyncIterator[bytes]:
+        """Encoded export, chunk by chunk."""
+        return {
+            "json": self._stream_json,
+            "ndjson": self._stream_ndjson,
+            "csv": self._stream_csv,
+            "parquet": self._stream_parquet,
+        }[self.options.format]()
+
+    async def write_to_storage(self, storage: StorageService, target: StorageRef) -> StorageRef:
+        """
+        Write the export to target's key.
+
+        The export is spooled (in memory up to EXPORT_SPOOL_BYTES, on disk
+        past it) and then uploaded with put_object_stream, which reads the
+        spool in bounded steps, so memory use is bounded by the spool
+        threshold rather than the export size.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES) as spool:
+            async for chunk in self.stream():
+                spool.write(chunk)
+            spool.seek(0)
+            return await storage.backend.put_object_stream(
+                key=target.key,
+                stream=spool,
+                content_type=self.media_type,
+            )
+
+    async def windows(
+        self,
+        tables: List[str],
+    ) -> AsyncIterator[Tuple[List[TelemetryKeyframe], List[TelemetryDelta]]]:
+        """Keyframes and deltas of each tick window, reading only what tables need."""
+        need_keyframes = "keyframes" in tables
+        need_deltas = "deltas" in tables or "events" in tables
+
+        start = self.tick_start
+        while start <= self.tick_end:
+            end = min(start + self.options.window_ticks - 1, self.tick_end)
+            keyframes = await self.view.keyframes_in_range(start, end) if need_keyframes else []
+            deltas = await self.view.deltas_in_range(start, end) if need_deltas else []
+            yield keyframes, deltas
+            start = end + 1
+
+    def rows(
+        self,
+        table: str,
+        keyframes: List[TelemetryKeyframe],
+        deltas: List[TelemetryDelta],
+    ) -> List[Dict[str, Any]]:
+        """Rows of table for one window, after agent and event filters."""
+        agents = self._agents
+        if table == "keyframes":
+            return [
+                {"tick": kf.tick, "timestamp": kf.timestamp, "agent_id": agent_id, "state": state}
+                for kf in keyframes
+                for agent_id, state in kf.agent_states.items()
+                if agents is None or agent_id in agents
+            ]
+
+        if table == "deltas":
+            rows = []
+            for delta in deltas:
+                for update in delta.agent_updates:
+                    agent_id = update.get("agent_id", update.get("id"))
+                    agent_id = str(agent_id) if agent_id is not None else None
+                    if agents is None or agent_id in agents:
+                        rows.append({"tick": delta.tick, "agent_id": agent_id, "update": update})
+            return rows
+
+        return [
+            {"tick": delta.tick, "event_type": event_type, "metrics": delta.metrics}
+            for delta in deltas
+            for event_type in delta.events_triggered
+            if self._event_types is None or event_type in self._event_types
+        ]
+
+    async def _stream_ndjson(self) -> AsyncIterator[bytes]:
+        tables = self.tables
+        async for keyframes, deltas in self.windows(tables):
+            lines = [
+                _json({"table": table, **row}) + "\n"
+                for table in tables
+                for row in self.rows(table, keyframes, deltas)
+            ]
+            if lines:
+                yield "".join(lines).encode("utf-8")
+
+    async def _stream_json(self) -> AsyncIterator[bytes]:
+        header = {
+            "run_id": self.view.run_id,
+            "schema_version": self.view.schema_version,
+            "ticks_executed": self.view.ticks_executed,
+            "seed_used": self.view.seed_used,
+            "tick_start": self.tick_start,
+            "tick_end": self.tick_end,
+        }
+        yield _json(header)[:-1].encode("utf-8")
+
+        # One pass per table so each array is contiguous
+        for table in self.tables:
+            yield f',"{table}":['.encode("utf-8")
+            first = True
+            async for keyframes, deltas in self.windows([table]):
+                rows = self.rows(table, keyframes, deltas)
+                if not rows:
+                    continue
+                chunk = ",".join(_json(row) for row in rows)
+                yield (chunk if first else "," + chunk).encode("utf-8")
+                first = False
+            yield b"]"
+        yield b"}"
+
+    async def _stream_csv(self) -> AsyncIterator[bytes]:
+        table = self.options.table
+        columns = [name for name, _ in EXPORT_TABLES[table]]
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=columns)
+        writer.writeheader()
+        yield output.getvalue().encode("utf-8")
+
+        async for keyframes, deltas in self.windows([table]):
+            rows = self.rows(table, keyframes, deltas)
+            if not rows:
+                continue
+            output.seek(0)
+            output.truncate()
+            writer.writerows(_flat_row(table, row) for row in rows)
+            yield output.getvalue().encode("utf-8")
+
+    async def _stream_parquet(self) -> AsyncIterator[bytes]:
+        table = self.options.table
+        schema = arrow_schema(table)
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+        try:
+            async for keyframes, deltas in self.windows([table]):
+                rows = self.rows(table, keyframes, deltas)
+                if rows:
+                    # One row group per tick window
+                    batch = pa.Table.from_pylist([_flat_row(table, row) for row in rows], schema=schema)
+                    writer.write_table(batch, row_group_size=len(rows))
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+        finally:
+            writer.close()
+        yield sink.drain()
+
+
+def export_ref(
+    storage: StorageService,
+    tenant_id: str,
+    run_id: str,
+    export_id: str,
+    filename: str,
+    content_type: str = "application/json",
+) -> StorageRef:
+    """Where a background export (or its status object) of a run is stored."""
+    return storage.artifact_ref(
+        tenant_id=tenant_id,
+        artifact_type="artifact",
+        artifact_id=run_id,
+        filename=f"exports/{export_id}/{filename}",
+        content_type=content_type,
+    )
+
+
+async def write_export_status(
+    storage: StorageService,
+    status_ref: StorageRef,
+    status: ExportStatus,
+) -> None:
+    """Record a background export's status."""
+    status.updated_at = datetime.utcnow().isoformat()
+    await storage.backend.put_object(
+        key=status_ref.key,
+        data=json.dumps(status.to_dict()).encode("utf-8"),
+        content_type="application/json",
+    )
+
+
+async def read_export_status(
+    storage: StorageService,
+    status_ref: StorageRef,
+) -> Optional[ExportStatus]:
+    """A background export's status, or None for an unknown export."""
+    try:
+        data = await storage.backend.get_object(status_ref.key)
+    except StorageNotFoundError:
+        return None
+    return ExportStatus.from_dict(json.loads(data))
+
+
+async def run_background_export(
+    exporter: TelemetryExporter,
+    storage: StorageService,
+    target: StorageRef,
+    status_ref: Optional[StorageRef] = None,
+) -> None:
+    """
+    Background task: write an export to storage.
+
+    With status_ref, the outcome (complete with its size, or failed with
+    the error) is recorded there for clients polling the export.
+    """
+    status = ExportStatus(
+        state=EXPORT_COMPLETE,
+        format=exporter.options.format,
+        filename=exporter.filename,
+    )
+    try:
+        ref = await exporter.write_to_storage(storage, target)
+        status.size_bytes = ref.size_bytes
+        logger.info(f"Telemetry export written to {ref.key} ({ref.size_bytes} bytes)")
+    except Exception as e:
+        status.state = EXPORT_FAILED
+        status.error = str(e)
+        logger.error(f"Telemetry export to {target.key} failed: {e}")
+
+    if status_ref is not None:
+        try:
+            await write_export_status(storage, status_ref, status)
+        except Exception as e:
+            logger.error(f"Recording status of telemetry export {target.key} failed: {e}")
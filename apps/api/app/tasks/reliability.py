@@ -0,0 +1,38 @@
+"""
+Reliability Background Tasks
+Reference: project.md §11 Phase 7
+
+Celery tasks backing CeleryRunExecutor: each task runs one seed replica or
+historical scenario described by a SimulationSpec, so a MultiSeedRunner
+or HistoricalScenarioRunner sweep can fan out as a Celery group.
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+from celery import shared_task
+
+from app.services.reliability.executors import SimulationSpec
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="app.tasks.reliability.run_simulation_spec")
+def run_simulation_spec(target: str, kwargs: Dict[str, Any], arg: Any) -> Dict[str, Any]:
+    """
+    Run one simulation described by a SimulationSpec.
+
+    Args:
+        target: Simulation function as "module:function"
+        kwargs: Fixed keyword arguments for the function
+        arg: Per-run argument (seed or simulation params)
+
+    Returns:
+        Dict with the function's value and run duration
+    """
+    start = time.perf_counter()
+    value = SimulationSpec(target=target, kwargs=kwargs)(arg)
+    duration = time.perf_counter() - start
+    logger.debug(f"Simulation {target} finished in {duration:.2f}s")
+    return {"value": value, "duration_seconds": duration}
@@ -26,10 +26,12 @@ import hashlib
 import json
 import os
 import socket
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 from uuid import UUID
 import uuid
 
@@ -53,8 +55,14 @@ from app.engine import (
     Agent,
     AgentFactory,
     AgentPool,
-    AgentState as EngineAgentState,
+    AgentMemory,
+    VectorizedTickKernel,
+    ShardedTickExecutor,
+    PartitionStrategy,
+    CounterRNG,
+    RNGAlgorithm,
 )
+from app.engine.rng import LEGACY_RNG_ALGORITHM, resolve_rng_algorithm
 # Import models
 from app.models.node import (
     Node,
@@ -72,6 +80,9 @@ from app.models.run_artifacts import (
 from app.models.run_outcome import RunOutcome, OutcomeStatus
 # STEP 3: Import PersonaSnapshot for immutable persona tracking
 from app.models.persona import PersonaSnapshot
+
+if TYPE_CHECKING:
+    from app.services.telemetry import TelemetryStreamWriter
 # Import services
 from app.services.node_service import (
     NodeService,
@@ -168,6 +179,7 @@ async def _execute_run(run_id: str, context: JobContext) -> dict:
 
     # BUG-006 FIX: Create fresh session factory for current event loop
     AsyncSessionLocal = get_async_session()
+    trace_sink = None
     async with AsyncSessionLocal() as db:
         try:
             # Phase 1: Worker assignment and heartbeat
@@ -234,13 +246,20 @@ async def _execute_run(run_id: str, context: JobContext) -> dict:
                               f"Initializing RNG with seed {primary_seed}")
 
             # Phase 4: Initialize RNG
-            rng = DeterministicRNG(primary_seed)
+            rng = DeterministicRNG(
+                primary_seed,
+                algorithm=resolve_rng_algorithm(config.get("seed_config")),
+            )
 
             await _write_trace(db, run_id, context.tenant_id, worker_id,
                               ExecutionStage.SIMULATION_START,
                               f"Starting simulation with {max_ticks} ticks")
 
             # Phase 5: Execute simulation (STEP 3: with persona snapshot)
+            # Deltas, keyframes and final states stream to telemetry storage
+            from app.services.telemetry import get_telemetry_service
+            trace_sink = get_telemetry_service().open_stream(context.tenant_id, run_id)
+
             execution_result = await _execute_simulation(
                 db=db,
                 run=run,
@@ -248,6 +267,7 @@ async def _execute_run(run_id: str, context: JobContext) -> dict:
                 context=context,
                 worker_id=worker_id,
                 personas_snapshot_id=personas_snapshot_id,  # STEP 3: immutable personas
+                trace_sink=trace_sink,
             )
 
             await _write_trace(db, run_id, context.tenant_id, worker_id,
@@ -271,6 +291,7 @@ async def _execute_run(run_id: str, context: JobContext) -> dict:
                 run_id=run_id,
                 tenant_id=context.tenant_id,
                 execution_result=execution_result,
+                trace_sink=trace_sink,
             )
 
             # Phase 8: Compute reliability
@@ -357,6 +378,11 @@ async def _execute_run(run_id: str, context: JobContext) -> dict:
                 await _update_worker_heartbeat(db, worker_id, None, runs_failed_increment=1)
             except Exception:
                 pass  # Don't fail on trace write failure
+            if trace_sink is not None:
+                try:
+                    await trace_sink.abort()  # Drop partially streamed telemetry
+                except Exception:
+                    pass
             await _update_run_status(db, run_id, "failed", error=str(e))
             await db.commit()
 
@@ -1137,11 +1163,27 @@ class DeterministicRNG:
     Reference: project.md §10.1
 
     Ensures reproducible simulation results.
+
+    ``algorithm`` selects how per-agent rule randomness is drawn: the
+    legacy SHA-256 derivation (create_agent_rng) or the counter-based
+    Philox stream (counter_rng). Runs without a recorded algorithm use
+    the legacy derivation so their results replay unchanged.
     """
 
-    def __init__(self, seed: int):
+    def __init__(self, seed: int, algorithm: RNGAlgorithm = LEGACY_RNG_ALGORITHM):
         self.seed = seed
         self._state = seed
+        self.algorithm = RNGAlgorithm(algorithm)
+
+    @property
+    def is_counter_based(self) -> bool:
+        return self.algorithm == RNGAlgorithm.PHILOX
+
+    def counter_rng(self, num_agents: Optional[int] = None) -> Optional[CounterRNG]:
+        """Counter-based stream for the run, or None in SHA-256 compatibility mode."""
+        if not self.is_counter_based:
+            return None
+        return CounterRNG(self.seed, num_agents=num_agents)
 
     def next_int(self, min_val: int = 0, max_val: int = 0xFFFFFFFF) -> int:
         """Generate next integer in range [min_val, max_val]."""
@@ -1167,6 +1209,10 @@ class DeterministicRNG:
         hash_bytes = hashlib.sha256(combined.encode()).digest()
         return int.from_bytes(hash_bytes[:4], "big")
 
+    def derive_agent_seeds(self, agent_ids: List[str], tick: int) -> List[int]:
+        """Seeds of create_agent_rng() for many agents at one tick."""
+        return [self.derive_seed(f"agent:{agent_id}:tick:{tick}") for agent_id in agent_ids]
+
     def create_agent_rng(self, agent_id: str, tick: int) -> "DeterministicRNG":
         """Create RNG for specific agent at specific tick."""
         derived = self.derive_seed(f"agent:{agent_id}:tick:{tick}")
@@ -1223,6 +1269,7 @@ async def _execute_simulation(
     context: JobContext,
     worker_id: str = "unknown",
     personas_snapshot_id: Optional[str] = None,
+    trace_sink: Optional["TelemetryStreamWriter"] = None,
 ) -> dict:
     """
     Execute the simulation engine.
@@ -1230,6 +1277,11 @@ async def _execute_simulation(
     Uses the Rule Engine (P1-001) and Agent State Machine (P1-002).
     Produces execution trace for telemetry and outcome aggregation.
 
+    With a ``trace_sink``, tick deltas, keyframes and final states are
+    streamed to storage as they are produced and left out of the returned
+    result, so memory stays flat as max_ticks grows. Without one, the full
+    trace is returned in memory (tick_data, agent_snapshots, ...).
+
     STEP 3: Uses personas_snapshot_id to load immutable persona data.
 
     Returns execution trace data for telemetry and outcomes.
@@ -1259,11 +1311,14 @@ async def _execute_simulation(
     for agent in agents:
         agent_pool.add(agent)
 
-    # Prepare execution trace
+    # Prepare execution trace (only accumulated when no trace sink is given)
     tick_data = []
     agent_snapshots = {}
     events_processed = []
     metrics_by_tick = []
+    recent_events: Deque[dict] = deque(maxlen=10)  # Last events, for events_triggered
+    events_processed_count = 0
+    ticks_executed = 0
     outcome_tracker = OutcomeTracker()
     execution_counters = ExecutionCounters()  # Evidence Pack instrumentation (§3.1)
 
@@ -1277,6 +1332,43 @@ async def _execute_simulation(
     backpressure_threshold_ms = scheduler_config.get("backpressure_threshold_ms", 500)  # ms per tick
     sampling_policy = scheduler_config.get("sampling_policy", "all")  # all, random, stratified
     sampling_ratio = scheduler_config.get("sampling_ratio", 1.0)  # For random/stratified
+    execution_mode = scheduler_config.get("execution_mode", "per_agent")  # per_agent, vectorized, sharded
+    memory_budget = scheduler_config.get("memory_budget", {})  # max_recent_events, max_episodes per agent
+
+    # Bound per-agent memory for this run (AgentMemory defaults otherwise)
+    if memory_budget:
+        max_recent_events = memory_budget.get("max_recent_events", AgentMemory.max_recent)
+        max_episodes = memory_budget.get("max_episodes", AgentMemory.max_episodes)
+        for agent in agent_pool.get_all():
+            agent.memory.set_capacity(max_recent_events, max_episodes)
+
+    # Counter-based stream shared by all agents (None in SHA-256 compatibility mode)
+    counter_rng = rng.counter_rng(num_agents=agent_pool.count())
+
+    # Vectorized kernel runs whole ticks as array operations; the per-agent
+    # path stays the reference and is used whenever a rule cannot be batched.
+    # Sharded mode evaluates partitions of the kernel on a process pool.
+    tick_kernel = None
+    shard_executor = None
+    sharding_config: Dict[str, Any] = {}
+    if execution_mode in ("vectorized", "sharded"):
+        if rule_engine.supports_batch():
+            tick_kernel = VectorizedTickKernel.from_pool(agent_pool, rule_engine, rng=counter_rng)
+        else:
+            logging.warning("Rule engine has rules without batch support; using per-agent execution")
+            execution_mode = "per_agent"
+    if execution_mode == "sharded":
+        shard_executor = ShardedTickExecutor(
+            tick_kernel,
+            num_shards=scheduler_config.get("num_shards", os.cpu_count() or 1),
+            workers=scheduler_config.get("shard_workers"),
+            strategy=scheduler_config.get("partition_strategy", PartitionStrategy.CONTIGUOUS),
+        )
+        sharding_config = {
+            "num_shards": shard_executor.num_shards,
+            "shard_workers": shard_executor.workers,
+            "partition_strategy": shard_executor.strategy.value,
+        }
 
     # Track scheduler metrics for Evidence Pack (§3.3)
     execution_counters.scheduler_config = {
@@ -1284,173 +1376,222 @@ async def _execute_simulation(
         "sampling_policy": sampling_policy,
         "sampling_ratio": sampling_ratio,
         "backpressure_threshold_ms": backpressure_threshold_ms,
+        "execution_mode": execution_mode,
+        "memory_budget": memory_budget,
+        **sharding_config,
     }
 
     # Main simulation loop (Society Mode)
-    for tick in range(max_ticks):
-        tick_start = time.perf_counter()
-        execution_counters.record_partition()  # §3.3: Each tick is a partition
-
-        # Collect peer states for social observation
-        peer_states = {
-            str(a.id): a.to_snapshot()
-            for a in agent_pool.get_all()
-            if a.state != EngineAgentState.TERMINATED
-        }
-
-        # §3.3 Sampling Policy Application
-        active_agents = agent_pool.get_active()
-        if sampling_policy == "random" and sampling_ratio < 1.0:
-            # Random sampling - select subset of agents
-            sample_size = max(1, int(len(active_agents) * sampling_ratio))
-            active_agents = rng.random_sample(active_agents, sample_size)
-        elif sampling_policy == "stratified" and sampling_ratio < 1.0:
-            # Stratified sampling - sample from each segment proportionally
-            active_agents = _stratified_sample(active_agents, sampling_ratio, rng)
-        # else: "all" policy - process all agents
-
-        # Run each agent through the tick (in batches for §3.3)
-        agent_updates = []
-        num_agents = len(active_agents)
-        for batch_start in range(0, num_agents, batch_size):
-            batch_end = min(batch_start + batch_size, num_agents)
-            batch = active_agents[batch_start:batch_end]
-            execution_counters.record_batch()  # §3.3: Track batch execution
-
-            for agent in batch:
-                try:
-                    # Create RNG for this agent at this tick (deterministic)
-                    agent_rng = rng.create_agent_rng(str(agent.id), tick)
-
-                    # Agent lifecycle: Observe -> Evaluate -> Decide -> Act -> Update
-                    # §3.1 Evidence Pack: Record each loop stage execution
-                    # BUG-007 FIX: agent.observe() expects List[Dict], not dict
-                    # Convert peer_states dict values to list for observe() method
-                    observation = agent.observe(environment, list(peer_states.values()))
-                    execution_counters.record_observe()
-
-                    evaluation = agent.evaluate(observation)
-                    execution_counters.record_evaluate()
-
-                    decision = agent.decide(evaluation)
-                    execution_counters.record_decide()
-
-                    action_results = []
-                    if decision:
-                        action_results = agent.act(decision)
-                        execution_counters.record_act()
-                        events_processed.extend(action_results)
-
-                    # Apply rule engine for behavioral modifications
-                    # Get peer IDs for this agent
-                    peer_ids = [str(p.id) for p in agent_pool.get_peers(agent)]
-                    rule_context = RuleContext(
-                        agent_id=str(agent.id),
-                        tick=tick,
-                        rng_seed=agent_rng.seed,  # BUG-008 fix: was 'seed', should be 'rng_seed'
-                        environment=environment,
-                        agent_state=agent.to_full_state(),
-                        peer_states=[
-                            s for aid, s in peer_states.items() if aid in peer_ids
-                        ],  # BUG-008b fix: RuleContext expects List, not Dict
-                        metadata={"global_metrics": outcome_tracker.get_current_metrics()},
-                    )
-
-                    # Run rules for this agent
-                    rule_results = rule_engine.run_agent_tick(rule_context)
-
-                    # §3.4 Evidence Pack: Record rule applications
-                    rules_applied = rule_results.get("rules_applied", [])
-                    for rule_info in rules_applied:
-                        execution_counters.record_rule_application(
-                            rule_name=rule_info.get("rule_name", "unknown"),
-                            rule_version=rule_info.get("rule_version", "1.0.0"),
-                            insertion_point=rule_info.get("insertion_point", "update"),
-                            agents_affected=1,
-                        )
-
-                    # Apply rule-driven state updates
-                    state_updates = rule_results.get("state_updates", {})
-                    agent.update(action_results, state_updates)
-                    execution_counters.record_update()
-
-                    # Record complete agent step
-                    execution_counters.record_agent_step()
-
-                    # Track updates
-                    agent_updates.append({
-                        "agent_id": str(agent.id),
-                        "observation": _summarize_observation(observation),
-                        "decision": decision.get("action_type") if decision else None,
-                        "actions": len(action_results),
-                        "state_delta": _compute_state_delta(rule_results),
-                    })
-
-                    # Update outcome tracker
-                    outcome_tracker.record_agent_action(
-                        agent_id=str(agent.id),
-                        tick=tick,
-                        decision=decision,
-                        action_results=action_results,
-                    )
-
-                except Exception as e:
-                    # Log agent error but continue simulation
-                    agent_updates.append({
-                        "agent_id": str(agent.id),
-                        "error": str(e),
-                    })
-
-        # Compute tick metrics
-        tick_metrics = outcome_tracker.compute_tick_metrics(tick, agent_pool)
-        metrics_by_tick.append(tick_metrics)
-
-        # Record tick data for telemetry
-        tick_elapsed_ms = int((time.perf_counter() - tick_start) * 1000)
-
-        # §3.3 Backpressure Detection: If tick takes too long, record it
-        if tick_elapsed_ms > backpressure_threshold_ms:
-            execution_counters.record_backpressure()
-
-        tick_result = {
-            "tick": tick,
-            "timestamp": datetime.utcnow().isoformat(),
-            "agent_updates": agent_updates,
-            "events_triggered": [e.get("event_type") for e in events_processed[-10:]],
-            "metrics": tick_metrics,
-            "elapsed_ms": tick_elapsed_ms,
-        }
-        tick_data.append(tick_result)
-
-        # Store agent snapshots at keyframe intervals
-        logging_profile = config.get("logging_profile", {})
-        keyframe_interval = logging_profile.get("keyframe_interval", 100)
-        if tick % keyframe_interval == 0:
-            agent_snapshots[tick] = {
-                str(a.id): a.to_snapshot()
-                for a in agent_pool.get_all()
+    try:
+        for tick in range(max_ticks):
+            tick_start = time.perf_counter()
+            shard_timings: Dict[str, float] = {}
+
+            # §3.3 Sampling Policy Application
+            active_agents = agent_pool.get_active()
+            if sampling_policy == "random" and sampling_ratio < 1.0:
+                # Random sampling - select subset of agents
+                sample_size = max(1, int(len(active_agents) * sampling_ratio))
+                active_agents = rng.random_sample(active_agents, sample_size)
+            elif sampling_policy == "stratified" and sampling_ratio < 1.0:
+                # Stratified sampling - sample from each segment proportionally
+                active_agents = _stratified_sample(active_agents, sampling_ratio, rng)
+            # else: "all" policy - process all agents
+
+            tick_events: List[dict] = []
+            if tick_kernel is not None:
+                agent_updates = _execute_tick_vectorized(
+                    tick_kernel,
+                    active_agents,
+                    tick,
+                    environment,
+                    rng,
+                    batch_size,
+                    execution_counters,
+                    outcome_tracker,
+                    tick_events,
+                    shard_executor=shard_executor,
+                    shard_timings=shard_timings,
+                )
+            else:
+                agent_updates = []
+                num_agents = len(active_agents)
+
+                # Collect peer states for social observation, keyed by agent index
+                peer_table = agent_pool.snapshot_peer_states()
+
+                # Run each agent through the tick (in batches for §3.3)
+                for batch_start in range(0, num_agents, batch_size):
+                    batch_end = min(batch_start + batch_size, num_agents)
+                    batch = active_agents[batch_start:batch_end]
+                    execution_counters.record_batch()  # §3.3: Track batch execution
+
+                    for agent in batch:
+                        try:
+                            agent_index = agent_pool.index_of(agent.id)
+
+                            # Legacy mode: derive a SHA-256 seed for this agent at this tick.
+                            # The counter-based stream is addressed by agent index instead.
+                            agent_rng_seed = 0
+                            if counter_rng is None:
+                                agent_rng_seed = rng.create_agent_rng(str(agent.id), tick).seed
+
+                            # Connected, non-terminated peers: O(degree) via the CSR index
+                            agent_peer_states = peer_table.peers_of(agent_index)
+
+                            # Agent lifecycle: Observe -> Evaluate -> Decide -> Act -> Update
+                            # §3.1 Evidence Pack: Record each loop stage execution
+                            # Only connected peers influence the agent; normalise by all observable agents
+                            observation = agent.observe(
+                                environment,
+                                agent_peer_states,
+                                peer_count=peer_table.alive_count,
+                            )
+                            execution_counters.record_observe()
+
+                            evaluation = agent.evaluate(observation)
+                            execution_counters.record_evaluate()
+
+                            decision = agent.decide(evaluation)
+                            execution_counters.record_decide()
+
+                            action_results = []
+                            if decision:
+                                action_results = agent.act(decision)
+                                execution_counters.record_act()
+                                tick_events.extend(action_results)
+
+                            # Apply rule engine for behavioral modifications
+                            rule_context = RuleContext(
+                                agent_id=str(agent.id),
+                                tick=tick,
+                                rng_seed=agent_rng_seed,  # BUG-008 fix: was 'seed', should be 'rng_seed'
+                                rng=counter_rng,
+                                agent_index=agent_index,
+                                environment=environment,
+                                agent_state=agent.to_full_state(),
+                                peer_states=agent_peer_states,  # BUG-008b fix: RuleContext expects List, not Dict
+                                metadata={"global_metrics": outcome_tracker.get_current_metrics()},
+                            )
+
+                            # Run rules for this agent
+                            rule_results = rule_engine.run_agent_tick(rule_context)
+
+                            # §3.4 Evidence Pack: Record rule applications
+                            rules_applied = rule_results.get("rules_applied", [])
+                            for rule_info in rules_applied:
+                                execution_counters.record_rule_application(
+                                    rule_name=rule_info.get("rule_name", "unknown"),
+                                    rule_version=rule_info.get("rule_version", "1.0.0"),
+                                    insertion_point=rule_info.get("insertion_point", "update"),
+                                    agents_affected=1,
+                                )
+
+                            # Apply rule-driven state updates
+                            state_updates = rule_results.get("state_updates", {})
+                            agent.update(action_results, state_updates)
+                            execution_counters.record_update()
+
+                            # Record complete agent step
+                            execution_counters.record_agent_step()
+
+                            # Track updates
+                            agent_updates.append({
+                                "agent_id": str(agent.id),
+                                "observation": _summarize_observation(observation),
+                                "decision": decision.get("action_type") if decision else None,
+                                "actions": len(action_results),
+                                "state_delta": _compute_state_delta(rule_results),
+                            })
+
+                            # Update outcome tracker
+                            outcome_tracker.record_agent_action(
+                                agent_id=str(agent.id),
+                                tick=tick,
+                                decision=decision,
+                                action_results=action_results,
+                            )
+
+                        except Exception as e:
+                            # Log agent error but continue simulation
+                            agent_updates.append({
+                                "agent_id": str(agent.id),
+                                "error": str(e),
+                            })
+
+            # Compute tick metrics
+            tick_metrics = outcome_tracker.compute_tick_metrics(tick, agent_pool)
+            events_processed_count += len(tick_events)
+            recent_events.extend(tick_events)
+            if trace_sink is None:
+                metrics_by_tick.append(tick_metrics)
+                events_processed.extend(tick_events)
+
+            # Record tick data for telemetry
+            tick_elapsed_ms = int((time.perf_counter() - tick_start) * 1000)
+
+            # §3.3 Backpressure Detection: If tick takes too long, record it
+            if tick_elapsed_ms > backpressure_threshold_ms:
+                execution_counters.record_backpressure()
+            execution_counters.record_memory_usage()
+            execution_counters.record_partition(shard_timings)  # §3.3: Each tick is a partition
+
+            tick_result = {
+                "tick": tick,
+                "timestamp": datetime.utcnow().isoformat(),
+                "agent_updates": agent_updates,
+                "events_triggered": [e.get("event_type") for e in recent_events],
+                "metrics": tick_metrics,
+                "elapsed_ms": tick_elapsed_ms,
             }
-
-        # Check for early termination
-        if _should_terminate_early(tick_result, config):
-            break
+            ticks_executed += 1
+            if trace_sink is not None:
+                await trace_sink.write_delta(
+                    tick=tick,
+                    agent_updates=agent_updates,
+                    events_triggered=tick_result["events_triggered"],
+                    metrics=tick_metrics,
+                )
+            else:
+                tick_data.append(tick_result)
+
+            # Store agent snapshots at keyframe intervals
+            logging_profile = config.get("logging_profile", {})
+            keyframe_interval = logging_profile.get("keyframe_interval", 100)
+            if tick % keyframe_interval == 0:
+                if tick_kernel is not None:
+                    tick_kernel.sync_to_agents()
+                keyframe = {
+                    str(a.id): a.to_snapshot()
+                    for a in agent_pool.get_all()
+                }
+                if trace_sink is not None:
+                    await trace_sink.write_keyframe(tick=tick, agent_states=keyframe)
+                else:
+                    agent_snapshots[tick] = keyframe
+
+            # Check for early termination
+            if _should_terminate_early(tick_result, config):
+                break
+    finally:
+        # Release the shard worker pool even if a tick raised
+        if shard_executor is not None:
+            shard_executor.close()
 
     # Final agent states
-    final_agent_states = {
-        str(a.id): a.to_full_state()
-        for a in agent_pool.get_all()
-    }
+    if tick_kernel is not None:
+        tick_kernel.sync_to_agents()
 
-    return {
-        "ticks_executed": len(tick_data),
+    result = {
+        "ticks_executed": ticks_executed,
         "ticks_configured": max_ticks,
-        "tick_data": tick_data,
-        "agent_snapshots": agent_snapshots,
-        "final_agent_states": final_agent_states,
-        "events_processed": events_processed,
-        "metrics_by_tick": metrics_by_tick,
+        # Aggregates computed on the fly (used by _aggregate_outcomes)
+        "events_processed_count": events_processed_count,
+        "final_metrics": outcome_tracker.last_metrics,
+        "metric_variance": outcome_tracker.get_metric_variance(),
         "outcome_distribution": outcome_tracker.get_outcome_distribution(),
         "seed_used": rng.seed,
+        "rng_algorithm": rng.algorithm.value,
         "agent_count": len(agents),
         # §3.1 Evidence Pack: Execution counters for verification
         "execution_counters": execution_counters.to_dict(),
@@ -1458,6 +1599,88 @@ async def _execute_simulation(
         "leakage_guard_stats": leakage_guard.get_stats().to_dict() if leakage_guard.is_active() else None,
     }
 
+    if trace_sink is not None:
+        for agent in agent_pool.get_all():
+            await trace_sink.write_final_state(str(agent.id), agent.to_full_state())
+    else:
+        result.update({
+            "tick_data": tick_data,
+            "agent_snapshots": agent_snapshots,
+            "final_agent_states": {
+                str(a.id): a.to_full_state()
+                for a in agent_pool.get_all()
+            },
+            "events_processed": events_processed,
+            "metrics_by_tick": metrics_by_tick,
+        })
+
+    return result
+
+
+def _execute_tick_vectorized(
+    tick_kernel: VectorizedTickKernel,
+    active_agents: List[Agent],
+    tick: int,
+    environment: dict,
+    rng: DeterministicRNG,
+    batch_size: int,
+    execution_counters: "ExecutionCounters",
+    outcome_tracker: "OutcomeTracker",
+    events_processed: List[dict],
+    shard_executor: Optional[ShardedTickExecutor] = None,
+    shard_timings: Optional[Dict[str, float]] = None,
+) -> List[dict]:
+    """
+    Run one tick through the vectorized kernel.
+
+    Produces the same agent updates, events, counters and outcome
+    tracking as the per-agent loop in _execute_simulation. With a
+    shard_executor the tick is evaluated shard by shard, and each
+    shard's evaluation time is added to ``shard_timings``.
+    """
+    num_agents = len(active_agents)
+    agent_ids = [str(a.id) for a in active_agents]
+    tick_args = dict(
+        tick=tick,
+        active=tick_kernel.indices_of(active_agents),
+        environment=environment,
+        rng_seeds=None if rng.is_counter_based else rng.derive_agent_seeds(agent_ids, tick),
+    )
+    if shard_executor is not None:
+        result, timings = shard_executor.run_tick(**tick_args)
+        if shard_timings is not None:
+            shard_timings.update(timings)
+    else:
+        result = tick_kernel.run_tick(**tick_args)
+
+    # §3.1 / §3.3 Evidence Pack counters for the whole tick
+    action_count = result.action_count
+    execution_counters.record_batch(-(-num_agents // batch_size))
+    execution_counters.record_observe(num_agents)
+    execution_counters.record_evaluate(num_agents)
+    execution_counters.record_decide(num_agents)
+    execution_counters.record_act(action_count)
+    execution_counters.record_update(num_agents)
+    execution_counters.record_agent_step(num_agents)
+
+    agent_updates = []
+    action_counts: Dict[str, int] = {}
+    observation_summary = _summarize_observation({})
+    for agent_id, decision_type, action, state_delta in result.iter_rows():
+        if action is not None:
+            events_processed.append(action)
+            action_counts[decision_type] = action_counts.get(decision_type, 0) + 1
+        agent_updates.append({
+            "agent_id": agent_id,
+            "observation": dict(observation_summary),
+            "decision": decision_type,
+            "actions": 0 if action is None else 1,
+            "state_delta": state_delta,
+        })
+
+    outcome_tracker.record_action_counts(action_counts)
+    return agent_updates
+
 
 async def _load_agents_for_run(
     db: AsyncSession,
@@ -1591,6 +1814,22 @@ def _compute_state_delta(rule_results: dict) -> dict:
     }
 
 
+def _peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this worker process, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss
+        except Exception:
+            return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
 class ExecutionCounters:
     """
     Execution counters for Evidence Pack verification (§3.1).
@@ -1620,34 +1859,38 @@ class ExecutionCounters:
         self.partitions_count: int = 0
         self.batches_count: int = 0
         self.backpressure_events: int = 0
+        self.shard_timings: Dict[str, Dict[str, float]] = {}  # Sharded mode, per shard
         self.scheduler_config: Dict[str, Any] = {}  # Set by main loop
 
         # Total agent steps
         self.agent_steps_executed: int = 0
 
-    def record_observe(self):
-        """Record an observe() call."""
-        self.loop_stage_counters["observe"] += 1
+        # Peak worker resident set size, sampled once per tick
+        self.peak_rss_bytes: Optional[int] = None
 
-    def record_evaluate(self):
-        """Record an evaluate() call."""
-        self.loop_stage_counters["evaluate"] += 1
+    def record_observe(self, count: int = 1):
+        """Record an observe() call (or ``count`` calls for a batch)."""
+        self.loop_stage_counters["observe"] += count
 
-    def record_decide(self):
-        """Record a decide() call."""
-        self.loop_stage_counters["decide"] += 1
+    def record_evaluate(self, count: int = 1):
+        """Record an evaluate() call (or ``count`` calls for a batch)."""
+        self.loop_stage_counters["evaluate"] += count
 
-    def record_act(self):
-        """Record an act() call."""
-        self.loop_stage_counters["act"] += 1
+    def record_decide(self, count: int = 1):
+        """Record a decide() call (or ``count`` calls for a batch)."""
+        self.loop_stage_counters["decide"] += count
 
-    def record_update(self):
-        """Record an update() call."""
-        self.loop_stage_counters["update"] += 1
+    def record_act(self, count: int = 1):
+        """Record an act() call (or ``count`` calls for a batch)."""
+        self.loop_stage_counters["act"] += count
 
-    def record_agent_step(self):
-        """Record a complete agent step."""
-        self.agent_steps_executed += 1
+    def record_update(self, count: int = 1):
+        """Record an update() call (or ``count`` calls for a batch)."""
+        self.loop_stage_counters["update"] += count
+
+    def record_agent_step(self, count: int = 1):
+        """Record a complete agent step (or ``count`` steps for a batch)."""
+        self.agent_steps_executed += count
 
     def record_rule_application(
         self,
@@ -1669,18 +1912,31 @@ class ExecutionCounters:
         self.rule_application_counts[key]["application_count"] += 1
         self.rule_application_counts[key]["agents_affected"] += agents_affected
 
-    def record_batch(self):
-        """Record a batch execution."""
-        self.batches_count += 1
+    def record_batch(self, count: int = 1):
+        """Record a batch execution (or ``count`` batches)."""
+        self.batches_count += count
 
-    def record_partition(self):
-        """Record a partition."""
+    def record_partition(self, shard_timings: Optional[Dict[str, float]] = None):
+        """Record a partition, with each shard's evaluation time (ms) in sharded mode."""
         self.partitions_count += 1
+        for shard, elapsed_ms in (shard_timings or {}).items():
+            stats = self.shard_timings.setdefault(
+                shard, {"partitions": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["partitions"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
 
     def record_backpressure(self):
         """Record a backpressure event."""
         self.backpressure_events += 1
 
+    def record_memory_usage(self):
+        """Sample the worker's peak RSS."""
+        rss = _peak_rss_bytes()
+        if rss is not None and (self.peak_rss_bytes is None or rss > self.peak_rss_bytes):
+            self.peak_rss_bytes = rss
+
     def to_dict(self) -> Dict[str, Any]:
         """Export counters for Evidence Pack."""
         return {
@@ -1691,7 +1947,17 @@ class ExecutionCounters:
             "partitions_count": self.partitions_count,
             "batches_count": self.batches_count,
             "backpressure_events": self.backpressure_events,
+            "shard_timings": {
+                shard: {
+                    "partitions": stats["partitions"],
+                    "total_ms": round(stats["total_ms"], 3),
+                    "mean_ms": round(stats["total_ms"] / stats["partitions"], 3),
+                    "max_ms": round(stats["max_ms"], 3),
+                }
+                for shard, stats in sorted(self.shard_timings.items())
+            },
             "agent_steps_executed": self.agent_steps_executed,
+            "peak_rss_bytes": self.peak_rss_bytes,
             "scheduler_config": self.scheduler_config,  # §3.3 scheduler policy documentation
         }
 
@@ -1705,7 +1971,8 @@ class OutcomeTracker:
     def __init__(self):
         self.action_counts: Dict[str, int] = {}
         self.outcome_votes: Dict[str, float] = {}
-        self.metric_series: Dict[str, List[float]] = {}
+        self.metric_stats: Dict[str, Dict[str, float]] = {}  # key -> count, mean, m2
+        self.last_metrics: Dict[str, Any] = {}
         self.agent_outcomes: Dict[str, str] = {}
 
     def record_agent_action(
@@ -1725,6 +1992,11 @@ class OutcomeTracker:
             if outcome:
                 self.outcome_votes[outcome] = self.outcome_votes.get(outcome, 0) + 1
 
+    def record_action_counts(self, action_counts: Dict[str, int]):
+        """Record decisions in bulk (vectorized kernel decisions carry no outcome signal)."""
+        for action_type, count in action_counts.items():
+            self.action_counts[action_type] = self.action_counts.get(action_type, 0) + count
+
     def compute_tick_metrics(self, tick: int, agent_pool: AgentPool) -> dict:
         """Compute metrics for this tick."""
         active_count = len(agent_pool.get_active())
@@ -1736,14 +2008,25 @@ class OutcomeTracker:
             "activity_rate": active_count / total_count if total_count > 0 else 0,
         }
 
-        # Track metric series
+        # Track running mean/variance per metric (Welford), not the full series
         for key, value in metrics.items():
-            if key not in self.metric_series:
-                self.metric_series[key] = []
-            self.metric_series[key].append(value)
+            stats = self.metric_stats.setdefault(key, {"count": 0, "mean": 0.0, "m2": 0.0})
+            stats["count"] += 1
+            delta = value - stats["mean"]
+            stats["mean"] += delta / stats["count"]
+            stats["m2"] += delta * (value - stats["mean"])
+        self.last_metrics = metrics
 
         return metrics
 
+    def get_metric_variance(self) -> Dict[str, float]:
+        """Population variance of each metric over the ticks seen so far."""
+        return {
+            key: stats["m2"] / stats["count"]
+            for key, stats in self.metric_stats.items()
+            if stats["count"] > 1
+        }
+
     def get_current_metrics(self) -> dict:
         """Get current aggregated metrics."""
         return {
@@ -1778,7 +2061,6 @@ def _aggregate_outcomes(execution_result: dict) -> dict:
     """
     ticks = execution_result.get("ticks_executed", 0)
     outcome_distribution = execution_result.get("outcome_distribution", {})
-    metrics_by_tick = execution_result.get("metrics_by_tick", [])
 
     # Determine primary outcome
     if outcome_distribution:
@@ -1789,7 +2071,7 @@ def _aggregate_outcomes(execution_result: dict) -> dict:
         primary_probability = 1.0
 
     # Compute key metrics from final tick
-    final_metrics = metrics_by_tick[-1] if metrics_by_tick else {}
+    final_metrics = execution_result.get("final_metrics") or {}
     key_metrics = [
         {
             "metric_name": "ticks_executed",
@@ -1803,7 +2085,7 @@ def _aggregate_outcomes(execution_result: dict) -> dict:
         },
         {
             "metric_name": "events_processed",
-            "value": len(execution_result.get("events_processed", [])),
+            "value": execution_result.get("events_processed_count", 0),
             "unit": "events",
         },
         {
@@ -1813,15 +2095,13 @@ def _aggregate_outcomes(execution_result: dict) -> dict:
         },
     ]
 
-    # Compute variance if we have metric series
-    variance_metrics = {}
-    if metrics_by_tick:
-        for key in ["activity_rate"]:
-            values = [m.get(key, 0) for m in metrics_by_tick if key in m]
-            if len(values) > 1:
-                mean = sum(values) / len(values)
-                variance = sum((v - mean) ** 2 for v in values) / len(values)
-                variance_metrics[key] = variance
+    # Variance over ticks (tracked incrementally by OutcomeTracker)
+    metric_variance = execution_result.get("metric_variance") or {}
+    variance_metrics = {
+        key: metric_variance[key]
+        for key in ["activity_rate"]
+        if key in metric_variance
+    }
 
     # Generate summary text
     summary_text = (
@@ -1845,6 +2125,7 @@ async def _store_telemetry(
     run_id: str,
     tenant_id: str,
     execution_result: dict,
+    trace_sink: Optional["TelemetryStreamWriter"] = None,
 ) -> dict:
     """
     Store telemetry data in object storage.
@@ -1855,10 +2136,23 @@ async def _store_telemetry(
     - deltas: Changes between ticks (for playback)
     - index: Quick lookup for events and ticks
 
+    When the trace was streamed during execution, only the remaining
+    chunks and the manifest are written here.
+
     Returns storage reference.
     """
     from app.services.telemetry import get_telemetry_service
 
+    if trace_sink is not None:
+        ref = await trace_sink.close(
+            seed_used=execution_result.get("seed_used", 0),
+            agent_count=execution_result.get("agent_count", 0),
+            metrics_summary={
+                "outcome_distribution": execution_result.get("outcome_distribution", {}),
+            },
+        )
+        return ref.to_dict()
+
     telemetry_service = get_telemetry_service()
 
     # Use TelemetryService to convert and store
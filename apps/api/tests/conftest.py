@@ -12,6 +12,9 @@ from sqlalchemy import text
 from app.main import app
 from app.core.config import settings
 from app.db.session import get_db, Base
+from app.services.storage import StorageService
+from app.services.telemetry import DecodedTelemetryCache, TelemetryService
+from tests.telemetry_helpers import CountingBackend
 
 # Use the same database for testing
 TEST_DATABASE_URL = settings.DATABASE_URL
@@ -108,6 +111,18 @@ async def auth_headers(client: AsyncClient) -> dict:
     return {}
 
 
+@pytest.fixture
+def backend(tmp_path) -> CountingBackend:
+    """Local storage backend counting object and range reads."""
+    return CountingBackend(str(tmp_path))
+
+
+@pytest.fixture
+def telemetry(backend) -> TelemetryService:
+    """Telemetry service on the counting backend with its own decoded cache."""
+    return TelemetryService(StorageService(backend), cache=DecodedTelemetryCache())
+
+
 @pytest.fixture
 def sample_project_data():
     """Sample project data for tests."""
@@ -0,0 +1,69 @@
+"""
+Shared helpers for telemetry storage tests.
+
+- CountingBackend: local storage that records object and byte-range reads
+- make_blob: TelemetryBlob around a test's keyframes and deltas
+
+The backend and telemetry fixtures built on them live in conftest.py.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.storage import LocalStorageBackend
+from app.services.telemetry import (
+    TelemetryBlob,
+    TelemetryDelta,
+    TelemetryIndex,
+    TelemetryKeyframe,
+)
+
+
+class CountingBackend(LocalStorageBackend):
+    """Local backend counting whole-object reads and recording range reads."""
+
+    def __init__(self, base_path: str):
+        super().__init__(base_path)
+        self.reads = 0
+        self.ranges: List[Tuple[str, int, int]] = []
+        self.delay = 0.0  # Seconds each whole-object read takes
+
+    async def get_object(self, key: str) -> bytes:
+        self.reads += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return await super().get_object(key)
+
+    async def get_object_range(self, key: str, offset: int, length: int) -> bytes:
+        self.ranges.append((key, offset, length))
+        return await super().get_object_range(key, offset, length)
+
+
+def make_blob(
+    ticks: int,
+    keyframes: List[TelemetryKeyframe],
+    deltas: List[TelemetryDelta],
+    run_id: str = "run-1",
+    seed_used: int = 1,
+    final_states: Optional[Dict[str, Any]] = None,
+    event_index: Optional[List[Dict[str, Any]]] = None,
+    metrics_summary: Optional[Dict[str, Any]] = None,
+) -> TelemetryBlob:
+    """Telemetry blob of ticks ticks; agent_count is the first keyframe's population."""
+    return TelemetryBlob(
+        run_id=run_id,
+        schema_version="1.1.0",
+        created_at="2024-01-01T00:00:00",
+        ticks_executed=ticks,
+        seed_used=seed_used,
+        agent_count=len(keyframes[0].agent_states) if keyframes else 0,
+        keyframes=keyframes,
+        deltas=deltas,
+        final_states=final_states or {},
+        index=TelemetryIndex(
+            tick_count=ticks,
+            keyframe_ticks=[kf.tick for kf in keyframes],
+            event_index=event_index or [],
+        ),
+        metrics_summary=metrics_summary or {},
+    )
@@ -0,0 +1,101 @@
+"""
+Action Log Writer Tests
+
+Verifies:
+- state_diff keeps only the keys an action changed
+- Environment state is stored once per step and referenced by id
+- Buffered actions are written with one bulk INSERT per chunk
+
+Reference: project.md §4.1
+"""
+
+import asyncio
+from typing import Any, List, Tuple
+from uuid import uuid4
+
+import pytest
+
+from app.engine.action_log import ActionLogWriter, state_diff
+from app.models.environment import EnvironmentState
+
+
+class _RecordingSession:
+    """Minimal AsyncSession stand-in that records added objects and statements."""
+
+    def __init__(self):
+        self.added: List[Any] = []
+        self.executed: List[Tuple[Any, Any]] = []
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+
+class TestStateDiff:
+    def test_changed_keys_only(self):
+        before = {"certainty": 0.4, "engagement_level": 0.5, "preferences": {"a": 0.6}, "old": 1}
+        after = {"certainty": 0.42, "engagement_level": 0.5, "preferences": {"a": 0.6}, "new": 2}
+
+        diff_before, diff_after = state_diff(before, after)
+
+        assert diff_before == {"certainty": 0.4, "old": 1, "new": None}
+        assert diff_after == {"certainty": 0.42, "old": None, "new": 2}
+
+    def test_unchanged_state_is_empty(self):
+        assert state_diff({"a": 1}, {"a": 1}) == ({}, {})
+
+
+class TestActionLogWriter:
+    def test_environment_state_once_per_step(self):
+        db = _RecordingSession()
+        environment_id, scenario_id = uuid4(), uuid4()
+        writer = ActionLogWriter(environment_id=environment_id, scenario_id=scenario_id)
+
+        writer.begin_step(db, 1, {"economic_index": 0.5})
+        for _ in range(3):
+            writer.record(uuid4(), "vote_a", {"vote_a": 1.0}, {}, {})
+
+        assert len(db.added) == 1
+        state = db.added[0]
+        assert isinstance(state, EnvironmentState)
+        assert state.time_step == 1
+        assert state.global_state == {"economic_index": 0.5}
+        assert state.environment_id == environment_id
+
+        contexts = writer._columns["decision_context"]
+        assert contexts == [{"step": 1, "environment_state_id": str(state.id)}] * 3
+
+    def test_flush_writes_bulk_chunks(self):
+        db = _RecordingSession()
+        writer = ActionLogWriter(insert_batch=4, flush_rows=10)
+        agent_ids = [uuid4() for _ in range(10)]
+
+        writer.begin_step(db, 2, None)
+        for i, agent_id in enumerate(agent_ids):
+            writer.record(
+                agent_id,
+                "vote_a",
+                {"vote_a": 0.7, "vote_b": 0.3},
+                {"certainty": 0.5, "engagement_level": 0.1},
+                {"certainty": 0.5 + i / 100, "engagement_level": 0.1},
+            )
+        assert writer.should_flush()
+
+        written = asyncio.run(writer.flush(db))
+
+        assert written == 10 and len(writer) == 0
+        assert [len(params) for _, params in db.executed] == [4, 4, 2]
+        rows = [row for _, params in db.executed for row in params]
+        assert [row["agent_id"] for row in rows] == agent_ids
+        assert rows[0]["state_before"] == {} and rows[0]["state_after"] == {}
+        assert rows[3]["state_before"] == {"certainty": 0.5}
+        assert rows[3]["state_after"] == {"certainty": pytest.approx(0.53)}
+        assert rows[5]["decision_context"] == {"step": 2}
+        assert writer.rows_written == 10
+
+    def test_flush_empty_buffer(self):
+        db = _RecordingSession()
+        assert asyncio.run(ActionLogWriter().flush(db)) == 0
+        assert db.executed == []
@@ -0,0 +1,89 @@
+"""
+Vectorized Action Processing Tests
+
+Verifies:
+- ActionEffectTable masks follow the DiscreteActionSpace action types
+- SimulationLoop._process_actions applies vote, abstain and switch effects
+  as masked array updates with the expected counters
+
+Reference: project.md §4.1
+"""
+
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.engine.action_space import ActionSpace
+from app.engine.behavioral_model import BehavioralModel
+from app.engine.simulation_loop import ActionEffectTable, SimulationConfig, SimulationLoop
+from app.engine.state_manager import StateManager
+
+
+def _make_loop(num_agents: int, preferences: np.ndarray) -> SimulationLoop:
+    manager = StateManager(preference_dimensions=preferences.shape[1])
+    manager.initialize(
+        agent_ids=[uuid4() for _ in range(num_agents)],
+        initial_preferences=preferences,
+        initial_issue_priorities=np.zeros((num_agents, 10)),
+        initial_scalar_states=np.full((num_agents, 7), 0.5),
+    )
+    return SimulationLoop(
+        config=SimulationConfig(total_steps=1, commitment_threshold=0.7),
+        state_manager=manager,
+        behavioral_model=BehavioralModel(),
+        action_space=ActionSpace.create_election_space(["a", "b", "c"]),
+    )
+
+
+class TestActionEffectTable:
+    def test_masks_follow_action_types(self):
+        table = ActionEffectTable.from_action_space(
+            ActionSpace.create_election_space(["a", "b", "c"])
+        )
+
+        # Election space: vote a/b/c, abstain, switch preference
+        assert table.num_actions == 5
+        assert table.vote.tolist() == [True, True, True, False, False]
+        assert table.abstain.tolist() == [False, False, False, True, False]
+        assert table.switch_preference.tolist() == [False, False, False, False, True]
+
+
+class TestProcessActions:
+    def test_masked_updates(self):
+        preferences = np.array([
+            [0.8, 0.1, 0.1],  # Votes a, crosses threshold -> commits
+            [0.4, 0.3, 0.3],  # Votes b, stays below threshold
+            [0.4, 0.3, 0.3],  # Abstains
+            [0.4, 0.3, 0.3],  # Switches while committed -> uncommits
+            [0.4, 0.3, 0.3],  # Switches while uncommitted -> no change
+            [0.4, 0.3, 0.3],  # Undefined action index
+        ])
+        loop = _make_loop(6, preferences)
+        manager = loop.state_manager
+        manager.committed_choices[3] = 1
+        manager.scalar_states[3, 4] = 0.6
+        actions = np.array([0, 1, 3, 4, 4, 99])
+
+        taken, commitments, changes = asyncio.run(
+            loop._process_actions(actions, np.zeros((6, 5)), step=0)
+        )
+
+        assert (taken, commitments, changes) == (5, 1, 3)
+        assert manager.committed_choices.tolist() == [0, -1, -1, -1, -1, -1]
+
+        scalars = manager.scalar_states
+        assert scalars[0, 4] == pytest.approx(0.6)
+        assert scalars[3, 4] == pytest.approx(0.3)
+        assert scalars[[0, 1], 1] == pytest.approx([0.51, 0.51])
+        assert scalars[2, 1] == pytest.approx(0.495)
+        assert scalars[[3, 4, 5], 1] == pytest.approx([0.5, 0.5, 0.5])
+
+        # Vote reinforced the chosen option by 0.1 * learning rate, then renormalized
+        reinforced = np.array([0.4, 0.3 + 0.005, 0.3])
+        assert manager.preferences_matrix[1] == pytest.approx(reinforced / reinforced.sum())
+        assert manager.preferences_matrix[2] == pytest.approx([0.4, 0.3, 0.3])
+        assert np.allclose(manager.preferences_matrix.sum(axis=1), 1.0)
+
+        assert manager.recent_actions_buffer[:, -1].tolist() == actions.tolist()
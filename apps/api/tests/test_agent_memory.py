@@ -0,0 +1,84 @@
+"""
+Agent Memory Tests
+
+Verifies:
+- Recent events are kept in a fixed-capacity ring buffer
+- Significant events evicted from recent memory become episodes
+- Episodes are bounded, dropping the least significant (oldest on ties)
+- Observations are recorded as summaries, not copies of peer snapshots
+
+Reference: project.md §6.3 (Agent memory)
+"""
+
+from app.engine.agent import Agent, AgentMemory, AgentProfile
+
+
+def _event(tick: int, significance: float) -> dict:
+    return {"tick": tick, "type": "action", "data": {}, "significance": significance}
+
+
+class TestAgentMemory:
+    """Bounded recent-event and episode buffers."""
+
+    def test_recent_events_are_bounded(self):
+        memory = AgentMemory(max_recent=3)
+        for tick in range(10):
+            memory.add_event(_event(tick, 0.5))
+
+        assert [e["tick"] for e in memory.recent_events] == [7, 8, 9]
+        assert memory.episode_count == 0
+
+    def test_significant_events_become_episodes(self):
+        memory = AgentMemory(max_recent=2)
+        for tick, significance in enumerate([0.9, 0.2, 0.8, 0.1, 0.1]):
+            memory.add_event(_event(tick, significance))
+
+        assert [e["tick"] for e in memory.episodes] == [0, 2]
+
+    def test_episodes_keep_most_significant(self):
+        memory = AgentMemory(max_episodes=3)
+        for tick, significance in enumerate([0.8, 0.9, 0.8, 0.95, 0.85]):
+            memory.add_episode(_event(tick, significance))
+
+        assert [e["tick"] for e in memory.episodes] == [1, 3, 4]
+
+    def test_set_capacity_trims_buffers(self):
+        memory = AgentMemory()
+        for tick in range(20):
+            memory.add_event(_event(tick, 0.5))
+            memory.add_episode(_event(tick, tick / 20))
+
+        memory.set_capacity(max_recent=5, max_episodes=2)
+
+        assert [e["tick"] for e in memory.recent_events] == [15, 16, 17, 18, 19]
+        assert [e["tick"] for e in memory.episodes] == [18, 19]
+        assert len(memory.to_dict()["recent_events"]) == 5
+
+    def test_set_capacity_keeps_significant_events(self):
+        memory = AgentMemory()
+        for tick in range(10):
+            memory.add_event(_event(tick, 0.9 if tick in (2, 6) else 0.5))
+
+        memory.set_capacity(max_recent=3, max_episodes=10)
+
+        assert [e["tick"] for e in memory.recent_events] == [7, 8, 9]
+        assert [e["tick"] for e in memory.episodes] == [2, 6]
+        memory.add_event(_event(10, 0.5))
+        assert [e["tick"] for e in memory.recent_events] == [8, 9, 10]
+
+    def test_episodes_round_trip(self):
+        agent = Agent(AgentProfile(agent_id="agent-1"))
+        agent.memory.add_episode(_event(1, 0.9))
+        agent.memory.add_episode(_event(2, 0.8))
+
+        restored = Agent.from_state(agent.to_full_state())
+
+        assert restored.memory.episodes == agent.memory.episodes
+
+    def test_observation_is_summarized(self):
+        agent = Agent(AgentProfile(agent_id="agent-1"))
+        peers = [{"agent_id": f"peer-{i}", "variables": {"opinion": 0.5}} for i in range(4)]
+
+        agent.observe({"media_signal": 0.4}, peers)
+
+        assert agent.memory.recent_events[-1]["data"] == {"peer_count": 4}
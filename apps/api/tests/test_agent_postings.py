@@ -0,0 +1,190 @@
+"""
+Agent Postings Index Tests
+
+Verifies:
+- The stream writer emits per-agent postings as a derived, key-ranged section
+- Agent updates are read through postings, touching only their delta segments
+- History series match replay reconstruction, including keyframe resets
+- The writer spills postings per delta segment instead of holding them
+- Single-document telemetry gets an in-memory postings index
+- Series are column-oriented and carry tick metrics at each point
+
+Reference: project.md §6.8, §11 Phase 8
+"""
+
+from typing import List
+
+from app.services.replay_loader import create_replay_loader
+from app.services.telemetry import (
+    AGENT_POSTINGS_SECTION,
+    AgentHistorySeries,
+    TelemetryBlob,
+    TelemetryDelta,
+    TelemetryKeyframe,
+    TelemetryService,
+    _AgentPostingsSpill,
+)
+from tests.telemetry_helpers import make_blob
+
+TICKS = 100
+AGENTS = [f"agent-{i:02d}" for i in range(40)]
+
+
+def _updates(tick: int) -> List[dict]:
+    # Busy agents update every tick; "agent-rare" only at ticks 10 and 90
+    updates = [{"agent_id": aid, "stance": tick / TICKS, "emotion": 0.5} for aid in AGENTS]
+    if tick in (10, 90):
+        updates.append({"agent_id": "agent-rare", "stance": tick / TICKS, "last_action": f"act-{tick}"})
+    return updates
+
+
+def _blob() -> TelemetryBlob:
+    keyframe_ticks = [0, 50]
+    everyone = AGENTS + ["agent-rare"]
+    keyframes = [
+        TelemetryKeyframe(
+            tick=tick,
+            timestamp=f"t{tick}",
+            agent_states={aid: {"agent_id": aid, "stance": -1.0, "segment": "s"} for aid in everyone},
+            metrics={"keyframe": float(tick)},
+        )
+        for tick in keyframe_ticks
+    ]
+    deltas = [
+        TelemetryDelta(tick=tick, agent_updates=_updates(tick), events_triggered=[], metrics={"adoption": tick / TICKS})
+        for tick in range(TICKS)
+    ]
+    return make_blob(TICKS, keyframes, deltas)
+
+
+async def _store_segmented(telemetry: TelemetryService):
+    return await telemetry.open_stream("tenant", "run-1", segment_bytes=4096).write_blob(_blob())
+
+
+class TestPostingsLayout:
+    async def test_postings_section_is_derived_and_key_ranged(self, telemetry):
+        ref = await _store_segmented(telemetry)
+
+        manifest, _ = await telemetry.storage.get_telemetry_header(ref)
+        section = manifest["sections"][AGENT_POSTINGS_SECTION]
+        document = await telemetry.storage.get_telemetry(ref)
+
+        assert section["derived"] and section["mapping"]
+        assert section["records"] == len(AGENTS) + 1
+        ranges = [(seg["key_start"], seg["key_end"]) for seg in section["segments"]]
+        assert len(ranges) > 1
+        assert all(end < next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+        assert AGENT_POSTINGS_SECTION not in document
+
+    async def test_rare_agent_reads_only_its_segments(self, telemetry, backend):
+        ref = await _store_segmented(telemetry)
+        manifest, _ = await telemetry.storage.get_telemetry_header(ref)
+        delta_segments = manifest["sections"]["deltas"]["segments"]
+        view = await telemetry.open_view(ref)
+
+        updates = await view.agent_updates("agent-rare", 0, TICKS)
+
+        assert [(tick, update["last_action"]) for tick, update in updates] == [
+            (10, "act-10"), (90, "act-90"),
+        ]
+        # One postings segment plus the two delta segments holding ticks 10 and 90
+        assert len(backend.ranges) == 3 < len(delta_segments)
+        assert await view.agent_updates("agent-missing", 0, TICKS) == []
+
+
+class TestPostingsSpill:
+    async def test_writer_holds_one_segment_of_postings(self, telemetry):
+        writer = telemetry.open_stream("tenant", "run-1", segment_bytes=4096)
+        spill = writer.agent_postings
+        blob = _blob()
+        held = []
+        for delta in blob.deltas:
+            await writer._append_delta(delta)
+            held.append(sum(len(flat) for flat in spill.pending.values()) // 4)
+        runs = spill.run_count
+
+        ref = await writer.close(seed_used=1, agent_count=len(AGENTS) + 1)
+        view = await telemetry.open_view(ref)
+
+        assert runs > 1
+        assert max(held) < sum(len(d.agent_updates) for d in blob.deltas) / 2
+        assert [tick for tick, _ in await view.agent_updates("agent-rare", 0, TICKS)] == [10, 90]
+        assert [tick for tick, _ in await view.agent_updates("agent-07", 0, TICKS)] == list(range(TICKS))
+
+    def test_merge_orders_by_agent_then_tick(self):
+        spill = _AgentPostingsSpill()
+        spill.READ_BYTES = 16  # Entries straddle reads
+        for segment, tick in enumerate([1, 2, 3]):
+            updates = [{"agent_id": aid} for aid in ("b", "a", "c")[:tick]]
+            delta = TelemetryDelta(tick=tick, agent_updates=updates, events_triggered=[], metrics={})
+            spill.add(delta, segment, 0)
+
+        merged = [(agent_id, flat[0::4].tolist()) for agent_id, flat in spill.merged()]
+        spill.close()
+
+        assert merged == [("a", [2, 3]), ("b", [1, 2, 3]), ("c", [3])]
+
+
+class TestAgentHistory:
+    async def test_replay_history_matches_reconstruction(self, telemetry):
+        ref = await _store_segmented(telemetry)
+        loader = create_replay_loader(telemetry)
+        await loader.load(ref, preload_ticks=0)
+
+        history = await loader.get_agent_history("agent-rare", 5, 95)
+
+        # Start of range, update at 10, keyframe reset at 50, update at 90
+        assert history.ticks == [5, 10, 50, 90]
+        assert history.columns["stance"] == [-1.0, 0.1, -1.0, 0.9]
+        assert history.columns["last_action"] == [None, "act-10", None, "act-90"]
+        for i, tick in enumerate(history.ticks):
+            agent = (await loader.get_state_at_tick(tick)).agents["agent-rare"]
+            assert history.columns["stance"][i] == agent.stance
+            assert history.columns["last_action"][i] == agent.last_action
+
+    async def test_single_document_builds_postings_once(self, telemetry):
+        segmented = await _store_segmented(telemetry)
+        legacy = await telemetry.storage.store_telemetry("tenant", "legacy", _blob().to_dict())
+
+        expected = await telemetry.get_agent_series(segmented, "agent-03", 40, 60)
+        first = await telemetry.get_agent_series(legacy, "agent-03", 40, 60)
+        misses = telemetry.cache.misses
+        await telemetry.get_agent_series(legacy, "agent-rare", 0, 20)
+
+        assert first.to_dict() == expected.to_dict()
+        assert first.ticks == list(range(40, 61))
+        assert telemetry.cache.misses == misses
+
+    async def test_raw_series_columns(self, telemetry):
+        ref = await _store_segmented(telemetry)
+
+        series = await telemetry.get_agent_series(ref, "agent-rare", 0, 20)
+
+        assert series.ticks == [0, 10]
+        assert series.columns == {
+            "stance": [-1.0, 0.1],
+            "segment": ["s", "s"],
+            "last_action": [None, "act-10"],
+        }
+        # Tick metrics of the keyframe at 0 and the delta at 10
+        assert series.metrics == [{"keyframe": 0.0}, {"adoption": 0.1}]
+
+    async def test_series_metrics_at_change_ticks(self, telemetry):
+        ref = await _store_segmented(telemetry)
+
+        series = await telemetry.get_agent_series(ref, "agent-rare", 5, 95)
+
+        # No record at the range start is read; 50 is a keyframe
+        assert series.ticks == [5, 10, 50, 90]
+        assert series.metrics == [None, {"adoption": 0.1}, {"keyframe": 50.0}, {"adoption": 0.9}]
+
+
+class TestAgentHistorySeries:
+    def test_new_columns_are_backfilled(self):
+        series = AgentHistorySeries("a")
+        series.append(1, {"x": 1})
+        series.append(2, {"x": 2, "y": "b"})
+
+        assert series.columns == {"x": [1, 2], "y": [None, "b"]}
+        assert series.rows() == [{"tick": 1, "x": 1, "y": None}, {"tick": 2, "x": 2, "y": "b"}]
+        assert len(series) == 2
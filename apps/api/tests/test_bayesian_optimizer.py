@@ -0,0 +1,157 @@
+"""
+Calibration Bayesian Optimizer Tests
+
+Verifies:
+- The incrementally extended Cholesky factor matches a full factorization
+- GP predictions match a from-scratch computation
+- Batch proposals are distinct and leave no fantasy observations behind
+- Batched optimization finds the optimum of a simple objective
+- Calibrator scores Bayesian batches on its worker pool
+
+Reference: project.md §11 Phase 4
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from app.engine.calibration.calibrator import (
+    CalibrationConfig,
+    CalibrationMethod,
+    Calibrator,
+    GroundTruth,
+)
+from app.engine.calibration.optimizer import BayesianOptimizer, ParameterBounds
+
+
+def quadratic(params: dict) -> float:
+    return -((params["x"] - 0.3) ** 2) - (params["y"] - 0.7) ** 2
+
+
+def share_simulation(params: dict) -> dict:
+    return {"a": params["share"], "b": 1.0 - params["share"]}
+
+
+def _optimizer(**kwargs) -> BayesianOptimizer:
+    bounds = [ParameterBounds("x", 0.0, 1.0), ParameterBounds("y", 0.0, 1.0)]
+    return BayesianOptimizer(bounds, random_seed=0, **kwargs)
+
+
+def _observe(optimizer: BayesianOptimizer, n: int, seed: int = 1) -> None:
+    rng = np.random.default_rng(seed)
+    for x, y in rng.random((n, 2)):
+        params = {"x": float(x), "y": float(y)}
+        optimizer.update(params, quadratic(params))
+
+
+def _full_prediction(optimizer: BayesianOptimizer, X_test: np.ndarray):
+    X, y = np.array(optimizer.X), np.array(optimizer.y)
+    y_mean, y_std = y.mean(), y.std() + 1e-8
+    K = optimizer._rbf_kernel(X, X) + optimizer.noise_var * np.eye(len(X))
+    K_s = optimizer._rbf_kernel(X_test, X)
+    mu = K_s @ np.linalg.solve(K, (y - y_mean) / y_std)
+    var = 1.0 - np.sum(K_s * np.linalg.solve(K, K_s.T).T, axis=1)
+    return mu * y_std + y_mean, np.maximum(var, 1e-8) * y_std ** 2
+
+
+class TestIncrementalGP:
+    def test_factor_matches_full_cholesky(self):
+        optimizer = _optimizer()
+        X_test = np.random.default_rng(2).random((5, 2))
+        for n in (3, 7, 12):
+            _observe(optimizer, n - len(optimizer.X), seed=n)
+            optimizer._gp_predict(X_test)
+
+            X = np.array(optimizer.X)
+            K = optimizer._rbf_kernel(X, X) + optimizer.noise_var * np.eye(n)
+            assert optimizer._L.shape == (n, n)
+            np.testing.assert_allclose(optimizer._L, np.linalg.cholesky(K), atol=1e-8)
+
+    def test_predictions_match_full_recompute(self):
+        optimizer = _optimizer()
+        optimizer.noise_var = 1e-3
+        X_test = np.random.default_rng(3).random((20, 2))
+        _observe(optimizer, 6)
+        optimizer._gp_predict(X_test)
+        _observe(optimizer, 6, seed=4)
+
+        mu, var = optimizer._gp_predict(X_test)
+        expected_mu, expected_var = _full_prediction(optimizer, X_test)
+
+        np.testing.assert_allclose(mu, expected_mu, rtol=1e-6, atol=1e-9)
+        np.testing.assert_allclose(var, expected_var, rtol=1e-5, atol=1e-9)
+
+    def test_hyperparameter_change_refactorizes(self):
+        optimizer = _optimizer()
+        _observe(optimizer, 5)
+        optimizer._gp_predict(np.zeros((1, 2)))
+        optimizer.length_scales = optimizer.length_scales * 2
+
+        optimizer._gp_predict(np.zeros((1, 2)))
+
+        X = np.array(optimizer.X)
+        K = optimizer._rbf_kernel(X, X) + optimizer.noise_var * np.eye(5)
+        np.testing.assert_allclose(optimizer._L, np.linalg.cholesky(K), atol=1e-8)
+
+
+class TestBatchAcquisition:
+    def test_batch_is_distinct_and_fantasies_are_dropped(self):
+        optimizer = _optimizer()
+        _observe(optimizer, 8)
+
+        batch = optimizer.suggest_batch(4)
+
+        points = {(p["x"], p["y"]) for p in batch}
+        assert len(points) == 4
+        assert optimizer._fantasy_X == [] and optimizer._fantasy_y == []
+        assert optimizer._L.shape == (8, 8)
+
+    def test_batched_optimize_finds_optimum(self):
+        optimizer = _optimizer(n_initial=8, n_iterations=24, batch_size=4)
+        batches = []
+
+        def batch_objective(batch):
+            batches.append(len(batch))
+            return [quadratic(params) for params in batch]
+
+        result = optimizer.optimize(quadratic, maximize=True, batch_objective_fn=batch_objective)
+
+        assert batches[0] == 8 and set(batches[1:]) == {4}
+        assert result.best_score > -0.01
+        assert result.best_params["x"] == pytest.approx(0.3, abs=0.1)
+        assert result.best_params["y"] == pytest.approx(0.7, abs=0.1)
+
+    def test_failed_evaluations_are_skipped(self):
+        optimizer = _optimizer(n_initial=4, n_iterations=4, batch_size=2)
+
+        def batch_objective(batch):
+            return [None] + [quadratic(params) for params in batch[1:]]
+
+        optimizer.optimize(quadratic, batch_objective_fn=batch_objective)
+
+        assert len(optimizer.X) == len(optimizer.y) == 3 + 2
+
+
+class TestCalibratorBatches:
+    def test_calibrator_runs_batches_on_process_pool(self):
+        config = CalibrationConfig(
+            method=CalibrationMethod.BAYESIAN,
+            max_iterations=8,
+            patience=100,
+            parameter_bounds={"share": (0.0, 1.0)},
+            n_parallel_evaluations=4,
+        )
+        ground_truth = GroundTruth(category_distributions={"a": 0.6, "b": 0.4})
+        calibrator = Calibrator(config, share_simulation, mp_context="spawn", seed=0)
+
+        result = calibrator.calibrate(ground_truth)
+
+        assert calibrator._pool is None
+        assert len(calibrator.calibration_history) == calibrator.optimizer.n_initial + 8
+        assert result.best_params["share"] == pytest.approx(0.6, abs=0.15)
+
+        # Seeded: the in-process calibration proposes and finds the same
+        serial = Calibrator(replace(config, n_parallel_evaluations=1), share_simulation, seed=0)
+        serial.optimizer.batch_size = calibrator.optimizer.batch_size
+        assert serial.calibrate(ground_truth).best_params == result.best_params
@@ -0,0 +1,160 @@
+"""
+Checkpoint Store Tests
+
+Verifies:
+- Delta-encoded checkpoints restore the exact arrays that were saved
+- The ring keeps the newest checkpoints and finds steps by binary search
+- Blocks spill to a memory-mapped file over the byte budget and still restore
+- StateManager rollback restores commitments and action buffers as well as
+  preferences and scalar state
+
+Reference: project.md §4.1
+"""
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.engine.checkpoint_store import CheckpointStore
+from app.engine.state_manager import StateManager
+
+
+def _history(steps: int, rows: int = 200, seed: int = 3):
+    """Sequence of (step, arrays) where a few rows change per step."""
+    rng = np.random.default_rng(seed)
+    prefs = rng.uniform(size=(rows, 4))
+    choices = np.full(rows, -1, dtype=np.int32)
+    history = []
+    for step in range(steps):
+        changed = rng.choice(rows, size=5, replace=False)
+        prefs[changed] = rng.uniform(size=(5, 4))
+        choices[changed[:2]] = step
+        if step == 4:
+            prefs[:] = rng.uniform(size=prefs.shape)  # Whole-array change
+        history.append((step * 2, {"prefs": prefs.copy(), "choices": choices.copy()}))
+    return history
+
+
+def _assert_restores(store: CheckpointStore, history) -> None:
+    for step, arrays in history:
+        checkpoint = store.find(step)
+        assert checkpoint.step == step
+        for name, values in arrays.items():
+            np.testing.assert_array_equal(checkpoint.arrays[name], values)
+
+
+class TestCheckpointStore:
+    """Delta encoding, ring eviction and step lookup."""
+
+    def test_restores_every_checkpoint(self):
+        history = _history(25)
+        store = CheckpointStore(capacity=100, keyframe_interval=6)
+        for step, arrays in history:
+            store.save(step, arrays, payload={"step": step})
+
+        _assert_restores(store, history)
+        assert store.find(7).step == 6
+        assert store.find(7).payload == {"step": 6}
+        assert store.find().step == 48
+        assert store.find(-1) is None
+
+    def test_deltas_are_smaller_than_full_copies(self):
+        history = _history(25)
+        store = CheckpointStore(capacity=100, keyframe_interval=100)
+        for step, arrays in history:
+            store.save(step, arrays)
+
+        full_bytes = sum(a.nbytes for _, arrays in history for a in arrays.values())
+        assert store.nbytes < full_bytes / 4
+
+    def test_ring_keeps_newest(self):
+        history = _history(30)
+        store = CheckpointStore(capacity=8, keyframe_interval=5)
+        for step, arrays in history:
+            store.save(step, arrays)
+
+        assert len(store) == 8
+        assert store.steps == [step for step, _ in history[-8:]]
+        assert store.find(history[-9][0]) is None
+        _assert_restores(store, history[-8:])
+
+    def test_restored_arrays_are_independent(self):
+        history = _history(3)
+        store = CheckpointStore()
+        for step, arrays in history:
+            store.save(step, arrays)
+
+        restored = store.find(2)
+        restored.arrays["prefs"][:] = 0
+        _assert_restores(store, history)
+
+    def test_saving_earlier_step_discards_newer(self):
+        history = _history(10)
+        store = CheckpointStore(keyframe_interval=4)
+        for step, arrays in history:
+            store.save(step, arrays)
+
+        replacement = {name: values + 1 for name, values in history[3][1].items()}
+        store.save(7, replacement)
+
+        assert store.steps == [0, 2, 4, 6, 7]
+        np.testing.assert_array_equal(store.find(7).arrays["prefs"], replacement["prefs"])
+        _assert_restores(store, history[:4])
+
+    def test_spills_over_byte_budget(self, tmp_path):
+        history = _history(30)
+        store = CheckpointStore(
+            capacity=12, keyframe_interval=4, byte_budget=8_000, spill_dir=str(tmp_path)
+        )
+        for step, arrays in history:
+            store.save(step, arrays)
+
+        assert store.nbytes <= 8_000 + max(a.nbytes for a in history[-1][1].values()) * 2
+        assert store.spilled_bytes > 0
+        assert len(list(tmp_path.iterdir())) == 1
+        _assert_restores(store, history[-12:])
+
+        store.clear()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStateManagerRollback:
+    """StateManager checkpoints capture the full agent state."""
+
+    @pytest.fixture
+    def manager(self) -> StateManager:
+        rng = np.random.default_rng(0)
+        manager = StateManager(checkpoint_interval=2, max_checkpoints=5)
+        manager.initialize(
+            agent_ids=[uuid4() for _ in range(50)],
+            initial_preferences=rng.uniform(size=(50, 10)),
+            initial_issue_priorities=rng.uniform(size=(50, 10)),
+            initial_scalar_states=rng.uniform(size=(50, 7)),
+        )
+        return manager
+
+    def test_rollback_restores_all_arrays(self, manager):
+        manager.advance_time_step()
+        manager.advance_time_step()  # Checkpoint at step 2
+        saved = {name: values.copy() for name, values in manager._checkpoint_arrays().items()}
+
+        idx = np.arange(10)
+        manager.commit_agents(idx, np.ones(10, dtype=np.int32), np.full(10, 0.9))
+        manager.record_actions(idx, np.full(10, 3), np.full(10, 1.5))
+        manager.update_agent_scalars(idx, {"certainty": np.zeros(10)})
+        manager.advance_time_step()
+
+        assert manager.rollback(2)
+        assert manager.global_state.time_step == 2
+        for name, values in manager._checkpoint_arrays().items():
+            np.testing.assert_array_equal(values, saved[name])
+
+    def test_checkpoint_ring_is_bounded(self, manager):
+        for _ in range(30):
+            manager.advance_time_step()
+
+        assert len(manager.checkpoints) == 5
+        assert manager.checkpoints.steps == [22, 24, 26, 28, 30]
+        assert not manager.rollback(10)
+        assert manager.get_state_summary()["checkpoint_count"] == 5
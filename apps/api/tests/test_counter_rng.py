@@ -0,0 +1,138 @@
+"""
+Counter-Based RNG Tests
+
+Verifies:
+- Philox4x32-10 matches the published known-answer vectors
+- Scalar, vectorized and block-cached draws agree for the same counter
+- Draws depend only on (seed, agent index, tick, domain, draw)
+- Runs without a recorded algorithm keep the legacy SHA-256 stream
+- Rules and event scripts draw from the counter-based stream when one
+  is provided
+
+Reference: project.md §10.1, P0-003
+"""
+
+import numpy as np
+import pytest
+
+from app.engine.rng import (
+    CounterRNG,
+    DEFAULT_RNG_ALGORITHM,
+    RNGAlgorithm,
+    _philox4x32_scalar,
+    create_counter_rng,
+    philox4x32,
+    resolve_rng_algorithm,
+)
+from app.engine.event_executor import ExecutionContext
+from app.engine.rules import MediaInfluenceRule, RuleContext, _hash_uniform
+from app.tasks.run_executor import DeterministicRNG
+
+
+# Random123 known-answer tests for philox4x32_10
+_KNOWN_ANSWERS = [
+    ((0, 0, 0, 0), (0, 0), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+    (
+        (0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF),
+        (0xFFFFFFFF, 0xFFFFFFFF),
+        (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD),
+    ),
+    (
+        (0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+        (0xA4093822, 0x299F31D0),
+        (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+    ),
+]
+
+
+class TestPhilox:
+    """Philox4x32-10 block function."""
+
+    @pytest.mark.parametrize("counter,key,expected", _KNOWN_ANSWERS)
+    def test_known_answers(self, counter, key, expected):
+        assert tuple(philox4x32(np.array([counter]), key)[0].tolist()) == expected
+        assert _philox4x32_scalar(*counter, *key) == expected
+
+
+class TestCounterRNG:
+    """Counter-addressed draws."""
+
+    def test_scalar_matches_vector(self):
+        rng = CounterRNG(987654321)
+        cached = CounterRNG(987654321, num_agents=50)
+        values = rng.uniforms(np.arange(50), 7, "rule:media:noise")
+
+        for i in (0, 13, 49):
+            assert rng.uniform(i, 7, "rule:media:noise") == values[i]
+            assert cached.uniform(i, 7, "rule:media:noise") == values[i]
+        assert ((values >= 0) & (values < 1)).all()
+
+    def test_draws_are_order_independent(self):
+        rng = CounterRNG(42)
+        forward = rng.uniforms(np.arange(10), 3, "domain")
+        backward = rng.uniforms(np.arange(10)[::-1], 3, "domain")
+
+        assert np.array_equal(forward, backward[::-1])
+
+    def test_streams_are_distinct(self):
+        rng = CounterRNG(42)
+        base = rng.uniforms(np.arange(100), 3, "domain")
+
+        assert not np.array_equal(base, rng.uniforms(np.arange(100), 4, "domain"))
+        assert not np.array_equal(base, rng.uniforms(np.arange(100), 3, "other"))
+        assert not np.array_equal(base, rng.uniforms(np.arange(100), 3, "domain", draw=1))
+        assert not np.array_equal(base, CounterRNG(43).uniforms(np.arange(100), 3, "domain"))
+
+
+class TestAlgorithmSelection:
+    """Algorithm recorded in seed_config."""
+
+    def test_unrecorded_algorithm_uses_legacy_stream(self):
+        assert resolve_rng_algorithm(None) == RNGAlgorithm.SHA256
+        assert resolve_rng_algorithm({"primary_seed": 42}) == RNGAlgorithm.SHA256
+        assert resolve_rng_algorithm({"rng_algorithm": "philox"}) == RNGAlgorithm.PHILOX
+        assert DEFAULT_RNG_ALGORITHM == RNGAlgorithm.PHILOX
+
+    def test_legacy_mode_keeps_sha256_derivation(self):
+        rng = DeterministicRNG(1234)
+
+        assert rng.counter_rng() is None
+        assert rng.create_agent_rng("agent-1", 5).seed == rng.derive_seed("agent:agent-1:tick:5")
+
+        rule = MediaInfluenceRule()
+        ctx = RuleContext(tick=5, agent_id="agent-1", rng_seed=99)
+        assert rule.derive_random(ctx, "media_noise") == _hash_uniform("99:agent-1:5:media_influence:media_noise")
+
+    def test_rules_use_counter_stream(self):
+        rng = DeterministicRNG(1234, algorithm="philox").counter_rng(num_agents=8)
+        rule = MediaInfluenceRule()
+        ctx = RuleContext(tick=5, agent_id="agent-3", rng=rng, agent_index=3)
+
+        expected = rng.uniforms(np.arange(8), 5, f"rule:{rule.name}:media_noise")[3]
+        assert rule.derive_random(ctx, "media_noise") == expected
+
+    def test_run_stream_follows_seed_config(self):
+        assert create_counter_rng(7, {"primary_seed": 7}) is None
+        assert create_counter_rng(7, {"rng_algorithm": "philox"}).seed == 7
+
+    def test_events_use_counter_stream(self):
+        rng = create_counter_rng(1234, {"rng_algorithm": "philox"}, num_agents=8)
+        agents = {f"agent-{i}": {} for i in range(8)}
+        ctx = ExecutionContext(run_id="run", current_tick=5, rng_seed=1234, agent_states=agents, rng=rng)
+
+        expected = rng.uniforms(np.arange(8), 5, "event:shock")
+        assert ctx.get_deterministic_random("shock", "agent-3") == expected[3]
+
+        # Whether the event fires is not agent 0's response draw
+        event_draws = [
+            ExecutionContext(run_id="run", current_tick=tick, rng_seed=1234,
+                             agent_states=agents, rng=rng).get_deterministic_random("shock")
+            for tick in range(200)
+        ]
+        agent_draws = [rng.uniform(0, tick, "event:shock") for tick in range(200)]
+        assert ctx.get_deterministic_random("shock") == rng.uniform(0, 5, "event:shock:global")
+        assert all(e != a for e, a in zip(event_draws, agent_draws))
+        assert abs(np.corrcoef(event_draws, agent_draws)[0, 1]) < 0.2
+
+        legacy = ExecutionContext(run_id="run", current_tick=5, rng_seed=1234)
+        assert legacy.get_deterministic_random("shock") != ctx.get_deterministic_random("shock")
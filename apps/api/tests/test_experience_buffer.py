@@ -0,0 +1,91 @@
+"""
+Prioritized Experience Replay Tests
+
+Verifies:
+- Sum tree totals and prefix-sum lookups match a linear scan
+- Prioritized sampling follows priority ** alpha
+- Priorities are tracked through add, add_batch wraparound and clear
+- Importance-sampling weights are normalized to a maximum of one
+"""
+
+import numpy as np
+import pytest
+
+from app.engine.marl.experience_buffer import ExperienceBuffer, SumTree
+
+
+def _fill(buffer: ExperienceBuffer, n: int) -> None:
+    buffer.add_batch(
+        states=np.zeros((n, buffer.state_dim)),
+        actions=np.zeros(n),
+        rewards=np.arange(n, dtype=np.float32),
+        next_states=np.zeros((n, buffer.state_dim)),
+        dones=np.zeros(n, dtype=bool),
+    )
+
+
+class TestSumTree:
+    def test_find_matches_linear_scan(self):
+        rng = np.random.default_rng(0)
+        tree = SumTree(37)
+        weights = rng.random(37)
+        tree.update(np.arange(37), weights)
+        targets = rng.random(200) * weights.sum()
+
+        expected = np.searchsorted(np.cumsum(weights), targets, side="right")
+
+        assert tree.total == pytest.approx(weights.sum())
+        np.testing.assert_array_equal(tree.find(targets), expected)
+
+    def test_update_with_repeated_indices(self):
+        tree = SumTree(8)
+        tree.update(np.arange(8), np.ones(8))
+        tree.update(np.array([3, 3, 5]), np.array([2.0, 4.0, 0.0]))
+
+        assert tree.total == pytest.approx(6 + 4)
+        np.testing.assert_array_equal(tree.get([3, 5]), [4.0, 0.0])
+
+    def test_single_leaf(self):
+        tree = SumTree(1)
+        tree.update(np.array([0]), np.array([0.5]))
+
+        assert tree.total == 0.5
+        np.testing.assert_array_equal(tree.find([0.1, 0.4]), [0, 0])
+
+
+class TestPrioritizedBuffer:
+    def test_sampling_follows_priorities(self):
+        np.random.seed(0)
+        buffer = ExperienceBuffer(capacity=64, state_dim=2, prioritized=True, priority_alpha=1.0)
+        _fill(buffer, 4)
+        buffer.update_priorities(np.arange(4), np.array([1.0, 2.0, 3.0, 4.0]), epsilon=0.0)
+
+        counts = np.zeros(4)
+        for _ in range(500):
+            counts += np.bincount(buffer.sample(8)["indices"], minlength=4)
+
+        np.testing.assert_allclose(counts / counts.sum(), [0.1, 0.2, 0.3, 0.4], atol=0.02)
+
+    def test_weights_and_batch_contents(self):
+        buffer = ExperienceBuffer(capacity=16, state_dim=2, prioritized=True)
+        _fill(buffer, 10)
+        buffer.update_priorities(np.array([0, 9]), np.array([5.0, 0.1]))
+
+        batch = buffer.sample(6)
+
+        assert batch["weights"].max() == pytest.approx(1.0)
+        assert np.all(batch["indices"] < 10)
+        np.testing.assert_array_equal(batch["rewards"], batch["indices"].astype(np.float32))
+
+    def test_wraparound_and_clear_keep_tree_in_sync(self):
+        buffer = ExperienceBuffer(capacity=8, state_dim=2, prioritized=True, priority_alpha=0.5)
+        _fill(buffer, 6)
+        buffer.update_priorities(np.arange(6), np.full(6, 3.0), epsilon=0.0)
+        _fill(buffer, 5)  # Wraps around to overwrite 6, 7, 0, 1, 2
+
+        expected = buffer.priorities.astype(np.float64) ** 0.5
+        assert buffer.priorities[:3].tolist() == [3.0] * 3
+        assert buffer.priority_tree.total == pytest.approx(expected.sum())
+
+        buffer.clear()
+        assert buffer.priority_tree.total == 0.0
@@ -0,0 +1,158 @@
+"""
+Global Sensitivity Analysis Tests
+
+Verifies:
+- Morris and Saltelli designs change one variable per pair
+- Sobol indices match the analytic values of an additive model
+- Morris screening ranks variables and flags interactions
+- Designs are evaluated once; repeated points come from the cache
+- Process-pool evaluation matches serial evaluation; failed runs are skipped
+- The one-at-a-time scan is unchanged
+
+Reference: project.md §11 Phase 7
+"""
+
+import numpy as np
+import pytest
+
+from app.services.reliability import (
+    ProcessPoolRunExecutor,
+    SensitivityMethod,
+    SensitivityScanner,
+    VariableBound,
+)
+from app.services.reliability.global_sensitivity import (
+    morris_design,
+    saltelli_design,
+)
+
+
+def additive_model(params: dict) -> dict:
+    share = 4 * params["x1"] + 2 * params["x2"]
+    return {"share": share, "turnout": 0.6}
+
+
+def interacting_model(params: dict) -> dict:
+    return {"share": params["x1"] * params["x2"] + 0.1 * params["x3"]}
+
+
+def flaky_model(params: dict) -> dict:
+    if params["x2"] > 0.95:
+        raise RuntimeError("diverged")
+    return additive_model(params)
+
+
+def _variables(*names: str) -> dict:
+    return {name: VariableBound(name, 0.5, 0.0, 1.0) for name in names}
+
+
+class TestDesigns:
+    @pytest.mark.parametrize("design", [
+        morris_design(5, 6, 4, np.random.default_rng(0)),
+        saltelli_design(5, 16, np.random.default_rng(0)),
+    ])
+    def test_pairs_change_one_variable(self, design):
+        diff = design.points[design.after_rows] - design.points[design.before_rows]
+        changed = np.abs(diff) > 0
+        others = changed.copy()
+        others[np.arange(len(diff)), design.variables] = False
+
+        assert not others.any()
+        assert design.points.min() >= 0 and design.points.max() <= 1
+
+    def test_morris_trajectory_moves_every_variable_once(self):
+        design = morris_design(4, 3, 4, np.random.default_rng(1))
+
+        assert design.n_points == 3 * 5
+        for trajectory in design.variables.reshape(3, 4):
+            assert sorted(trajectory) == [0, 1, 2, 3]
+
+
+class TestSobol:
+    def test_additive_model_indices(self):
+        scanner = SensitivityScanner(method=SensitivityMethod.SOBOL, n_samples=1024)
+        report = scanner.scan(_variables("x1", "x2", "x3"), additive_model)
+
+        # Var(4 x1) : Var(2 x2) = 16 : 4
+        x1, x2, x3 = (report.global_indices[v] for v in ("x1", "x2", "x3"))
+        assert x1.first_order == pytest.approx(0.8, abs=0.05)
+        assert x1.total_order == pytest.approx(0.8, abs=0.05)
+        assert x2.total_order == pytest.approx(0.2, abs=0.05)
+        assert x3.first_order == 0.0 and x3.total_order == 0.0
+        assert report.impact_ranking == ["x1", "x2", "x3"]
+        assert report.variable_impacts["x1"].direction == "positive"
+        assert report.total_perturbations == 1024 * 5
+
+    def test_failed_runs_are_skipped(self):
+        scanner = SensitivityScanner(method=SensitivityMethod.SOBOL, n_samples=256)
+        report = scanner.scan(_variables("x1", "x2"), flaky_model)
+
+        assert report.global_indices["x1"].total_order == pytest.approx(0.8, abs=0.1)
+
+
+class TestMorris:
+    def test_screening_and_interactions(self):
+        scanner = SensitivityScanner(method=SensitivityMethod.MORRIS, n_trajectories=20)
+        report = scanner.scan(_variables("x1", "x2", "x3"), interacting_model)
+
+        x1, x3 = report.global_indices["x1"], report.global_indices["x3"]
+        assert report.impact_ranking[-1] == "x3"
+        assert x3.mu_star == pytest.approx(0.1)
+        assert x3.sigma == pytest.approx(0.0, abs=1e-12)
+        assert x1.sigma > 0.1 * x1.mu_star
+        assert not report.variable_impacts["x1"].is_linear
+        assert report.variable_impacts["x3"].is_linear
+
+
+class TestBatchEvaluation:
+    def test_cache_serves_repeated_points(self):
+        scanner = SensitivityScanner(method=SensitivityMethod.MORRIS, n_trajectories=10)
+        first = scanner.scan(_variables("x1", "x2"), additive_model)
+        second = scanner.scan(_variables("x1", "x2"), additive_model)
+
+        assert first.simulations_run + first.cache_hits == first.total_perturbations
+        assert first.simulations_run < first.total_perturbations
+        assert second.simulations_run == 0
+        assert second.cache_hits == second.total_perturbations
+
+    def test_cache_is_per_simulation_fn(self):
+        scanner = SensitivityScanner(method=SensitivityMethod.MORRIS, n_trajectories=10)
+        variables = _variables("x1", "x2", "x3")
+        additive = scanner.scan(variables, additive_model)
+        interacting = scanner.scan(variables, interacting_model)
+        fresh = SensitivityScanner(method=SensitivityMethod.MORRIS, n_trajectories=10).scan(
+            variables, interacting_model
+        )
+
+        assert interacting.simulations_run == additive.simulations_run
+        assert interacting.cache_hits == fresh.cache_hits
+        for name in variables:
+            assert interacting.global_indices[name].to_dict() == fresh.global_indices[name].to_dict()
+
+    def test_process_pool_matches_serial(self):
+        variables = _variables("x1", "x2", "x3")
+        serial = SensitivityScanner(method=SensitivityMethod.SOBOL, n_samples=32).scan(
+            variables, interacting_model
+        )
+        parallel = SensitivityScanner(
+            method=SensitivityMethod.SOBOL,
+            n_samples=32,
+            executor=ProcessPoolRunExecutor(max_workers=2, mp_context="fork"),
+        ).scan(variables, interacting_model)
+
+        for name in variables:
+            assert parallel.global_indices[name].to_dict() == serial.global_indices[name].to_dict()
+
+
+class TestOneAtATime:
+    def test_oat_scan(self):
+        scanner = SensitivityScanner()
+        report = scanner.scan(_variables("x1", "x2"), additive_model)
+
+        assert report.method == "oat" and not report.global_indices
+        assert report.total_perturbations == 4
+        assert report.simulations_run == 5
+        x1 = report.variable_impacts["x1"]
+        # share = 3 at baseline and x1 +/-10% moves it by 0.2; turnout is flat
+        assert x1.elasticity == pytest.approx(((0.2 / 3) / 0.1 + 0.0) / 2)
+        assert report.impact_ranking == ["x1", "x2"]
@@ -0,0 +1,131 @@
+"""
+MARL Simulation Environment Tests
+
+Verifies:
+- Array rewards match RewardFunction.compute_batch_rewards on dict states
+- SimulationEnv steps all agents with the loop's action effects and
+  resets to the start state at episode end
+- VectorSimulationEnv stacks worker-process copies along the agent axis
+  and matches the same copies run in-process
+
+Reference: project.md §4.1
+"""
+
+from functools import partial
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.engine.action_space import ActionSpace, RewardFunction
+from app.engine.behavioral_model import BehavioralModel
+from app.engine.marl.environment import EnvConfig, SimulationEnv, VectorSimulationEnv
+from app.engine.simulation_loop import SimulationConfig, SimulationLoop
+from app.engine.state_manager import StateManager
+
+PARTIES = ["a", "b", "c"]
+
+
+def make_env(num_agents: int = 20, episode_length: int = 3, seed: int = 0) -> SimulationEnv:
+    rng = np.random.default_rng(seed)
+    manager = StateManager(preference_dimensions=len(PARTIES), issue_dimensions=4)
+    manager.initialize(
+        agent_ids=[uuid4() for _ in range(num_agents)],
+        initial_preferences=rng.dirichlet(np.ones(len(PARTIES)), num_agents),
+        initial_issue_priorities=rng.random((num_agents, 4)),
+        initial_scalar_states=rng.random((num_agents, 7)),
+    )
+    loop = SimulationLoop(
+        config=SimulationConfig(total_steps=episode_length, event_probability_per_step=0.0),
+        state_manager=manager,
+        behavioral_model=BehavioralModel(),
+        action_space=ActionSpace.create_election_space(PARTIES),
+    )
+    return SimulationEnv(loop, EnvConfig(seed=seed))
+
+
+class TestArrayRewards:
+    def test_matches_dict_rewards(self):
+        rng = np.random.default_rng(1)
+        n = 50
+        space = ActionSpace.create_election_space(PARTIES)
+        reward_fn = RewardFunction()
+        actions = rng.integers(-1, space.n + 1, n)
+        preferences = rng.dirichlet(np.ones(3), n)
+        committed_before = rng.integers(-1, 3, n)
+        committed_after = np.where(rng.random(n) < 0.5, committed_before, rng.integers(-1, 3, n))
+        info_before, info_after = rng.random(n), rng.random(n)
+        support = rng.random(n)
+
+        rewards, _ = reward_fn.compute_batch_rewards_from_arrays(
+            actions, space,
+            {"committed_choice": committed_before, "information_level": info_before},
+            {"preferences": preferences, "committed_choice": committed_after,
+             "information_level": info_after},
+            {"peer_support": support},
+            option_names=PARTIES,
+        )
+
+        def as_dict(committed, info, prefs=None):
+            state = {"committed_choice": None if committed < 0 else int(committed),
+                     "information_level": info}
+            if prefs is not None:
+                state["preferences"] = dict(zip(PARTIES, prefs))
+            return state
+
+        expected = [
+            reward_fn.compute_batch_rewards(
+                actions[i:i + 1], space,
+                [as_dict(committed_before[i], info_before[i])],
+                [as_dict(committed_after[i], info_after[i], preferences[i])],
+                {"peer_support": support[i]},
+            )[0][0]
+            for i in range(n)
+        ]
+        np.testing.assert_allclose(rewards, expected)
+
+
+class TestSimulationEnv:
+    def test_step_and_episode_reset(self):
+        env = make_env()
+        obs = env.reset()
+        start = env.state_manager.preferences_matrix.copy()
+
+        assert obs.shape == (20, env.state_dim) == (20, 3 + 3 + 7 + 4)
+        np.testing.assert_array_equal(obs[:, :3], start.astype(np.float32))
+
+        votes = np.zeros(20, dtype=np.int64)  # Everyone votes "a"
+        next_obs, rewards, dones, info = env.step(votes)
+
+        assert rewards.shape == (20,) and not dones.any()
+        assert info["actions_taken"] == 20
+        assert np.all(env.state_manager.preferences_matrix[:, 0] >= start[:, 0])
+        assert env.state_manager.recent_rewards_buffer[:, -1].tolist() == pytest.approx(rewards.tolist())
+
+        env.step(votes)
+        reset_obs, _, dones, _ = env.step(votes)
+
+        assert dones.all()
+        np.testing.assert_array_equal(env.state_manager.preferences_matrix, start)
+        np.testing.assert_array_equal(reset_obs[:, :3], start.astype(np.float32))
+        assert env.episode_step == 0
+
+
+class TestVectorSimulationEnv:
+    def test_worker_processes_match_in_process(self):
+        env_fns = [partial(make_env, num_agents=10 + i, seed=i) for i in range(3)]
+        actions = np.random.default_rng(2).integers(0, 5, 33)
+
+        with VectorSimulationEnv(env_fns, mp_context="fork") as parallel:
+            assert parallel.num_agents == 33
+            parallel_obs = parallel.reset()
+            parallel_step = parallel.step(actions)
+
+        local = VectorSimulationEnv([lambda fn=fn: fn() for fn in env_fns])
+        local_obs = local.reset()
+        local_step = local.step(actions)
+
+        np.testing.assert_allclose(parallel_obs[:, :3], local_obs[:, :3])
+        np.testing.assert_allclose(parallel_step[1], local_step[1])
+        assert len(parallel_step[3]["envs"]) == 3
+        assert parallel_step[0].shape == (33, parallel.state_dim)
@@ -0,0 +1,109 @@
+"""
+Monte Carlo Replicate Tests
+
+Verifies:
+- Replicates are reproducible from (master seed, index) and independent
+  of each other
+- Every replicate starts from fresh initial state; the source loop is
+  never run or modified
+- Process-pool replicates match in-process replicates
+- Early stopping accepts a contiguous prefix once the CI target is met
+
+Reference: project.md §4.1
+"""
+
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.engine.action_space import ActionSpace
+from app.engine.behavioral_model import BehavioralModel
+from app.engine.monte_carlo import (
+    MonteCarloRunner,
+    confidence_interval_width,
+)
+from app.engine.simulation_loop import SimulationConfig, SimulationLoop
+from app.engine.state_manager import StateManager
+
+
+def _loop(n: int = 40, **config) -> SimulationLoop:
+    rng = np.random.default_rng(0)
+    manager = StateManager(preference_dimensions=3)
+    manager.initialize(
+        agent_ids=[uuid4() for _ in range(n)],
+        initial_preferences=rng.dirichlet(np.ones(3), size=n),
+        initial_issue_priorities=np.zeros((n, 10)),
+        initial_scalar_states=rng.uniform(size=(n, 7)),
+    )
+    return SimulationLoop(
+        config=SimulationConfig(total_steps=8, commitment_threshold=0.4, **config),
+        state_manager=manager,
+        behavioral_model=BehavioralModel(),
+        action_space=ActionSpace.create_election_space(["a", "b", "c"]),
+    )
+
+
+def _distributions(runner: MonteCarloRunner, num_runs: int):
+    async def collect():
+        return {r.index: r.final_distribution async for r in runner.stream(num_runs)}
+    return asyncio.run(collect())
+
+
+class TestReplicates:
+    def test_reproducible_per_index(self):
+        loop = _loop()
+        first = _distributions(MonteCarloRunner(loop, workers=1, seed=7), 4)
+        second = _distributions(MonteCarloRunner(loop, workers=1, seed=7), 3)
+
+        assert [first[i] for i in range(3)] == [second[i] for i in range(3)]
+        assert len({str(sorted(d.items())) for d in first.values()}) > 1
+
+    def test_source_loop_untouched(self):
+        loop = _loop()
+        preferences = loop.state_manager.preferences_matrix.copy()
+        global_state = np.random.get_state()[1].copy()
+
+        _distributions(MonteCarloRunner(loop, workers=1, seed=1), 2)
+
+        assert loop.current_step == 0 and not loop.step_results
+        assert (loop.state_manager.preferences_matrix == preferences).all()
+        assert (loop.state_manager.committed_choices == -1).all()
+        assert (np.random.get_state()[1] == global_state).all()
+
+    def test_process_pool_matches_in_process(self):
+        loop = _loop()
+        serial = _distributions(MonteCarloRunner(loop, workers=1, seed=3), 4)
+        parallel = _distributions(
+            MonteCarloRunner(loop, workers=2, seed=3, mp_context="fork"), 4
+        )
+
+        assert parallel == serial
+
+
+class TestAggregation:
+    def test_early_stop_on_ci_target(self):
+        runner = MonteCarloRunner(_loop(), workers=1, seed=5, ci_target=10.0, min_runs=3)
+        result = asyncio.run(runner.run(20))
+
+        assert runner.stopped_early
+        assert [r.index for r in runner.accepted] == [0, 1, 2]
+        assert len(result.monte_carlo_distributions) == 3
+        for key, (low, high) in result.confidence_intervals.items():
+            if key in result.monte_carlo_mean:
+                assert 0 <= low <= result.monte_carlo_mean[key] <= high <= 1
+
+    def test_run_monte_carlo_uses_config(self):
+        loop = _loop(random_seed=11, monte_carlo_workers=1)
+        result = asyncio.run(loop.run_monte_carlo(3))
+
+        expected = _distributions(MonteCarloRunner(loop, workers=1, seed=11), 3)
+        assert result.monte_carlo_distributions == [expected[i] for i in range(3)]
+
+    def test_confidence_interval_width(self):
+        distributions = [{0: 0.4, 1: 0.6}, {0: 0.5, 1: 0.5}, {0: 0.6, 1: 0.4}]
+        expected = 2 * 1.96 * np.std([0.4, 0.5, 0.6], ddof=1) / np.sqrt(3)
+
+        assert confidence_interval_width(distributions) == pytest.approx(expected)
+        assert confidence_interval_width(distributions[:1]) == float("inf")
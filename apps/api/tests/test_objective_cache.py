@@ -0,0 +1,139 @@
+"""
+Objective Cache Tests
+
+Verifies:
+- Keys ignore parameter order and numeric type but not seed or ruleset
+- LRU eviction and hit-rate accounting
+- Per-node persistence across cache instances
+- Calibrator and BoundedAutoTune skip repeated simulations
+
+Reference: project.md §11 Phase 7
+"""
+
+import numpy as np
+import pytest
+
+from app.engine.calibration import ObjectiveCache, evaluation_key
+from app.engine.calibration.calibrator import (
+    CalibrationConfig,
+    CalibrationMethod,
+    Calibrator,
+    GroundTruth,
+)
+from app.services.reliability.auto_tune import BoundedAutoTune, ParameterBound, TuneConfig
+
+
+class CountingRunner:
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, params):
+        self.calls += 1
+        return self.fn(params)
+
+
+class TestEvaluationKey:
+    def test_canonical_params(self):
+        key = evaluation_key({"a": 1, "b": np.float64(0.5)}, seed=3, ruleset_hash="r1")
+
+        assert key == evaluation_key({"b": 0.5, "a": 1.0}, seed=3, ruleset_hash="r1")
+        assert key != evaluation_key({"a": 1, "b": 0.5}, seed=4, ruleset_hash="r1")
+        assert key != evaluation_key({"a": 1, "b": 0.5}, seed=3, ruleset_hash="r2")
+        assert key != evaluation_key({"a": 1, "b": 0.501}, seed=3, ruleset_hash="r1")
+
+
+class TestObjectiveCache:
+    def test_lru_eviction_and_hit_rate(self):
+        cache = ObjectiveCache(max_entries=2)
+        cache.put({"x": 1}, 0.1)
+        cache.put({"x": 2}, 0.2)
+        assert cache.get({"x": 1}) == 0.1  # x=2 is now least recently used
+        cache.put({"x": 3}, 0.3)
+
+        assert cache.get({"x": 2}) is None
+        assert cache.get({"x": 3}) == 0.3
+        assert len(cache) == 2
+        assert cache.get_stats()["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_returns_copies(self):
+        cache = ObjectiveCache()
+        cache.put({"x": 1}, {"a": 0.5})
+        cache.get({"x": 1})["a"] = 0.0
+
+        assert cache.get({"x": 1}) == {"a": 0.5}
+
+    def test_node_cache_persists(self, tmp_path):
+        cache = ObjectiveCache.for_node("node-1", tmp_path)
+        cache.put({"x": 1}, {"a": 0.5}, seed=7)
+        cache.save()
+
+        reloaded = ObjectiveCache.for_node("node-1", tmp_path)
+        other_node = ObjectiveCache.for_node("node-2", tmp_path)
+
+        assert reloaded.get({"x": 1}, seed=7) == {"a": 0.5}
+        assert other_node.get({"x": 1}, seed=7) is None
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text("not json")
+
+        assert len(ObjectiveCache(path=path)) == 0
+
+
+class TestCalibratorCache:
+    def _calibrator(self, runner, cache=None):
+        config = CalibrationConfig(
+            method=CalibrationMethod.BAYESIAN,
+            max_iterations=4,
+            parameter_bounds={"share": (0.0, 1.0)},
+            n_parallel_evaluations=1,
+        )
+        return Calibrator(config, runner, cache=cache, ruleset_hash="rules-v1")
+
+    def test_repeated_points_are_served_from_cache(self, tmp_path):
+        truth = GroundTruth(category_distributions={"a": 0.6, "b": 0.4})
+        runner = CountingRunner(lambda p: {"a": p["share"], "b": 1 - p["share"]})
+        params = {"share": 0.6}
+
+        calibrator = self._calibrator(runner, ObjectiveCache.for_node("n1", tmp_path))
+        first = calibrator._compute_objective(params, truth)
+        second = calibrator._compute_objective(dict(params), truth)
+
+        assert first == second and runner.calls == 1
+        assert calibrator.get_progress()["cache"]["hit_rate"] == 0.5
+
+        calibrator.cache.save()
+        next_job = self._calibrator(runner, ObjectiveCache.for_node("n1", tmp_path))
+        next_job._compute_objective(params, truth)
+        assert runner.calls == 1
+
+    def test_failed_simulations_are_not_cached(self):
+        truth = GroundTruth(category_distributions={"a": 0.6, "b": 0.4})
+
+        def failing(params):
+            raise RuntimeError("diverged")
+
+        calibrator = self._calibrator(failing)
+
+        assert calibrator._compute_objective({"share": 0.5}, truth) == 0.0
+        assert len(calibrator.cache) == 0
+
+
+class TestAutoTuneCache:
+    def test_gradient_base_point_and_folds_hit_cache(self):
+        runner = CountingRunner(lambda p: 0.5 - (p["w"] - 0.7) ** 2)
+        config = TuneConfig(
+            tunable_parameters=["w"],
+            bounds={"w": ParameterBound("w", 0.0, 1.0, 0.5)},
+            max_iterations=5,
+            convergence_threshold=0.0,
+            n_folds=3,
+        )
+        tuner = BoundedAutoTune(config, runner)
+
+        result = tuner.tune({"w": 0.5}, scenario_ids=[f"s{i}" for i in range(6)])
+
+        # Per iteration: one perturbed point and one new point; everything else repeats
+        assert runner.calls == 1 + 2 * result.n_iterations
+        assert tuner.get_tuning_summary()["cache"]["hits"] > 0
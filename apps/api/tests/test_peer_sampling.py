@@ -0,0 +1,181 @@
+"""
+Vectorized Peer Sampling Tests
+
+Verifies:
+- NeighborIndex samples distinct neighbours with their edge weights
+- Random peer sampling never returns the agent itself or repeats a peer
+- initialize_from_agents indexes SimulationAgent social_network connections
+- SimulationLoop decision context uses the network for peer choices
+- Opt-in multi-hop network influence follows influence_radius and influence_decay
+
+Reference: project.md §4.1
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.engine.action_space import ActionSpace
+from app.engine.behavioral_model import BehavioralModel
+from app.engine.simulation_loop import SimulationConfig, SimulationLoop
+from app.engine.state_manager import (
+    DEFAULT_PEER_WEIGHT,
+    NeighborIndex,
+    StateManager,
+    sample_random_peers,
+)
+
+
+def _ring_adjacency(n: int, degree: int):
+    return {
+        i: [((i + d) % n, 0.1 * d) for d in range(1, degree + 1)]
+        for i in range(n)
+    }
+
+
+class TestNeighborIndex:
+    def test_samples_distinct_neighbours_with_weights(self):
+        np.random.seed(0)
+        adjacency = _ring_adjacency(50, 6)
+        adjacency[7] = []  # Isolated agent
+        index = NeighborIndex.from_adjacency(adjacency, 50)
+
+        peers, weights = index.sample(4)
+
+        assert peers.shape == weights.shape == (50, 4)
+        assert (peers[7] == -1).all() and (weights[7] == 0).all()
+        for i in range(50):
+            if i == 7:
+                continue
+            assert len(set(peers[i].tolist())) == 4
+            for peer, weight in zip(peers[i].tolist(), weights[i].tolist()):
+                offset = (peer - i) % 50
+                assert 1 <= offset <= 6
+                assert weight == pytest.approx(0.1 * offset)
+
+    def test_low_degree_rows_are_padded(self):
+        index = NeighborIndex.from_adjacency({0: [(1, 0.5)], 1: [(0, 0.5), (2, 0.2)]}, 3)
+        peers, _ = index.sample(3)
+
+        assert peers[0].tolist() == [1, -1, -1]
+        assert sorted(peers[1].tolist()) == [-1, 0, 2]
+        assert peers[2].tolist() == [-1, -1, -1]
+
+
+class TestRandomPeers:
+    @pytest.mark.parametrize("num_agents,num_peers", [(500, 10), (12, 10), (5, 10)])
+    def test_distinct_and_excludes_self(self, num_agents, num_peers):
+        np.random.seed(1)
+        peers = sample_random_peers(num_agents, num_peers)
+
+        assert peers.shape == (num_agents, min(num_peers, num_agents - 1))
+        for i, row in enumerate(peers.tolist()):
+            assert i not in row
+            assert len(set(row)) == len(row)
+
+
+class TestStateManagerNetwork:
+    def test_initialize_from_agents_indexes_connections(self):
+        ids = [uuid4() for _ in range(4)]
+        agents = [
+            SimpleNamespace(
+                id=agent_id,
+                state_vector={},
+                commitment_strength=0.0,
+                social_network={
+                    "connections": [str(ids[(i + 1) % 4]), str(uuid4())],
+                    "influence_weights": {str(ids[(i + 1) % 4]): 0.4},
+                },
+                region_id=None,
+                demographics={},
+            )
+            for i, agent_id in enumerate(ids)
+        ]
+        manager = StateManager()
+        manager.initialize_from_agents(agents)
+
+        assert manager.network_adjacency[2] == [(3, 0.4)]
+        peers, weights = manager.sample_peers(2)
+        assert peers[:, 0].tolist() == [1, 2, 3, 0]
+        assert weights[:, 0].tolist() == [0.4] * 4
+        assert (peers[:, 1] == -1).all()
+
+    def test_without_network_samples_all_agents(self):
+        manager = StateManager()
+        manager.initialize(
+            agent_ids=[uuid4() for _ in range(30)],
+            initial_preferences=np.full((30, 10), 0.1),
+            initial_issue_priorities=np.zeros((30, 10)),
+            initial_scalar_states=np.full((30, 7), 0.5),
+        )
+        peers, weights = manager.sample_peers(10)
+
+        assert (peers >= 0).all()
+        assert (weights == DEFAULT_PEER_WEIGHT).all()
+
+
+class TestDecisionContext:
+    def test_peer_choices_follow_network(self):
+        n = 40
+        manager = StateManager(preference_dimensions=3)
+        manager.initialize(
+            agent_ids=[uuid4() for _ in range(n)],
+            initial_preferences=np.full((n, 3), 1 / 3),
+            initial_issue_priorities=np.zeros((n, 10)),
+            initial_scalar_states=np.full((n, 7), 0.5),
+        )
+        manager.set_network_adjacency(_ring_adjacency(n, 2))
+        manager.committed_choices[:] = np.arange(n) % 3
+
+        loop = SimulationLoop(
+            config=SimulationConfig(total_steps=1),
+            state_manager=manager,
+            behavioral_model=BehavioralModel(),
+            action_space=ActionSpace.create_election_space(["a", "b", "c"]),
+        )
+        context = loop._build_decision_context(step=0)
+
+        assert context["peer_choices"].shape == context["social_weights"].shape == (n, 10)
+        for i in range(n):
+            expected = sorted([(i + 1) % n % 3, (i + 2) % n % 3])
+            assert sorted(context["peer_choices"][i, :2].tolist()) == expected
+            assert (context["peer_choices"][i, 2:] == -1).all()
+            assert sorted(context["social_weights"][i, :2].tolist()) == pytest.approx([0.1, 0.2])
+
+    @pytest.mark.parametrize("radius,decay", [(1, 0.5), (2, 0.5), (3, 0.25)])
+    def test_network_influence_spans_radius(self, radius, decay):
+        # Chain 0 -> 1 -> 2 -> 3; agent 4 is isolated
+        n = 5
+        manager = StateManager(preference_dimensions=2)
+        preferences = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+        manager.initialize(
+            agent_ids=[uuid4() for _ in range(n)],
+            initial_preferences=preferences,
+            initial_issue_priorities=np.zeros((n, 10)),
+            initial_scalar_states=np.full((n, 7), 0.5),
+        )
+        manager.set_network_adjacency({0: [(1, 1.0)], 1: [(2, 1.0)], 2: [(3, 1.0)]})
+        config = SimulationConfig(total_steps=1, influence_radius=radius, influence_decay=decay)
+        loop = SimulationLoop(
+            config=config,
+            state_manager=manager,
+            behavioral_model=BehavioralModel(),
+            action_space=ActionSpace.create_election_space(["a", "b"]),
+        )
+
+        # Off unless network_influence_scale is set
+        assert loop._apply_network_influence(preferences, np.full(n, 0.5)) is preferences
+
+        config.network_influence_scale = 0.5
+        influenced = loop._apply_network_influence(preferences, np.full(n, 0.5))
+
+        # Agent 0 reaches agents 1, 2, 3 at hops 1, 2, 3
+        hops = [preferences[1], preferences[2], preferences[3]][:radius]
+        weights = [decay ** h for h in range(radius)]
+        expected_influence = sum(w * p for w, p in zip(weights, hops)) / sum(weights)
+        pull = 0.5 * config.network_influence_scale
+        assert influenced[0] == pytest.approx(preferences[0] + pull * (expected_influence - preferences[0]))
+        assert influenced[3].tolist() == preferences[3].tolist()
+        assert influenced[4].tolist() == preferences[4].tolist()
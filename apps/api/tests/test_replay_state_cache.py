@@ -0,0 +1,240 @@
+"""
+Incremental Replay Reconstruction Tests
+
+Verifies:
+- Seeks play forward from the nearest reconstructed tick after the keyframe
+- Incremental and from-scratch reconstruction produce identical states
+- play() applies one tick's deltas per step
+- Reconstructed states are kept in a size-bounded LRU cache
+- Applying a delta leaves the previous state untouched
+- The variable panel serves partial history when telemetry reads fail
+
+Reference: project.md §11 Phase 8
+"""
+
+import logging
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import replay
+from app.services.replay_loader import (
+    AGENT_STATE_BYTES,
+    AgentReplayState,
+    DeterministicReplayLoader,
+    EnvironmentReplayState,
+    ReplayStateCache,
+    WorldReplayState,
+)
+from app.services.storage import StorageError
+from app.services.telemetry import TelemetryBlob, TelemetryDelta, TelemetryKeyframe
+from tests.telemetry_helpers import make_blob
+
+TICKS = 100
+KEYFRAME_TICKS = [0, 50, 75]
+AGENTS = [f"agent-{i}" for i in range(10)]
+
+
+class CountingLoader(DeterministicReplayLoader):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.applied = 0
+
+    def _apply_delta(self, state, delta):
+        self.applied += 1
+        return super()._apply_delta(state, delta)
+
+
+def _blob() -> TelemetryBlob:
+    keyframes = [
+        TelemetryKeyframe(
+            tick=tick,
+            timestamp=f"t{tick}",
+            agent_states={aid: {"agent_id": aid, "stance": -tick / TICKS} for aid in AGENTS},
+            metrics={"keyframe": tick},
+        )
+        for tick in KEYFRAME_TICKS
+    ]
+    deltas = [
+        TelemetryDelta(
+            tick=tick,
+            agent_updates=[{"agent_id": AGENTS[tick % len(AGENTS)], "stance": tick / TICKS}],
+            events_triggered=["shock"] if tick % 30 == 0 else [],
+            metrics={"adoption": tick / TICKS},
+        )
+        for tick in range(TICKS)
+    ]
+    return make_blob(TICKS, keyframes, deltas)
+
+
+def _comparable(state) -> dict:
+    data = state.to_dict()
+    data.pop("timestamp")
+    return data
+
+
+def _state(tick: int, agents: int = 0) -> WorldReplayState:
+    return WorldReplayState(
+        tick=tick,
+        timestamp="",
+        agents={
+            f"a{i}": AgentReplayState.from_dict({"agent_id": f"a{i}"}, tick) for i in range(agents)
+        },
+        environment=EnvironmentReplayState(tick=tick, variables={}, active_events=[], metrics={}),
+        event_log=[],
+    )
+
+
+@pytest.fixture
+async def ref_and_telemetry(telemetry):
+    ref = await telemetry.storage.store_telemetry("tenant", "run-1", _blob().to_dict())
+    return ref, telemetry
+
+
+async def _loader(ref_and_telemetry, **kwargs) -> CountingLoader:
+    ref, telemetry = ref_and_telemetry
+    loader = CountingLoader(telemetry, **kwargs)
+    await loader.load(ref, preload_ticks=0)
+    return loader
+
+
+async def _from_scratch(ref_and_telemetry, tick: int):
+    loader = await _loader(ref_and_telemetry)
+    return await loader.get_state_at_tick(tick)
+
+
+class TestIncrementalReconstruction:
+    async def test_seek_reuses_nearest_reconstructed_tick(self, ref_and_telemetry):
+        loader = await _loader(ref_and_telemetry)
+
+        await loader.get_state_at_tick(60)
+        assert loader.applied == 10  # Deltas 51..60 after keyframe 50
+
+        state = await loader.get_state_at_tick(70)
+        assert loader.applied == 20  # Only deltas 61..70
+        assert _comparable(state) == _comparable(await _from_scratch(ref_and_telemetry, 70))
+
+    async def test_seek_past_keyframe_restarts_from_keyframe(self, ref_and_telemetry):
+        loader = await _loader(ref_and_telemetry)
+        await loader.get_state_at_tick(70)
+
+        state = await loader.get_state_at_tick(80)
+
+        assert loader.applied == 20 + 5
+        assert state.agents["agent-1"].stance == -0.75
+        assert _comparable(state) == _comparable(await _from_scratch(ref_and_telemetry, 80))
+
+    async def test_play_matches_from_scratch(self, ref_and_telemetry):
+        loader = await _loader(ref_and_telemetry)
+        loader.PLAY_WINDOW = 7
+
+        played = [(tick, _comparable(state)) async for tick, state in loader.play(45, 85)]
+
+        assert [tick for tick, _ in played] == list(range(45, 86))
+        # 45 from keyframe 0 (45 deltas), then one delta per tick except keyframes 50 and 75
+        assert loader.applied == 45 + 40 - 2
+        for tick in (45, 49, 50, 51, 74, 75, 85):
+            assert played[tick - 45][1] == _comparable(await _from_scratch(ref_and_telemetry, tick))
+
+    async def test_preload_plays_forward(self, ref_and_telemetry):
+        ref, telemetry = ref_and_telemetry
+        loader = CountingLoader(telemetry)
+
+        await loader.load(ref, preload_ticks=30)
+
+        assert loader.applied == 29
+        assert len(loader.state_cache) == 30
+
+    async def test_delta_does_not_mutate_previous_state(self, ref_and_telemetry):
+        loader = await _loader(ref_and_telemetry)
+        before = await loader.get_state_at_tick(51)
+        snapshot = _comparable(before)
+
+        after = await loader.get_state_at_tick(52)
+
+        assert _comparable(before) == snapshot
+        assert after.agents["agent-2"] is not before.agents["agent-2"]
+        assert after.agents["agent-3"] is before.agents["agent-3"]
+
+
+class TestStateCacheBounds:
+    async def test_loader_cache_is_bounded(self, ref_and_telemetry):
+        max_bytes = 5 * AGENT_STATE_BYTES * (len(AGENTS) + 1)
+        loader = await _loader(ref_and_telemetry, state_cache_bytes=max_bytes)
+
+        async for _ in loader.play(0, 40):
+            pass
+
+        assert len(loader.state_cache) == 5
+        assert loader.state_cache.current_bytes <= max_bytes
+        assert loader.state_cache.evictions == 36
+        # Seeks still continue from the latest cached tick
+        applied = loader.applied
+        await loader.get_state_at_tick(45)
+        assert loader.applied == applied + 5
+
+    def test_lru_order_and_nearest_lookup(self):
+        cache = ReplayStateCache(max_bytes=3 * AGENT_STATE_BYTES)
+        states = {}
+        for tick in (10, 20, 30):
+            states[tick] = _state(tick)
+            cache.put(tick, states[tick])
+
+        assert cache.get(10) is states[10]  # 20 is now least recently used
+        cache.put(40, _state(40))
+
+        assert 20 not in cache and len(cache) == 3
+        assert cache.nearest_before(25, floor=0)[0] == 10
+        assert cache.nearest_before(35, floor=31) is None
+        assert cache.nearest_before(45, floor=0)[0] == 40
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_oversized_state_is_not_cached(self):
+        cache = ReplayStateCache(max_bytes=AGENT_STATE_BYTES)
+        cache.put(1, _state(1, agents=3))
+
+        assert len(cache) == 0 and cache.current_bytes == 0
+
+
+
+class FailingPlaybackLoader:
+    """Replay loader whose playback fails after two ticks."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+    async def load_from_ref_dict(self, ref, preload_ticks=0):
+        pass
+
+    async def get_state_at_tick(self, tick):
+        state = _state(tick)
+        state.environment.variables = {"price": tick}
+        return state
+
+    async def play(self, start_tick, end_tick):
+        for tick in (start_tick, start_tick + 1):
+            yield tick, await self.get_state_at_tick(tick)
+        raise self.error
+
+
+class TestVariablePanel:
+    async def _panel(self, monkeypatch, error: Exception):
+        monkeypatch.setattr(replay, "create_replay_loader", lambda: FailingPlaybackLoader(error))
+        request = replay.SceneControlRequest(run_id="run-1", current_tick=10, storage_ref={})
+        return await replay.show_variable_panel(
+            request, tick_history=5, current_user=None, tenant_id="tenant", db=None,
+        )
+
+    async def test_read_failure_serves_partial_history(self, monkeypatch, caplog):
+        with caplog.at_level(logging.WARNING):
+            panel = await self._panel(monkeypatch, StorageError("segment unreadable"))
+
+        assert panel.variables == {"price": 10}
+        assert panel.variable_history == {"price": [{"tick": 5, "value": 5}, {"tick": 6, "value": 6}]}
+        assert "segment unreadable" in caplog.text
+
+    async def test_unexpected_errors_are_not_swallowed(self, monkeypatch):
+        with pytest.raises(HTTPException) as exc_info:
+            await self._panel(monkeypatch, TypeError("bad delta"))
+
+        assert exc_info.value.status_code == 500
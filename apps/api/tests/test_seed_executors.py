@@ -0,0 +1,224 @@
+"""
+Reliability Run Executor Tests
+
+Verifies:
+- SimulationSpec resolves module-level functions by import path
+- Process-pool seed runs match serial runs; slow seeds time out
+- Hung runs are stopped at the timeout and their workers terminated
+- Unpicklable closures fall back to threads instead of failing
+- Worker availability checks daemonic processes and picklability
+- Incremental stability analysis matches population statistics
+- Historical scenarios keep their order when run through an executor
+
+Reference: project.md §11 Phase 7
+"""
+
+import multiprocessing
+import time
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.services.reliability import (
+    HistoricalDataset,
+    HistoricalScenario,
+    HistoricalScenarioRunner,
+    MultiSeedRunner,
+    ProcessPoolRunExecutor,
+    SerialExecutor,
+    SimulationSpec,
+    StabilityAnalyzer,
+    ThreadPoolRunExecutor,
+    TimeCutoff,
+)
+from app.engine.workers import worker_processes_unavailable
+from app.services.reliability.stability import SeedRunResult
+
+
+def seeded_outcomes(seed: int, categories: int = 3) -> dict:
+    rng = np.random.default_rng(seed)
+    shares = rng.dirichlet(np.ones(categories))
+    return {f"c{i}": float(share) for i, share in enumerate(shares)}
+
+
+def slow_outcomes(seed: int) -> dict:
+    if seed == 2:
+        time.sleep(5)
+    return seeded_outcomes(seed)
+
+
+def hung_outcomes(seed: int) -> dict:
+    if seed == 1:
+        time.sleep(600)
+    time.sleep(0.3)
+    return seeded_outcomes(seed)
+
+
+def scenario_predictions(params: dict) -> dict:
+    return {"a": params["share"], "b": 1 - params["share"]}
+
+
+def _scenario(i: int) -> HistoricalScenario:
+    return HistoricalScenario(
+        scenario_id=f"s{i}",
+        name=f"scenario {i}",
+        description="",
+        dataset=HistoricalDataset(
+            dataset_id=f"d{i}",
+            name="dataset",
+            outcomes={"a": 0.5, "b": 0.5},
+            outcome_date=date(2024, 1, 1),
+            prediction_date=date(2023, 12, 1),
+        ),
+        initial_state={},
+        time_cutoff=TimeCutoff(cutoff_date=date(2023, 12, 1)),
+        simulation_params={"share": 0.1 * (i + 1)},
+    )
+
+
+class TestExecutors:
+    def test_simulation_spec(self):
+        spec = SimulationSpec(f"{__name__}:seeded_outcomes", {"categories": 4})
+
+        assert spec(5) == seeded_outcomes(5, categories=4)
+        with pytest.raises(ValueError):
+            SimulationSpec("no_function_here").resolve()
+
+    def test_process_pool_matches_serial(self):
+        seeds = list(range(6))
+        spec = SimulationSpec(f"{__name__}:seeded_outcomes")
+        serial = MultiSeedRunner().run_with_seeds(spec, seeds, parallel=False)
+        parallel = MultiSeedRunner(
+            executor=ProcessPoolRunExecutor(max_workers=2, mp_context="fork"),
+        ).run_with_seeds(spec, seeds)
+
+        assert [r.seed for r in parallel] == seeds
+        assert [r.outcomes for r in parallel] == [r.outcomes for r in serial]
+        assert all(r.success for r in parallel)
+
+    def test_per_seed_timeout(self):
+        runner = MultiSeedRunner(
+            executor=ProcessPoolRunExecutor(max_workers=2, mp_context="fork"),
+            timeout_seconds=1.0,
+        )
+        start = time.perf_counter()
+        results = runner.run_with_seeds(slow_outcomes, [0, 1, 2, 3])
+
+        assert time.perf_counter() - start < 4
+        failed = [r for r in results if not r.success]
+        assert [r.seed for r in failed] == [2]
+        assert "timeout" in failed[0].error
+
+    def test_hung_run_is_terminated(self):
+        executor = ProcessPoolRunExecutor(max_workers=2, mp_context="fork")
+        start = time.perf_counter()
+        outcomes = sorted(
+            executor.map_unordered(hung_outcomes, [0, 1, 2, 3, 4], timeout=1.0),
+            key=lambda outcome: outcome.index,
+        )
+
+        assert time.perf_counter() - start < 10
+        assert [o.timed_out for o in outcomes] == [False, True, False, False, False]
+        assert [o.value for o in outcomes if o.success] == [seeded_outcomes(s) for s in (0, 2, 3, 4)]
+        assert multiprocessing.active_children() == []
+
+    def test_closure_falls_back_to_threads(self):
+        offset = 0.25
+        results = MultiSeedRunner(
+            executor=ProcessPoolRunExecutor(max_workers=2),
+        ).run_with_seeds(lambda seed: {"x": seed + offset}, [1, 2, 3])
+
+        assert [r.outcomes for r in results] == [{"x": 1.25}, {"x": 2.25}, {"x": 3.25}]
+
+    def test_worker_availability_check(self, monkeypatch, caplog):
+        assert worker_processes_unavailable("using threads", simulation_function=seeded_outcomes) is None
+
+        reason = worker_processes_unavailable("using threads", simulation_function=lambda seed: seed)
+        assert reason.startswith("simulation function is not picklable")
+        assert "using threads" in caplog.text
+
+        monkeypatch.setattr(multiprocessing.current_process(), "daemon", True, raising=False)
+        assert "daemonic" in worker_processes_unavailable("in-process")
+
+    def test_thread_pool_reports_errors(self):
+        def flaky(seed):
+            if seed == 1:
+                raise RuntimeError("boom")
+            return {"x": 1.0}
+
+        outcomes = list(ThreadPoolRunExecutor(2).map_unordered(flaky, [0, 1, 2]))
+
+        assert sorted(o.index for o in outcomes) == [0, 1, 2]
+        assert [o.error for o in outcomes if not o.success] == ["boom"]
+
+
+class TestIncrementalStability:
+    def test_stream_matches_population_statistics(self):
+        seeds = list(range(8))
+        results = [
+            SeedRunResult(seed=s, outcomes=seeded_outcomes(s), metrics={},
+                          duration_seconds=0.1, success=True)
+            for s in seeds
+        ]
+        results.append(SeedRunResult(seed=99, outcomes={}, metrics={},
+                                     duration_seconds=0.0, success=False, error="x"))
+        updates = []
+
+        report = StabilityAnalyzer().analyze_stream(iter(results), on_update=updates.append)
+
+        assert len(updates) == len(results)
+        assert updates[2].successful_runs == 3
+        assert report.successful_runs == 8 and report.failed_runs == 1
+        for category, variance in report.outcome_variances.items():
+            values = np.array([r.outcomes[category] for r in results[:8]])
+            assert variance.mean == pytest.approx(values.mean())
+            assert variance.variance == pytest.approx(values.var())
+            assert variance.std == pytest.approx(values.std())
+            assert variance.range == pytest.approx(values.max() - values.min())
+
+    def test_analyze_consumes_runner_iterator(self):
+        runner = MultiSeedRunner(n_seeds=4)
+        report = StabilityAnalyzer().analyze_stream(
+            runner.iter_with_seeds(seeded_outcomes, parallel=False),
+            base_seed=runner.base_seed,
+        )
+
+        assert sorted(report.seeds_used) == sorted(runner.generate_seeds())
+
+
+class TestHistoricalScenarios:
+    def test_executor_preserves_scenario_order(self):
+        scenarios = [_scenario(i) for i in range(4)]
+        serial = HistoricalScenarioRunner(scenario_predictions).run_multiple_scenarios(scenarios)
+        runner = HistoricalScenarioRunner(scenario_predictions)
+        parallel = runner.run_multiple_scenarios(
+            scenarios,
+            executor=ProcessPoolRunExecutor(max_workers=2, mp_context="fork"),
+        )
+
+        assert [r.scenario_id for r in parallel] == ["s0", "s1", "s2", "s3"]
+        assert [r.predictions for r in parallel] == [r.predictions for r in serial]
+        assert [r.accuracy for r in parallel] == [r.accuracy for r in serial]
+        assert len(runner.run_history) == 4
+
+    def test_seeds_must_match_scenarios(self):
+        runner = HistoricalScenarioRunner(scenario_predictions)
+        scenarios = [_scenario(i) for i in range(3)]
+
+        with pytest.raises(ValueError, match="one seed per scenario"):
+            runner.run_multiple_scenarios(scenarios, seeds=[1, 2])
+
+        assert runner.run_history == []
+        results = runner.run_multiple_scenarios(scenarios, seeds=[1, 2, 3])
+        assert all(result is not None for result in results)
+
+    def test_failed_simulation(self):
+        def failing(params):
+            raise RuntimeError("solver diverged")
+
+        [result] = HistoricalScenarioRunner(failing).run_multiple_scenarios(
+            [_scenario(0)], executor=SerialExecutor(),
+        )
+
+        assert result.accuracy == 0.0 and result.predictions == {}
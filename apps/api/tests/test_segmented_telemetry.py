@@ -0,0 +1,212 @@
+"""
+Segmented Telemetry Tests
+
+Verifies:
+- Segments round trip through the columnar encoding
+- Local storage serves byte-range reads and stream uploads in bounded reads
+- Segmented objects reassemble into the original telemetry blob
+- Keyframe seeks, tick-range slices and replay chunks read only the
+  segments they need
+- Single-document and chunked telemetry remain readable
+
+Reference: project.md §6.8, §11 Phase 8
+"""
+
+import io
+import json
+from typing import List
+
+import pytest
+
+from app.services import storage as storage_module
+from app.services.replay_loader import create_replay_loader
+from app.services.storage import (
+    SEGMENTED_TELEMETRY_FORMAT,
+    _decode_records,
+    _encode_records,
+)
+from app.services.telemetry import (
+    TelemetryBlob,
+    TelemetryDelta,
+    TelemetryKeyframe,
+    TelemetryService,
+)
+from tests.telemetry_helpers import make_blob
+
+TICKS = 120
+KEYFRAME_INTERVAL = 25
+
+
+def _blob(run_id: str = "run-1") -> TelemetryBlob:
+    agents = [f"agent-{i}" for i in range(20)]
+    keyframes = [
+        TelemetryKeyframe(
+            tick=tick,
+            timestamp=f"t{tick}",
+            agent_states={aid: {"agent_id": aid, "x": tick, "y": i} for i, aid in enumerate(agents)},
+            metrics={"tick": tick},
+        )
+        for tick in range(0, TICKS, KEYFRAME_INTERVAL)
+    ]
+    deltas = [
+        TelemetryDelta(
+            tick=tick,
+            agent_updates=[{"agent_id": aid, "stance": tick / TICKS} for aid in agents[:5]],
+            events_triggered=["shock"] if tick % 40 == 0 else [],
+            metrics={"adoption": tick / TICKS},
+        )
+        for tick in range(TICKS)
+    ]
+    return make_blob(
+        TICKS,
+        keyframes,
+        deltas,
+        run_id=run_id,
+        seed_used=7,
+        final_states={aid: {"segment": "a" if i % 2 else "b"} for i, aid in enumerate(agents)},
+        event_index=[{"tick": d.tick, "events": d.events_triggered} for d in deltas if d.events_triggered],
+        metrics_summary={"by_tick": [d.metrics for d in deltas], "outcome_distribution": {"a": 0.5}},
+    )
+
+
+async def _store_segmented(telemetry: TelemetryService, blob: TelemetryBlob):
+    return await telemetry.open_stream("tenant", blob.run_id, segment_bytes=2048).write_blob(blob)
+
+
+class TestSegmentEncoding:
+    def test_columnar_round_trip(self):
+        records = [{"tick": i, "metrics": {"m": i / 2}} for i in range(5)]
+
+        payload = json.loads(_encode_records(records))
+
+        assert "columns" in payload
+        assert _decode_records(payload) == records
+
+    @pytest.mark.parametrize("records", [
+        [{"a": 1}, {"b": 2}],
+        [["agent-1", {"x": 1}], ["agent-2", {"x": 2}]],
+        [{}, {}],
+        [],
+    ])
+    def test_irregular_records_round_trip(self, records):
+        assert _decode_records(json.loads(_encode_records(records))) == records
+
+    async def test_local_range_read(self, backend):
+        await backend.put_object("obj", b"0123456789")
+
+        assert await backend.get_object_range("obj", 3, 4) == b"3456"
+        assert await backend.get_object_range("obj", 8, 10) == b"89"
+
+    async def test_local_stream_upload(self, backend, monkeypatch):
+        data = bytes(range(256)) * 40
+        reads: List[int] = []
+
+        class RecordingStream(io.BytesIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        monkeypatch.setattr(storage_module, "STREAM_COPY_BYTES", 1000)
+        streamed = await backend.put_object_stream("streamed", RecordingStream(data))
+        whole = await backend.put_object("whole", data)
+
+        assert await backend.get_object("streamed") == data
+        assert (streamed.size_bytes, streamed.checksum) == (whole.size_bytes, whole.checksum)
+        assert reads and all(0 < size <= 1000 for size in reads)
+
+
+class TestSegmentedLayout:
+    async def test_round_trip_matches_blob(self, telemetry):
+        blob = _blob()
+        ref = await _store_segmented(telemetry, blob)
+
+        manifest, _ = await telemetry.storage.get_telemetry_header(ref)
+        restored = await telemetry.get_telemetry(ref)
+
+        assert manifest["storage_format"] == SEGMENTED_TELEMETRY_FORMAT
+        assert len(manifest["sections"]["keyframes"]["segments"]) == len(blob.keyframes)
+        assert len(manifest["sections"]["deltas"]["segments"]) > 1
+        assert manifest["event_postings"] == {"shock": [0, 40, 80]}
+        assert restored.to_dict() == blob.to_dict()
+
+    async def test_keyframe_seek_reads_one_segment(self, telemetry, backend):
+        ref = await _store_segmented(telemetry, _blob())
+
+        keyframe = await telemetry.get_keyframe_at_tick(ref, 60)
+
+        assert keyframe.tick == 50
+        assert len(backend.ranges) == 1
+        assert await telemetry.get_keyframe_at_tick(ref, 60) is keyframe
+        assert len(backend.ranges) == 1
+
+    async def test_delta_range_reads_overlapping_segments(self, telemetry, backend):
+        blob = _blob()
+        ref = await _store_segmented(telemetry, blob)
+        manifest, _ = await telemetry.storage.get_telemetry_header(ref)
+        segments = manifest["sections"]["deltas"]["segments"]
+
+        deltas = await telemetry.get_deltas_in_range(ref, 30, 34)
+
+        assert [d.tick for d in deltas] == list(range(30, 35))
+        assert 1 <= len(backend.ranges) < len(segments)
+        touched = sum(length for _, _, length in backend.ranges)
+        assert touched < ref.size_bytes / 4
+
+    async def test_view_exposes_header_without_segments(self, telemetry, backend):
+        ref = await _store_segmented(telemetry, _blob())
+
+        view = await telemetry.open_view(ref)
+
+        assert view.is_segmented and view.ticks_executed == TICKS
+        assert view.capabilities.has_spatial and view.capabilities.has_events
+        assert view.event_ticks("shock") == [0, 40, 80]
+        assert backend.ranges == []
+        assert len(await view.final_states()) == 20
+        assert len((await view.metrics_summary())["by_tick"]) == TICKS
+
+
+class TestReplayOverSegments:
+    async def test_chunk_and_state_match_single_document(self, telemetry, backend):
+        blob = _blob()
+        segmented_ref = await _store_segmented(telemetry, blob)
+        legacy_ref = await telemetry.storage.store_telemetry("tenant", "legacy", blob.to_dict())
+
+        segmented = create_replay_loader(telemetry)
+        legacy = create_replay_loader(telemetry)
+        timeline = await segmented.load(segmented_ref, preload_ticks=0)
+        await legacy.load(legacy_ref, preload_ticks=0)
+        backend.ranges.clear()
+
+        chunk = await segmented.get_chunk(50, 59)
+        state = await segmented.get_state_at_tick(57)
+        expected_state = await legacy.get_state_at_tick(57)
+
+        assert timeline.segment_distribution == {"a": 10, "b": 10}
+        assert [kf.tick for kf in chunk.keyframes] == [50]
+        assert [d.tick for d in chunk.deltas] == list(range(50, 60))
+        assert state.agents.keys() == expected_state.agents.keys()
+        assert state.agents["agent-1"].stance == expected_state.agents["agent-1"].stance
+        assert state.environment.metrics == expected_state.environment.metrics
+        # Keyframe 50 plus the delta segments around ticks 50-59 only
+        read_keys = {key for key, _, _ in backend.ranges}
+        assert len(backend.ranges) <= 4 and len(read_keys) == 1
+
+    async def test_chunked_v1_still_readable(self, telemetry):
+        writer = telemetry.storage.open_telemetry_stream("tenant", "chunked", chunk_bytes=256)
+        blob = _blob("chunked")
+        for keyframe in blob.keyframes:
+            await writer.append("keyframes", keyframe.to_dict())
+        for delta in blob.deltas:
+            await writer.append("deltas", delta.to_dict())
+        ref = await writer.close({
+            "run_id": "chunked",
+            "created_at": blob.created_at,
+            "ticks_executed": TICKS,
+            "index": blob.index.to_dict(),
+        })
+
+        view = await telemetry.open_view(ref)
+
+        assert not view.is_segmented
+        assert (await view.keyframe_at(99)).tick == 75
+        assert [d.tick for d in await view.deltas_in_range(10, 12)] == [10, 11, 12]
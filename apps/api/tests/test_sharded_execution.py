@@ -0,0 +1,231 @@
+"""
+Sharded Society Mode Tick Execution Tests
+
+Verifies:
+- Population partitioning keeps segments/regions whole and covers every agent
+- TickEvaluation.merge scatters shard results back into row order
+- ShardedTickExecutor reproduces VectorizedTickKernel.run_tick in-process
+  and on a process pool attached to shared-memory kernel arrays
+- The sharded execution mode of _execute_simulation reproduces the
+  vectorized path and reports per-shard timings, closing its worker
+  pool even when a tick fails
+
+Reference: project.md §3.3, §4.1, Phase 1
+"""
+
+import copy
+from typing import Any, Dict, Optional
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.engine.agent import AgentPool
+from app.engine.rng import CounterRNG
+from app.engine.rules import RuleEngine
+from app.engine.sharding import (
+    PartitionStrategy,
+    ShardedTickExecutor,
+    partition_population,
+)
+from app.engine.tick_kernel import TickEvaluation, VectorizedTickKernel
+from app.tasks import run_executor
+from app.tasks.base import JobContext
+
+from tests.test_society_tick_kernel import _population
+
+
+ENVIRONMENT = {"media_signal": 0.7, "media_topic": "prices"}
+
+
+def _pool(count: int = 30) -> AgentPool:
+    pool = AgentPool()
+    for agent in _population(count):
+        pool.add(agent)
+    return pool
+
+
+def _kernel(pool: AgentPool, rng: Optional[CounterRNG] = None) -> VectorizedTickKernel:
+    return VectorizedTickKernel.from_pool(pool, RuleEngine(), rng=rng or CounterRNG(99))
+
+
+def _run_ticks(pool: AgentPool, executor: Optional[ShardedTickExecutor] = None, ticks: int = 3):
+    """Per-tick kernel outputs plus final agent variables."""
+    kernel = executor.kernel if executor is not None else _kernel(pool)
+    outputs = []
+    for tick in range(ticks):
+        active = np.arange(tick, len(kernel.agents))  # Shrinking active set
+        if executor is not None:
+            result, _ = executor.run_tick(tick, active, ENVIRONMENT)
+        else:
+            result = kernel.run_tick(tick, active, ENVIRONMENT)
+        outputs.append((
+            result.decision_types,
+            {k: v.tolist() for k, v in result.state_updates.items()},
+            {k: v.tolist() for k, v in result.state_update_masks.items()},
+        ))
+    kernel.sync_to_agents()
+    return outputs, [agent.to_full_state()["variables"] for agent in pool.get_all()]
+
+
+class TestPartitioning:
+    """partition_population assigns every agent to exactly one shard."""
+
+    @pytest.mark.parametrize("strategy", list(PartitionStrategy))
+    def test_covers_population(self, strategy):
+        pool = _pool()
+        shard_of = partition_population(pool.get_all(), pool.social_index, 4, strategy)
+
+        assert shard_of.shape == (30,)
+        assert set(shard_of.tolist()) <= set(range(4))
+
+    @pytest.mark.parametrize("strategy", ["segment", "region"])
+    def test_groups_are_kept_whole(self, strategy):
+        pool = _pool()
+        agents = pool.get_all()
+        shard_of = partition_population(agents, pool.social_index, 4, strategy)
+
+        shards_by_group: Dict[str, set] = {}
+        for agent, shard in zip(agents, shard_of.tolist()):
+            shards_by_group.setdefault(getattr(agent.profile, strategy), set()).add(shard)
+        assert all(len(shards) == 1 for shards in shards_by_group.values())
+
+    def test_more_shards_than_agents(self):
+        pool = _pool(6)
+        shard_of = partition_population(pool.get_all(), pool.social_index, 8)
+        assert sorted(shard_of.tolist()) == [0, 1, 2, 3, 4, 5]
+
+
+class TestTickEvaluationMerge:
+    """Merging shard evaluations equals evaluating all rows at once."""
+
+    def test_merge_matches_whole_evaluation(self):
+        kernel = _kernel(_pool())
+        active = np.arange(30)[::-1]
+        whole = kernel.evaluate(0, active, ENVIRONMENT)
+
+        positions = [np.arange(0, 30, 3), np.arange(1, 30, 3), np.arange(2, 30, 3)]
+        parts = [(p, kernel.evaluate(0, active[p], ENVIRONMENT)) for p in positions]
+        merged = TickEvaluation.merge(active, parts)
+
+        np.testing.assert_array_equal(merged.active, whole.active)
+        np.testing.assert_array_equal(merged.decision_index, whole.decision_index)
+        assert merged.social_signals.keys() == whole.social_signals.keys()
+        for key, values in whole.social_signals.items():
+            np.testing.assert_array_equal(merged.social_signals[key], values)
+
+
+class TestShardedTickExecutor:
+    """Sharded ticks are identical to the single-process kernel."""
+
+    @pytest.mark.parametrize("strategy", list(PartitionStrategy))
+    def test_in_process_matches_kernel(self, strategy):
+        reference = _run_ticks(_pool())
+
+        pool = _pool()
+        with ShardedTickExecutor(_kernel(pool), num_shards=4, workers=1, strategy=strategy) as executor:
+            assert not executor.is_parallel
+            assert executor.shard_sizes().sum() == 30
+            sharded = _run_ticks(pool, executor)
+
+        assert sharded == reference
+
+    def test_process_pool_matches_kernel(self):
+        reference = _run_ticks(_pool())
+
+        pool = _pool()
+        executor = ShardedTickExecutor(
+            _kernel(pool), num_shards=3, workers=2, strategy="graph", mp_context="fork"
+        )
+        try:
+            assert executor.is_parallel
+            sharded = _run_ticks(pool, executor)
+        finally:
+            executor.close()
+
+        assert sharded == reference
+
+    def test_reports_shard_timings(self):
+        with ShardedTickExecutor(_kernel(_pool()), num_shards=3, workers=1) as executor:
+            _, timings = executor.run_tick(0, np.arange(30), ENVIRONMENT)
+
+        assert sorted(timings) == ["shard_0", "shard_1", "shard_2"]
+        assert all(ms >= 0 for ms in timings.values())
+
+    def test_requires_seeds_without_counter_rng(self):
+        pool = _pool()
+        kernel = VectorizedTickKernel.from_pool(pool, RuleEngine())
+        with ShardedTickExecutor(kernel, num_shards=2, workers=1) as executor:
+            with pytest.raises(ValueError):
+                executor.run_tick(0, np.arange(30), ENVIRONMENT)
+
+
+class TestShardedExecution:
+    """Sharded execution mode reproduces the vectorized path."""
+
+    async def _run(self, execution_mode: str, algorithm: str, **scheduler: Any) -> Dict[str, Any]:
+        run = {
+            "project_id": "project",
+            "run_config": {
+                "max_ticks": 5,
+                "scheduler": {"batch_size": 7, "execution_mode": execution_mode, **scheduler},
+                "logging_profile": {"keyframe_interval": 2},
+                "scenario_patch": {
+                    "variables": {"media_signal": 0.6, "media_topic": "prices"},
+                },
+            },
+        }
+
+        async def load_agents(*args, **kwargs):
+            return _population()
+
+        with patch.object(run_executor, "_load_agents_for_run", load_agents):
+            return await run_executor._execute_simulation(
+                db=None,
+                run=run,
+                rng=run_executor.DeterministicRNG(1234, algorithm=algorithm),
+                context=JobContext(job_id="job", tenant_id="tenant", user_id="user"),
+            )
+
+    @staticmethod
+    def _comparable(result: Dict[str, Any]) -> Dict[str, Any]:
+        result = copy.deepcopy(result)
+        for tick in result["tick_data"]:
+            tick.pop("timestamp")
+            tick.pop("elapsed_ms")
+        counters = result["execution_counters"]
+        counters["scheduler_config"] = {
+            k: v for k, v in counters["scheduler_config"].items()
+            if k not in ("execution_mode", "num_shards", "shard_workers", "partition_strategy")
+        }
+        counters.pop("peak_rss_bytes")
+        counters.pop("shard_timings")
+        return result
+
+    @pytest.mark.parametrize("algorithm", ["sha256", "philox"])
+    async def test_matches_vectorized_path(self, algorithm):
+        vectorized = await self._run("vectorized", algorithm)
+        sharded = await self._run(
+            "sharded", algorithm, num_shards=3, shard_workers=1, partition_strategy="segment"
+        )
+
+        counters = sharded["execution_counters"]
+        assert counters["scheduler_config"]["execution_mode"] == "sharded"
+        assert counters["scheduler_config"]["partition_strategy"] == "segment"
+        assert sorted(counters["shard_timings"]) == ["shard_0", "shard_1", "shard_2"]
+        assert all(s["partitions"] == 5 for s in counters["shard_timings"].values())
+        assert vectorized["execution_counters"]["shard_timings"] == {}
+        assert self._comparable(sharded) == self._comparable(vectorized)
+
+    async def test_shard_pool_closed_when_tick_fails(self):
+        closed = []
+
+        def failing_tick(self, **kwargs):
+            raise RuntimeError("shard worker died")
+
+        with patch.object(run_executor.ShardedTickExecutor, "run_tick", failing_tick), \
+                patch.object(run_executor.ShardedTickExecutor, "close", lambda self: closed.append(self)):
+            with pytest.raises(RuntimeError, match="shard worker died"):
+                await self._run("sharded", "philox", num_shards=2, shard_workers=1)
+
+        assert len(closed) == 1
@@ -0,0 +1,100 @@
+"""
+Sparse Social Influence Tests
+
+Verifies:
+- Sparse and dense graphs give the same influence, cascades and homophily
+- Multi-hop influence matches the decayed sum of hop averages
+- NeighborIndex.to_csr exposes the StateManager social network
+
+Reference: project.md §4.1
+"""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from app.engine.behavioral_model import SocialInfluenceModel
+from app.engine.state_manager import NeighborIndex
+
+
+def _random_graph(n: int, density: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(0.1, 1.0, size=(n, n))
+    weights[rng.random((n, n)) > density] = 0.0
+    np.fill_diagonal(weights, 0.0)
+    weights[3] = 0.0  # Isolated agent
+    return weights
+
+
+class TestSparseMatchesDense:
+    def test_single_hop_influence(self):
+        dense = _random_graph(60, 0.1, seed=0)
+        states = np.random.default_rng(1).random((60, 4))
+        model = SocialInfluenceModel()
+
+        expected = model.compute_social_influence(states, dense > 0, dense)
+        result = model.compute_social_influence(states, sparse.csr_matrix(dense))
+
+        assert result == pytest.approx(expected)
+        assert (result[3] == 0).all()
+
+    def test_information_cascade(self):
+        dense = _random_graph(80, 0.15, seed=2)
+        choices = np.random.default_rng(3).integers(-1, 3, size=80)
+        model = SocialInfluenceModel(cascade_threshold=0.5)
+
+        expected = np.zeros(80, dtype=bool)
+        for i in range(80):
+            neighbors = np.where(dense[i] > 0)[0]
+            neighbor_choices = choices[neighbors]
+            neighbor_choices = neighbor_choices[neighbor_choices >= 0]
+            if choices[i] >= 0 and len(neighbor_choices):
+                expected[i] = (neighbor_choices == choices[i]).mean() >= 0.5
+
+        assert model.detect_information_cascade(choices, dense).tolist() == expected.tolist()
+        assert model.detect_information_cascade(
+            choices, sparse.csr_matrix(dense)
+        ).tolist() == expected.tolist()
+
+    def test_edge_homophily(self):
+        dense = _random_graph(30, 0.2, seed=4)
+        features = np.random.default_rng(5).normal(size=(30, 5))
+        features[7] = 0.0
+        model = SocialInfluenceModel()
+
+        scores = model.compute_edge_homophily(features, sparse.csr_matrix(dense), chunk_size=16)
+
+        for i, j in zip(*np.nonzero(dense)):
+            assert scores[i, j] == pytest.approx(
+                model.compute_homophily_score(features[i], features[j])
+            )
+        assert scores.nnz <= np.count_nonzero(dense)
+
+
+class TestMultiHop:
+    def test_decayed_hops(self):
+        dense = _random_graph(40, 0.1, seed=6)
+        states = np.random.default_rng(7).random((40, 3))
+        model = SocialInfluenceModel(distance_decay=0.5, max_hops=3)
+
+        transition = dense / np.where(dense.sum(axis=1) > 0, dense.sum(axis=1), 1)[:, None]
+        hop1 = transition @ states
+        hop2 = transition @ hop1
+        hop3 = transition @ hop2
+        expected = (hop1 + 0.5 * hop2 + 0.25 * hop3) / 1.75
+
+        assert model.compute_social_influence(
+            states, sparse.csr_matrix(dense)
+        ) == pytest.approx(expected)
+        assert model.compute_social_influence(
+            states, dense, max_hops=1
+        ) == pytest.approx(hop1)
+
+
+class TestNeighborIndexCsr:
+    def test_to_csr(self):
+        index = NeighborIndex.from_adjacency({0: [(1, 0.5), (2, 0.2)], 2: [(0, 0.3)]}, 3)
+        graph = index.to_csr()
+
+        assert graph.shape == (3, 3)
+        assert graph.toarray().tolist() == [[0.0, 0.5, 0.2], [0.0, 0.0, 0.0], [0.3, 0.0, 0.0]]
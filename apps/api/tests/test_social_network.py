@@ -0,0 +1,122 @@
+"""
+Homophily Social Network Tests
+
+Verifies:
+- Block-wise similarity matches pairwise similarity of demographic dicts
+- Block rows shrink as the population grows
+- Network generation is deterministic under the seed
+- Sampled peers are distinct, never the agent itself, never zero-similarity
+- Sampling frequency follows similarity
+
+Reference: project.md §4.1
+"""
+
+import numpy as np
+import pytest
+
+from app.engine.social_network import (
+    AGE_SPAN,
+    AGE_WEIGHT,
+    BLOCK_ELEMENTS,
+    CATEGORY_WEIGHT,
+    SIMILARITY_CATEGORIES,
+    DemographicColumns,
+    block_rows,
+    build_homophily_network,
+)
+
+
+def _demographics(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "age": int(rng.integers(18, 80)),
+            "education": str(rng.choice(["high_school", "bachelor", "master"])),
+            "income_bracket": str(rng.choice(["low", "middle", "high"])),
+            "urban_rural": str(rng.choice(["urban", "rural"])),
+            "ethnicity": str(rng.choice(["majority", "minority_1"])),
+        }
+        for _ in range(n)
+    ]
+
+
+def _pairwise_similarity(demo1, demo2) -> float:
+    age_diff = abs(demo1.get("age", 40) - demo2.get("age", 40))
+    score = max(0, 1 - age_diff / AGE_SPAN) * AGE_WEIGHT
+    for key in SIMILARITY_CATEGORIES:
+        if demo1.get(key) == demo2.get(key):
+            score += CATEGORY_WEIGHT
+    return score
+
+
+class TestSimilarity:
+    def test_matches_pairwise_similarity(self):
+        demographics = _demographics(25, seed=0)
+        demographics[4] = {"age": 30}  # Missing categories
+        demographics[9] = {"age": 70}
+        columns = DemographicColumns.from_demographics(demographics)
+
+        block = columns.similarity_block(3, 12)
+
+        for row, i in enumerate(range(3, 12)):
+            for j in range(25):
+                assert block[row, j] == pytest.approx(
+                    _pairwise_similarity(demographics[i], demographics[j])
+                )
+
+
+    def test_block_rows_sized_to_population(self):
+        assert block_rows(10) == 10
+        assert block_rows(BLOCK_ELEMENTS // 4) == 4
+        assert block_rows(BLOCK_ELEMENTS * 2) == 1
+        assert block_rows(0) == 1
+
+
+class TestBuildNetwork:
+    def test_deterministic_under_seed(self):
+        demographics = _demographics(300, seed=1)
+
+        first = build_homophily_network(demographics, np.random.default_rng(42), block_size=64)
+        second = build_homophily_network(demographics, np.random.default_rng(42), block_size=64)
+
+        assert len(first) == 300
+        for (peers_a, weights_a), (peers_b, weights_b) in zip(first, second):
+            assert peers_a.tolist() == peers_b.tolist()
+            assert weights_a.tolist() == weights_b.tolist()
+
+    def test_peers_are_valid(self):
+        demographics = _demographics(200, seed=2)
+        demographics[0] = {"age": 18, "education": "x", "income_bracket": "x",
+                           "urban_rural": "x", "ethnicity": "x"}
+        columns = DemographicColumns.from_demographics(demographics)
+
+        network = build_homophily_network(demographics, np.random.default_rng(3), block_size=50)
+
+        for i, (peers, weights) in enumerate(network):
+            assert len(peers) >= 1
+            assert i not in peers.tolist()
+            assert len(set(peers.tolist())) == len(peers)
+            expected = columns.similarity_block(i, i + 1)[0, peers]
+            assert weights == pytest.approx(expected)
+            assert (weights > 0).all()
+
+    def test_sampling_follows_similarity(self):
+        # Agent 0 shares every category with agents 1-5 and none with 6-10
+        match = {"age": 40, "education": "a", "income_bracket": "a",
+                 "urban_rural": "a", "ethnicity": "a"}
+        other = {"age": 40, "education": "b", "income_bracket": "b",
+                 "urban_rural": "b", "ethnicity": "b"}
+        demographics = [match] * 6 + [other] * 5
+        rng = np.random.default_rng(4)
+
+        counts = np.zeros(11)
+        for _ in range(400):
+            peers, _ = build_homophily_network(demographics, rng)[0]
+            np.add.at(counts, peers, 1)
+
+        # Similarity 1.0 vs 0.2 -> matching peers drawn far more often
+        assert counts[1:6].sum() > 3 * counts[6:].sum()
+
+    def test_single_agent_has_no_connections(self):
+        network = build_homophily_network([{"age": 30}], np.random.default_rng(0))
+        assert len(network) == 1 and len(network[0][0]) == 0
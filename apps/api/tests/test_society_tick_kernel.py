@@ -0,0 +1,281 @@
+"""
+Vectorized Society Mode Tick Kernel Tests
+
+Verifies:
+- Batched built-in rules match per-agent rule evaluation row for row
+- The AgentPool social graph index and peer-state table give O(edges)
+  observation without changing social signals
+- The vectorized execution mode of _execute_simulation reproduces the
+  per-agent reference path for the same seed
+
+Reference: project.md §4.1, §6.3, Phase 1
+"""
+
+import copy
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.engine.agent import Agent, AgentPool, AgentProfile, SocialEdge, SocialEdgeType
+from app.engine.rules import (
+    BatchRuleContext,
+    ConformityRule,
+    LossAversionRule,
+    MediaInfluenceRule,
+    RuleContext,
+    RuleEngine,
+    SocialNetworkRule,
+)
+from app.tasks import run_executor
+from app.tasks.base import JobContext
+
+
+def _population(count: int = 24) -> List[Any]:
+    personas = []
+    for i in range(count):
+        personas.append({
+            "persona_id": f"persona-{i}",
+            "label": f"P{i}",
+            "demographics": {"segment": f"seg-{i % 3}", "region": f"r-{i % 2}"},
+            "psychographics": {"big_five": {"extraversion": (i % 10) / 9}},
+            "economic": {"risk_tolerance": ((i * 7) % 10) / 9},
+            "action_probabilities": {
+                "risky_action": 0.4 + (i % 5) * 0.15,
+                "social_action": 0.9,
+                "purchase": 0.3 + (i % 4) * 0.1,
+            },
+        })
+    agents = []
+    for i, persona in enumerate(personas):
+        profile = AgentProfile.from_persona(persona)
+        profile.agent_id = f"agent-{i}"
+        agent = Agent(profile)
+        agent.initialize()
+        agents.append(agent)
+    for i, agent in enumerate(agents):
+        for offset in (1, 3):
+            peer = agents[(i + offset) % count]
+            agent.add_social_edge(SocialEdge(
+                target_agent_id=peer.id,
+                edge_type=SocialEdgeType.FRIEND,
+                weight=0.5 + offset * 0.1,
+            ))
+    agents[5].memory.beliefs["action_social_action_success"] = 0.8
+    return agents
+
+
+def _batch_context(contexts: List[RuleContext]) -> BatchRuleContext:
+    """Build the columnar equivalent of a list of per-agent contexts."""
+    indptr = [0]
+    indices: List[int] = []
+    peer_opinions: List[float] = []
+    for ctx in contexts:
+        for peer in ctx.peer_states:
+            indices.append(len(peer_opinions))
+            peer_opinions.append(peer.get("opinion", np.nan))
+        indptr.append(len(indices))
+
+    signal_keys = sorted({k for ctx in contexts for k in ctx.social_signals})
+    has_decision = np.array([ctx.current_decision is not None for ctx in contexts])
+
+    return BatchRuleContext(
+        tick=contexts[0].tick,
+        agent_ids=[ctx.agent_id for ctx in contexts],
+        rng_seeds=np.array([ctx.rng_seed for ctx in contexts]),
+        agent_state={
+            "opinion": np.array([ctx.agent_state.get("opinion", np.nan) for ctx in contexts]),
+        },
+        environment=contexts[0].environment,
+        social_signals={
+            k: np.array([ctx.social_signals.get(k, np.nan) for ctx in contexts])
+            for k in signal_keys
+        },
+        peer_indptr=np.array(indptr),
+        peer_indices=np.array(indices, dtype=np.int64),
+        peer_state={"opinion": np.array(peer_opinions)},
+        decision_mask=has_decision,
+        current_decision={
+            key: np.array([
+                (ctx.current_decision or {}).get(key, np.nan) for ctx in contexts
+            ])
+            for key in ("potential_gain", "potential_loss")
+        },
+        decision_confidence=np.array([ctx.decision_confidence for ctx in contexts]),
+    )
+
+
+class TestBatchedRules:
+    """Each built-in rule's evaluate_batch matches evaluate row for row."""
+
+    @pytest.fixture
+    def contexts(self) -> List[RuleContext]:
+        rng = np.random.default_rng(7)
+        contexts = []
+        for i in range(40):
+            peers = [
+                {"opinion": float(rng.uniform(0.45, 0.55))}
+                for _ in range(int(rng.integers(0, 5)))
+            ]
+            signals = {}
+            if i % 3:
+                signals["strong_tie_opinion"] = float(rng.uniform())
+            if i % 4:
+                signals["weak_tie_opinion"] = float(rng.uniform())
+            decision = None
+            if i % 2:
+                decision = {
+                    "potential_gain": float(rng.uniform(0, 5)),
+                    "potential_loss": float(rng.uniform(-3, 0)) if i % 5 else 0,
+                }
+            contexts.append(RuleContext(
+                tick=3,
+                agent_id=f"agent-{i}",
+                rng_seed=int(rng.integers(0, 2**32)),
+                agent_state={"opinion": float(rng.uniform())} if i % 2 else {},
+                environment={"media_signal": 0.7, "media_topic": "policy"},
+                social_signals=signals,
+                peer_states=peers,
+                current_decision=decision,
+            ))
+        return contexts
+
+    @pytest.mark.parametrize(
+        "rule",
+        [ConformityRule(threshold=0.5), MediaInfluenceRule(), LossAversionRule(), SocialNetworkRule()],
+        ids=lambda r: r.name,
+    )
+    def test_batch_matches_per_agent(self, rule, contexts):
+        batch = rule.evaluate_batch(_batch_context(contexts))
+
+        for row, ctx in enumerate(contexts):
+            expected = rule.evaluate(copy.deepcopy(ctx))
+            assert bool(batch.applied[row]) == expected.applied
+            if not expected.applied:
+                continue
+            for key, value in expected.state_updates.items():
+                assert batch.state_updates[key][row] == pytest.approx(value)
+            if rule.name == "loss_aversion":
+                assert batch.decision_confidence[row] == pytest.approx(expected.decision_confidence)
+
+    def test_engine_reports_batch_support(self):
+        engine = RuleEngine()
+        assert engine.supports_batch()
+
+        class ScalarOnlyRule(ConformityRule):
+            def applies_to(self, ctx):
+                return ctx.tick > 0
+
+        engine.register(ScalarOnlyRule())
+        assert not engine.supports_batch()
+
+
+class TestVectorizedExecution:
+    """Vectorized execution mode reproduces the per-agent reference path."""
+
+    async def _run(
+        self, execution_mode: str, algorithm: str = "sha256", **scheduler: Any
+    ) -> Dict[str, Any]:
+        run = {
+            "project_id": "project",
+            "run_config": {
+                "max_ticks": 6,
+                "scheduler": {"batch_size": 7, "execution_mode": execution_mode, **scheduler},
+                "logging_profile": {"keyframe_interval": 2},
+                "scenario_patch": {
+                    "variables": {"media_signal": 0.6, "media_topic": "prices"},
+                },
+            },
+        }
+
+        async def load_agents(*args, **kwargs):
+            return _population()
+
+        with patch.object(run_executor, "_load_agents_for_run", load_agents):
+            return await run_executor._execute_simulation(
+                db=None,
+                run=run,
+                rng=run_executor.DeterministicRNG(1234, algorithm=algorithm),
+                context=JobContext(job_id="job", tenant_id="tenant", user_id="user"),
+            )
+
+    @staticmethod
+    def _comparable(result: Dict[str, Any]) -> Dict[str, Any]:
+        result = copy.deepcopy(result)
+        for tick in result["tick_data"]:
+            tick.pop("timestamp")
+            tick.pop("elapsed_ms")
+        result["execution_counters"]["scheduler_config"].pop("execution_mode")
+        result["execution_counters"].pop("peak_rss_bytes")
+        return result
+
+    @pytest.mark.parametrize("algorithm", ["sha256", "philox"])
+    async def test_matches_reference_path(self, algorithm):
+        reference = await self._run("per_agent", algorithm)
+        vectorized = await self._run("vectorized", algorithm)
+
+        assert vectorized["execution_counters"]["scheduler_config"]["execution_mode"] == "vectorized"
+        assert any(u["decision"] for u in reference["tick_data"][0]["agent_updates"])
+        assert self._comparable(vectorized) == self._comparable(reference)
+
+
+    @pytest.mark.parametrize("execution_mode", ["per_agent", "vectorized"])
+    async def test_memory_budget_bounds_agent_memory(self, execution_mode):
+        result = await self._run(
+            execution_mode, memory_budget={"max_recent_events": 4, "max_episodes": 2}
+        )
+
+        for state in result["final_agent_states"].values():
+            assert len(state["memory"]["recent_events"]) == 4
+        counters = result["execution_counters"]
+        assert counters["scheduler_config"]["memory_budget"]["max_recent_events"] == 4
+        assert counters["peak_rss_bytes"] > 0
+
+
+class TestSocialGraphIndex:
+    """AgentPool CSR index and per-tick peer-state table."""
+
+    @pytest.fixture
+    def pool(self) -> AgentPool:
+        pool = AgentPool()
+        for agent in _population(12):
+            pool.add(agent)
+        return pool
+
+    def test_index_matches_social_edges(self, pool):
+        index = pool.social_index
+        for agent in pool.get_all():
+            i = pool.index_of(agent.id)
+            peer_ids = sorted(agent.get_peer_ids(), key=pool.index_of)
+            assert [index.agent_ids[j] for j in index.peers_of(i)] == peer_ids
+            assert index.influence_of(i).tolist() == [
+                agent.get_influence_from(pid) for pid in peer_ids
+            ]
+
+    def test_index_invalidated_when_pool_changes(self, pool):
+        assert pool.social_index.num_agents == 12
+        pool.remove("agent-0")
+        assert pool.social_index.num_agents == 11
+        assert "agent-0" not in pool.social_index.positions
+
+    def test_peer_table_skips_terminated_peers(self, pool):
+        pool.get("agent-1").terminate()
+        table = pool.snapshot_peer_states()
+
+        assert table.alive_count == 11
+        peers = table.peers_of(pool.index_of("agent-0"))
+        assert [p["agent_id"] for p in peers] == ["agent-3"]
+
+    def test_observe_with_connected_peers_matches_full_scan(self, pool):
+        all_states = [a.to_snapshot() for a in pool.get_all()]
+        table = pool.snapshot_peer_states()
+
+        for agent in pool.get_all():
+            full = agent.observe({}, all_states)
+            sparse = agent.observe(
+                {},
+                table.peers_of(pool.index_of(agent.id)),
+                peer_count=table.alive_count,
+            )
+            assert sparse["social_signals"] == full["social_signals"]
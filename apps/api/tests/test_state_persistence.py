@@ -0,0 +1,116 @@
+"""
+StateManager Bulk Persistence Tests
+
+Verifies:
+- State vectors built from the matrices match the per-agent layout
+- persist_to_database sends one statement per chunk (unnest on PostgreSQL,
+  executemany elsewhere) and reports rows per second
+- only_changed writes just the agents modified since the last flush
+
+Reference: project.md §4.1
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.engine.state_manager import StateManager
+
+
+class _RecordingSession:
+    """Minimal AsyncSession stand-in that records executed statements."""
+
+    def __init__(self, dialect: str):
+        self.dialect = dialect
+        self.executed: List[Tuple[Any, Any]] = []
+        self.commits = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name=self.dialect))
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def manager() -> StateManager:
+    rng = np.random.default_rng(1)
+    manager = StateManager(preference_dimensions=4, issue_dimensions=3)
+    prefs = rng.uniform(size=(25, 4))
+    prefs[:, 3] = 0.0  # Omitted from persisted preferences
+    manager.initialize(
+        agent_ids=[uuid4() for _ in range(25)],
+        initial_preferences=prefs,
+        initial_issue_priorities=rng.uniform(size=(25, 3)),
+        initial_scalar_states=rng.uniform(size=(25, 7)),
+    )
+    return manager
+
+
+class TestStateVectorRows:
+    def test_row_layout(self, manager):
+        manager.commit_agents(np.array([2]), np.array([1], dtype=np.int32), np.array([0.8]))
+        row = manager.state_vector_rows(np.array([2]))[0]
+
+        assert row["id"] == manager.agent_ids[2]
+        assert row["committed_action"] == "1"
+        assert row["commitment_strength"] == pytest.approx(0.8)
+        vector = row["state_vector"]
+        assert vector["political_preference"] == {
+            f"choice_{j}": float(manager.preferences_matrix[2, j]) for j in range(3)
+        }
+        assert vector["issue_priorities"] == {
+            f"issue_{j}": float(manager.issue_priorities_matrix[2, j]) for j in range(3)
+        }
+        assert vector["certainty"] == float(manager.scalar_states[2, 1])
+        json.dumps(vector)  # Plain Python values only
+
+
+class TestPersistToDatabase:
+    async def test_unnest_statement_per_chunk(self, manager):
+        db = _RecordingSession("postgresql")
+        stats = await manager.persist_to_database(db, batch_size=10)
+
+        assert len(db.executed) == 3
+        _, params = db.executed[0]
+        assert params["ids"] == manager.agent_ids[:10]
+        assert json.loads(params["state_vectors"][0]) == manager.state_vector_rows([0])[0]["state_vector"]
+        assert stats["rows_persisted"] == 25
+        assert stats["method"] == "unnest"
+        assert stats["rows_per_second"] > 0
+        assert db.commits == 1
+
+    async def test_executemany_fallback(self, manager):
+        db = _RecordingSession("sqlite")
+        stats = await manager.persist_to_database(db)
+
+        assert len(db.executed) == 1
+        _, rows = db.executed[0]
+        assert len(rows) == 25
+        assert stats["method"] == "executemany"
+
+    async def test_only_changed(self, manager):
+        db = _RecordingSession("postgresql")
+        assert (await manager.persist_to_database(db, only_changed=True))["rows_persisted"] == 25
+
+        manager.update_agent_scalars(np.array([3, 7]), {"certainty": np.array([0.1, 0.2])})
+        manager.commit_agents(np.array([11]), np.array([0], dtype=np.int32), np.array([0.5]))
+        manager.update_agent_scalars(np.array([4]), {"echo_chamber_score": np.array([0.9])})  # Not persisted
+
+        np.testing.assert_array_equal(manager.changed_agent_indices(), [3, 7, 11])
+        db = _RecordingSession("postgresql")
+        stats = await manager.persist_to_database(db, only_changed=True)
+        assert stats["rows_persisted"] == 3
+        assert db.executed[0][1]["ids"] == [manager.agent_ids[i] for i in (3, 7, 11)]
+
+        assert (await manager.persist_to_database(db, only_changed=True))["rows_persisted"] == 0
@@ -0,0 +1,147 @@
+"""
+Streaming Telemetry Tests
+
+Verifies:
+- Chunked telemetry objects reassemble into the original document
+- Streaming a run's trace produces the same telemetry blob as storing
+  the in-memory execution result
+- Streamed runs do not return the trace in memory
+- Aborting a stream removes uploaded chunks
+
+Reference: project.md §6.8
+"""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from app.engine.agent import Agent, AgentProfile, SocialEdge, SocialEdgeType
+from app.services.storage import LocalStorageBackend, StorageService
+from app.services.telemetry import TelemetryService
+from app.tasks import run_executor
+from app.tasks.base import JobContext
+
+
+def _agents(count: int = 12) -> List[Agent]:
+    agents = []
+    for i in range(count):
+        profile = AgentProfile(
+            agent_id=f"agent-{i}",
+            extraversion=(i % 5) / 4,
+            action_probabilities={"social_action": 0.9, "purchase": 0.4 + (i % 3) * 0.1},
+        )
+        agent = Agent(profile)
+        agent.initialize()
+        agents.append(agent)
+    for i, agent in enumerate(agents):
+        agent.add_social_edge(SocialEdge(
+            target_agent_id=agents[(i + 1) % count].id,
+            edge_type=SocialEdgeType.FRIEND,
+        ))
+    return agents
+
+
+@pytest.fixture
+def telemetry(tmp_path) -> TelemetryService:
+    return TelemetryService(StorageService(LocalStorageBackend(str(tmp_path))))
+
+
+async def _simulate(trace_sink: Optional[Any] = None) -> Dict[str, Any]:
+    run = {
+        "project_id": "project",
+        "run_config": {
+            "max_ticks": 7,
+            "logging_profile": {"keyframe_interval": 3},
+            "scenario_patch": {"variables": {"media_signal": 0.6}},
+        },
+    }
+
+    async def load_agents(*args, **kwargs):
+        return _agents()
+
+    with patch.object(run_executor, "_load_agents_for_run", load_agents):
+        return await run_executor._execute_simulation(
+            db=None,
+            run=run,
+            rng=run_executor.DeterministicRNG(99),
+            context=JobContext(job_id="job", tenant_id="tenant", user_id="user"),
+            trace_sink=trace_sink,
+        )
+
+
+def _comparable(blob: Dict[str, Any]) -> Dict[str, Any]:
+    blob.pop("created_at")
+    for keyframe in blob["keyframes"]:
+        keyframe.pop("timestamp")
+    return blob
+
+
+class TestChunkedTelemetry:
+    """ChunkedTelemetryWriter round trip."""
+
+    async def test_chunks_reassemble(self, telemetry):
+        writer = telemetry.storage.open_telemetry_stream("tenant", "run-1", chunk_bytes=64)
+        for tick in range(20):
+            await writer.append("deltas", {"tick": tick, "updates": [tick] * 5})
+            await writer.append("metrics_summary.by_tick", {"tick": tick})
+        await writer.put("final_states", "agent-1", {"tick": 19})
+        ref = await writer.close({"run_id": "run-1", "metrics_summary": {"outcome_distribution": {}}})
+
+        data = await telemetry.storage.get_telemetry(ref)
+
+        assert [d["tick"] for d in data["deltas"]] == list(range(20))
+        assert len(data["metrics_summary"]["by_tick"]) == 20
+        assert data["metrics_summary"]["outcome_distribution"] == {}
+        assert data["final_states"] == {"agent-1": {"tick": 19}}
+        assert "chunks" not in data
+
+    async def test_abort_removes_chunks(self, telemetry):
+        writer = telemetry.storage.open_telemetry_stream("tenant", "run-2", chunk_bytes=16)
+        for tick in range(5):
+            await writer.append("deltas", {"tick": tick})
+        keys = [part["key"] for part in writer._sections["deltas"]["parts"]]
+        await writer.abort()
+
+        assert keys
+        for key in keys:
+            assert not await telemetry.storage.backend.object_exists(key)
+
+
+class TestStreamingExecution:
+    """Streaming the trace matches storing the in-memory result."""
+
+    async def test_streamed_blob_matches_in_memory(self, telemetry):
+        in_memory = await _simulate()
+        stored_ref = await telemetry.store_from_execution_result(
+            tenant_id="tenant",
+            run_id="in-memory",
+            execution_result=in_memory,
+        )
+
+        trace_sink = telemetry.open_stream("tenant", "streamed")
+        streamed = await _simulate(trace_sink)
+        streamed_ref = await trace_sink.close(
+            seed_used=streamed["seed_used"],
+            agent_count=streamed["agent_count"],
+            metrics_summary={"outcome_distribution": streamed["outcome_distribution"]},
+        )
+
+        assert "tick_data" not in streamed and "final_agent_states" not in streamed
+        assert streamed["ticks_executed"] == in_memory["ticks_executed"] == 7
+        assert streamed["events_processed_count"] == len(in_memory["events_processed"])
+
+        expected = (await telemetry.get_telemetry(stored_ref)).to_dict()
+        actual = (await telemetry.get_telemetry(streamed_ref)).to_dict()
+        expected["run_id"] = actual["run_id"]
+        assert _comparable(actual) == _comparable(expected)
+        assert actual["index"]["keyframe_ticks"] == [0, 3, 6]
+
+    async def test_aggregates_computed_on_the_fly(self):
+        result = await _simulate()
+        outcomes = run_executor._aggregate_outcomes(result)
+
+        metrics = {m["metric_name"]: m["value"] for m in outcomes["key_metrics"]}
+        assert metrics["events_processed"] == len(result["events_processed"])
+        assert metrics["final_activity_rate"] == result["metrics_by_tick"][-1]["activity_rate"]
+        assert outcomes["variance_metrics"] == {"activity_rate": pytest.approx(0.0)}
@@ -0,0 +1,119 @@
+"""
+Decoded Telemetry Cache Tests
+
+Verifies:
+- Repeated reads of one telemetry object are served without downloading it
+- Concurrent reads share a single load (single flight)
+- Entries are keyed by checksum and bounded by decoded bytes (LRU)
+- Failed loads are not cached and refs without a checksum bypass the cache
+- Replay loaders share the cache with telemetry queries
+
+Reference: project.md §6.8, §11 Phase 8
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.replay_loader import create_replay_loader
+from app.services.storage import StorageNotFoundError, StorageRef
+from app.services.telemetry import (
+    TelemetryBlob,
+    TelemetryKeyframe,
+    TelemetryQueryParams,
+    TelemetryService,
+)
+from tests.telemetry_helpers import make_blob
+
+
+def _blob(run_id: str, ticks: int = 4) -> TelemetryBlob:
+    keyframes = [TelemetryKeyframe(tick=0, timestamp="", agent_states={"a": {"stance": 0.5}})]
+    return make_blob(ticks, keyframes, [], run_id=run_id)
+
+
+async def _store(telemetry: TelemetryService, run_id: str, blob: TelemetryBlob) -> StorageRef:
+    """Single-document telemetry: one object read per load."""
+    return await telemetry.storage.store_telemetry("tenant", run_id, blob.to_dict())
+
+
+class TestDecodedTelemetryCache:
+    async def test_repeated_reads_hit_cache(self, telemetry, backend):
+        ref = await _store(telemetry, "run-1", _blob("run-1"))
+
+        first = await telemetry.get_telemetry(ref)
+        keyframe = await telemetry.get_keyframe_at_tick(ref, 3)
+        await telemetry.get_deltas_in_range(ref, 0, 3)
+
+        assert backend.reads == 1
+        assert keyframe is first.keyframes[0]
+        stats = telemetry.cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["bytes"] > 0
+
+    async def test_concurrent_reads_load_once(self, telemetry, backend):
+        ref = await _store(telemetry, "run-1", _blob("run-1"))
+        backend.delay = 0.05
+
+        blobs = await asyncio.gather(*(telemetry.get_telemetry(ref) for _ in range(5)))
+
+        assert backend.reads == 1
+        assert all(blob is blobs[0] for blob in blobs)
+        assert telemetry.cache.get_stats()["coalesced"] == 4
+
+    async def test_rewritten_object_is_not_served_stale(self, telemetry):
+        old_ref = await _store(telemetry, "run-1", _blob("run-1", ticks=4))
+        await telemetry.get_telemetry(old_ref)
+        new_ref = await _store(telemetry, "run-1", _blob("run-1", ticks=9))
+
+        assert old_ref.key == new_ref.key
+        assert (await telemetry.get_telemetry(new_ref)).ticks_executed == 9
+
+    async def test_lru_eviction_by_bytes(self, telemetry, backend):
+        refs = [await _store(telemetry, f"run-{i}", _blob(f"run-{i}")) for i in range(3)]
+        await telemetry.get_telemetry(refs[0])
+        telemetry.cache.max_bytes = telemetry.cache.current_bytes * 2
+
+        await telemetry.get_telemetry(refs[1])
+        await telemetry.get_telemetry(refs[0])  # run-1 is now least recently used
+        await telemetry.get_telemetry(refs[2])
+        reads = backend.reads
+        await telemetry.get_telemetry(refs[0])
+        await telemetry.get_telemetry(refs[1])
+
+        assert backend.reads == reads + 1
+        assert telemetry.cache.evictions >= 1
+        assert telemetry.cache.current_bytes <= telemetry.cache.max_bytes
+
+    async def test_failed_load_is_retried(self, telemetry, backend):
+        ref = await _store(telemetry, "run-1", _blob("run-1"))
+        await backend.delete_object(ref.key)
+
+        with pytest.raises(StorageNotFoundError):
+            await telemetry.get_telemetry(ref)
+        assert len(telemetry.cache) == 0 and telemetry.cache.get_stats()["in_flight"] == 0
+
+        await _store(telemetry, "run-1", _blob("run-1"))
+        assert (await telemetry.get_telemetry(ref)).run_id == "run-1"
+
+    async def test_refs_without_checksum_bypass_cache(self, telemetry, backend):
+        ref = await _store(telemetry, "run-1", _blob("run-1"))
+        ref.checksum = None
+
+        await telemetry.get_telemetry(ref)
+        await telemetry.get_telemetry(ref)
+
+        assert backend.reads == 2
+        assert telemetry.cache.get_stats()["uncached"] == 2
+
+
+class TestReplaySharesCache:
+    async def test_replay_loads_reuse_decoded_blob(self, telemetry, backend):
+        ref = await _store(telemetry, "run-1", _blob("run-1"))
+
+        for _ in range(3):
+            loader = create_replay_loader(telemetry)
+            timeline = await loader.load_from_ref_dict(ref.to_dict(), preload_ticks=0)
+            assert timeline.run_id == "run-1"
+        await telemetry.query_telemetry(ref, TelemetryQueryParams(tick_start=0, tick_end=2))
+
+        assert backend.reads == 1
@@ -0,0 +1,239 @@
+"""
+Telemetry Export Tests
+
+Verifies:
+- NDJSON, JSON and CSV exports stream one chunk per tick window
+- Tick range, agent and event filters apply to every table
+- Malformed tick ranges are rejected by request validation
+- Exports of a tick range read only the overlapping segments
+- Parquet exports carry a typed schema and one row group per tick window
+- Background exports land in object storage behind a signed URL
+- Background exports record a pollable complete or failed status
+
+Reference: project.md §6.8, §8.4
+"""
+
+import csv
+import io
+import json
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.v1.endpoints.telemetry import TelemetryExportRequest
+from app.services import telemetry_export
+from app.services.telemetry import (
+    TelemetryBlob,
+    TelemetryDelta,
+    TelemetryKeyframe,
+    TelemetryService,
+)
+from app.services.telemetry_export import (
+    EXPORT_COMPLETE,
+    EXPORT_FAILED,
+    EXPORT_PENDING,
+    EXPORT_STATUS_FILENAME,
+    ExportStatus,
+    TelemetryExporter,
+    TelemetryExportError,
+    TelemetryExportOptions,
+    export_ref,
+    read_export_status,
+    run_background_export,
+    write_export_status,
+)
+from tests.telemetry_helpers import make_blob
+
+TICKS = 60
+KEYFRAME_TICKS = [0, 20, 40]
+AGENTS = [f"agent-{i}" for i in range(4)]
+
+
+def _blob() -> TelemetryBlob:
+    keyframes = [
+        TelemetryKeyframe(
+            tick=tick,
+            timestamp=f"t{tick}",
+            agent_states={aid: {"agent_id": aid, "stance": 0.0} for aid in AGENTS},
+        )
+        for tick in KEYFRAME_TICKS
+    ]
+    deltas = [
+        TelemetryDelta(
+            tick=tick,
+            agent_updates=[{"agent_id": AGENTS[tick % len(AGENTS)], "stance": tick / TICKS}],
+            events_triggered=["shock"] if tick % 10 == 0 else (["rumor"] if tick % 15 == 0 else []),
+            metrics={"adoption": tick / TICKS},
+        )
+        for tick in range(TICKS)
+    ]
+    return make_blob(TICKS, keyframes, deltas, seed_used=3)
+
+
+async def _view(telemetry: TelemetryService):
+    ref = await telemetry.open_stream("tenant", "run-1", segment_bytes=1024).write_blob(_blob())
+    return await telemetry.open_view(ref)
+
+
+async def _collect(exporter: TelemetryExporter) -> List[bytes]:
+    return [chunk async for chunk in exporter.stream()]
+
+
+class TestStreamingExport:
+    async def test_ndjson_streams_per_window(self, telemetry):
+        view = await _view(telemetry)
+        exporter = TelemetryExporter(view, TelemetryExportOptions(format="ndjson", window_ticks=10))
+
+        chunks = await _collect(exporter)
+        records = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+
+        assert len(chunks) == TICKS // 10
+        tables = [record["table"] for record in records]
+        assert tables.count("keyframes") == len(KEYFRAME_TICKS) * len(AGENTS)
+        assert tables.count("deltas") == TICKS
+        assert [r["tick"] for r in records if r["table"] == "events"] == [0, 10, 15, 20, 30, 40, 45, 50]
+
+    async def test_filters(self, telemetry):
+        view = await _view(telemetry)
+        exporter = TelemetryExporter(view, TelemetryExportOptions(
+            format="ndjson",
+            tick_start=15,
+            tick_end=45,
+            agent_ids=["agent-1"],
+            event_types=["rumor"],
+            include_keyframes=False,
+        ))
+
+        records = [json.loads(line) for line in b"".join(await _collect(exporter)).decode().splitlines()]
+
+        assert {r["table"] for r in records} == {"deltas", "events"}
+        assert [r["tick"] for r in records if r["table"] == "deltas"] == [17, 21, 25, 29, 33, 37, 41, 45]
+        assert [r["tick"] for r in records if r["table"] == "events"] == [15, 45]
+
+    async def test_json_document(self, telemetry):
+        view = await _view(telemetry)
+        exporter = TelemetryExporter(view, TelemetryExportOptions(format="json", window_ticks=7))
+
+        document = json.loads(b"".join(await _collect(exporter)))
+
+        assert document["run_id"] == "run-1" and document["seed_used"] == 3
+        assert len(document["keyframes"]) == len(KEYFRAME_TICKS) * len(AGENTS)
+        assert [row["tick"] for row in document["deltas"]] == list(range(TICKS))
+        assert document["events"][0] == {"tick": 0, "event_type": "shock", "metrics": {"adoption": 0.0}}
+
+    async def test_csv_table(self, telemetry):
+        view = await _view(telemetry)
+        exporter = TelemetryExporter(view, TelemetryExportOptions(format="csv", table="deltas"))
+
+        rows = list(csv.DictReader(io.StringIO(b"".join(await _collect(exporter)).decode())))
+
+        assert len(rows) == TICKS
+        assert rows[5]["tick"] == "5" and rows[5]["agent_id"] == "agent-1"
+        assert json.loads(rows[5]["update"]) == {"agent_id": "agent-1", "stance": 5 / TICKS}
+
+    async def test_tick_range_reads_overlapping_segments(self, telemetry, backend):
+        view = await _view(telemetry)
+        manifest = view._manifest
+        segments = len(manifest["sections"]["deltas"]["segments"])
+        backend.ranges.clear()
+
+        exporter = TelemetryExporter(view, TelemetryExportOptions(
+            format="csv", table="events", tick_start=30, tick_end=34,
+        ))
+        await _collect(exporter)
+
+        assert 1 <= len(backend.ranges) < segments
+
+    async def test_invalid_options(self, telemetry, monkeypatch):
+        view = await _view(telemetry)
+
+        with pytest.raises(TelemetryExportError):
+            TelemetryExporter(view, TelemetryExportOptions(format="xml"))
+        with pytest.raises(TelemetryExportError):
+            TelemetryExporter(view, TelemetryExportOptions(format="csv", table="agents"))
+        monkeypatch.setattr(telemetry_export, "PARQUET_AVAILABLE", False)
+        with pytest.raises(TelemetryExportError):
+            TelemetryExporter(view, TelemetryExportOptions(format="parquet"))
+
+    @pytest.mark.parametrize("tick_range", [[5], [1, 2, 3], ["a", "b"]])
+    def test_malformed_tick_range(self, tick_range):
+        with pytest.raises(ValidationError):
+            TelemetryExportRequest(tick_range=tick_range)
+
+        assert TelemetryExportRequest(tick_range=[3, 9]).tick_range == (3, 9)
+
+
+class TestParquetExport:
+    async def test_row_group_per_window(self, telemetry):
+        pq = pytest.importorskip("pyarrow.parquet")
+        view = await _view(telemetry)
+        exporter = TelemetryExporter(view, TelemetryExportOptions(
+            format="parquet", table="deltas", window_ticks=20,
+        ))
+
+        parquet = pq.ParquetFile(io.BytesIO(b"".join(await _collect(exporter))))
+        table = parquet.read()
+
+        assert parquet.num_row_groups == TICKS // 20
+        assert str(table.schema.field("tick").type) == "int64"
+        assert table.column("tick").to_pylist() == list(range(TICKS))
+        assert json.loads(table.column("update")[3].as_py())["agent_id"] == "agent-3"
+
+
+class TestBackgroundExport:
+    async def test_export_written_to_signed_location(self, telemetry):
+        view = await _view(telemetry)
+        storage = telemetry.storage
+        exporter = TelemetryExporter(view, TelemetryExportOptions(format="ndjson"))
+        target = storage.artifact_ref("tenant", "artifact", "run-1", "exports/e1/" + exporter.filename)
+
+        url = await telemetry.get_signed_download_url(target)
+        assert not await storage.backend.object_exists(target.key)
+
+        async def whole_object_upload(key, data, *args, **kwargs):
+            raise AssertionError("export uploaded as one in-memory object")
+
+        storage.backend.put_object = whole_object_upload
+        await run_background_export(exporter, storage, target)
+
+        assert target.key in url
+        assert await storage.backend.get_object(target.key) == b"".join(await _collect(exporter))
+
+    async def test_status_records_completion(self, telemetry):
+        view = await _view(telemetry)
+        storage = telemetry.storage
+        exporter = TelemetryExporter(view, TelemetryExportOptions(format="csv"))
+        target = export_ref(storage, "tenant", "run-1", "e1", exporter.filename, exporter.media_type)
+        status_ref = export_ref(storage, "tenant", "run-1", "e1", EXPORT_STATUS_FILENAME)
+
+        assert await read_export_status(storage, status_ref) is None
+        await write_export_status(storage, status_ref, ExportStatus(
+            state=EXPORT_PENDING, format="csv", filename=exporter.filename,
+        ))
+        assert (await read_export_status(storage, status_ref)).state == EXPORT_PENDING
+
+        await run_background_export(exporter, storage, target, status_ref)
+
+        status = await read_export_status(storage, status_ref)
+        assert status.state == EXPORT_COMPLETE and status.error is None
+        assert status.size_bytes == len(await storage.backend.get_object(target.key))
+
+    async def test_status_records_failure(self, telemetry, monkeypatch):
+        view = await _view(telemetry)
+        storage = telemetry.storage
+        exporter = TelemetryExporter(view, TelemetryExportOptions(format="ndjson"))
+        target = export_ref(storage, "tenant", "run-1", "e2", exporter.filename)
+        status_ref = export_ref(storage, "tenant", "run-1", "e2", EXPORT_STATUS_FILENAME)
+
+        async def failing_stream():
+            raise RuntimeError("segment unreadable")
+            yield b""
+
+        monkeypatch.setattr(exporter, "stream", failing_stream)
+        await run_background_export(exporter, storage, target, status_ref)
+
+        status = await read_export_status(storage, status_ref)
+        assert status.state == EXPORT_FAILED
+        assert status.error == "segment unreadable"
+        assert not await storage.backend.object_exists(target.key)